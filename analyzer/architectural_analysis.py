@@ -5,13 +5,43 @@ Architectural Analysis Module
 
 Provides functionality for analyzing code architecture,
 detecting architectural violations and dependency issues.
+
+The import graph is kept in an ``ImportGraph`` that is built once, persisted
+keyed by file content hashes, and updated per changed module; cycles are
+enumerated with an iterative Tarjan SCC pass in O(V+E).
 """
 
 import ast
-import os
+from collections import deque
 from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from analyzer.optimization.digest_service import find_project_root, iter_tree_files
+
+logger = logging.getLogger(__name__)
+
+GRAPH_CACHE_VERSION = 1
+# Import graph caches live beside the digest cache at the project root
+GRAPH_CACHE_DIR = ".connascence_cache"
+
+# Layer hierarchy (higher layers can import from lower)
+LAYERS = {
+    "presentation": 3,
+    "application": 2,
+    "domain": 1,
+    "infrastructure": 0,
+    "ui": 3,
+    "api": 2,
+    "services": 1,
+    "data": 0,
+}
+
+MAX_DEPENDENCIES = 10
 
 
 @dataclass
@@ -49,6 +79,310 @@ class ArchitecturalViolation:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
+def extract_module_info(tree: ast.AST, module_name: str, file_path: str) -> Tuple[ModuleInfo, List[DependencyInfo]]:
+    """
+    Extract module information and import edges from a parsed module.
+
+    Args:
+        tree: Parsed module (shared with other analyzers when available)
+        module_name: Dotted module name
+        file_path: Path of the module file
+
+    Returns:
+        Tuple of (module info, outgoing dependencies in source order)
+    """
+    info = ModuleInfo(name=module_name, path=file_path)
+    dependencies: List[DependencyInfo] = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                info.imports.add(alias.name)
+                dependencies.append(DependencyInfo(module_name, alias.name, "absolute", node.lineno))
+
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                info.imports.add(node.module)
+                dependencies.append(DependencyInfo(module_name, node.module, "from", node.lineno))
+
+        elif isinstance(node, ast.ClassDef):
+            info.classes.append(node.name)
+            info.exports.add(node.name)
+
+        elif isinstance(node, ast.FunctionDef):
+            if not node.name.startswith("_"):
+                info.functions.append(node.name)
+                info.exports.add(node.name)
+
+    return info, dependencies
+
+
+class ImportGraph:
+    """
+    Module import graph, updated incrementally per changed module.
+
+    Each module keeps the content digest it was built from; ``refresh``
+    re-parses only modules whose digest changed and replaces just their
+    outgoing edges. The graph can be saved to and loaded from a JSON cache.
+    """
+
+    def __init__(self):
+        self.modules: Dict[str, ModuleInfo] = {}
+        self.edges: Dict[str, List[DependencyInfo]] = {}
+        self.digests: Dict[str, str] = {}
+        self._internal_adjacency: Optional[Dict[str, List[str]]] = None
+        self.parsed = 0
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def set_module(self, info: ModuleInfo, dependencies: List[DependencyInfo], digest: str = "") -> None:
+        """Add or replace one module and its outgoing edges."""
+        self.modules[info.name] = info
+        self.edges[info.name] = dependencies
+        self.digests[info.name] = digest
+        self._internal_adjacency = None
+
+    def remove_module(self, module_name: str) -> None:
+        self.modules.pop(module_name, None)
+        self.edges.pop(module_name, None)
+        self.digests.pop(module_name, None)
+        self._internal_adjacency = None
+
+    def update_from_source(self, module_name: str, file_path: str, source: Union[str, bytes], tree: Optional[ast.AST] = None) -> bool:
+        """
+        Update one module from its source, skipping the parse when the digest is unchanged.
+
+        Returns:
+            True when the module was (re)parsed
+        """
+        data = source.encode("utf-8") if isinstance(source, str) else source
+        digest = hashlib.sha256(data).hexdigest()
+        if self.digests.get(module_name) == digest and module_name in self.modules:
+            self.modules[module_name].path = file_path
+            return False
+
+        if tree is None:
+            tree = ast.parse(data)
+        info, dependencies = extract_module_info(tree, module_name, file_path)
+        self.set_module(info, dependencies, digest)
+        self.parsed += 1
+        return True
+
+    def refresh(self, directory: Path, root_path: Path) -> List[str]:
+        """
+        Bring the graph in line with the files under ``directory``.
+
+        Unchanged files (same content digest) are not parsed; modules whose
+        file disappeared are dropped.
+
+        Returns:
+            Names of the modules that were re-parsed
+        """
+        seen: Set[str] = set()
+        changed: List[str] = []
+        for py_file in iter_tree_files(directory):
+            file_path = str(py_file)
+            module_name = module_name_for(file_path, root_path)
+            try:
+                with open(file_path, "rb") as f:
+                    source = f.read()
+                if self.update_from_source(module_name, file_path, source):
+                    changed.append(module_name)
+            except (OSError, SyntaxError, ValueError):
+                self.remove_module(module_name)
+                continue
+            seen.add(module_name)
+
+        # Drop modules whose file under this directory is gone
+        resolved_directory = Path(directory).resolve()
+        for module_name, info in list(self.modules.items()):
+            if module_name not in seen and _is_within(Path(info.path).resolve(), resolved_directory):
+                self.remove_module(module_name)
+        return changed
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def iter_dependencies(self) -> Iterable[DependencyInfo]:
+        for dependencies in self.edges.values():
+            yield from dependencies
+
+    def internal_adjacency(self) -> Dict[str, List[str]]:
+        """Edges between modules of the graph (external imports dropped), deduplicated."""
+        if self._internal_adjacency is None:
+            modules = self.modules
+            self._internal_adjacency = {
+                name: list(dict.fromkeys(dep.target for dep in self.edges.get(name, ()) if dep.target in modules))
+                for name in modules
+            }
+        return self._internal_adjacency
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """
+        Every import cycle, as strongly connected components (iterative Tarjan, O(V+E)).
+
+        Returns:
+            Components with more than one module or a self-import, each in
+            discovery order
+        """
+        adjacency = self.internal_adjacency()
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        counter = 0
+
+        for root in adjacency:
+            if root in index_of:
+                continue
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(adjacency[root]))]
+
+            while work:
+                node, neighbors = work[-1]
+                for neighbor in neighbors:
+                    if neighbor not in index_of:
+                        index_of[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(adjacency[neighbor])))
+                        break
+                    if neighbor in on_stack and index_of[neighbor] < lowlink[node]:
+                        lowlink[node] = index_of[neighbor]
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if lowlink[node] < lowlink[parent]:
+                            lowlink[parent] = lowlink[node]
+                    if lowlink[node] == index_of[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in adjacency[node]:
+                            component.reverse()
+                            components.append(component)
+
+        return components
+
+    def cycle_through(self, component: List[str]) -> List[str]:
+        """Shortest cycle through the component's first module (BFS inside the component)."""
+        adjacency = self.internal_adjacency()
+        members = set(component)
+        start = component[0]
+        parents: Dict[str, str] = {}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for neighbor in adjacency[node]:
+                if neighbor == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return path + [start]
+                if neighbor in members and neighbor not in parents:
+                    parents[neighbor] = node
+                    queue.append(neighbor)
+        return [start, start]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, cache_path: Union[str, Path]) -> None:
+        """Write the graph to a JSON cache file."""
+        cache_path = Path(cache_path)
+        payload = {
+            "version": GRAPH_CACHE_VERSION,
+            "modules": {
+                name: {
+                    "path": info.path,
+                    "digest": self.digests.get(name, ""),
+                    "imports": [[dep.target, dep.import_type, dep.line_number] for dep in self.edges.get(name, ())],
+                    "classes": info.classes,
+                    "functions": info.functions,
+                }
+                for name, info in self.modules.items()
+            },
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to save import graph cache {cache_path}: {e}")
+
+    @classmethod
+    def load(cls, cache_path: Union[str, Path]) -> "ImportGraph":
+        """Read a graph saved by ``save``; an unreadable or stale cache yields an empty graph."""
+        graph = cls()
+        cache_path = Path(cache_path)
+        if not cache_path.exists():
+            return graph
+        try:
+            with open(cache_path, encoding="utf-8") as handle:
+                raw = json.load(handle)
+            if raw.get("version") != GRAPH_CACHE_VERSION:
+                return graph
+            for name, entry in raw["modules"].items():
+                dependencies = [DependencyInfo(name, target, kind, line) for target, kind, line in entry["imports"]]
+                info = ModuleInfo(
+                    name=name,
+                    path=entry["path"],
+                    imports={dep.target for dep in dependencies},
+                    exports=set(entry["classes"]) | set(entry["functions"]),
+                    classes=list(entry["classes"]),
+                    functions=list(entry["functions"]),
+                )
+                graph.set_module(info, dependencies, entry["digest"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable import graph cache {cache_path}: {e}")
+            return cls()
+        return graph
+
+
+def _is_within(path: Path, directory: Path) -> bool:
+    """Whether ``path`` lies under ``directory`` (``Path.is_relative_to`` needs Python 3.9)."""
+    try:
+        path.relative_to(directory)
+    except ValueError:
+        return False
+    return True
+
+
+def default_graph_cache(root_path: Union[str, Path]) -> Path:
+    """
+    Project-scoped import graph cache for analyses rooted at ``root_path``.
+
+    Module names are relative to the analysis root, so each root gets its own
+    file under the project's ``.connascence_cache`` directory.
+    """
+    resolved = Path(root_path).resolve()
+    key = hashlib.sha256(str(resolved).encode("utf-8")).hexdigest()[:12]
+    return find_project_root(resolved) / GRAPH_CACHE_DIR / f"import_graph-{key}.json"
+
+
+def module_name_for(file_path: str, root_path: Path) -> str:
+    """Dotted module name of a file relative to the analysis root."""
+    rel_path = os.path.relpath(file_path, root_path)
+    return rel_path.replace(os.sep, ".").replace(".py", "")
+
+
 class ArchitecturalAnalyzer:
     """
     Analyzes code architecture for violations.
@@ -60,12 +394,28 @@ class ArchitecturalAnalyzer:
     - Module coupling issues
     """
 
-    def __init__(self, root_path: str = "."):
+    def __init__(self, root_path: str = ".", graph_cache: Optional[str] = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            root_path: Project root that module names are relative to
+            graph_cache: JSON file persisting the import graph between runs
+                (None keeps the graph in memory only)
+        """
         self.root_path = Path(root_path)
-        self.modules: Dict[str, ModuleInfo] = {}
-        self.dependencies: List[DependencyInfo] = []
+        self.graph_cache = Path(graph_cache) if graph_cache else None
+        self.graph = ImportGraph.load(self.graph_cache) if self.graph_cache else ImportGraph()
         self.violations: List[ArchitecturalViolation] = []
 
+    @property
+    def modules(self) -> Dict[str, ModuleInfo]:
+        return self.graph.modules
+
+    @property
+    def dependencies(self) -> List[DependencyInfo]:
+        return list(self.graph.iter_dependencies())
+
     def analyze_directory(self, path: Optional[str] = None) -> List[ArchitecturalViolation]:
         """Analyze a directory for architectural violations."""
         target_path = Path(path) if path else self.root_path
@@ -84,148 +434,88 @@ class ArchitecturalAnalyzer:
     def analyze_file(self, file_path: str) -> List[ArchitecturalViolation]:
         """Analyze a single file for architectural violations."""
         self.violations = []
-        module_info = self._analyze_module(file_path)
-        if module_info:
-            self.modules[module_info.name] = module_info
-            self._detect_import_violations(module_info)
+        tree = self._analyze_module(file_path)
+        if tree is not None:
+            self._detect_import_violations(tree, file_path)
         return self.violations
 
+    def update_module(self, file_path: str, source: str, tree: Optional[ast.AST] = None) -> bool:
+        """
+        Update the graph from an already-read (and optionally parsed) module.
+
+        Lets callers that parse files anyway share their trees instead of
+        having this analyzer read and parse them again.
+
+        Returns:
+            True when the module's edges were rebuilt
+        """
+        return self.graph.update_from_source(module_name_for(file_path, self.root_path), file_path, source, tree)
+
+    def save_graph(self) -> None:
+        """Persist the import graph to ``graph_cache`` (no-op without one)."""
+        if self.graph_cache:
+            self.graph.save(self.graph_cache)
+
     def _collect_modules(self, directory: Path):
-        """Recursively collect module information from a directory."""
-        for py_file in directory.rglob("*.py"):
-            if "__pycache__" in str(py_file):
-                continue
-            module_info = self._analyze_module(str(py_file))
-            if module_info:
-                self.modules[module_info.name] = module_info
+        """Collect module information from a directory, re-parsing only changed files."""
+        self.graph.refresh(directory, self.root_path)
+        self.save_graph()
 
-    def _analyze_module(self, file_path: str) -> Optional[ModuleInfo]:
-        """Analyze a Python module and extract information."""
+    def _analyze_module(self, file_path: str) -> Optional[ast.AST]:
+        """Analyze a Python module, add it to the graph and return its tree."""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 source = f.read()
 
             tree = ast.parse(source)
-            rel_path = os.path.relpath(file_path, self.root_path)
-            module_name = rel_path.replace(os.sep, ".").replace(".py", "")
-
-            info = ModuleInfo(name=module_name, path=file_path)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        info.imports.add(alias.name)
-                        self.dependencies.append(
-                            DependencyInfo(
-                                source=module_name,
-                                target=alias.name,
-                                import_type="absolute",
-                                line_number=node.lineno,
-                            )
-                        )
-
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        info.imports.add(node.module)
-                        self.dependencies.append(
-                            DependencyInfo(
-                                source=module_name,
-                                target=node.module,
-                                import_type="from",
-                                line_number=node.lineno,
-                            )
-                        )
-
-                elif isinstance(node, ast.ClassDef):
-                    info.classes.append(node.name)
-                    info.exports.add(node.name)
-
-                elif isinstance(node, ast.FunctionDef):
-                    if not node.name.startswith("_"):
-                        info.functions.append(node.name)
-                        info.exports.add(node.name)
-
-            return info
+            self.update_module(file_path, source, tree)
+            return tree
 
         except Exception:
             return None
 
     def _detect_circular_dependencies(self):
-        """Detect circular dependencies in the module graph."""
-        # Build adjacency list
-        graph: Dict[str, Set[str]] = {}
-        for dep in self.dependencies:
-            if dep.source not in graph:
-                graph[dep.source] = set()
-            graph[dep.source].add(dep.target)
-
-        # Find cycles using DFS
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node: str, path: List[str]) -> Optional[List[str]]:
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor in self.modules:  # Only check internal modules
-                    if neighbor not in visited:
-                        cycle = dfs(neighbor, path)
-                        if cycle:
-                            return cycle
-                    elif neighbor in rec_stack:
-                        # Found cycle
-                        cycle_start = path.index(neighbor)
-                        return path[cycle_start:] + [neighbor]
-
-            path.pop()
-            rec_stack.remove(node)
-            return None
-
-        for module in self.modules:
-            if module not in visited:
-                cycle = dfs(module, [])
-                if cycle:
-                    self.violations.append(
-                        ArchitecturalViolation(
-                            type="CircularDependency",
-                            severity="high",
-                            file_path=self.modules[module].path,
-                            line_number=0,
-                            description=f"Circular dependency detected: {' -> '.join(cycle)}",
-                            recommendation="Refactor to break the circular dependency",
-                            details={"cycle": cycle},
-                        )
-                    )
+        """Report every strongly connected component of the module graph as a cycle."""
+        for component in self.graph.strongly_connected_components():
+            cycle = self.graph.cycle_through(component)
+            self.violations.append(
+                ArchitecturalViolation(
+                    type="CircularDependency",
+                    severity="high",
+                    file_path=self.modules[cycle[0]].path,
+                    line_number=0,
+                    description=f"Circular dependency detected: {' -> '.join(cycle)}",
+                    recommendation="Refactor to break the circular dependency",
+                    details={"cycle": cycle, "modules": component},
+                )
+            )
 
     def _detect_layer_violations(self):
         """Detect layer violations (e.g., UI importing from data layer directly)."""
-        # Define layer hierarchy (higher layers can import from lower)
-        layers = {
-            "presentation": 3,
-            "application": 2,
-            "domain": 1,
-            "infrastructure": 0,
-            "ui": 3,
-            "api": 2,
-            "services": 1,
-            "data": 0,
-        }
+        # Many edges share a target; resolve each module name's layer once
+        layer_of: Dict[str, Optional[int]] = {}
+
+        for source, dependencies in self.graph.edges.items():
+            source_layer = self._get_module_layer(source, LAYERS)
+            if source_layer is None or not dependencies:
+                continue
+            source_path = self.modules[source].path
 
-        for dep in self.dependencies:
-            source_layer = self._get_module_layer(dep.source, layers)
-            target_layer = self._get_module_layer(dep.target, layers)
+            for dep in dependencies:
+                target = dep.target
+                if target in layer_of:
+                    target_layer = layer_of[target]
+                else:
+                    target_layer = layer_of[target] = self._get_module_layer(target, LAYERS)
 
-            if source_layer is not None and target_layer is not None:
-                if source_layer < target_layer:
+                if target_layer is not None and source_layer < target_layer:
                     self.violations.append(
                         ArchitecturalViolation(
                             type="LayerViolation",
                             severity="medium",
-                            file_path=self.modules.get(dep.source, ModuleInfo("", "")).path or "",
+                            file_path=source_path,
                             line_number=dep.line_number,
-                            description=f"Layer violation: lower layer '{dep.source}' imports from higher layer '{dep.target}'",
+                            description=f"Layer violation: lower layer '{source}' imports from higher layer '{target}'",
                             recommendation="Refactor to maintain proper layer boundaries",
                         )
                     )
@@ -240,8 +530,6 @@ class ArchitecturalAnalyzer:
 
     def _detect_coupling_issues(self):
         """Detect modules with excessive coupling."""
-        MAX_DEPENDENCIES = 10
-
         for module_name, module_info in self.modules.items():
             if len(module_info.imports) > MAX_DEPENDENCIES:
                 self.violations.append(
@@ -256,54 +544,56 @@ class ArchitecturalAnalyzer:
                     )
                 )
 
-    def _detect_import_violations(self, module_info: ModuleInfo):
-        """Detect import-related violations in a module."""
+    def _detect_import_violations(self, tree: ast.AST, file_path: str):
+        """Detect import-related violations in a parsed module."""
         # Check for wildcard imports
-        try:
-            with open(module_info.path, "r", encoding="utf-8") as f:
-                source = f.read()
-
-            tree = ast.parse(source)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ImportFrom):
-                    for alias in node.names:
-                        if alias.name == "*":
-                            self.violations.append(
-                                ArchitecturalViolation(
-                                    type="WildcardImport",
-                                    severity="low",
-                                    file_path=module_info.path,
-                                    line_number=node.lineno,
-                                    description=f"Wildcard import from '{node.module}'",
-                                    recommendation="Use explicit imports instead of wildcard",
-                                )
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    if alias.name == "*":
+                        self.violations.append(
+                            ArchitecturalViolation(
+                                type="WildcardImport",
+                                severity="low",
+                                file_path=file_path,
+                                line_number=node.lineno,
+                                description=f"Wildcard import from '{node.module}'",
+                                recommendation="Use explicit imports instead of wildcard",
                             )
-        except Exception:
-            pass
+                        )
 
     def get_dependency_graph(self) -> Dict[str, List[str]]:
         """Return the dependency graph as an adjacency list."""
-        graph: Dict[str, List[str]] = {}
-        for dep in self.dependencies:
-            if dep.source not in graph:
-                graph[dep.source] = []
-            graph[dep.source].append(dep.target)
-        return graph
+        return {
+            source: [dep.target for dep in dependencies]
+            for source, dependencies in self.graph.edges.items()
+            if dependencies
+        }
 
 
-def analyze_architecture(path: str) -> List[ArchitecturalViolation]:
+def analyze_architecture(
+    path: str,
+    graph_cache: Optional[str] = None,
+    parsed: Optional[Iterable[Tuple[str, str, ast.AST]]] = None,
+) -> List[ArchitecturalViolation]:
     """
     Convenience function to analyze architecture.
 
     Args:
         path: Directory or file path to analyze
+        graph_cache: Import graph cache (defaults to ``default_graph_cache(path)``
+            for directories)
+        parsed: ``(file_path, source, tree)`` triples already parsed by the
+            caller, fed to the graph so they are not parsed again
 
     Returns:
         List of architectural violations
     """
-    analyzer = ArchitecturalAnalyzer(path)
     if os.path.isfile(path):
-        return analyzer.analyze_file(path)
+        return ArchitecturalAnalyzer(path).analyze_file(path)
+    analyzer = ArchitecturalAnalyzer(path, graph_cache=graph_cache or str(default_graph_cache(path)))
+    for file_path, source, tree in parsed or ():
+        analyzer.update_module(file_path, source, tree)
     return analyzer.analyze_directory()
 
 
@@ -311,6 +601,9 @@ __all__ = [
     "ArchitecturalAnalyzer",
     "ArchitecturalViolation",
     "DependencyInfo",
+    "ImportGraph",
     "ModuleInfo",
     "analyze_architecture",
+    "default_graph_cache",
+    "extract_module_info",
 ]
@@ -71,6 +71,11 @@ class MonitoringCoordinator:
             f"resources={resource_manager is not None})"
         )
 
+    def setup_hooks(self) -> None:
+        """Register the monitoring and cleanup hooks (once) and start monitoring."""
+        if not self._cleanup_callbacks_registered:
+            self._setup_monitoring_and_cleanup_hooks()
+
     def _setup_monitoring_and_cleanup_hooks(self) -> None:
         """
         Setup memory monitoring and resource cleanup hooks.
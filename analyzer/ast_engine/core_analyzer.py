@@ -23,15 +23,19 @@ AST module to analyze code and detect various forms of connascence including:
 """
 
 import ast
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 import hashlib
+import logging
 from pathlib import Path
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import uuid
 
 from utils.types import ConnascenceViolation
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ThresholdConfig:
@@ -53,6 +57,8 @@ class AnalysisResult:
     total_files: int = 0
     analysis_time: float = 0.0
     connascence_index: float = 0.0
+    # CPU seconds spent in worker processes (0.0 when analyzed in-process)
+    worker_cpu_time: float = 0.0
 
     @property
     def total_violations(self) -> int:
@@ -158,12 +164,13 @@ class ConnascenceASTAnalyzer:
             code = f.read()
         return self.analyze_string(code, str(file_path))
 
-    def analyze_directory(self, dir_path: Path) -> AnalysisResult:
+    def analyze_directory(self, dir_path: Path, max_workers: int = 1) -> AnalysisResult:
         """
         Analyze all Python files in a directory.
 
         Args:
             dir_path: Path to the directory
+            max_workers: Processes to spread the files over (1 stays in-process)
 
         Returns:
             AnalysisResult with all violations found
@@ -172,14 +179,29 @@ class ConnascenceASTAnalyzer:
         all_violations = []
         file_count = 0
 
-        for py_file in dir_path.rglob("*.py"):
+        files = list(Path(dir_path).rglob("*.py"))
+        workers = min(max_workers, len(files))
+        results = None
+        worker_cpu_time = 0.0
+        if workers > 1:
             try:
-                violations = self.analyze_file(py_file)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunksize = max(1, len(files) // (workers * 4))
+                    timed = list(
+                        executor.map(_analyze_file_with, [self.thresholds] * len(files), files, chunksize=chunksize)
+                    )
+                results = [violations for violations, _ in timed]
+                worker_cpu_time = sum(cpu_time for _, cpu_time in timed)
+            except (OSError, RuntimeError) as e:
+                logger.debug(f"Process pool unavailable, analyzing serially: {e}")
+        if results is None:
+            results = [self._analyze_file_or_none(py_file) for py_file in files]
+
+        for violations in results:
+            # Files that can't be analyzed are skipped
+            if violations is not None:
                 all_violations.extend(violations)
                 file_count += 1
-            except Exception:
-                # Skip files that can't be analyzed
-                continue
 
         analysis_time = time.time() - start_time
 
@@ -187,11 +209,59 @@ class ConnascenceASTAnalyzer:
         total_weight = sum(v.weight for v in all_violations)
 
         return AnalysisResult(
-            violations=all_violations, total_files=file_count, analysis_time=analysis_time, connascence_index=total_weight
+            violations=all_violations,
+            total_files=file_count,
+            analysis_time=analysis_time,
+            connascence_index=total_weight,
+            worker_cpu_time=worker_cpu_time,
         )
 
+    def _analyze_file_or_none(self, file_path: Path) -> Optional[List[ConnascenceViolation]]:
+        try:
+            return self.analyze_file(file_path)
+        except Exception:
+            return None
+
+    def analyze_scopes(self, tree: ast.Module, file_path: str, selection) -> List[ConnascenceViolation]:
+        """
+        Analyze only the parts of a parsed module touched by a change.
+
+        Runs the function and class checks on the touched scopes and the magic
+        literal check on the touched statements and definition headers. Used by
+        diff-driven runs; see ``analyzer.diff_scope.select_changed_scopes``.
+
+        Args:
+            tree: Parsed module the selection was made from
+            file_path: Path to the file (for reporting purposes)
+            selection: ScopeSelection with the touched scopes and nodes
+
+        Returns:
+            List of ConnascenceViolation objects
+        """
+        functions = [node for node in selection.scopes if isinstance(node, ast.FunctionDef)]
+        classes = [node for node in selection.scopes if isinstance(node, ast.ClassDef)]
+
+        # Same pass order as analyze_string
+        checks = [
+            (functions, self._parameter_bomb_violation),
+            (functions, self._missing_type_hint_violation),
+            (classes, self._god_class_violation),
+            (functions, self._complex_method_violation),
+        ]
+        violations = self._detect_magic_literals_in(selection.nodes, file_path)
+        for nodes, check in checks:
+            for node in nodes:
+                violation = check(node, file_path)
+                if violation:
+                    violations.append(violation)
+        return violations
+
     def _detect_magic_literals(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
         """Detect magic literals (CoM - Connascence of Meaning)."""
+        return self._detect_magic_literals_in([tree], file_path)
+
+    def _detect_magic_literals_in(self, roots: List[ast.AST], file_path: str) -> List[ConnascenceViolation]:
+        """Detect magic literals in the subtrees rooted at ``roots``."""
         violations = []
 
         # Skip constants definition files entirely
@@ -200,9 +270,11 @@ class ConnascenceASTAnalyzer:
         if any(pattern in file_name_lower for pattern in constants_file_patterns):
             return violations
 
+        nodes = [node for root in roots for node in ast.walk(root)]
+
         # Track constant assignments to skip values inside them
         constant_assignments = set()
-        for node in ast.walk(tree):
+        for node in nodes:
             if isinstance(node, ast.Assign):
                 for target in node.targets:
                     if isinstance(target, ast.Name) and target.id.isupper() and len(target.id) > 1:
@@ -212,7 +284,7 @@ class ConnascenceASTAnalyzer:
                             for child in ast.walk(node.value):
                                 constant_assignments.add(id(child))
 
-        for node in ast.walk(tree):
+        for node in nodes:
             # Skip nodes that are part of constant assignments
             if id(node) in constant_assignments:
                 continue
@@ -245,121 +317,115 @@ class ConnascenceASTAnalyzer:
 
     def _detect_parameter_bombs(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
         """Detect functions with too many parameters (CoP - Connascence of Position)."""
-        violations = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Count positional parameters (excluding self/cls)
-                param_count = len(node.args.args)
-                if param_count > 0 and node.args.args[0].arg in ("self", "cls"):
-                    param_count -= 1
-
-                if param_count > self.thresholds.max_positional_params:
-                    # Determine severity based on parameter count
-                    if param_count > 10:
-                        severity = "critical"
-                    elif param_count > 8:
-                        severity = "high"
-                    else:
-                        severity = "medium"
-
-                    violations.append(
-                        ConnascenceViolation(
-                            id=str(uuid.uuid4()),
-                            rule_id="CON_CoP",
-                            connascence_type="CoP",
-                            severity=severity,
-                            description=f"Function '{node.name}' has {param_count} parameters (max: {self.thresholds.max_positional_params})",
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            weight=10.0 if severity == "critical" else (5.0 if severity == "high" else 2.0),
-                        )
-                    )
-
-        return violations
+        return self._collect(tree, ast.FunctionDef, self._parameter_bomb_violation, file_path)
 
     def _detect_missing_type_hints(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
         """Detect functions missing type hints (CoT - Connascence of Type)."""
-        violations = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Check if function has type hints
-                has_param_hints = any(arg.annotation is not None for arg in node.args.args)
-                has_return_hint = node.returns is not None
-
-                # Skip if function has no parameters
-                if not node.args.args:
-                    continue
-
-                # Report missing type hints
-                if not has_param_hints and not has_return_hint:
-                    violations.append(
-                        ConnascenceViolation(
-                            id=str(uuid.uuid4()),
-                            rule_id="CON_CoT",
-                            connascence_type="CoT",
-                            severity="medium",
-                            description=f"Function '{node.name}' missing type hints",
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            weight=2.0,
-                        )
-                    )
-
-        return violations
+        return self._collect(tree, ast.FunctionDef, self._missing_type_hint_violation, file_path)
 
     def _detect_god_classes(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
         """Detect god classes (CoA - Connascence of Algorithm)."""
-        violations = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Count methods in the class
-                methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
-                method_count = len(methods)
-
-                if method_count > self.thresholds.god_class_methods:
-                    severity = "critical" if method_count > 30 else "high"
-                    violations.append(
-                        ConnascenceViolation(
-                            id=str(uuid.uuid4()),
-                            rule_id="CON_CoA",
-                            connascence_type="CoA",
-                            severity=severity,
-                            description=f"God class '{node.name}' has {method_count} methods (max: {self.thresholds.god_class_methods})",
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            weight=10.0 if severity == "critical" else 5.0,
-                        )
-                    )
-
-        return violations
+        return self._collect(tree, ast.ClassDef, self._god_class_violation, file_path)
 
     def _detect_complex_methods(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
         """Detect methods with high cyclomatic complexity (CoA - Connascence of Algorithm)."""
-        violations = []
+        return self._collect(tree, ast.FunctionDef, self._complex_method_violation, file_path)
 
+    @staticmethod
+    def _collect(tree: ast.AST, node_type: type, check, file_path: str) -> List[ConnascenceViolation]:
+        """Run a per-node check on every ``node_type`` node in the tree."""
+        violations = []
         for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                complexity = self._calculate_complexity(node)
+            if isinstance(node, node_type):
+                violation = check(node, file_path)
+                if violation:
+                    violations.append(violation)
+        return violations
 
-                if complexity > self.thresholds.max_cyclomatic_complexity:
-                    severity = "high" if complexity > 15 else "medium"
-                    violations.append(
-                        ConnascenceViolation(
-                            id=str(uuid.uuid4()),
-                            rule_id="CON_CoA",
-                            connascence_type="CoA",
-                            severity=severity,
-                            description=f"Function '{node.name}' has cyclomatic complexity of {complexity} (max: {self.thresholds.max_cyclomatic_complexity})",
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            weight=5.0 if severity == "high" else 2.0,
-                        )
-                    )
+    def _parameter_bomb_violation(self, node: ast.FunctionDef, file_path: str) -> Optional[ConnascenceViolation]:
+        # Count positional parameters (excluding self/cls)
+        param_count = len(node.args.args)
+        if param_count > 0 and node.args.args[0].arg in ("self", "cls"):
+            param_count -= 1
+
+        if param_count <= self.thresholds.max_positional_params:
+            return None
+
+        # Determine severity based on parameter count
+        if param_count > 10:
+            severity = "critical"
+        elif param_count > 8:
+            severity = "high"
+        else:
+            severity = "medium"
+
+        return ConnascenceViolation(
+            id=str(uuid.uuid4()),
+            rule_id="CON_CoP",
+            connascence_type="CoP",
+            severity=severity,
+            description=f"Function '{node.name}' has {param_count} parameters (max: {self.thresholds.max_positional_params})",
+            file_path=file_path,
+            line_number=node.lineno,
+            weight=10.0 if severity == "critical" else (5.0 if severity == "high" else 2.0),
+        )
 
-        return violations
+    def _missing_type_hint_violation(self, node: ast.FunctionDef, file_path: str) -> Optional[ConnascenceViolation]:
+        # Skip if function has no parameters
+        if not node.args.args:
+            return None
+
+        # Check if function has type hints
+        has_param_hints = any(arg.annotation is not None for arg in node.args.args)
+        has_return_hint = node.returns is not None
+        if has_param_hints or has_return_hint:
+            return None
+
+        return ConnascenceViolation(
+            id=str(uuid.uuid4()),
+            rule_id="CON_CoT",
+            connascence_type="CoT",
+            severity="medium",
+            description=f"Function '{node.name}' missing type hints",
+            file_path=file_path,
+            line_number=node.lineno,
+            weight=2.0,
+        )
+
+    def _god_class_violation(self, node: ast.ClassDef, file_path: str) -> Optional[ConnascenceViolation]:
+        # Count methods in the class
+        method_count = sum(1 for n in node.body if isinstance(n, ast.FunctionDef))
+        if method_count <= self.thresholds.god_class_methods:
+            return None
+
+        severity = "critical" if method_count > 30 else "high"
+        return ConnascenceViolation(
+            id=str(uuid.uuid4()),
+            rule_id="CON_CoA",
+            connascence_type="CoA",
+            severity=severity,
+            description=f"God class '{node.name}' has {method_count} methods (max: {self.thresholds.god_class_methods})",
+            file_path=file_path,
+            line_number=node.lineno,
+            weight=10.0 if severity == "critical" else 5.0,
+        )
+
+    def _complex_method_violation(self, node: ast.FunctionDef, file_path: str) -> Optional[ConnascenceViolation]:
+        complexity = self._calculate_complexity(node)
+        if complexity <= self.thresholds.max_cyclomatic_complexity:
+            return None
+
+        severity = "high" if complexity > 15 else "medium"
+        return ConnascenceViolation(
+            id=str(uuid.uuid4()),
+            rule_id="CON_CoA",
+            connascence_type="CoA",
+            severity=severity,
+            description=f"Function '{node.name}' has cyclomatic complexity of {complexity} (max: {self.thresholds.max_cyclomatic_complexity})",
+            file_path=file_path,
+            line_number=node.lineno,
+            weight=5.0 if severity == "high" else 2.0,
+        )
 
     def _calculate_complexity(self, node: ast.FunctionDef) -> int:
         """Calculate cyclomatic complexity of a function."""
@@ -381,6 +447,15 @@ class ConnascenceASTAnalyzer:
         return complexity
 
 
+def _analyze_file_with(
+    thresholds: ThresholdConfig, file_path: Path
+) -> Tuple[Optional[List[ConnascenceViolation]], float]:
+    """Process-pool entry point for ``analyze_directory``; also returns the worker CPU seconds spent."""
+    start_cpu = time.process_time()
+    violations = ConnascenceASTAnalyzer(thresholds)._analyze_file_or_none(file_path)
+    return violations, time.process_time() - start_cpu
+
+
 class Violation:
     """Legacy compatibility class."""
 
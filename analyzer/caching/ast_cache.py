@@ -5,6 +5,10 @@ AST Caching System
 
 Intelligent caching system for AST parsing and analysis results
 to improve performance on repeated analysis runs.
+
+Persisted entries live in a single pack file with a memory-mapped index
+(see ``pack_store``); opening the cache does not read any entry, and entries
+are decoded on first access.
 """
 
 import ast
@@ -12,6 +16,7 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import hashlib
 import logging
+import os
 from pathlib import Path
 import pickle
 import sys
@@ -19,6 +24,7 @@ import threading
 import time
 from typing import Any, Dict, List, Optional, Union
 
+from analyzer.caching.pack_store import PackStore, path_key
 from fixes.phase0.production_safe_assertions import ProductionAssert
 
 # Add project root to path
@@ -27,6 +33,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 logger = logging.getLogger(__name__)
 
 
+def _file_matches(file_path: str, file_mtime: float, file_size: int) -> bool:
+    """Check that a file still has the mtime and size an entry was cached with."""
+    try:
+        current_stat = os.stat(file_path)
+    except OSError:
+        return False
+    return abs(current_stat.st_mtime - file_mtime) < 1.0 and current_stat.st_size == file_size
+
+
 @dataclass
 class CacheEntry:
     """Single cache entry with metadata."""
@@ -43,15 +58,7 @@ class CacheEntry:
 
     def is_valid(self) -> bool:
         """Check if cache entry is still valid."""
-        try:
-            file_path = Path(self.file_path)
-            if not file_path.exists():
-                return False
-
-            current_stat = file_path.stat()
-            return abs(current_stat.st_mtime - self.file_mtime) < 1.0 and current_stat.st_size == self.file_size
-        except Exception:
-            return False
+        return _file_matches(self.file_path, self.file_mtime, self.file_size)
 
     def update_access(self):
         """Update access statistics."""
@@ -64,7 +71,7 @@ class ASTCache:
     Intelligent AST and analysis result caching system.
 
     Features:
-    - File-based persistence
+    - Pack-file persistence with lazy, memory-mapped index lookups
     - Automatic cache invalidation
     - LRU eviction policy
     - Thread-safe operations
@@ -88,41 +95,44 @@ class ASTCache:
         self.enable_persistence = enable_persistence
         self.enable_compression = enable_compression
 
-        # In-memory cache
+        # In-memory cache of decoded entries
         self.memory_cache: Dict[str, CacheEntry] = {}
+        self._entry_sizes: Dict[str, int] = {}
         self.cache_stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0, "size_bytes": 0}
 
         # Thread safety
         self.cache_lock = threading.RLock()
 
-        # Initialize cache directory
+        # Pack store is opened on first use
+        self._store: Optional[PackStore] = None
         if self.enable_persistence:
             self.cache_dir.mkdir(exist_ok=True)
-            self._load_cache_index()
 
         logger.info(f"AST cache initialized: {self.cache_dir}, max {max_size_mb}MB, {max_entries} entries")
 
+    @property
+    def store(self) -> Optional[PackStore]:
+        """Pack store behind the cache, opened on first access (None without persistence)."""
+        if self._store is None and self.enable_persistence:
+            with self.cache_lock:
+                if self._store is None:
+                    self._store = PackStore(self.cache_dir, compress=self.enable_compression)
+        return self._store
+
+    def close(self):
+        """Release the pack store's file handles."""
+        with self.cache_lock:
+            if self._store is not None:
+                self._sync_access_times()
+                self._store.close()
+                self._store = None
+
     def get_ast(self, file_path: Union[str, Path]) -> Optional[ast.AST]:
         """Get cached AST for file, or None if not cached/invalid."""
 
         file_path = Path(file_path)
         cache_key = self._generate_cache_key(file_path, "ast")
-
-        with self.cache_lock:
-            entry = self.memory_cache.get(cache_key)
-
-            if entry and entry.is_valid():
-                entry.update_access()
-                self.cache_stats["hits"] += 1
-                logger.debug(f"Cache hit for AST: {file_path}")
-                return entry.data
-            elif entry:
-                # Invalid entry, remove it
-                self._remove_entry(cache_key)
-                self.cache_stats["invalidations"] += 1
-
-            self.cache_stats["misses"] += 1
-            return None
+        return self._get_entry_data(cache_key, file_path, f"AST: {file_path}")
 
     def put_ast(self, file_path: Union[str, Path], ast_tree: ast.AST, analysis_duration_ms: float = 0.0):
         """Cache AST for file."""
@@ -176,21 +186,7 @@ class ASTCache:
 
         file_path = Path(file_path)
         cache_key = self._generate_cache_key(file_path, f"analysis_{analysis_type}")
-
-        with self.cache_lock:
-            entry = self.memory_cache.get(cache_key)
-
-            if entry and entry.is_valid():
-                entry.update_access()
-                self.cache_stats["hits"] += 1
-                logger.debug(f"Cache hit for {analysis_type} analysis: {file_path}")
-                return entry.data
-            elif entry:
-                self._remove_entry(cache_key)
-                self.cache_stats["invalidations"] += 1
-
-            self.cache_stats["misses"] += 1
-            return None
+        return self._get_entry_data(cache_key, file_path, f"{analysis_type} analysis: {file_path}")
 
     def put_analysis_result(
         self,
@@ -241,7 +237,12 @@ class ASTCache:
         file_path = Path(file_path)
 
         with self.cache_lock:
-            keys_to_remove = [key for key, entry in self.memory_cache.items() if entry.file_path == str(file_path)]
+            keys_to_remove = {key for key, entry in self.memory_cache.items() if entry.file_path == str(file_path)}
+            if self.store is not None:
+                file_key = path_key(str(file_path))
+                keys_to_remove.update(
+                    key.hex() for key, record in self.store.iter_records() if record.path_key == file_key
+                )
 
             for key in keys_to_remove:
                 self._remove_entry(key)
@@ -254,14 +255,20 @@ class ASTCache:
 
         with self.cache_lock:
             if self.enable_persistence:
-                # Remove all cache files
-                for cache_file in self.cache_dir.glob("*.cache"):
+                if self._store is not None:
+                    self._store.close()
+                    self._store = None
+                # Remove the pack, its index, its lock file and any per-entry files from older versions
+                cache_files = [self.cache_dir / f"ast_cache.{suffix}" for suffix in ("pack", "idx", "lock")]
+                for cache_file in cache_files + list(self.cache_dir.glob("*.cache")):
                     try:
-                        cache_file.unlink()
+                        if cache_file.exists():
+                            cache_file.unlink()
                     except Exception as e:
                         logger.warning(f"Failed to delete cache file {cache_file}: {e}")
 
             self.memory_cache.clear()
+            self._entry_sizes.clear()
             self.cache_stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0, "size_bytes": 0}
 
         logger.info("Cache cleared")
@@ -275,6 +282,7 @@ class ASTCache:
 
             # Calculate memory usage
             memory_usage_mb = self.cache_stats["size_bytes"] / (1024 * 1024)
+            store = self.store
 
             # Entry statistics
             if self.memory_cache:
@@ -296,8 +304,10 @@ class ASTCache:
                 "cache_misses": self.cache_stats["misses"],
                 "invalidations": self.cache_stats["invalidations"],
                 "evictions": self.cache_stats["evictions"],
-                "entries_count": len(self.memory_cache),
+                "entries_count": store.live_count if store is not None else len(self.memory_cache),
+                "loaded_entries_count": len(self.memory_cache),
                 "memory_usage_mb": memory_usage_mb,
+                "pack_size_mb": store.pack_bytes / (1024 * 1024) if store is not None else 0.0,
                 "memory_limit_mb": self.max_size_bytes / (1024 * 1024),
                 "memory_utilization_percent": (memory_usage_mb / (self.max_size_bytes / (1024 * 1024))) * 100,
                 "avg_access_count": avg_access_count,
@@ -305,16 +315,24 @@ class ASTCache:
             }
 
     def optimize_cache(self):
-        """Optimize cache by removing stale entries and defragmenting."""
+        """Optimize cache by removing stale entries and compacting the pack file."""
 
         logger.info("Starting cache optimization")
         start_time = time.time()
 
         with self.cache_lock:
-            initial_count = len(self.memory_cache)
+            store = self.store
+            initial_count = self._entry_count()
 
             # Remove invalid entries
-            invalid_keys = [key for key, entry in self.memory_cache.items() if not entry.is_valid()]
+            invalid_keys = {key for key, entry in self.memory_cache.items() if not entry.is_valid()}
+            if store is not None:
+                for key, record in store.iter_records():
+                    if key.hex() in self.memory_cache:
+                        continue
+                    path = store.read_path(record)
+                    if path is None or not _file_matches(path, record.file_mtime, record.file_size):
+                        invalid_keys.add(key.hex())
 
             for key in invalid_keys:
                 self._remove_entry(key)
@@ -323,12 +341,12 @@ class ASTCache:
             # Enforce cache limits
             self._enforce_cache_limits()
 
-            # Persist cache index
-            if self.enable_persistence:
-                self._save_cache_index()
+            # Reclaim space left by removed and replaced entries
+            if store is not None and store.pack_bytes > store.live_bytes:
+                store.compact()
 
         optimization_time = time.time() - start_time
-        final_count = len(self.memory_cache)
+        final_count = self._entry_count()
         removed_count = initial_count - final_count
 
         logger.info(
@@ -411,49 +429,105 @@ class ASTCache:
         key_data = f"{file_path.absolute()}:{cache_type}"
         return hashlib.md5(key_data.encode()).hexdigest()
 
+    def _get_entry_data(self, key: str, file_path: Path, description: str) -> Optional[Any]:
+        """Return cached data for a key, loading it from the pack on first access."""
+
+        with self.cache_lock:
+            entry = self.memory_cache.get(key)
+            if entry is None:
+                entry = self._load_entry(key, file_path)
+
+            if entry and entry.is_valid():
+                entry.update_access()
+                self.cache_stats["hits"] += 1
+                logger.debug(f"Cache hit for {description}")
+                return entry.data
+            elif entry:
+                # Invalid entry, remove it
+                self._remove_entry(key)
+                self.cache_stats["invalidations"] += 1
+
+            self.cache_stats["misses"] += 1
+            return None
+
+    def _load_entry(self, key: str, file_path: Path) -> Optional[CacheEntry]:
+        """Decode a persisted entry into memory; stale entries are dropped undecoded."""
+
+        store = self.store
+        if store is None:
+            return None
+
+        record = store.lookup(bytes.fromhex(key))
+        if record is None:
+            return None
+
+        entry = None
+        if _file_matches(str(file_path), record.file_mtime, record.file_size):
+            try:
+                payload = store.read(record)
+                entry = pickle.loads(payload) if payload is not None else None
+            except Exception as e:
+                logger.warning(f"Failed to load cache entry {key}: {e}")
+
+        if entry is None:
+            store.delete(bytes.fromhex(key))
+            self.cache_stats["invalidations"] += 1
+            return None
+
+        entry.accessed_at = time.time()
+        self.memory_cache[key] = entry
+        self._entry_sizes[key] = record.length
+        self.cache_stats["size_bytes"] += record.length
+        self._enforce_cache_limits()
+        return entry
+
+    def _entry_count(self) -> int:
+        store = self.store
+        return store.live_count if store is not None else len(self.memory_cache)
+
     def _add_entry(self, key: str, entry: CacheEntry):
         """Add entry to cache."""
 
-        # Calculate entry size (rough estimate)
-        try:
-            entry_size = len(pickle.dumps(entry.data))
-        except Exception:
-            entry_size = 1024  # Default estimate
+        payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
 
+        # Persisted entries are charged by their size in the pack
+        store = self.store
+        if store is not None:
+            entry_size = store.put(bytes.fromhex(key), payload, entry.file_path, entry.file_mtime, entry.file_size)
+        else:
+            entry_size = len(payload)
+
+        self._drop_loaded(key)
         self.memory_cache[key] = entry
+        self._entry_sizes[key] = entry_size
         self.cache_stats["size_bytes"] += entry_size
 
-        # Persist to disk if enabled
-        if self.enable_persistence:
-            self._persist_entry(key, entry)
+    def _drop_loaded(self, key: str):
+        """Forget the decoded copy of an entry, keeping it on disk."""
+
+        if self.memory_cache.pop(key, None) is not None:
+            self.cache_stats["size_bytes"] -= self._entry_sizes.pop(key, 0)
 
     def _remove_entry(self, key: str):
         """Remove entry from cache."""
 
-        if key in self.memory_cache:
-            entry = self.memory_cache[key]
+        self._drop_loaded(key)
+        if self._store is not None:
+            self._store.delete(bytes.fromhex(key))
 
-            # Estimate size reduction
-            try:
-                entry_size = len(pickle.dumps(entry.data))
-            except Exception:
-                entry_size = 1024
-
-            del self.memory_cache[key]
-            self.cache_stats["size_bytes"] -= entry_size
+    def _sync_access_times(self):
+        """Write access times of loaded entries back to the index for LRU eviction."""
 
-            # Remove from disk if enabled
-            if self.enable_persistence:
-                cache_file = self.cache_dir / f"{key}.cache"
-                try:
-                    if cache_file.exists():
-                        cache_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to delete cache file {cache_file}: {e}")
+        for key, entry in self.memory_cache.items():
+            self._store.touch(bytes.fromhex(key), entry.accessed_at)
 
     def _enforce_cache_limits(self):
         """Enforce cache size and entry count limits."""
 
+        store = self.store
+        # Without persistence dropping a decoded entry loses it
+        release = self._drop_loaded if store is not None else self._remove_entry
+
         # Check entry count limit
         if len(self.memory_cache) > self.max_entries:
             # Remove least recently used entries
@@ -461,8 +535,9 @@ class ASTCache:
 
             entries_to_remove = len(self.memory_cache) - self.max_entries
             for key, _ in lru_entries[:entries_to_remove]:
-                self._remove_entry(key)
-                self.cache_stats["evictions"] += 1
+                release(key)
+                if store is None:
+                    self.cache_stats["evictions"] += 1
 
         # Check memory size limit
         if self.cache_stats["size_bytes"] > self.max_size_bytes:
@@ -472,79 +547,17 @@ class ASTCache:
             for key, _ in lru_entries:
                 if self.cache_stats["size_bytes"] <= self.max_size_bytes * 0.9:
                     break
-                self._remove_entry(key)
+                release(key)
+                if store is None:
+                    self.cache_stats["evictions"] += 1
+
+        # Evict persisted entries by size and count
+        if store is not None and (store.live_bytes > self.max_size_bytes or store.live_count > self.max_entries):
+            self._sync_access_times()
+            for key in store.evict(self.max_size_bytes, self.max_entries):
+                self._drop_loaded(key.hex())
                 self.cache_stats["evictions"] += 1
 
-    def _persist_entry(self, key: str, entry: CacheEntry):
-        """Persist cache entry to disk."""
-
-        try:
-            cache_file = self.cache_dir / f"{key}.cache"
-
-            with open(cache_file, "wb") as f:
-                if self.enable_compression:
-                    import gzip
-
-                    with gzip.open(f, "wb") as gf:
-                        pickle.dump(entry, gf)
-                else:
-                    pickle.dump(entry, f)
-
-        except Exception as e:
-            logger.warning(f"Failed to persist cache entry {key}: {e}")
-
-    def _load_cache_index(self):
-        """Load cache entries from disk."""
-
-        if not self.cache_dir.exists():
-            return
-
-        loaded_count = 0
-        failed_count = 0
-
-        for cache_file in self.cache_dir.glob("*.cache"):
-            try:
-                key = cache_file.stem
-
-                with open(cache_file, "rb") as f:
-                    if self.enable_compression:
-                        import gzip
-
-                        with gzip.open(f, "rb") as gf:
-                            entry = pickle.load(gf)
-                    else:
-                        entry = pickle.load(f)
-
-                # Validate entry
-                if entry.is_valid():
-                    self.memory_cache[key] = entry
-                    loaded_count += 1
-                else:
-                    # Remove invalid cache file
-                    cache_file.unlink()
-                    failed_count += 1
-
-            except Exception as e:
-                logger.warning(f"Failed to load cache file {cache_file}: {e}")
-                failed_count += 1
-
-        if loaded_count > 0:
-            logger.info(f"Loaded {loaded_count} cache entries from disk ({failed_count} invalid)")
-
-    def _save_cache_index(self):
-        """Save current cache entries to disk."""
-
-        saved_count = 0
-
-        for key, entry in self.memory_cache.items():
-            try:
-                self._persist_entry(key, entry)
-                saved_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to save cache entry {key}: {e}")
-
-        logger.debug(f"Saved {saved_count} cache entries to disk")
-
     def get_python_files(self, project_path: str) -> List[Path]:
         """
         Get all Python files in project directory.
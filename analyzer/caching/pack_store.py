@@ -0,0 +1,541 @@
+# SPDX-License-Identifier: MIT
+"""
+Pack-File Cache Store
+=====================
+
+On-disk storage behind ``ASTCache``: one append-only pack file holding the
+encoded entries and a fixed-size, open-addressing hash index that is
+memory-mapped on open.
+
+- Opening maps the index and reads its header only, so it is O(1) in the
+  number of entries; nothing is decoded until it is asked for
+- A lookup probes index slots in place; the entry's file mtime/size live in
+  the slot, so stale entries are rejected without decoding them
+- Payloads use lz4 when installed, otherwise zlib level 1
+- Deletions leave garbage in the pack; ``compact`` rewrites the live records
+  once garbage outweighs live data
+- ``evict`` drops least recently accessed entries down to a size or count
+- Appends and index rewrites hold an exclusive lock on ``<name>.lock`` so
+  several processes can share one cache directory
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
+import logging
+import mmap
+import os
+from pathlib import Path
+import struct
+import threading
+import time
+from typing import Iterator, List, Optional, Tuple, Union
+import zlib
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+INDEX_MAGIC = b"CNXPACK1"
+INDEX_VERSION = 1
+# magic, version, capacity, live count, used slots (live + deleted), live bytes
+HEADER = struct.Struct("<8sIIIIQ")
+# key, offset, length, state, codec, file mtime, file size, accessed at, path key
+SLOT = struct.Struct("<16sQIBB2xdQdQ")
+# Each pack record is the source file path (length-prefixed) followed by the payload
+PATH_PREFIX = struct.Struct("<H")
+
+SLOT_EMPTY = 0
+SLOT_LIVE = 1
+SLOT_DELETED = 2
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+CODEC_LZ4 = 2
+
+INITIAL_CAPACITY = 1024
+# Grow the index before probe chains get long
+MAX_LOAD_FACTOR = 0.7
+# Compact once at least this much of the pack is garbage
+COMPACT_MIN_GARBAGE_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class PackRecord:
+    """Index slot of one live entry."""
+
+    slot: int
+    offset: int
+    length: int
+    codec: int
+    file_mtime: float
+    file_size: int
+    accessed_at: float
+    path_key: int
+
+
+def path_key(file_path: str) -> int:
+    """Stable 64-bit key of a file path, kept in the index for invalidation."""
+    return int.from_bytes(hashlib.md5(file_path.encode()).digest()[:8], "little")
+
+
+def encode_payload(data: bytes, compress: bool) -> Tuple[int, bytes]:
+    """Compress ``data`` with the fastest available codec."""
+    if not compress:
+        return CODEC_RAW, data
+    if lz4_frame is not None:
+        return CODEC_LZ4, lz4_frame.compress(data)
+    return CODEC_ZLIB, zlib.compress(data, 1)
+
+
+def decode_payload(codec: int, data: bytes) -> bytes:
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    if codec == CODEC_LZ4:
+        if lz4_frame is None:
+            raise ValueError("entry was written with lz4, which is not installed")
+        return lz4_frame.decompress(data)
+    return data
+
+
+class PackStore:
+    """
+    Append-only pack file with a memory-mapped hash index.
+
+    Keys are 16-byte digests. Writers in several processes are serialized by
+    an inter-process file lock; each writer first picks up what the others
+    appended or rewrote. Lookups and reads take no file lock; an index or pack
+    replaced by another process is picked up on this store's next write.
+    """
+
+    def __init__(self, directory: Union[str, Path], name: str = "ast_cache", compress: bool = True):
+        self.directory = Path(directory)
+        self.pack_path = self.directory / f"{name}.pack"
+        self.index_path = self.directory / f"{name}.idx"
+        self.lock_path = self.directory / f"{name}.lock"
+        self.compress = compress
+        self._lock = threading.RLock()
+        self._index: Optional[mmap.mmap] = None
+        self._index_identity: Optional[Tuple[int, int]] = None
+        self._pack_fd: Optional[int] = None
+        self._pack_identity: Optional[Tuple[int, int]] = None
+        self._pack_size = 0
+        self._lock_fd: Optional[int] = None
+        self._lock_depth = 0
+        with self._exclusive():
+            pass
+
+    # ------------------------------------------------------------------
+    # Open / close
+    # ------------------------------------------------------------------
+
+    def _open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not self._index_is_usable():
+            self._write_empty_index(self.index_path, INITIAL_CAPACITY)
+            with open(self.pack_path, "wb"):
+                pass
+        self._map_index()
+        self._pack_fd = os.open(self.pack_path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0))
+        stat = os.fstat(self._pack_fd)
+        self._pack_identity = (stat.st_dev, stat.st_ino)
+        self._pack_size = stat.st_size
+
+    def _index_is_usable(self) -> bool:
+        try:
+            with open(self.index_path, "rb") as handle:
+                header = handle.read(HEADER.size)
+            magic, version, capacity, *_ = HEADER.unpack(header)
+            expected = HEADER.size + capacity * SLOT.size
+            return (
+                magic == INDEX_MAGIC
+                and version == INDEX_VERSION
+                and os.path.getsize(self.index_path) == expected
+                and self.pack_path.exists()
+            )
+        except (OSError, struct.error):
+            return False
+
+    @staticmethod
+    def _write_empty_index(path: Path, capacity: int) -> None:
+        with open(path, "wb") as handle:
+            handle.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, capacity, 0, 0, 0))
+            handle.truncate(HEADER.size + capacity * SLOT.size)
+
+    def _map_index(self) -> None:
+        with open(self.index_path, "r+b") as handle:
+            self._index = mmap.mmap(handle.fileno(), 0)
+            stat = os.fstat(handle.fileno())
+        self._index_identity = (stat.st_dev, stat.st_ino)
+        self._read_header()
+
+    def _read_header(self) -> None:
+        _, _, self._capacity, self._live, self._used, self._live_bytes = HEADER.unpack_from(self._index, 0)
+
+    def _write_header(self) -> None:
+        HEADER.pack_into(
+            self._index, 0, INDEX_MAGIC, INDEX_VERSION, self._capacity, self._live, self._used, self._live_bytes
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_files()
+            if self._lock_fd is not None and self._lock_depth == 0:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    def _close_files(self) -> None:
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self._pack_fd is not None:
+            os.close(self._pack_fd)
+            self._pack_fd = None
+
+    # ------------------------------------------------------------------
+    # Inter-process locking
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """
+        Hold the thread lock and the inter-process file lock.
+
+        The outermost holder takes the file lock and then syncs with changes
+        other processes made since this store last looked; nested holders
+        reuse it.
+        """
+        with self._lock:
+            outermost = self._lock_depth == 0
+            if outermost:
+                self._lock_file()
+            self._lock_depth += 1
+            try:
+                if outermost:
+                    self._sync()
+                yield
+            finally:
+                self._lock_depth -= 1
+                if outermost:
+                    self._unlock_file()
+
+    def _lock_file(self) -> None:
+        if self._lock_fd is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            os.lseek(self._lock_fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._lock_fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            os.lseek(self._lock_fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._lock_fd, msvcrt.LK_UNLCK, 1)
+
+    def _sync(self) -> None:
+        """Reopen files another process replaced; re-read the counters it changed in place."""
+        if self._index is None or self._pack_fd is None:
+            self._close_files()
+            self._open()
+            return
+        try:
+            index_stat = os.stat(self.index_path)
+            pack_stat = os.stat(self.pack_path)
+        except OSError:
+            index_stat = pack_stat = None
+        if (
+            index_stat is None
+            or (index_stat.st_dev, index_stat.st_ino) != self._index_identity
+            or (pack_stat.st_dev, pack_stat.st_ino) != self._pack_identity
+            or index_stat.st_size != len(self._index)
+        ):
+            self._close_files()
+            self._open()
+            return
+        self._read_header()
+        self._pack_size = os.fstat(self._pack_fd).st_size
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _probe(self, key: bytes) -> Tuple[int, bool]:
+        """Slot holding ``key``, or the slot to insert it into (found flag)."""
+        capacity = self._capacity
+        slot = int.from_bytes(key[:8], "little") % capacity
+        first_free = -1
+        index = self._index
+        for _ in range(capacity):
+            position = HEADER.size + slot * SLOT.size
+            state = index[position + 28]
+            if state == SLOT_EMPTY:
+                return (first_free if first_free >= 0 else slot), False
+            if state == SLOT_DELETED:
+                if first_free < 0:
+                    first_free = slot
+            elif index[position : position + 16] == key:
+                return slot, True
+            slot = (slot + 1) % capacity
+        return first_free, False
+
+    def _record(self, slot: int) -> PackRecord:
+        _, offset, length, _, codec, mtime, size, accessed, path_hash = SLOT.unpack_from(
+            self._index, HEADER.size + slot * SLOT.size
+        )
+        return PackRecord(slot, offset, length, codec, mtime, size, accessed, path_hash)
+
+    def lookup(self, key: bytes) -> Optional[PackRecord]:
+        """Index record for ``key`` without reading its payload."""
+        with self._lock:
+            slot, found = self._probe(key)
+            return self._record(slot) if found else None
+
+    def read(self, record: PackRecord) -> Optional[bytes]:
+        """Decoded payload of a record (None if the pack is truncated)."""
+        if record.offset + record.length > self._pack_size:
+            return None
+        with self._lock:
+            data = self._read_raw(record)
+        (path_length,) = PATH_PREFIX.unpack_from(data)
+        return decode_payload(record.codec, data[PATH_PREFIX.size + path_length :])
+
+    def read_path(self, record: PackRecord) -> Optional[str]:
+        """Source file path of a record, without reading its payload."""
+        if record.offset + record.length > self._pack_size:
+            return None
+        with self._lock:
+            (path_length,) = PATH_PREFIX.unpack(self._read_raw(record, PATH_PREFIX.size))
+            path = self._read_raw(record, path_length, PATH_PREFIX.size)
+        return path.decode("utf-8", errors="surrogateescape")
+
+    def touch(self, key: bytes, accessed_at: Optional[float] = None) -> bool:
+        """Record an access for LRU eviction."""
+        with self._lock:
+            slot, found = self._probe(key)
+            if found:
+                struct.pack_into("<d", self._index, HEADER.size + slot * SLOT.size + 48, accessed_at or time.time())
+            return found
+
+    def iter_records(self) -> Iterator[Tuple[bytes, PackRecord]]:
+        """Every live entry, in slot order."""
+        with self._lock:
+            records = []
+            for slot, fields in enumerate(SLOT.iter_unpack(self._index[HEADER.size :])):
+                if fields[3] == SLOT_LIVE:
+                    key, offset, length, _, codec, mtime, size, accessed, path_hash = fields
+                    records.append((key, PackRecord(slot, offset, length, codec, mtime, size, accessed, path_hash)))
+        return iter(records)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def put(self, key: bytes, payload: bytes, file_path: str, file_mtime: float, file_size: int) -> int:
+        """
+        Append an entry, replacing any previous one with the same key.
+
+        Returns:
+            Number of bytes the entry occupies in the pack
+        """
+        codec, encoded = encode_payload(payload, self.compress)
+        path = file_path.encode("utf-8", errors="surrogateescape")
+        data = PATH_PREFIX.pack(len(path)) + path + encoded
+        with self._exclusive():
+            if self._used + 1 > self._capacity * MAX_LOAD_FACTOR:
+                self._rebuild_index(self._target_capacity(self._live + 1))
+
+            offset = self._pack_size
+            os.lseek(self._pack_fd, offset, os.SEEK_SET)
+            os.write(self._pack_fd, data)
+            self._pack_size += len(data)
+
+            slot, found = self._probe(key)
+            if found:
+                self._live_bytes -= self._record(slot).length
+            else:
+                if self._index[HEADER.size + slot * SLOT.size + 28] == SLOT_EMPTY:
+                    self._used += 1
+                self._live += 1
+            self._live_bytes += len(data)
+            SLOT.pack_into(
+                self._index,
+                HEADER.size + slot * SLOT.size,
+                key,
+                offset,
+                len(data),
+                SLOT_LIVE,
+                codec,
+                file_mtime,
+                file_size,
+                time.time(),
+                path_key(file_path),
+            )
+            self._write_header()
+        return len(data)
+
+    def delete(self, key: bytes) -> bool:
+        with self._exclusive():
+            slot, found = self._probe(key)
+            if not found:
+                return False
+            self._delete_slot(slot)
+            self._write_header()
+            return True
+
+    def _delete_slot(self, slot: int) -> None:
+        position = HEADER.size + slot * SLOT.size
+        self._live_bytes -= self._record(slot).length
+        self._live -= 1
+        self._index[position + 28] = SLOT_DELETED
+
+    def evict(self, max_bytes: int, max_entries: int, keep_ratio: float = 0.9) -> List[bytes]:
+        """
+        Drop least recently accessed entries once a limit is exceeded.
+
+        Returns:
+            Keys of the evicted entries
+        """
+        with self._exclusive():
+            if self._live_bytes <= max_bytes and self._live <= max_entries:
+                return []
+            byte_target = max_bytes * keep_ratio if self._live_bytes > max_bytes else max_bytes
+            records = sorted(self.iter_records(), key=lambda item: item[1].accessed_at)
+            evicted = []
+            for key, record in records:
+                if self._live_bytes <= byte_target and self._live <= max_entries:
+                    break
+                self._delete_slot(record.slot)
+                evicted.append(key)
+            self._write_header()
+        self.maybe_compact()
+        return evicted
+
+    def clear(self) -> None:
+        with self._exclusive():
+            self._close_files()
+            # Replace rather than truncate: other processes still map the old index
+            index_tmp = self._temporary(self.index_path)
+            pack_tmp = self._temporary(self.pack_path)
+            self._write_empty_index(index_tmp, INITIAL_CAPACITY)
+            with open(pack_tmp, "wb"):
+                pass
+            os.replace(pack_tmp, self.pack_path)
+            os.replace(index_tmp, self.index_path)
+            self._open()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    @property
+    def live_count(self) -> int:
+        return self._live
+
+    @property
+    def live_bytes(self) -> int:
+        return self._live_bytes
+
+    @property
+    def pack_bytes(self) -> int:
+        return self._pack_size
+
+    def maybe_compact(self) -> bool:
+        """Compact when garbage outweighs live data and is worth reclaiming."""
+        garbage = self._pack_size - self._live_bytes
+        if garbage >= COMPACT_MIN_GARBAGE_BYTES and garbage > self._live_bytes:
+            self.compact()
+            return True
+        return False
+
+    def compact(self) -> None:
+        """Rewrite the pack with live records only and rebuild the index."""
+        with self._exclusive():
+            records = list(self.iter_records())
+            capacity = self._target_capacity(len(records))
+            pack_tmp = self._temporary(self.pack_path)
+            index_tmp = self._temporary(self.index_path)
+
+            rewritten = []
+            offset = 0
+            with open(pack_tmp, "wb") as pack:
+                for key, record in records:
+                    data = self._read_raw(record)
+                    pack.write(data)
+                    rewritten.append((key, record, offset))
+                    offset += len(data)
+
+            self._write_index_file(index_tmp, capacity, rewritten)
+            self._close_files()
+            os.replace(pack_tmp, self.pack_path)
+            os.replace(index_tmp, self.index_path)
+            self._open()
+        logger.debug(f"Compacted cache pack to {offset} bytes ({len(records)} entries)")
+
+    def _read_raw(self, record: PackRecord, length: Optional[int] = None, skip: int = 0) -> bytes:
+        length = record.length if length is None else length
+        if hasattr(os, "pread"):
+            return os.pread(self._pack_fd, length, record.offset + skip)
+        os.lseek(self._pack_fd, record.offset + skip, os.SEEK_SET)  # pragma: no cover - Windows
+        return os.read(self._pack_fd, length)  # pragma: no cover - Windows
+
+    def _rebuild_index(self, capacity: int) -> None:
+        """Re-hash live slots into a fresh index (drops deleted markers)."""
+        records = [(key, record, record.offset) for key, record in self.iter_records()]
+        index_tmp = self._temporary(self.index_path)
+        self._write_index_file(index_tmp, capacity, records)
+        self._index.close()
+        os.replace(index_tmp, self.index_path)
+        self._map_index()
+
+    @staticmethod
+    def _temporary(path: Path) -> Path:
+        return path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+    @staticmethod
+    def _target_capacity(live: int) -> int:
+        capacity = INITIAL_CAPACITY
+        while live > capacity * MAX_LOAD_FACTOR / 2:
+            capacity *= 2
+        return capacity
+
+    @staticmethod
+    def _write_index_file(path: Path, capacity: int, records: List[Tuple[bytes, PackRecord, int]]) -> None:
+        table = bytearray(capacity * SLOT.size)
+        live_bytes = 0
+        for key, record, offset in records:
+            slot = int.from_bytes(key[:8], "little") % capacity
+            while table[slot * SLOT.size + 28] != SLOT_EMPTY:
+                slot = (slot + 1) % capacity
+            SLOT.pack_into(
+                table,
+                slot * SLOT.size,
+                key,
+                offset,
+                record.length,
+                SLOT_LIVE,
+                record.codec,
+                record.file_mtime,
+                record.file_size,
+                record.accessed_at,
+                record.path_key,
+            )
+            live_bytes += record.length
+        with open(path, "wb") as handle:
+            handle.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, capacity, len(records), len(records), live_bytes))
+            handle.write(table)
+
+
+__all__ = ["PackRecord", "PackStore", "decode_payload", "encode_payload", "path_key"]
@@ -9,6 +9,7 @@ NASA Rule 5 Compliant: Input assertions
 """
 
 import ast
+import io
 import logging
 from pathlib import Path
 import sys
@@ -230,8 +231,6 @@ class ClarityLinter:
         assert file_path.exists(), f"file_path must exist: {file_path}"
         assert file_path.is_file(), f"file_path must be file: {file_path}"
 
-        violations = []
-
         try:
             # Read and parse file
             with open(file_path, encoding='utf-8') as f:
@@ -239,14 +238,55 @@ class ClarityLinter:
 
             tree = ast.parse(source_code, filename=str(file_path))
 
+        except SyntaxError as e:
+            # Skip files with syntax errors
+            logger.warning("Syntax error in %s: %s", file_path, e)
+            return []
+        except Exception as e:
+            # Log other errors but continue
+            logger.error("Failed to analyze %s: %s", file_path, e)
+            return []
+
+        return self.analyze_source(file_path, source_code, tree)
+
+    def analyze_source(
+        self,
+        file_path: Path,
+        source_code: str,
+        tree: ast.Module
+    ) -> List[ClarityViolation]:
+        """
+        Run all enabled detectors on a file that is already read and parsed.
+
+        Lets callers such as the unified quality gate share one read and one
+        parse of each file across several analyzers.
+
+        NASA Rule 4: Function under 60 lines
+        NASA Rule 5: Input validation assertions
+
+        Args:
+            file_path: Path the source was read from
+            source_code: File contents
+            tree: AST parsed from ``source_code``
+
+        Returns:
+            List of violations found in file
+        """
+        # NASA Rule 5: Input validation
+        assert isinstance(source_code, str), "source_code must be string"
+        assert isinstance(tree, ast.Module), "tree must be ast.Module"
+
+        file_path = Path(file_path)
+        # Same line splitting as file.readlines(), without touching the disk again
+        source_lines = io.StringIO(source_code).readlines()
+        violations = []
+
+        try:
             # Run each enabled detector
             for detector in self.detectors:
-                detector_violations = detector.detect(tree, file_path)
+                detector_violations = detector.detect_source(tree, file_path, source_lines)
                 violations.extend(detector_violations)
 
-        except SyntaxError as e:
-            # Skip files with syntax errors
-            logger.warning("Syntax error in %s: %s", file_path, e)
         except Exception as e:
             # Log other errors but continue
             logger.error("Failed to analyze %s: %s", file_path, e)
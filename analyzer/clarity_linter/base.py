@@ -11,10 +11,43 @@ NASA Rule 5 Compliant: Input assertions
 from abc import ABC, abstractmethod
 import ast
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from analyzer.clarity_linter.models import ClarityViolation
 
+# Per-tree cache of ast.walk order, filtered by node type(s); set on the tree root
+_NODE_INDEX_ATTR = "_clarity_node_index"
+
+NodeTypes = Union[Type[ast.AST], Tuple[Type[ast.AST], ...]]
+
+
+def iter_nodes(tree: ast.AST, node_types: NodeTypes) -> List[ast.AST]:
+    """
+    Return all nodes of the given type(s) in ``ast.walk`` order.
+
+    The tree is walked once and the result cached on the root node, so every
+    detector running against the same parsed module shares a single traversal.
+
+    NASA Rule 4: Function under 60 lines
+
+    Args:
+        tree: Parsed AST tree
+        node_types: Node type or tuple of node types to select
+
+    Returns:
+        Matching nodes in breadth-first walk order
+    """
+    index = getattr(tree, _NODE_INDEX_ATTR, None)
+    if index is None:
+        index = {None: list(ast.walk(tree))}
+        setattr(tree, _NODE_INDEX_ATTR, index)
+
+    nodes = index.get(node_types)
+    if nodes is None:
+        nodes = [node for node in index[None] if isinstance(node, node_types)]
+        index[node_types] = nodes
+    return nodes
+
 
 class BaseClarityDetector(ABC):
     """
@@ -147,6 +180,30 @@ class BaseClarityDetector(ABC):
         """
         pass
 
+    def detect_source(
+        self,
+        tree: ast.Module,
+        file_path: Path,
+        source_lines: List[str]
+    ) -> List[ClarityViolation]:
+        """
+        Detect violations when the caller already holds the file contents.
+
+        Detectors that need raw source lines override this to avoid reading
+        the file again; AST-only detectors simply delegate to ``detect``.
+
+        NASA Rule 4: Function under 60 lines
+
+        Args:
+            tree: Parsed AST tree to analyze
+            file_path: Path to file being analyzed
+            source_lines: File contents as ``readlines()`` would return them
+
+        Returns:
+            List of clarity violations found
+        """
+        return self.detect(tree, file_path)
+
     def get_code_snippet(
         self,
         file_path: Path,
@@ -277,4 +334,4 @@ class BaseClarityDetector(ABC):
         }
 
 
-__all__ = ['BaseClarityDetector']
+__all__ = ['BaseClarityDetector', 'iter_nodes']
@@ -0,0 +1,669 @@
+# SPDX-License-Identifier: MIT
+"""Opt-in background daemon that keeps CLI analyzers warm between invocations.
+
+Each ``connascence`` invocation normally starts a fresh interpreter, rebuilds
+``SharedCLIAnalyzer`` and re-reads policy presets with empty caches. With
+``--daemon`` (or ``CONNASCENCE_DAEMON=1``) the CLI instead forwards its argv
+over a Unix domain socket to a long-lived server that reuses one CLI instance,
+its per-profile analyzers and the per-file result cache (invalidated by
+mtime/size, then content hash). Output is streamed back line by line, so every
+output format behaves exactly as it does in-process.
+
+Cached results are only reused for the same code and configuration: the
+client restarts a daemon whose code fingerprint (package version plus the
+stat signature of the analyzer sources) differs from its own, forwards its
+``CONNASCENCE_*`` environment, and sends a digest of the config files in
+effect, which the daemon adds to the result cache key.
+
+Protocol: newline-delimited JSON. A request is
+``{"argv": [...], "cwd": ..., "cli": "connascence" | "simple", "env": {...},
+"version": ..., "config_digest": ...}``
+or ``{"command": "ping" | "stats" | "shutdown"}``; responses are
+``{"stream": "stdout" | "stderr", "data": ...}`` chunks followed by a final
+``{"exit_code": N}`` (or a single JSON object for commands).
+
+This module only imports the standard library at the top level so the client
+path stays cheap; the analyzer stack is loaded inside the daemon process.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+from pathlib import Path
+import socket
+import socketserver
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+DAEMON_ENV_VAR = "CONNASCENCE_DAEMON"
+SOCKET_ENV_VAR = "CONNASCENCE_DAEMON_SOCKET"
+DEFAULT_IDLE_TIMEOUT_SECONDS = 900.0
+CONNECT_TIMEOUT_SECONDS = 0.5
+STARTUP_TIMEOUT_SECONDS = 10.0
+PROJECT_ROOT = Path(__file__).parent.parent
+PACKAGE_NAME = "connascence-analyzer"
+# Packages whose sources decide the results a daemon serves
+CODE_PACKAGES = ("analyzer", "policy", "interfaces", "utils", "config", "grammar", "fixes")
+# Config files the CLI discovers by walking up from the working directory
+CONFIG_FILENAMES = (".connascence.yml", ".connascence.yaml", "pyproject.toml", "setup.cfg", ".connascence.cfg")
+# Options whose value may name a file that changes the analysis
+CONFIG_FILE_OPTIONS = ("--config", "--policy", "--baseline")
+FORWARDED_ENV_PREFIX = "CONNASCENCE_"
+# Client-side daemon controls that do not affect results
+LOCAL_ENV_VARS = frozenset({"CONNASCENCE_DAEMON", "CONNASCENCE_DAEMON_SOCKET"})
+
+DAEMON_SUPPORTED = hasattr(socket, "AF_UNIX")
+
+
+def _current_uid() -> int:
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+def _fallback_socket_dir() -> Path:
+    return Path(tempfile.gettempdir()) / f"connascence-cli-{_current_uid()}"
+
+
+def default_socket_path() -> Path:
+    """
+    Per-user socket path (overridable through ``CONNASCENCE_DAEMON_SOCKET``).
+
+    Lives in ``$XDG_RUNTIME_DIR`` when set, otherwise in a private (0700)
+    per-user directory under the temp dir, so other users cannot pre-create
+    or connect to it.
+    """
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return Path(runtime_dir) / "connascence-cli.sock"
+    return _fallback_socket_dir() / "daemon.sock"
+
+
+def _ensure_private_dir(directory: Path) -> None:
+    """Create ``directory`` as 0700, or check an existing one is ours and private."""
+    with contextlib.suppress(FileExistsError):
+        directory.mkdir(mode=0o700, parents=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != _current_uid():
+        raise PermissionError(f"Daemon socket directory {directory} is not owned by the current user")
+    if info.st_mode & 0o077:
+        os.chmod(directory, 0o700)
+
+
+def _socket_owned_by_user(socket_path: Path) -> bool:
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == _current_uid()
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """Uid of the process at the other end of ``sock`` (None where unsupported)."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", credentials)
+    return uid
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover - Python < 3.8
+        return "unknown"
+    try:
+        return version(PACKAGE_NAME)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def code_fingerprint(root: Path = PROJECT_ROOT) -> str:
+    """
+    Identify the analyzer code a process runs.
+
+    Hashes the package version with the path, mtime and size of every source
+    file, so an upgrade or a local edit yields a new fingerprint without
+    reading the sources.
+    """
+    digest = hashlib.sha256(_package_version().encode("utf-8"))
+    for package in CODE_PACKAGES:
+        for path in sorted((root / package).rglob("*.py")):
+            with contextlib.suppress(OSError):
+                info = path.stat()
+                digest.update(f"{path.relative_to(root)}:{info.st_mtime_ns}:{info.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def forwarded_environment(environ: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """The ``CONNASCENCE_*`` variables a request carries to the daemon."""
+    environ = os.environ if environ is None else environ
+    return {
+        name: value
+        for name, value in environ.items()
+        if name.startswith(FORWARDED_ENV_PREFIX) and name not in LOCAL_ENV_VARS
+    }
+
+
+def _config_files(argv: List[str], cwd: Path) -> List[Path]:
+    found = []
+    for filename in CONFIG_FILENAMES:
+        for directory in (cwd, *cwd.parents):
+            candidate = directory / filename
+            if candidate.is_file():
+                found.append(candidate)
+                break
+    for index, arg in enumerate(argv):
+        option, separator, value = arg.partition("=")
+        if option not in CONFIG_FILE_OPTIONS:
+            continue
+        if not separator:
+            value = argv[index + 1] if index + 1 < len(argv) else ""
+        if value and (cwd / value).is_file():
+            found.append(cwd / value)
+    return found
+
+
+def config_digest(argv: List[str], cwd: str, env: Dict[str, str]) -> str:
+    """
+    Digest of the configuration an invocation runs under.
+
+    Covers the discovered config files, any config/policy/baseline file named
+    on the command line and the forwarded environment.
+    """
+    digest = hashlib.sha256()
+    for name, value in sorted(env.items()):
+        digest.update(f"env:{name}={value}\n".encode("utf-8"))
+    for path in _config_files(argv, Path(cwd)):
+        digest.update(f"file:{path}\n".encode("utf-8"))
+        with contextlib.suppress(OSError):
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+@contextlib.contextmanager
+def _applied_environment(env: Optional[Dict[str, str]]):
+    """Replace the process's forwarded variables with ``env`` for one invocation."""
+    if env is None:
+        yield
+        return
+    previous = forwarded_environment()
+    for name in previous:
+        del os.environ[name]
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        for name in forwarded_environment():
+            del os.environ[name]
+        os.environ.update(previous)
+
+
+def daemon_requested(argv: List[str]) -> bool:
+    """Check whether the invocation opted into daemon mode."""
+    if "--daemon" in argv:
+        return True
+    return os.environ.get(DAEMON_ENV_VAR, "").lower() in {"1", "true", "yes", "on"}
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+class _StreamWriter(io.TextIOBase):
+    """File-like object that forwards writes as protocol chunks."""
+
+    def __init__(self, stream: str, send: Callable[[Dict[str, Any]], None]):
+        self._stream = stream
+        self._send = send
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str) -> int:
+        if data:
+            self._send({"stream": self._stream, "data": data})
+        return len(data)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "CLIDaemonServer"
+
+    def handle(self) -> None:
+        peer_uid = _peer_uid(self.connection)
+        if peer_uid is not None and peer_uid != _current_uid():
+            logger.warning(f"Rejected CLI daemon connection from uid {peer_uid}")
+            return
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            self._send({"error": "malformed request", "exit_code": 2})
+            return
+        self.server.dispatch(request, self._send)
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        try:
+            self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class CLIDaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server running CLI invocations against warm analyzers."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Path,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        cli_factories: Optional[Dict[str, Callable[[], Any]]] = None,
+    ):
+        """
+        Bind the daemon socket.
+
+        Args:
+            socket_path: Unix socket to listen on (replaced if stale)
+            idle_timeout: Seconds without requests before shutting down
+            cli_factories: Builders for the CLI instances reused across
+                requests, keyed by the request's ``cli`` field
+        """
+        self.socket_path = Path(socket_path)
+        self.idle_timeout = idle_timeout
+        self._cli_factories = cli_factories or dict(DEFAULT_CLI_FACTORIES)
+        self._clis: Dict[str, Any] = {}
+        # Invocations redirect process-wide stdout/stderr and cwd, so they run one at a time
+        self._run_lock = threading.Lock()
+        self._last_activity = time.monotonic()
+        self._requests_served = 0
+        self._started_at = time.time()
+        self.version = code_fingerprint()
+
+        if self.socket_path.parent == _fallback_socket_dir():
+            _ensure_private_dir(self.socket_path.parent)
+        if self.socket_path.is_socket():
+            self.socket_path.unlink()
+        # Create the socket 0600 from the start; chmod after bind leaves a window
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def dispatch(self, request: Dict[str, Any], send: Callable[[Dict[str, Any]], None]) -> None:
+        """Handle one decoded request."""
+        self._last_activity = time.monotonic()
+        command = request.get("command")
+        if command == "ping":
+            send({"status": "ok", "pid": os.getpid(), "version": self.version})
+        elif command == "stats":
+            send(self.get_stats())
+        elif command == "shutdown":
+            send({"status": "stopping"})
+            threading.Thread(target=self.shutdown, daemon=True).start()
+        elif "argv" in request:
+            cli_name = request.get("cli", "connascence")
+            if cli_name not in self._cli_factories:
+                send({"error": f"unknown cli {cli_name!r}", "exit_code": 2})
+            elif request.get("version", self.version) != self.version:
+                # The client falls back to running in-process
+                send({"error": "daemon version mismatch", "version_mismatch": True, "exit_code": 2})
+            else:
+                exit_code = self.run_cli(
+                    request["argv"],
+                    request.get("cwd"),
+                    send,
+                    cli_name,
+                    env=request.get("env"),
+                    digest=request.get("config_digest", ""),
+                )
+                send({"exit_code": exit_code})
+        else:
+            send({"error": f"unknown request {request!r}", "exit_code": 2})
+        self._last_activity = time.monotonic()
+
+    def run_cli(
+        self,
+        argv: List[str],
+        cwd: Optional[str],
+        send: Callable[[Dict[str, Any]], None],
+        cli_name: str = "connascence",
+        env: Optional[Dict[str, str]] = None,
+        digest: str = "",
+    ) -> int:
+        """
+        Run one CLI invocation, streaming its output through ``send``.
+
+        Args:
+            argv: CLI arguments
+            cwd: Client working directory to run in
+            send: Protocol chunk sink
+            cli_name: Which CLI front end runs the arguments
+            env: The client's forwarded ``CONNASCENCE_*`` variables (None keeps the daemon's)
+            digest: Client config digest, added to the result cache key
+        """
+        stdout = _StreamWriter("stdout", send)
+        stderr = _StreamWriter("stderr", send)
+        with self._run_lock, _applied_environment(env):
+            previous_cwd = os.getcwd()
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    return self._invoke(cli_name, argv, f"{self.version}:{digest}")
+            finally:
+                os.chdir(previous_cwd)
+                self._requests_served += 1
+
+    def _invoke(self, cli_name: str, argv: List[str], cache_context: str = "") -> int:
+        try:
+            cli = self._clis.get(cli_name)
+            if cli is None:
+                cli = self._clis[cli_name] = self._cli_factories[cli_name]()
+            helper = getattr(cli, "analysis_helper", None)
+            if helper is not None and hasattr(helper, "cache_context"):
+                helper.cache_context = cache_context
+            if hasattr(cli, "errors"):
+                cli.errors = []
+                cli.warnings = []
+            return int(cli.run(argv) or 0)
+        except SystemExit as exc:
+            # argparse exits on --help, --version and invalid arguments
+            code = exc.code
+            return code if isinstance(code, int) else (0 if code is None else 1)
+        except Exception as exc:
+            print(f"Daemon invocation failed: {exc}", file=sys.stderr)
+            return 1
+
+    def idle_for(self) -> float:
+        return time.monotonic() - self._last_activity
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime_seconds": round(time.time() - self._started_at, 1),
+            "idle_seconds": round(self.idle_for(), 1),
+            "idle_timeout_seconds": self.idle_timeout,
+            "requests_served": self._requests_served,
+        }
+        helper = getattr(self._clis.get("connascence"), "analysis_helper", None)
+        if helper is not None and hasattr(helper, "get_cache_stats"):
+            stats["result_cache"] = helper.get_cache_stats()
+        return stats
+
+    def serve_until_idle(self, poll_interval: float = 1.0) -> None:
+        """Serve requests until shut down or idle for ``idle_timeout`` seconds."""
+        watchdog = threading.Thread(target=self._watch_idle, args=(poll_interval,), daemon=True)
+        watchdog.start()
+        try:
+            self.serve_forever(poll_interval=poll_interval)
+        finally:
+            self.server_close()
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+    def _watch_idle(self, poll_interval: float) -> None:
+        while True:
+            time.sleep(poll_interval)
+            if self.idle_for() >= self.idle_timeout and not self._run_lock.locked():
+                logger.info("CLI daemon idle for %.0fs, shutting down", self.idle_for())
+                self.shutdown()
+                return
+
+
+def _connascence_cli_factory() -> Any:
+    from interfaces.cli.connascence import ConnascenceCLI
+
+    return ConnascenceCLI()
+
+
+def _simple_cli_factory() -> Any:
+    from interfaces.cli.simple_cli import SimpleConnascenceCLI
+
+    return SimpleConnascenceCLI()
+
+
+DEFAULT_CLI_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "connascence": _connascence_cli_factory,
+    "simple": _simple_cli_factory,
+}
+
+
+# ----------------------------------------------------------------------
+# Client
+# ----------------------------------------------------------------------
+def _connect(socket_path: Path) -> Optional[socket.socket]:
+    if not DAEMON_SUPPORTED or not socket_path.exists():
+        return None
+    # Never hand argv and cwd to a daemon run by someone else
+    if not _socket_owned_by_user(socket_path):
+        logger.warning(f"Ignoring daemon socket {socket_path} not owned by the current user")
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+    try:
+        sock.connect(str(socket_path))
+        peer_uid = _peer_uid(sock)
+    except OSError:
+        sock.close()
+        return None
+    if peer_uid is not None and peer_uid != _current_uid():
+        logger.warning(f"Ignoring daemon on {socket_path} run by uid {peer_uid}")
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def send_command(command: str, socket_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Send a control command (ping/stats/shutdown); None when no daemon answers."""
+    sock = _connect(socket_path or default_socket_path())
+    if sock is None:
+        return None
+    try:
+        with sock, sock.makefile("rwb") as stream:
+            stream.write((json.dumps({"command": command}) + "\n").encode("utf-8"))
+            stream.flush()
+            line = stream.readline()
+    except OSError:
+        # A daemon that is shutting down drops connections still in its backlog
+        return None
+    return json.loads(line) if line else None
+
+
+def _stop_daemon(socket_path: Path, wait: float) -> bool:
+    """Ask the daemon on ``socket_path`` to exit and wait until it stops answering."""
+    send_command("shutdown", socket_path)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if send_command("ping", socket_path) is None:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def start_daemon(
+    socket_path: Optional[Path] = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    wait: float = STARTUP_TIMEOUT_SECONDS,
+    version: Optional[str] = None,
+) -> bool:
+    """
+    Spawn a detached daemon process and wait until it answers a ping.
+
+    A daemon already listening on the socket is kept when it runs the same
+    code as this process (``version``, defaulting to ``code_fingerprint()``)
+    and restarted otherwise.
+    """
+    if not DAEMON_SUPPORTED:
+        return False
+    socket_path = socket_path or default_socket_path()
+    version = version or code_fingerprint()
+    reply = send_command("ping", socket_path)
+    if reply is not None:
+        if reply.get("version") == version:
+            return True
+        logger.info(f"Restarting CLI daemon {reply.get('pid')}: code changed since it started")
+        if not _stop_daemon(socket_path, wait):
+            return False
+
+    cmd = [
+        sys.executable,
+        "-m",
+        "analyzer.cli_daemon",
+        "--socket",
+        str(socket_path),
+        "--idle-timeout",
+        str(idle_timeout),
+    ]
+    subprocess.Popen(
+        cmd,
+        cwd=str(PROJECT_ROOT),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        reply = send_command("ping", socket_path)
+        if reply is not None and reply.get("version") == version:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def forward_to_daemon(
+    argv: List[str],
+    socket_path: Optional[Path] = None,
+    autostart: bool = True,
+    cli: str = "connascence",
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """
+    Run a CLI invocation on the daemon, streaming its output locally.
+
+    Args:
+        argv: CLI arguments (``--daemon`` is stripped before forwarding)
+        socket_path: Daemon socket (defaults to the per-user path)
+        autostart: Spawn a daemon when none is listening, or restart one
+            running different code
+        cli: Which CLI front end runs the arguments (``connascence`` or ``simple``)
+        stdout: Destination for forwarded stdout (defaults to sys.stdout)
+        stderr: Destination for forwarded stderr (defaults to sys.stderr)
+
+    Returns:
+        The invocation's exit code, or None when no daemon could be reached
+        and the caller should run in-process.
+    """
+    socket_path = socket_path or default_socket_path()
+    version = code_fingerprint()
+    reply = send_command("ping", socket_path)
+    if reply is None or reply.get("version") != version:
+        if not (autostart and start_daemon(socket_path, version=version)):
+            return None
+    sock = _connect(socket_path)
+    if sock is None:
+        return None
+
+    outputs = {"stdout": stdout or sys.stdout, "stderr": stderr or sys.stderr}
+    forwarded_argv = [arg for arg in argv if arg != "--daemon"]
+    cwd = os.getcwd()
+    env = forwarded_environment()
+    request = {
+        "argv": forwarded_argv,
+        "cwd": cwd,
+        "cli": cli,
+        "env": env,
+        "version": version,
+        "config_digest": config_digest(forwarded_argv, cwd, env),
+    }
+    with sock, sock.makefile("rwb") as stream:
+        stream.write((json.dumps(request) + "\n").encode("utf-8"))
+        stream.flush()
+        for line in stream:
+            message = json.loads(line)
+            if "stream" in message:
+                target = outputs.get(message["stream"], outputs["stdout"])
+                target.write(message["data"])
+                target.flush()
+            elif "exit_code" in message:
+                if message.get("version_mismatch"):
+                    return None
+                if message.get("error"):
+                    print(f"Daemon error: {message['error']}", file=outputs["stderr"])
+                return int(message["exit_code"])
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the daemon server in the foreground."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Connascence CLI analysis daemon")
+    parser.add_argument("--socket", type=str, default=None, help="Unix socket path")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT_SECONDS,
+        help="Shut down after this many idle seconds",
+    )
+    args = parser.parse_args(argv)
+
+    if not DAEMON_SUPPORTED:
+        print("CLI daemon requires Unix domain sockets", file=sys.stderr)
+        return 1
+
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+    if send_command("ping", socket_path):
+        # Another daemon already owns the socket
+        return 0
+
+    try:
+        server = CLIDaemonServer(socket_path, idle_timeout=args.idle_timeout)
+    except PermissionError as e:
+        print(f"Refusing to start CLI daemon: {e}", file=sys.stderr)
+        return 1
+    server.serve_until_idle()
+    return 0
+
+
+__all__ = [
+    "CLIDaemonServer",
+    "DAEMON_SUPPORTED",
+    "code_fingerprint",
+    "config_digest",
+    "daemon_requested",
+    "default_socket_path",
+    "forward_to_daemon",
+    "forwarded_environment",
+    "send_command",
+    "start_daemon",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,11 +10,21 @@ in sync.
 
 from __future__ import annotations
 
+import ast
+from collections import OrderedDict
+from contextlib import nullcontext
 from dataclasses import dataclass
+import hashlib
+import io
 import json
+import math
+import os
 from pathlib import Path
+import threading
 import time
-from typing import Dict, Iterable, Iterator, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from analyzer.diff_scope import FileChanges, filter_to_changes, select_changed_scopes
 
 try:  # Import heavy analyzer dependencies lazily to keep tests lightweight
     from analyzer.ast_engine.core_analyzer import ConnascenceASTAnalyzer
@@ -28,8 +38,31 @@ try:
 except ImportError:  # pragma: no cover - policy manager optional in tests
     PolicyManager = None  # type: ignore[assignment]
 
+try:
+    from analyzer.optimization.memory_budget import (
+        SHED_PRIORITY_RESULTS,
+        MemoryBudget,
+        cache_name,
+        estimate_file_cost_mb,
+        get_global_memory_budget,
+    )
+except ImportError:  # pragma: no cover - runs without admission control
+    MemoryBudget = None  # type: ignore[assignment]
+    get_global_memory_budget = None  # type: ignore[assignment]
+
 
 DEFAULT_FILE_PATTERNS: tuple[str, ...] = ("*.py",)
+# Per-file results kept warm for repeated scans (long-lived CLI daemon, MCP server)
+RESULT_CACHE_MAX_ENTRIES = 20000
+
+
+@dataclass
+class _CachedFileResult:
+    """Violations for one file, keyed by stat signature and content digest."""
+
+    signature: Tuple[int, int]
+    digest: str
+    violations: list
 
 
 @dataclass(frozen=True)
@@ -50,18 +83,32 @@ class CliFinding:
 class SharedCLIAnalyzer:
     """Singleton-friendly helper that powers CLI + MCP workflows."""
 
-    def __init__(self) -> None:
+    def __init__(self, memory_budget: Optional["MemoryBudget"] = None) -> None:
         self.policy_manager = PolicyManager() if PolicyManager else None
         self._threshold_cache: Dict[str, ThresholdConfig] = {}
         self._analyzer_cache: Dict[str, ConnascenceASTAnalyzer] = {}
+        self._result_cache: "OrderedDict[Tuple[str, str, str], _CachedFileResult]" = OrderedDict()
+        self._result_lock = threading.Lock()
+        self._cache_stats = {"hits": 0, "rehashed_hits": 0, "misses": 0}
+        # Code version and config digest of the current invocation (set by the CLI daemon),
+        # so results computed under other code or configuration are never reused
+        self.cache_context = ""
+
+        # Workspace files are admitted against a memory budget that may shed the result cache
+        if memory_budget is None and get_global_memory_budget is not None:
+            memory_budget = get_global_memory_budget()
+        self.memory_budget = memory_budget
+        if self.memory_budget is not None:
+            self.memory_budget.register_cache(
+                cache_name("cli_results", self), self.shed_result_cache, SHED_PRIORITY_RESULTS
+            )
 
     # ------------------------------------------------------------------
     # Public surface consumed by CLI + MCP
     # ------------------------------------------------------------------
     def analyze_file(self, target: Path, profile: str) -> Dict[str, object]:
-        analyzer = self._require_analyzer(profile)
         start = time.time()
-        violations = analyzer.analyze_file(target)
+        violations = self.analyze_file_cached(target, profile)
         payload = self._format_analysis_result(
             violations,
             profile=profile,
@@ -79,21 +126,13 @@ class SharedCLIAnalyzer:
         patterns: Optional[Iterable[str]] = None,
         selected_files: Optional[Iterable[Path]] = None,
     ) -> Dict[str, object]:
-        analyzer = self._require_analyzer(profile)
+        self._require_analyzer(profile)
         files: Dict[str, Dict[str, object]] = {}
         total_score = 0.0
         file_iter = selected_files if selected_files else self._iter_workspace_files(workspace, patterns)
 
         for file_path in file_iter:
-            start = time.time()
-            violations = analyzer.analyze_file(file_path)
-            file_payload = self._format_analysis_result(
-                violations,
-                profile=profile,
-                target=str(file_path),
-                files_analyzed=1,
-                analysis_time=time.time() - start,
-            )
+            file_payload = self.analyze_workspace_file(file_path, profile)
             files[str(file_path)] = file_payload
             total_score += file_payload.get("quality_score", 0.0)  # type: ignore[arg-type]
 
@@ -105,6 +144,143 @@ class SharedCLIAnalyzer:
             "overall_score": round(total_score / analyzed_files, 2) if analyzed_files else 100.0,
         }
 
+    def analyze_workspace_file(self, file_path: Path, profile: str) -> Dict[str, object]:
+        """Analyze one file of a workspace run and format it like ``analyze_file``."""
+        start = time.time()
+        with self._admit(file_path):
+            violations = self.analyze_file_cached(file_path, profile)
+        return self._format_analysis_result(
+            violations,
+            profile=profile,
+            target=str(file_path),
+            files_analyzed=1,
+            analysis_time=time.time() - start,
+        )
+
+    def analyze_file_cached(self, file_path: Path, profile: str) -> list:
+        """
+        Analyze one file, reusing the previous result while it is unchanged.
+
+        The (mtime_ns, size) signature is checked first; when it changed the
+        content digest decides, so a touched-but-identical file is not
+        re-analyzed.
+
+        Args:
+            file_path: File to analyze
+            profile: Safety profile whose analyzer to use
+
+        Returns:
+            List of violations for the file (a copy callers may modify)
+        """
+        analyzer = self._require_analyzer(profile)
+        key = (os.path.realpath(file_path), profile, self.cache_context)
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._result_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None and cached.signature == signature:
+                self._result_cache.move_to_end(key)
+                self._cache_stats["hits"] += 1
+                return list(cached.violations)
+
+        with open(file_path, "rb") as handle:
+            content = handle.read()
+        digest = hashlib.sha256(content).hexdigest()
+
+        with self._result_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None and cached.digest == digest:
+                cached.signature = signature
+                self._result_cache.move_to_end(key)
+                self._cache_stats["rehashed_hits"] += 1
+                return list(cached.violations)
+
+        # Decode like open(..., encoding="utf-8"): strict errors, universal newlines
+        code = io.TextIOWrapper(io.BytesIO(content), encoding="utf-8").read()
+        violations = analyzer.analyze_string(code, str(file_path))
+
+        with self._result_lock:
+            self._result_cache[key] = _CachedFileResult(signature, digest, list(violations))
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > RESULT_CACHE_MAX_ENTRIES:
+                self._result_cache.popitem(last=False)
+            self._cache_stats["misses"] += 1
+        return violations
+
+    def analyze_source(self, code: str, file_path: Path, profile: str) -> list:
+        """Analyze source text that is not read from the working tree (e.g. a git revision)."""
+        return self._require_analyzer(profile).analyze_string(code, str(file_path))
+
+    def analyze_file_changes(
+        self, file_path: Path, profile: str, changes: FileChanges, code: Optional[str] = None
+    ) -> Tuple[list, bool]:
+        """
+        Analyze only the scopes of one file touched by a diff.
+
+        Function and class checks run on the touched scopes; when a module-level
+        statement changed the whole file is analyzed instead. Either way the
+        result is limited to changed lines and the definition lines of touched
+        scopes, so both paths report the same findings.
+
+        Args:
+            file_path: File to analyze
+            profile: Safety profile whose analyzer to use
+            changes: Changed lines of the file, from ``parse_unified_diff``
+            code: Source of the diff's head revision; read from ``file_path``
+                when omitted (diffs against the working tree)
+
+        Returns:
+            Tuple of (violations, scoped) where scoped is False when the whole
+            file was analyzed
+        """
+        analyzer = self._require_analyzer(profile)
+        from_working_tree = code is None
+        if from_working_tree:
+            with open(file_path, encoding="utf-8") as handle:
+                code = handle.read()
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            return [], False
+
+        selection = select_changed_scopes(tree, changes)
+        if selection.module_level_changed:
+            if from_working_tree:
+                violations = self.analyze_file_cached(file_path, profile)
+            else:
+                violations = analyzer.analyze_string(code, str(file_path))
+        else:
+            violations = analyzer.analyze_scopes(tree, str(file_path), selection)
+        return filter_to_changes(violations, changes, selection), not selection.module_level_changed
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Per-file result cache counters."""
+        with self._result_lock:
+            return {"entries": len(self._result_cache), **self._cache_stats}
+
+    def clear_result_cache(self) -> None:
+        with self._result_lock:
+            self._result_cache.clear()
+
+    def shed_result_cache(self, fraction: float) -> int:
+        """Drop the least recently used ``fraction`` of cached results; returns the count dropped."""
+        with self._result_lock:
+            count = math.ceil(len(self._result_cache) * fraction)
+            for _ in range(count):
+                self._result_cache.popitem(last=False)
+            return count
+
+    def _admit(self, file_path: Path):
+        """Hold a memory budget reservation sized for ``file_path`` while it is analyzed."""
+        if self.memory_budget is None:
+            return nullcontext()
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            size = 0
+        return self.memory_budget.admit(estimate_file_cost_mb(size))
+
     def serialize(self, payload: Dict[str, object]) -> str:
         """Utility used by CLI + MCP to ensure identical JSON serialization."""
 
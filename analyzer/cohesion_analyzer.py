@@ -5,11 +5,56 @@ Cohesion Analyzer Module
 
 Provides functionality for analyzing class and module cohesion,
 detecting low-cohesion code that may indicate design issues.
+
+Each class is walked once; every method's ``self.<name>`` references are
+encoded as integer bitsets, so pair counting for TCC is a popcount per
+method and LCC/LCOM4 are union-find component counts.
 """
 
 import ast
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+FunctionNode = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:  # pragma: no cover - older interpreters
+
+    def _popcount(mask: int) -> int:
+        return bin(mask).count("1")
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """Yield the indexes of the set bits of ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class _UnionFind:
+    """Disjoint sets over 0..size-1 with path halving and union by size."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
 
 
 @dataclass
@@ -25,6 +70,23 @@ class CohesionMetrics:
     shared_attributes: int = 0
 
 
+@dataclass
+class ClassReferences:
+    """``self.<name>`` references of one class, collected in a single pass."""
+
+    # Public methods the metrics are computed over
+    methods: List[ast.AST]
+    # Bit index of every self.<name> referenced anywhere in the class
+    names: Dict[str, int]
+    # Per public method: every self.<name> it references (attributes and methods)
+    usage: List[int]
+    # Per public method: instance attributes it touches directly or through the methods it calls
+    state: List[int]
+    # Per method name (public and private): direct instance attributes / called methods
+    direct_state: Dict[str, int]
+    calls: Dict[str, Set[str]]
+
+
 @dataclass
 class CohesionViolation:
     """Represents a cohesion violation."""
@@ -80,13 +142,12 @@ class CohesionAnalyzer:
 
     def _analyze_class(self, class_node: ast.ClassDef, file_path: str):
         """Analyze a class for cohesion."""
-        methods = self._get_methods(class_node)
-        attributes = self._get_instance_attributes(class_node)
+        references = self._collect_references(class_node)
 
-        if len(methods) < 2:
+        if len(references.methods) < 2:
             return  # Can't calculate meaningful cohesion
 
-        metrics = self._calculate_metrics(methods, attributes)
+        metrics = self._calculate_metrics(references)
 
         # Check for LCOM violations
         if metrics.lcom > self.LCOM_THRESHOLD:
@@ -118,72 +179,140 @@ class CohesionAnalyzer:
                 )
             )
 
-    def _get_methods(self, class_node: ast.ClassDef) -> List[ast.FunctionDef]:
-        """Extract method definitions from a class."""
-        return [
-            node
-            for node in class_node.body
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-            and not node.name.startswith("_")
-        ]
-
-    def _get_instance_attributes(self, class_node: ast.ClassDef) -> Set[str]:
-        """Extract instance attributes from a class."""
-        attributes = set()
-        for node in ast.walk(class_node):
-            if isinstance(node, ast.Attribute):
-                if isinstance(node.value, ast.Name) and node.value.id == "self":
-                    attributes.add(node.attr)
-        return attributes
-
-    def _get_method_attributes(self, method: ast.FunctionDef) -> Set[str]:
-        """Get instance attributes used by a method."""
-        attributes = set()
-        for node in ast.walk(method):
-            if isinstance(node, ast.Attribute):
-                if isinstance(node.value, ast.Name) and node.value.id == "self":
-                    attributes.add(node.attr)
-        return attributes
-
-    def _calculate_metrics(
-        self, methods: List[ast.FunctionDef], attributes: Set[str]
-    ) -> CohesionMetrics:
+    def _collect_references(self, class_node: ast.ClassDef) -> ClassReferences:
+        """Walk the class once and encode each method's self.<name> references as bitsets."""
+        names: Dict[str, int] = {}
+        method_masks: List[Tuple[ast.AST, int]] = []
+        by_name: Dict[str, int] = {}
+
+        for stmt in class_node.body:
+            mask = 0
+            for node in ast.walk(stmt):
+                if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self":
+                    mask |= 1 << names.setdefault(node.attr, len(names))
+            if isinstance(stmt, FunctionNode):
+                method_masks.append((stmt, mask))
+                by_name[stmt.name] = by_name.get(stmt.name, 0) | mask
+
+        # self.<method> references are calls, everything else is instance state
+        method_bits = {names[name]: name for name in by_name if name in names}
+        method_mask = sum(1 << bit for bit in method_bits)
+        direct_state = {name: mask & ~method_mask for name, mask in by_name.items()}
+        calls = {name: {method_bits[bit] for bit in _iter_bits(mask & method_mask)} for name, mask in by_name.items()}
+        reachable = self._reachable_state(direct_state, calls)
+
+        methods, usage, state = [], [], []
+        for node, mask in method_masks:
+            if node.name.startswith("_"):
+                continue
+            methods.append(node)
+            usage.append(mask)
+            reached = mask & ~method_mask
+            for callee in calls[node.name]:
+                reached |= reachable[callee]
+            state.append(reached)
+
+        return ClassReferences(methods, names, usage, state, direct_state, calls)
+
+    @staticmethod
+    def _reachable_state(direct_state: Dict[str, int], calls: Dict[str, Set[str]]) -> Dict[str, int]:
+        """Instance attributes each method touches itself or through any chain of self-calls."""
+        reachable = dict(direct_state)
+        changed = True
+        while changed:
+            changed = False
+            for name, callees in calls.items():
+                mask = reachable[name]
+                for callee in callees:
+                    mask |= reachable[callee]
+                if mask != reachable[name]:
+                    reachable[name] = mask
+                    changed = True
+        return reachable
+
+    def _calculate_metrics(self, references: ClassReferences) -> CohesionMetrics:
         """Calculate cohesion metrics for a class."""
-        method_count = len(methods)
-        attribute_count = len(attributes)
+        method_count = len(references.methods)
+        attribute_count = len(references.names)
 
         if method_count == 0 or attribute_count == 0:
             return CohesionMetrics(method_count=method_count, attribute_count=attribute_count)
 
-        # Calculate method-attribute usage
-        method_attrs = [self._get_method_attributes(m) for m in methods]
-
         # LCOM calculation (Henderson-Sellers variant)
-        total_usage = sum(len(ma) for ma in method_attrs)
-        lcom = 1 - (total_usage / (method_count * attribute_count)) if attribute_count > 0 else 0
+        total_usage = sum(_popcount(mask) for mask in references.usage)
+        lcom = 1 - (total_usage / (method_count * attribute_count))
+
+        # Column per attribute: the methods that touch it
+        columns: Dict[int, int] = {}
+        for index, mask in enumerate(references.state):
+            for bit in _iter_bits(mask):
+                columns[bit] = columns.get(bit, 0) | (1 << index)
+
+        # TCC: pairs of methods sharing at least one attribute (directly connected)
+        direct_pairs = 0
+        for index, mask in enumerate(references.state):
+            neighbours = 0
+            for bit in _iter_bits(mask):
+                neighbours |= columns[bit]
+            direct_pairs += _popcount(neighbours & ~(1 << index))
+        direct_pairs //= 2
+
+        # LCC: pairs connected through any chain of direct connections
+        connected = _UnionFind(method_count)
+        for column in columns.values():
+            self._union_members(connected, column)
+        component_sizes: Dict[int, int] = {}
+        for index in range(method_count):
+            root = connected.find(index)
+            component_sizes[root] = component_sizes.get(root, 0) + 1
+        indirect_pairs = sum(size * (size - 1) // 2 for size in component_sizes.values())
 
-        # TCC calculation (Tight Class Cohesion)
-        shared_pairs = 0
         total_pairs = method_count * (method_count - 1) // 2
-
-        for i in range(len(method_attrs)):
-            for j in range(i + 1, len(method_attrs)):
-                if method_attrs[i] & method_attrs[j]:
-                    shared_pairs += 1
-
-        tcc = shared_pairs / total_pairs if total_pairs > 0 else 0
-        lcc = tcc  # LCC is typically >= TCC, simplified here
+        tcc = direct_pairs / total_pairs if total_pairs > 0 else 0
+        lcc = indirect_pairs / total_pairs if total_pairs > 0 else 0
 
         return CohesionMetrics(
             lcom=lcom,
-            lcom4=lcom,
+            lcom4=float(self._lcom4(references)),
             tcc=tcc,
             lcc=lcc,
             method_count=method_count,
             attribute_count=attribute_count,
-            shared_attributes=sum(1 for ma in method_attrs if ma),
+            shared_attributes=sum(1 for mask in references.usage if mask),
         )
 
+    @staticmethod
+    def _union_members(union_find: _UnionFind, members: int) -> None:
+        bits = _iter_bits(members)
+        first = next(bits, None)
+        for other in bits:
+            union_find.union(first, other)
+
+    def _lcom4(self, references: ClassReferences) -> int:
+        """
+        LCOM4 (Hitz & Montazeri): connected components of the method graph.
+
+        Methods are linked when they touch the same instance attribute or one
+        calls the other. Private helpers take part in the graph, but only
+        components containing a public method are counted. Dunder methods
+        (``__init__`` touches every attribute) are left out.
+        """
+        names = [name for name in references.direct_state if not (name.startswith("__") and name.endswith("__"))]
+        index_of = {name: index for index, name in enumerate(names)}
+        components = _UnionFind(len(names))
+
+        columns: Dict[int, int] = {}
+        for index, name in enumerate(names):
+            for bit in _iter_bits(references.direct_state[name]):
+                columns[bit] = columns.get(bit, 0) | (1 << index)
+            for callee in references.calls[name]:
+                if callee in index_of:
+                    components.union(index, index_of[callee])
+        for column in columns.values():
+            self._union_members(components, column)
+
+        return len({components.find(index_of[method.name]) for method in references.methods})
+
 
 def analyze_cohesion(source_or_path: str, is_file: bool = True) -> List[CohesionViolation]:
     """
@@ -0,0 +1,136 @@
+"""
+Lazy Component Registry
+=======================
+
+Resolves optional analyzer components (detector families, caches, monitors,
+backends) on first use instead of at import time, so a CLI invocation or a
+single-file scan only pays the import cost of the components it touches.
+
+Components are registered with one or more ``(module, attribute)``
+candidates, tried in order; the first that imports wins. Failed imports are
+remembered and resolve to ``None`` (or raise for required components).
+"""
+
+import importlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+Candidate = Tuple[str, str]
+
+
+class LazyComponent:
+    """A single component resolved from the first importable candidate."""
+
+    def __init__(
+        self,
+        name: str,
+        candidates: Sequence[Candidate],
+        group: Optional[str] = None,
+        required: bool = False,
+        package: Optional[str] = None,
+    ):
+        self.name = name
+        self.candidates = list(candidates)
+        self.package = package
+        self.group = group
+        self.required = required
+        self._value: Any = _MISSING
+        self._error: Optional[BaseException] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not _MISSING
+
+    def resolve(self) -> Any:
+        """Import and return the component, or None when unavailable and optional."""
+        if self._value is _MISSING:
+            value = None
+            for module_name, attribute in self.candidates:
+                try:
+                    value = getattr(importlib.import_module(module_name, self.package), attribute)
+                    self._error = None
+                    break
+                except (ImportError, AttributeError) as e:
+                    self._error = e
+            if value is None:
+                logger.debug(f"Component {self.name} unavailable: {self._error}")
+            self._value = value
+
+        if self._value is None and self.required:
+            raise ImportError(f"Required component {self.name} is unavailable: {self._error}")
+        return self._value
+
+
+class ComponentRegistry:
+    """
+    Registry of lazily imported components.
+
+    Attribute access resolves components by name, so call sites read like the
+    eager imports they replace (``components.MECEAnalyzer()``).
+    """
+
+    def __init__(self, package: Optional[str] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            package: Package used to resolve relative module names (``.foo``)
+        """
+        self._package = package
+        self._components: Dict[str, LazyComponent] = {}
+        self._groups: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+
+    def register(
+        self,
+        name: str,
+        *candidates: Candidate,
+        group: Optional[str] = None,
+        required: bool = False,
+    ) -> None:
+        """
+        Register a component.
+
+        Args:
+            name: Name the component is looked up by
+            candidates: ``(module, attribute)`` pairs tried in order
+            group: Optional availability group (all members must resolve)
+            required: Raise ImportError on use when no candidate imports
+        """
+        self._components[name] = LazyComponent(name, candidates, group, required, self._package)
+        if group:
+            self._groups.setdefault(group, []).append(name)
+
+    def get(self, name: str) -> Any:
+        """Resolve a component by name (None when unavailable)."""
+        component = self._components.get(name)
+        if component is None:
+            raise KeyError(name)
+        if component.loaded:
+            return component.resolve()
+        with self._lock:
+            return component.resolve()
+
+    def available(self, group: str) -> bool:
+        """Check whether every component in ``group`` can be imported."""
+        return all(self.get(name) is not None for name in self._groups.get(group, ()))
+
+    def loaded_components(self) -> List[str]:
+        """Names of components that have been resolved so far."""
+        return [name for name, component in self._components.items() if component.loaded]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._components
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.get(name)
+        except KeyError:
+            raise AttributeError(name) from None
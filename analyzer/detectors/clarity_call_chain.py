@@ -11,7 +11,7 @@ import ast
 from pathlib import Path
 from typing import List, Dict, Set, Tuple
 
-from analyzer.clarity_linter.base import BaseClarityDetector
+from analyzer.clarity_linter.base import BaseClarityDetector, iter_nodes
 from analyzer.clarity_linter.models import ClarityViolation
 
 
@@ -69,15 +69,14 @@ class CallChainDepthDetector(BaseClarityDetector):
         violations = []
         max_depth = self._get_max_depth()
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                chain_info = self._analyze_call_chain(node)
-                if chain_info and chain_info["depth"] > max_depth:
-                    if not self._is_fluent_api(chain_info["methods"]):
-                        violation = self._create_chain_violation(
-                            node, file_path, chain_info, max_depth
-                        )
-                        violations.append(violation)
+        for node in iter_nodes(tree, ast.Call):
+            chain_info = self._analyze_call_chain(node)
+            if chain_info and chain_info["depth"] > max_depth:
+                if not self._is_fluent_api(chain_info["methods"]):
+                    violation = self._create_chain_violation(
+                        node, file_path, chain_info, max_depth
+                    )
+                    violations.append(violation)
 
         return violations
 
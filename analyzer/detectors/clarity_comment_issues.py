@@ -97,6 +97,27 @@ class CommentIssuesDetector(BaseClarityDetector):
         self._analyze_comments(lines, file_path, violations)
         return violations
 
+    def detect_source(
+        self,
+        tree: ast.Module,
+        file_path: Path,
+        source_lines: List[str]
+    ) -> List[ClarityViolation]:
+        """
+        Detect comment issues from already-read source lines.
+
+        NASA Rule 4: Function under 60 lines
+        NASA Rule 5: Input validation assertions
+        """
+        # NASA Rule 5: Input validation
+        assert tree is not None, "tree cannot be None"
+        assert file_path is not None, "file_path cannot be None"
+        assert isinstance(source_lines, list), "source_lines must be list"
+
+        violations = []
+        self._analyze_comments(source_lines, file_path, violations)
+        return violations
+
     def _analyze_comments(
         self,
         lines: List[str],
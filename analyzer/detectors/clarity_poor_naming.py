@@ -12,7 +12,7 @@ import re
 from pathlib import Path
 from typing import List, Set
 
-from analyzer.clarity_linter.base import BaseClarityDetector
+from analyzer.clarity_linter.base import BaseClarityDetector, iter_nodes
 from analyzer.clarity_linter.models import ClarityViolation
 
 
@@ -106,29 +106,28 @@ class PoorNamingDetector(BaseClarityDetector):
 
         NASA Rule 4: Function under 60 lines
         """
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                # Check function name
-                issue = self._check_name(node.name, "function")
+        for node in iter_nodes(tree, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # Check function name
+            issue = self._check_name(node.name, "function")
+            if issue:
+                violations.append(
+                    self._create_naming_violation(
+                        file_path, node.lineno, node.name, "function", issue
+                    )
+                )
+
+            # Check parameter names
+            for arg in node.args.args:
+                if arg.arg == "self" or arg.arg == "cls":
+                    continue
+                issue = self._check_name(arg.arg, "parameter")
                 if issue:
                     violations.append(
                         self._create_naming_violation(
-                            file_path, node.lineno, node.name, "function", issue
+                            file_path, node.lineno, arg.arg, "parameter", issue
                         )
                     )
 
-                # Check parameter names
-                for arg in node.args.args:
-                    if arg.arg == "self" or arg.arg == "cls":
-                        continue
-                    issue = self._check_name(arg.arg, "parameter")
-                    if issue:
-                        violations.append(
-                            self._create_naming_violation(
-                                file_path, node.lineno, arg.arg, "parameter", issue
-                            )
-                        )
-
     def _analyze_variables(
         self,
         tree: ast.Module,
@@ -140,20 +139,19 @@ class PoorNamingDetector(BaseClarityDetector):
 
         NASA Rule 4: Function under 60 lines
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        # Skip constants (UPPER_CASE)
-                        if target.id.isupper():
-                            continue
-                        issue = self._check_name(target.id, "variable")
-                        if issue:
-                            violations.append(
-                                self._create_naming_violation(
-                                    file_path, node.lineno, target.id, "variable", issue
-                                )
+        for node in iter_nodes(tree, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    # Skip constants (UPPER_CASE)
+                    if target.id.isupper():
+                        continue
+                    issue = self._check_name(target.id, "variable")
+                    if issue:
+                        violations.append(
+                            self._create_naming_violation(
+                                file_path, node.lineno, target.id, "variable", issue
                             )
+                        )
 
     def _check_name(self, name: str, context: str) -> str:
         """
@@ -11,7 +11,7 @@ import ast
 from pathlib import Path
 from typing import List, Set
 
-from analyzer.clarity_linter.base import BaseClarityDetector
+from analyzer.clarity_linter.base import BaseClarityDetector, iter_nodes
 from analyzer.clarity_linter.models import ClarityViolation
 
 
@@ -93,11 +93,10 @@ class ThinHelperDetector(BaseClarityDetector):
 
         NASA Rule 4: Function under 60 lines
         """
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if self._is_thin_helper(node):
-                    violation = self._create_thin_helper_violation(node, file_path)
-                    violations.append(violation)
+        for node in iter_nodes(tree, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if self._is_thin_helper(node):
+                violation = self._create_thin_helper_violation(node, file_path)
+                violations.append(violation)
 
     def _is_thin_helper(self, func: ast.FunctionDef) -> bool:
         """
@@ -11,7 +11,7 @@ import ast
 from pathlib import Path
 from typing import List, Dict, Any, Set
 
-from analyzer.clarity_linter.base import BaseClarityDetector
+from analyzer.clarity_linter.base import BaseClarityDetector, iter_nodes
 from analyzer.clarity_linter.models import ClarityViolation
 
 
@@ -78,9 +78,8 @@ class UselessIndirectionDetector(BaseClarityDetector):
 
         NASA Rule 4: Function under 60 lines
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                self._check_class_methods(node, file_path, violations)
+        for node in iter_nodes(tree, ast.ClassDef):
+            self._check_class_methods(node, file_path, violations)
 
     def _analyze_functions(
         self,
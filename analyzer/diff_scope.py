@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+"""
+Diff Hunk Scoping
+=================
+
+Maps ``git diff -U0`` hunks onto the function and class scopes they touch, so
+diff-driven runs (``scan-diff``, pull-request checks) cost in proportion to
+the size of the change rather than the size of the files it lands in.
+
+- ``parse_unified_diff`` turns diff text into changed line ranges per file
+  (new/head side of the diff)
+- ``select_changed_scopes`` finds the function and class definitions that
+  enclose those lines, the statements and definition headers to re-scan, and
+  whether any module-level statement changed
+- ``filter_to_changes`` keeps only findings on changed lines or on the
+  definition line of a touched scope
+"""
+
+import ast
+from bisect import bisect_right
+from dataclasses import dataclass, field
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+LineRange = Tuple[int, int]
+
+DIFF_FILE_HEADER = "+++ "
+DIFF_NULL_PATH = "/dev/null"
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+SCOPE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+@dataclass
+class FileChanges:
+    """Lines changed in one file, numbered as in the new (head) version."""
+
+    path: str
+    # Inclusive ranges of added or modified lines
+    ranges: List[LineRange] = field(default_factory=list)
+    # Lines after which old lines were removed (0 = start of file)
+    deletions: List[int] = field(default_factory=list)
+
+    @property
+    def changed_line_count(self) -> int:
+        return sum(end - start + 1 for start, end in self.ranges)
+
+    def contains_line(self, line: int) -> bool:
+        """True when ``line`` was added or modified."""
+        index = bisect_right(self.ranges, (line, float("inf"))) - 1
+        return index >= 0 and self.ranges[index][1] >= line
+
+    def touch_spans(self) -> List[LineRange]:
+        """Ranges used to find touched scopes; a deletion touches the lines on both sides."""
+        spans = list(self.ranges)
+        spans.extend((max(line, 1), line + 1) for line in self.deletions)
+        return _merge_ranges(spans)
+
+
+def parse_unified_diff(diff_text: str, suffixes: Optional[Tuple[str, ...]] = (".py",)) -> Dict[str, FileChanges]:
+    """
+    Parse ``git diff -U0`` output into changed line ranges per file.
+
+    Args:
+        diff_text: Unified diff with zero context lines
+        suffixes: File suffixes to keep (None keeps every file)
+
+    Returns:
+        Mapping of new-side path to its changes, in diff order. Deleted
+        files are omitted.
+    """
+    changes: Dict[str, FileChanges] = {}
+    current: Optional[FileChanges] = None
+
+    for line in diff_text.splitlines():
+        if line.startswith(DIFF_FILE_HEADER):
+            path = line[len(DIFF_FILE_HEADER):].split("\t", 1)[0]
+            if path == DIFF_NULL_PATH or (suffixes and not path.endswith(suffixes)):
+                current = None
+                continue
+            if path.startswith("b/"):
+                path = path[2:]
+            current = changes.setdefault(path, FileChanges(path))
+            continue
+
+        if current is None:
+            continue
+
+        match = HUNK_HEADER.match(line)
+        if not match:
+            continue
+        start = int(match.group(1))
+        count = int(match.group(2)) if match.group(2) is not None else 1
+        if count:
+            current.ranges.append((start, start + count - 1))
+        else:
+            current.deletions.append(start)
+
+    for file_changes in changes.values():
+        file_changes.ranges = _merge_ranges(file_changes.ranges)
+    return changes
+
+
+@dataclass
+class ScopeSelection:
+    """What a set of changed lines touches in one parsed module."""
+
+    # Touched function/class definitions, each enclosing scope before its children
+    scopes: List[ast.AST] = field(default_factory=list)
+    # Statements overlapping the changed lines, plus the headers of touched scopes
+    nodes: List[ast.AST] = field(default_factory=list)
+    # A module-level statement (import, assignment, top-level code) changed
+    module_level_changed: bool = False
+
+    @property
+    def header_lines(self) -> Set[int]:
+        """Definition lines of touched scopes, where scope-level findings are reported."""
+        return {scope.lineno for scope in self.scopes}
+
+
+def select_changed_scopes(tree: ast.Module, changes: FileChanges) -> ScopeSelection:
+    """
+    Map changed lines onto the scopes and statements of a parsed module.
+
+    Args:
+        tree: Module parsed from the new version of the file
+        changes: Changed lines of that file
+
+    Returns:
+        ScopeSelection for the change
+    """
+    selection = ScopeSelection()
+    spans = changes.touch_spans()
+    _select_in_body(tree.body, spans, selection, module_level=True)
+
+    # A deletion outside every top-level definition may have removed module-level code
+    top_level = [(_scope_start(node), node.end_lineno) for node in tree.body if isinstance(node, SCOPE_TYPES)]
+    for line in changes.deletions:
+        if not any(start <= line and line + 1 <= end for start, end in top_level):
+            selection.module_level_changed = True
+            break
+
+    return selection
+
+
+def filter_to_changes(violations: Iterable, changes: FileChanges, selection: ScopeSelection) -> list:
+    """
+    Keep findings on changed lines or on the definition line of a touched scope.
+
+    Args:
+        violations: Findings with a ``line_number`` attribute
+        changes: Changed lines of the file
+        selection: Scopes touched by the change
+
+    Returns:
+        Filtered list, in the original order
+    """
+    header_lines = selection.header_lines
+    kept = []
+    for violation in violations:
+        line = getattr(violation, "line_number", 0) or 0
+        if line in header_lines or changes.contains_line(line):
+            kept.append(violation)
+    return kept
+
+
+def _select_in_body(body: List[ast.stmt], spans: List[LineRange], selection: ScopeSelection, module_level: bool) -> None:
+    for stmt in body:
+        start = _scope_start(stmt) if isinstance(stmt, SCOPE_TYPES) else stmt.lineno
+        if not _overlaps(spans, start, stmt.end_lineno):
+            continue
+
+        if isinstance(stmt, SCOPE_TYPES):
+            selection.scopes.append(stmt)
+            # Findings on the definition line are kept for every touched scope,
+            # so its header is re-scanned even when only the body changed
+            selection.nodes.extend(_header_nodes(stmt))
+            _select_in_body(stmt.body, spans, selection, module_level=False)
+            continue
+
+        if module_level:
+            selection.module_level_changed = True
+        selection.nodes.append(stmt)
+        # Definitions nested in compound statements (if/try/with) are scopes too
+        for node in ast.walk(stmt):
+            if isinstance(node, SCOPE_TYPES) and _overlaps(spans, _scope_start(node), node.end_lineno):
+                selection.scopes.append(node)
+
+
+def _scope_start(node: ast.AST) -> int:
+    decorators = getattr(node, "decorator_list", None)
+    if decorators:
+        return min(node.lineno, *(decorator.lineno for decorator in decorators))
+    return node.lineno
+
+
+def _header_nodes(node: ast.AST) -> List[ast.AST]:
+    nodes: List[ast.AST] = list(node.decorator_list)
+    if isinstance(node, ast.ClassDef):
+        nodes.extend(node.bases)
+        nodes.extend(node.keywords)
+    else:
+        nodes.append(node.args)
+        if node.returns is not None:
+            nodes.append(node.returns)
+    return nodes
+
+
+def _overlaps(spans: List[LineRange], start: int, end: int) -> bool:
+    """True when [start, end] intersects any of the sorted, merged spans."""
+    index = bisect_right(spans, (end, float("inf"))) - 1
+    return index >= 0 and spans[index][1] >= start
+
+
+def _merge_ranges(ranges: Iterable[LineRange]) -> List[LineRange]:
+    merged: List[LineRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+__all__ = [
+    "FileChanges",
+    "ScopeSelection",
+    "filter_to_changes",
+    "parse_unified_diff",
+    "select_changed_scopes",
+]
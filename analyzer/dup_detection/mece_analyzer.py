@@ -11,7 +11,7 @@ import json
 import logging
 from pathlib import Path
 import sys
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Import constants
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -127,6 +127,32 @@ class MECEAnalyzer:
         except Exception as e:
             return {"success": False, "error": f"Analysis error: {e!s}", "mece_score": 0.0, "duplications": []}
 
+    def extract_file_blocks(self, file_path: Path) -> List[CodeBlock]:
+        """Code blocks of one file, for callers that collect blocks as files stream in."""
+        if file_path.suffix != ".py" or not self._should_analyze_file(file_path):
+            return []
+        return self._extract_blocks_from_file(file_path)
+
+    def find_duplications(
+        self,
+        blocks: List[CodeBlock],
+        should_stop: Optional[Callable[[], bool]] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Cluster blocks gathered with ``extract_file_blocks``.
+
+        Args:
+            blocks: Code blocks of every analyzed file
+            should_stop: Polled before each block; clustering stops early when it returns True
+            on_progress: Called with (blocks reached, blocks total) as clustering advances
+
+        Returns:
+            Duplications in ``analyze_path`` format and the MECE score
+        """
+        clusters = self._find_duplication_clusters(blocks, should_stop, on_progress)
+        return [self._cluster_to_dict(cluster) for cluster in clusters], self._calculate_mece_score(blocks, clusters)
+
     def _extract_code_blocks(self, path_obj: Path) -> List[CodeBlock]:
         """Extract code blocks from Python files."""
         blocks = []
@@ -211,12 +237,21 @@ class MECEAnalyzer:
         line_count = block.end_line - block.start_line + 1
         return line_count >= self.min_lines and len(block.normalized_content) > 50
 
-    def _find_duplication_clusters(self, blocks: List[CodeBlock]) -> List[DuplicationCluster]:
+    def _find_duplication_clusters(
+        self,
+        blocks: List[CodeBlock],
+        should_stop: Optional[Callable[[], bool]] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[DuplicationCluster]:
         """Find clusters of similar code blocks."""
         clusters = []
         processed_blocks = set()
 
         for i, block1 in enumerate(blocks):
+            if should_stop is not None and should_stop():
+                break
+            if on_progress is not None:
+                on_progress(i + 1, len(blocks))
             if block1.hash_signature in processed_blocks:
                 continue
 
@@ -2,6 +2,7 @@
 
 from .analyzer import SixSigmaAnalyzer
 from .calculator import CTQCalculator, ProcessCapability
+from .metrics_kernel import SixSigmaMetricsKernel, ViolationTable, count_ast_opportunities
 from .telemetry import QualityLevel, SixSigmaMetrics, SixSigmaTelemetry
 
 __all__ = [
@@ -10,5 +11,8 @@ __all__ = [
     "QualityLevel",
     "SixSigmaAnalyzer",
     "SixSigmaMetrics",
+    "SixSigmaMetricsKernel",
     "SixSigmaTelemetry",
+    "ViolationTable",
+    "count_ast_opportunities",
 ]
@@ -15,7 +15,14 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from analyzer.constants import MAX_DPMO, SIGMA_LEVEL_TARGET
 from .calculator import CTQCalculator, ProcessCapability
-from .telemetry import SixSigmaTelemetry
+from .metrics_kernel import (
+    MIN_FILE_OPPORTUNITIES,
+    FileSigmaMetrics,
+    SixSigmaMetricsKernel,
+    ViolationTable,
+    count_ast_opportunities,
+)
+from .telemetry import SixSigmaMetrics, SixSigmaTelemetry
 
 logger = logging.getLogger(__name__)
 
@@ -65,21 +72,26 @@ class SixSigmaAnalyzer:
         "convention": 0.05,  # Lower impact
     }
 
-    def __init__(self, target_level: str = "enterprise"):
+    def __init__(self, target_level: str = "enterprise", history_dir: Optional[Path] = None):
         """
         Initialize Six Sigma analyzer
 
         Args:
             target_level: Target quality level (world_class, enterprise, standard, baseline)
+            history_dir: Directory of the persistent snapshot history (see ``SixSigmaTelemetry``)
         """
-        self.telemetry = SixSigmaTelemetry()
+        self.telemetry = SixSigmaTelemetry(history_dir=history_dir)
         self.ctq_calculator = CTQCalculator()
         self.process_capability = ProcessCapability()
+        self.metrics_kernel = SixSigmaMetricsKernel(self.telemetry, self.CTQ_WEIGHTS)
         self.target_level = self.QUALITY_TARGETS.get(target_level, self.QUALITY_TARGETS["enterprise"])
         self.analysis_results = []
 
     def analyze_violations(
-        self, violations: List[Dict[str, Any]], file_path: Optional[Path] = None
+        self,
+        violations: List[Dict[str, Any]],
+        file_path: Optional[Path] = None,
+        opportunities: Optional[int] = None,
     ) -> SixSigmaAnalysisResult:
         """
         Analyze connascence violations using Six Sigma methodology
@@ -87,6 +99,8 @@ class SixSigmaAnalyzer:
         Args:
             violations: List of violation dictionaries
             file_path: Optional file path being analyzed
+            opportunities: Optional precomputed AST opportunity count (from
+                ``count_ast_opportunities``); ``file_path`` is re-parsed otherwise
 
         Returns:
             SixSigmaAnalysisResult with comprehensive metrics
@@ -113,7 +127,7 @@ class SixSigmaAnalyzer:
 
         # Record file analysis
         total_violations = len(violations)
-        total_checks = self._count_violation_opportunities(file_path)
+        total_checks = opportunities if opportunities is not None else self._count_violation_opportunities(file_path)
         self.telemetry.record_file_analyzed(total_violations, total_checks)
 
         # Generate metrics
@@ -123,13 +137,7 @@ class SixSigmaAnalyzer:
         ctq_metrics = self._calculate_ctq_metrics(violations_by_type, total_violations)
 
         # Calculate process capability
-        if total_violations > 0:
-            violation_rates = [violations_by_type.get(vtype, 0) / total_violations for vtype in self.CTQ_WEIGHTS]
-            cp, cpk = self.telemetry.calculate_process_capability(
-                violation_rates, 0.0, 0.1  # Target: 0%, USL: 10% violation rate
-            )
-        else:
-            cp, cpk = float("inf"), float("inf")
+        cp, cpk = self._calculate_process_capability(violations_by_type, total_violations)
 
         # Generate improvement suggestions
         suggestions = self._generate_improvement_suggestions(
@@ -169,31 +177,28 @@ class SixSigmaAnalyzer:
 
         return ctq_metrics
 
+    def _calculate_process_capability(
+        self, violations_by_type: Dict[str, int], total_violations: int
+    ) -> Tuple[float, float]:
+        """Cp/Cpk of the per-type violation rates (target 0%, USL 10%)."""
+        if total_violations == 0:
+            return float("inf"), float("inf")
+
+        violation_rates = [violations_by_type.get(vtype, 0) / total_violations for vtype in self.CTQ_WEIGHTS]
+        return self.telemetry.calculate_process_capability(violation_rates, 0.0, 0.1)
+
     def _count_violation_opportunities(self, file_path: Optional[Path]) -> int:
         """Count actual checkable opportunities in the AST."""
         if not file_path:
-            return 10
+            return MIN_FILE_OPPORTUNITIES
 
         try:
             path = Path(file_path)
             tree = ast.parse(path.read_text(encoding="utf-8"))
         except (FileNotFoundError, PermissionError, SyntaxError, UnicodeDecodeError):
-            return 10
-
-        opportunities = 0
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                opportunities += 10
-            elif isinstance(node, ast.ClassDef):
-                opportunities += 8
-            elif isinstance(node, ast.If):
-                opportunities += 2
-            elif isinstance(node, ast.Try):
-                opportunities += 3
-            elif isinstance(node, ast.Assign):
-                opportunities += 1
-
-        return max(opportunities, 10)
+            return MIN_FILE_OPPORTUNITIES
+
+        return count_ast_opportunities(tree)
 
     def _generate_improvement_suggestions(
         self,
@@ -246,20 +251,33 @@ class SixSigmaAnalyzer:
 
         return suggestions
 
-    def analyze_codebase(self, violations_by_file: Dict[Path, List[Dict]]) -> Dict[str, Any]:
+    def analyze_codebase(
+        self,
+        violations_by_file: Dict[Path, List[Dict]],
+        file_opportunities: Optional[Dict[Path, int]] = None,
+    ) -> Dict[str, Any]:
         """
         Analyze entire codebase using Six Sigma methodology
 
+        All per-violation work happens in one pass of the columnar metrics
+        kernel. Pass ``file_opportunities`` (from ``count_ast_opportunities``
+        on already-parsed trees) to avoid re-reading and re-parsing files.
+
         Args:
             violations_by_file: Dictionary mapping file paths to violation lists
+            file_opportunities: Optional precomputed AST opportunity counts per file
 
         Returns:
             Comprehensive Six Sigma analysis report
         """
-        all_results = []
-        for file_path, violations in violations_by_file.items():
-            result = self.analyze_violations(violations, file_path)
-            all_results.append(result)
+        file_opportunities = dict(file_opportunities or {})
+        for file_path in violations_by_file:
+            if file_path not in file_opportunities:
+                file_opportunities[file_path] = self._count_violation_opportunities(file_path)
+
+        table = ViolationTable.from_violations_by_file(violations_by_file)
+        kernel_result = self.metrics_kernel.compute(table, file_opportunities)
+        all_results = [self._result_from_kernel(file_metrics) for file_metrics in kernel_result.files]
 
         # Aggregate metrics
         total_dpmo = sum(r.dpmo for r in all_results) / len(all_results) if all_results else 0
@@ -267,13 +285,8 @@ class SixSigmaAnalyzer:
         avg_rty = sum(r.rty for r in all_results) / len(all_results) if all_results else 100.0
 
         # Aggregate violations
-        total_by_type = {}
-        total_by_severity = {}
-        for result in all_results:
-            for vtype, count in result.violations_by_type.items():
-                total_by_type[vtype] = total_by_type.get(vtype, 0) + count
-            for severity, count in result.violations_by_severity.items():
-                total_by_severity[severity] = total_by_severity.get(severity, 0) + count
+        total_by_type = kernel_result.violations_by_type
+        total_by_severity = kernel_result.violations_by_severity
 
         # Determine overall quality level
         overall_quality = self.telemetry.get_quality_level(total_dpmo)
@@ -304,6 +317,45 @@ class SixSigmaAnalyzer:
             "timestamp": datetime.now().isoformat(),
         }
 
+    def _result_from_kernel(self, file_metrics: FileSigmaMetrics) -> SixSigmaAnalysisResult:
+        """Build a per-file result (and telemetry snapshot) from kernel output."""
+        self.telemetry.metrics_history.append(
+            SixSigmaMetrics(
+                dpmo=file_metrics.dpmo,
+                rty=file_metrics.rty,
+                sigma_level=file_metrics.sigma_level,
+                process_capability=0.0,  # single-file session: one measurement, no capability
+                quality_level=file_metrics.quality_level,
+                process_name=self.telemetry.process_name,
+                sample_size=1,
+                defect_count=file_metrics.defects,
+                opportunity_count=file_metrics.opportunities,
+                connascence_metrics=dict(file_metrics.violations_by_type),
+            )
+        )
+
+        result = SixSigmaAnalysisResult(
+            file_path=file_metrics.file_key or Path("."),
+            dpmo=file_metrics.dpmo,
+            sigma_level=file_metrics.sigma_level,
+            rty=file_metrics.rty,
+            quality_level=file_metrics.quality_level.name if file_metrics.quality_level else "UNKNOWN",
+            violations_by_type=file_metrics.violations_by_type,
+            violations_by_severity=file_metrics.violations_by_severity,
+            process_capability=self._calculate_process_capability(
+                file_metrics.violations_by_type, file_metrics.defects
+            ),
+            improvement_suggestions=self._generate_improvement_suggestions(
+                file_metrics.dpmo,
+                file_metrics.sigma_level,
+                file_metrics.violations_by_type,
+                file_metrics.violations_by_severity,
+            ),
+            ctq_metrics=file_metrics.ctq_metrics,
+        )
+        self.analysis_results.append(result)
+        return result
+
     def _generate_dmaic_plan(
         self,
         dpmo: float,
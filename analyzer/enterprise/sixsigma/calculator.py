@@ -10,6 +10,8 @@ import math
 import statistics
 from typing import Any, Dict, List, Optional, Tuple
 
+from .metrics_kernel import SixSigmaMetricsKernel, ViolationTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,25 +68,19 @@ class CTQCalculator:
         """
         metrics = {}
 
-        # Calculate maintainability index based on violations
-        maintainability = self._calculate_maintainability(violations)
-        metrics["maintainability_index"] = self._create_metric("maintainability_index", maintainability)
-
-        # Calculate complexity from algorithm/execution violations
-        complexity = self._calculate_complexity(violations)
-        metrics["cyclomatic_complexity"] = self._create_metric("cyclomatic_complexity", complexity)
-
-        # Calculate coupling from identity/type violations
-        coupling = self._calculate_coupling(violations)
-        metrics["coupling_factor"] = self._create_metric("coupling_factor", coupling)
+        # Single pass over the violations: every CTQ characteristic is
+        # derived from the per-type and per-severity counts.
+        table = ViolationTable.from_violations(violations)
+        violations_by_type: Dict[str, int] = {}
+        violations_by_severity: Dict[str, int] = {}
+        for (_file, type_code, severity_code), count in table.histogram().items():
+            vtype, severity = table.types[type_code], table.severities[severity_code]
+            violations_by_type[vtype] = violations_by_type.get(vtype, 0) + count
+            violations_by_severity[severity] = violations_by_severity.get(severity, 0) + count
 
-        # Calculate cohesion from meaning/convention violations
-        cohesion = self._calculate_cohesion(violations)
-        metrics["cohesion_score"] = self._create_metric("cohesion_score", cohesion)
-
-        # Calculate duplication from algorithm violations
-        duplication = self._calculate_duplication(violations)
-        metrics["duplication_ratio"] = self._create_metric("duplication_ratio", duplication)
+        values = SixSigmaMetricsKernel.quality_ctq_values(violations_by_type, violations_by_severity)
+        for name, value in values.items():
+            metrics[name] = self._create_metric(name, value)
 
         # Placeholder for test coverage (would need actual test data)
         test_coverage = 75.0  # Default assumption
@@ -116,66 +112,6 @@ class CTQCalculator:
             status=status,
         )
 
-    def _calculate_maintainability(self, violations: List[Dict]) -> float:
-        """Calculate maintainability index from violations"""
-        if not violations:
-            return 100.0  # Perfect maintainability
-
-        # Base score of 100, reduced by violations
-        score = 100.0
-
-        severity_impact = {"critical": 10.0, "high": 5.0, "medium": 2.0, "low": 0.5}
-
-        for violation in violations:
-            severity = violation.get("severity", "low").lower()
-            score -= severity_impact.get(severity, 1.0)
-
-        return max(0.0, score)
-
-    def _calculate_complexity(self, violations: List[Dict]) -> float:
-        """Calculate complexity metric from violations"""
-        # Count algorithm and execution violations as complexity indicators
-        complexity_violations = [v for v in violations if v.get("type") in ["algorithm", "execution", "timing"]]
-
-        # Estimate cyclomatic complexity
-        base_complexity = 5.0
-        additional = len(complexity_violations) * 0.5
-        return min(20.0, base_complexity + additional)
-
-    def _calculate_coupling(self, violations: List[Dict]) -> float:
-        """Calculate coupling factor from violations"""
-        # Count identity and type violations as coupling indicators
-        coupling_violations = [v for v in violations if v.get("type") in ["identity", "type", "position"]]
-
-        if not violations:
-            return 0.0
-
-        # Coupling factor = coupling violations / total violations
-        return min(1.0, len(coupling_violations) / (len(violations) * 2))
-
-    def _calculate_cohesion(self, violations: List[Dict]) -> float:
-        """Calculate cohesion score from violations"""
-        # Meaning and convention violations indicate poor cohesion
-        cohesion_violations = [v for v in violations if v.get("type") in ["meaning", "convention", "values"]]
-
-        if not violations:
-            return 1.0  # Perfect cohesion
-
-        # Cohesion = 1 - (cohesion violations / total violations)
-        poor_cohesion_ratio = len(cohesion_violations) / len(violations)
-        return max(0.0, 1.0 - poor_cohesion_ratio)
-
-    def _calculate_duplication(self, violations: List[Dict]) -> float:
-        """Calculate duplication ratio from violations"""
-        # Algorithm violations often indicate duplication
-        duplication_violations = [v for v in violations if v.get("type") == "algorithm"]
-
-        if not violations:
-            return 0.0
-
-        # Rough estimate of duplication ratio
-        return min(1.0, len(duplication_violations) / (len(violations) * 5))
-
     def calculate_composite_score(self) -> float:
         """Calculate weighted composite CTQ score"""
         if not self.calculated_metrics:
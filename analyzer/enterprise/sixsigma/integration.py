@@ -25,15 +25,17 @@ class ConnascenceSixSigmaIntegration:
     violation detection and Six Sigma's quality measurement framework.
     """
 
-    def __init__(self, target_sigma_level: float = 5.0):
+    def __init__(self, target_sigma_level: float = 5.0, history_dir: Optional[Path] = None):
         """
         Initialize integration
 
         Args:
             target_sigma_level: Target sigma level (default 5.0 for enterprise)
+            history_dir: Directory of the persistent snapshot history (see ``SixSigmaTelemetry``)
         """
-        self.analyzer = SixSigmaAnalyzer(self._get_target_level(target_sigma_level))
-        self.telemetry = SixSigmaTelemetry()
+        self.analyzer = SixSigmaAnalyzer(self._get_target_level(target_sigma_level), history_dir=history_dir)
+        # One telemetry per history store; the analyzer records the snapshots
+        self.telemetry: SixSigmaTelemetry = self.analyzer.telemetry
         self.violation_history = []
 
     def _get_target_level(self, sigma_level: float) -> str:
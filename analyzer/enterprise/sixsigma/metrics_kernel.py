@@ -0,0 +1,331 @@
+"""
+Columnar Six Sigma Metrics Kernel
+
+Computes DPMO, sigma level, RTY and the CTQ scores for a whole codebase in
+one pass over a columnar violation table, instead of re-parsing files to
+count opportunities and re-scanning the violation list once per CTQ
+category and severity bucket.
+
+The kernel reproduces the per-violation bookkeeping of ``SixSigmaTelemetry``,
+``SixSigmaAnalyzer`` and ``CTQCalculator`` exactly: all per-violation work is
+reduced to a single histogram of (file, type, severity) cells, and every
+metric is derived from that histogram.
+"""
+
+import ast
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Minimum opportunity count per file (mirrors the analyzer fallback).
+MIN_FILE_OPPORTUNITIES = 10
+
+# Opportunities contributed by each AST node kind.
+AST_OPPORTUNITY_WEIGHTS = {
+    ast.FunctionDef: 10,
+    ast.ClassDef: 8,
+    ast.If: 2,
+    ast.Try: 3,
+    ast.Assign: 1,
+}
+
+# Default opportunity multiplier for connascence types the telemetry does not know.
+DEFAULT_TYPE_OPPORTUNITIES = 3
+
+# CTQCalculator category memberships (matched on the raw violation type).
+COMPLEXITY_TYPES = frozenset({"algorithm", "execution", "timing"})
+COUPLING_TYPES = frozenset({"identity", "type", "position"})
+COHESION_TYPES = frozenset({"meaning", "convention", "values"})
+DUPLICATION_TYPES = frozenset({"algorithm"})
+SEVERITY_IMPACT = {"critical": 10.0, "high": 5.0, "medium": 2.0, "low": 0.5}
+DEFAULT_SEVERITY_IMPACT = 1.0
+
+
+def count_ast_opportunities(tree: ast.AST) -> int:
+    """Count checkable opportunities in a parsed module (at least 10)."""
+    weights = AST_OPPORTUNITY_WEIGHTS
+    opportunities = 0
+    for node in ast.walk(tree):
+        opportunities += weights.get(type(node), 0)
+    return max(opportunities, MIN_FILE_OPPORTUNITIES)
+
+
+class ViolationTable:
+    """
+    Columnar violation storage.
+
+    Each violation is three small integers (file, type and severity codes)
+    into per-table vocabularies, so a million violations cost a few
+    megabytes and can be histogrammed in a single pass.
+    """
+
+    def __init__(self):
+        self.files: List[Hashable] = []
+        self.types: List[str] = []
+        self.severities: List[str] = []
+        self._file_ids: Dict[Hashable, int] = {}
+        self._type_ids: Dict[str, int] = {}
+        self._severity_ids: Dict[str, int] = {}
+        self.file_codes = array("I")
+        self.type_codes = array("I")
+        self.severity_codes = array("I")
+
+    def __len__(self) -> int:
+        return len(self.type_codes)
+
+    @staticmethod
+    def _code(value, vocabulary: List, ids: Dict) -> int:
+        code = ids.get(value)
+        if code is None:
+            code = ids[value] = len(vocabulary)
+            vocabulary.append(value)
+        return code
+
+    def add_file(self, file_key: Hashable) -> int:
+        """Register a file (so files without violations are still reported)."""
+        return self._code(file_key, self.files, self._file_ids)
+
+    def append(self, file_key: Hashable, violation_type: str, severity: str) -> None:
+        """Append one violation."""
+        self.file_codes.append(self._code(file_key, self.files, self._file_ids))
+        self.type_codes.append(self._code(violation_type, self.types, self._type_ids))
+        self.severity_codes.append(self._code(severity, self.severities, self._severity_ids))
+
+    def extend_file(self, file_key: Hashable, violations: Iterable[Dict[str, Any]]) -> None:
+        """Append all violations of one file, using the analyzer's defaults."""
+        file_code = self.add_file(file_key)
+        types, type_ids = self.types, self._type_ids
+        severities, severity_ids = self.severities, self._severity_ids
+        type_codes, severity_codes = self.type_codes, self.severity_codes
+        count = 0
+
+        for violation in violations:
+            vtype = violation.get("type", "unknown")
+            severity = violation.get("severity", "low")
+            code = type_ids.get(vtype)
+            if code is None:
+                code = type_ids[vtype] = len(types)
+                types.append(vtype)
+            type_codes.append(code)
+            code = severity_ids.get(severity)
+            if code is None:
+                code = severity_ids[severity] = len(severities)
+                severities.append(severity)
+            severity_codes.append(code)
+            count += 1
+
+        self.file_codes.extend([file_code] * count)
+
+    @classmethod
+    def from_violations(cls, violations: Iterable[Dict[str, Any]], file_key: Hashable = None) -> "ViolationTable":
+        """Build a single-file table from violation dictionaries."""
+        table = cls()
+        table.extend_file(file_key, violations)
+        return table
+
+    @classmethod
+    def from_violations_by_file(cls, violations_by_file: Dict[Hashable, List[Dict[str, Any]]]) -> "ViolationTable":
+        """Build a table from a ``{file: [violation, ...]}`` mapping."""
+        table = cls()
+        for file_key, violations in violations_by_file.items():
+            table.extend_file(file_key, violations)
+        return table
+
+    def histogram(self) -> Dict[Tuple[int, int, int], int]:
+        """Count violations per (file, type, severity) cell in one pass."""
+        if not len(self):
+            return {}
+
+        if NUMPY_AVAILABLE:
+            n_types, n_severities = len(self.types), len(self.severities)
+            files = np.frombuffer(self.file_codes, dtype=np.uint32).astype(np.int64)
+            types = np.frombuffer(self.type_codes, dtype=np.uint32).astype(np.int64)
+            severities = np.frombuffer(self.severity_codes, dtype=np.uint32).astype(np.int64)
+            cells = (files * n_types + types) * n_severities + severities
+            counts = np.bincount(cells)
+            nonzero = np.flatnonzero(counts)
+            return {
+                (int(cell) // (n_types * n_severities), (int(cell) // n_severities) % n_types, int(cell) % n_severities): int(
+                    counts[cell]
+                )
+                for cell in nonzero
+            }
+
+        return dict(Counter(zip(self.file_codes, self.type_codes, self.severity_codes)))
+
+
+@dataclass
+class FileSigmaMetrics:
+    """Six Sigma metrics for one file, as produced by ``SixSigmaAnalyzer``."""
+
+    file_key: Hashable
+    defects: int
+    opportunities: int
+    dpmo: float
+    sigma_level: float
+    rty: float
+    quality_level: Any
+    violations_by_type: Dict[str, int] = field(default_factory=dict)
+    violations_by_severity: Dict[str, int] = field(default_factory=dict)
+    ctq_metrics: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class KernelResult:
+    """Output of one kernel pass."""
+
+    files: List[FileSigmaMetrics]
+    violations_by_type: Dict[str, int]
+    violations_by_severity: Dict[str, int]
+    ctq_values: Dict[str, float]
+    total_violations: int
+
+
+class SixSigmaMetricsKernel:
+    """
+    Derives every Six Sigma and CTQ metric from a violation histogram.
+
+    Args:
+        telemetry: ``SixSigmaTelemetry`` providing DPMO/sigma/quality
+            conversions and the per-type opportunity multipliers
+        ctq_weights: Connascence CTQ weights (``SixSigmaAnalyzer.CTQ_WEIGHTS``)
+    """
+
+    def __init__(self, telemetry, ctq_weights: Dict[str, float]):
+        self.telemetry = telemetry
+        self.ctq_weights = ctq_weights
+
+    def compute(
+        self, table: ViolationTable, file_opportunities: Optional[Dict[Hashable, int]] = None
+    ) -> KernelResult:
+        """
+        Compute per-file and codebase metrics.
+
+        Args:
+            table: Columnar violations
+            file_opportunities: Precomputed AST opportunity counts per file
+                (from ``count_ast_opportunities``); missing files use the
+                analyzer's minimum of 10
+
+        Returns:
+            KernelResult with per-file metrics, aggregates and CTQ inputs
+        """
+        file_opportunities = file_opportunities or {}
+        histogram = table.histogram()
+        n_files = len(table.files)
+
+        type_opportunities = [
+            self.telemetry.CONNASCENCE_OPPORTUNITIES.get(vtype.lower(), DEFAULT_TYPE_OPPORTUNITIES)
+            for vtype in table.types
+        ]
+        severities_lower = [severity.lower() for severity in table.severities]
+
+        per_file_type: List[Dict[str, int]] = [{} for _ in range(n_files)]
+        per_file_severity: List[Dict[str, int]] = [{} for _ in range(n_files)]
+        defects = [0] * n_files
+        opportunities = [0] * n_files
+        blocking = [0] * n_files  # critical + high violations
+
+        for (file_code, type_code, severity_code), count in histogram.items():
+            vtype = table.types[type_code]
+            severity = table.severities[severity_code]
+            severity_lower = severities_lower[severity_code]
+
+            by_type = per_file_type[file_code]
+            by_type[vtype] = by_type.get(vtype, 0) + count
+            by_severity = per_file_severity[file_code]
+            by_severity[severity] = by_severity.get(severity, 0) + count
+
+            defects[file_code] += count
+            multiplier = type_opportunities[type_code] * (2 if severity_lower == "critical" else 1)
+            opportunities[file_code] += count * multiplier
+            if severity_lower in ("critical", "high"):
+                blocking[file_code] += count
+
+        files = []
+        for file_code, file_key in enumerate(table.files):
+            checks = file_opportunities.get(file_key, MIN_FILE_OPPORTUNITIES)
+            total_opportunities = opportunities[file_code] + checks
+            dpmo = self.telemetry.calculate_dpmo(defects[file_code], total_opportunities)
+            passed = 1 if defects[file_code] == 0 or blocking[file_code] == 0 else 0
+            files.append(
+                FileSigmaMetrics(
+                    file_key=file_key,
+                    defects=defects[file_code],
+                    opportunities=total_opportunities,
+                    dpmo=dpmo,
+                    sigma_level=self.telemetry.calculate_sigma_level(dpmo),
+                    rty=self.telemetry.calculate_rty(1, passed),
+                    quality_level=self.telemetry.get_quality_level(dpmo),
+                    violations_by_type=per_file_type[file_code],
+                    violations_by_severity=per_file_severity[file_code],
+                    ctq_metrics=self.connascence_ctq_metrics(per_file_type[file_code], defects[file_code]),
+                )
+            )
+
+        total_by_type: Dict[str, int] = {}
+        total_by_severity: Dict[str, int] = {}
+        for metrics in files:
+            for vtype, count in metrics.violations_by_type.items():
+                total_by_type[vtype] = total_by_type.get(vtype, 0) + count
+            for severity, count in metrics.violations_by_severity.items():
+                total_by_severity[severity] = total_by_severity.get(severity, 0) + count
+
+        return KernelResult(
+            files=files,
+            violations_by_type=total_by_type,
+            violations_by_severity=total_by_severity,
+            ctq_values=self.quality_ctq_values(total_by_type, total_by_severity),
+            total_violations=len(table),
+        )
+
+    def connascence_ctq_metrics(self, violations_by_type: Dict[str, int], total_violations: int) -> Dict[str, float]:
+        """Weighted connascence CTQ scores (``SixSigmaAnalyzer._calculate_ctq_metrics``)."""
+        if total_violations == 0:
+            return dict.fromkeys(self.ctq_weights.keys(), 0.0)
+
+        ctq_metrics = {
+            vtype: round((violations_by_type.get(vtype, 0) / total_violations) * weight * 100, 2)
+            for vtype, weight in self.ctq_weights.items()
+        }
+        ctq_metrics["composite"] = round(sum(ctq_metrics.values()), 2)
+        return ctq_metrics
+
+    @staticmethod
+    def quality_ctq_values(violations_by_type: Dict[str, int], violations_by_severity: Dict[str, int]) -> Dict[str, float]:
+        """Raw CTQ characteristic values (``CTQCalculator.calculate_from_violations``)."""
+        total = sum(violations_by_type.values())
+        if total == 0:
+            return {
+                "maintainability_index": 100.0,
+                "cyclomatic_complexity": 5.0,
+                "coupling_factor": 0.0,
+                "cohesion_score": 1.0,
+                "duplication_ratio": 0.0,
+            }
+
+        impact = 0.0
+        for severity, count in violations_by_severity.items():
+            impact += count * SEVERITY_IMPACT.get(severity.lower(), DEFAULT_SEVERITY_IMPACT)
+
+        def in_category(category: frozenset) -> int:
+            return sum(count for vtype, count in violations_by_type.items() if vtype in category)
+
+        return {
+            "maintainability_index": max(0.0, 100.0 - impact),
+            "cyclomatic_complexity": min(20.0, 5.0 + in_category(COMPLEXITY_TYPES) * 0.5),
+            "coupling_factor": min(1.0, in_category(COUPLING_TYPES) / (total * 2)),
+            "cohesion_score": max(0.0, 1.0 - in_category(COHESION_TYPES) / total),
+            "duplication_ratio": min(1.0, in_category(DUPLICATION_TYPES) / (total * 5)),
+        }
@@ -3,6 +3,11 @@ Six Sigma Telemetry System for Connascence Analysis
 
 Tracks and calculates enterprise-grade quality metrics specifically
 for connascence violations and code quality.
+
+With a history store attached, every snapshot is appended to an
+append-only time series, so history persists without rewriting a JSON file
+and trend queries read only the requested window. Snapshots from files
+written by ``save_metrics`` are imported into the store when loaded.
 """
 
 from dataclasses import dataclass, field
@@ -15,8 +20,27 @@ import statistics
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
+from analyzer.optimization.timeseries_store import TimeSeriesStore
+
 logger = logging.getLogger(__name__)
 
+# History directory under a project root, shared with the drift tracker
+DEFAULT_HISTORY_DIR = ".connascence"
+
+# Snapshots written by save_metrics when a history store holds the full history
+MAX_SAVED_SNAPSHOTS = 100
+
+# Snapshot fields kept in the history store
+HISTORY_FIELDS = (
+    "dpmo",
+    "rty",
+    "sigma_level",
+    "process_capability",
+    "sample_size",
+    "defect_count",
+    "opportunity_count",
+)
+
 
 class QualityLevel(Enum):
     """Six Sigma quality levels with DPMO thresholds"""
@@ -93,10 +117,20 @@ class SixSigmaTelemetry:
         "convention": 2,
     }
 
-    def __init__(self, process_name: str = "connascence_analysis"):
-        """Initialize telemetry system"""
+    def __init__(self, process_name: str = "connascence_analysis", history_dir: Optional[Path] = None):
+        """
+        Initialize telemetry system
+
+        Args:
+            process_name: Name of the measured process
+            history_dir: Directory of the persistent snapshot history; without
+                it history lives in memory only
+        """
         self.process_name = process_name
         self.metrics_history: List[SixSigmaMetrics] = []
+        self.history_store: Optional[TimeSeriesStore] = None
+        if history_dir is not None:
+            self.history_store = TimeSeriesStore(history_dir, f"sixsigma_{process_name}", HISTORY_FIELDS)
         self.current_session_data = {
             "defects": 0,
             "opportunities": 0,
@@ -280,6 +314,10 @@ class SixSigmaTelemetry:
         )
 
         self.metrics_history.append(metrics)
+        if self.history_store is not None:
+            self.history_store.append(
+                {name: getattr(metrics, name) for name in HISTORY_FIELDS}, timestamp=metrics.timestamp.timestamp()
+            )
         return metrics
 
     def reset_session(self):
@@ -303,12 +341,19 @@ class SixSigmaTelemetry:
         cutoff_date = datetime.now() - timedelta(days=days)
         recent_metrics = [m for m in self.metrics_history if m.timestamp >= cutoff_date]
 
-        if not recent_metrics:
-            return {"error": "No metrics data available for trend analysis"}
+        if self.history_store is not None:
+            # Persistent history covers earlier sessions too; read just the window
+            rows = [values for _, values in self.history_store.records(since=cutoff_date.timestamp())]
+            dpmo_values = [values["dpmo"] for values in rows]
+            rty_values = [values["rty"] for values in rows]
+            sigma_values = [values["sigma_level"] for values in rows]
+        else:
+            dpmo_values = [m.dpmo for m in recent_metrics]
+            rty_values = [m.rty for m in recent_metrics]
+            sigma_values = [m.sigma_level for m in recent_metrics]
 
-        dpmo_values = [m.dpmo for m in recent_metrics]
-        rty_values = [m.rty for m in recent_metrics]
-        sigma_values = [m.sigma_level for m in recent_metrics]
+        if not dpmo_values:
+            return {"error": "No metrics data available for trend analysis"}
 
         # Analyze connascence type trends
         connascence_trends = {}
@@ -320,7 +365,7 @@ class SixSigmaTelemetry:
 
         return {
             "period_days": days,
-            "sample_count": len(recent_metrics),
+            "sample_count": len(dpmo_values),
             "dpmo": {
                 "current": dpmo_values[-1] if dpmo_values else 0,
                 "average": round(statistics.mean(dpmo_values), 2) if dpmo_values else 0,
@@ -373,14 +418,25 @@ class SixSigmaTelemetry:
         }
 
     def save_metrics(self, filepath: Path):
-        """Save metrics to file"""
+        """
+        Save metrics to file
+
+        With a history store attached only the latest snapshots are written;
+        the full history is already in the store.
+        """
+        data = self.export_metrics()
+        if self.history_store is not None:
+            data["metrics_history"] = data["metrics_history"][-MAX_SAVED_SNAPSHOTS:]
         with open(filepath, "w") as f:
-            json.dump(self.export_metrics(), f, indent=2, default=str)
+            json.dump(data, f, indent=2, default=str)
 
     def load_metrics(self, filepath: Path):
-        """Load metrics from file"""
+        """Load metrics from file, importing snapshots newer than the history store's into it"""
         with open(filepath) as f:
             data = json.load(f)
+            last_stored = None
+            if self.history_store is not None:
+                last_stored = self.history_store.last_timestamp
             # Restore metrics history
             for metric_data in data.get("metrics_history", []):
                 metric = SixSigmaMetrics(
@@ -397,3 +453,7 @@ class SixSigmaTelemetry:
                     connascence_metrics=metric_data.get("connascence_metrics", {}),
                 )
                 self.metrics_history.append(metric)
+                stamp = metric.timestamp.timestamp()
+                if self.history_store is not None and (last_stored is None or stamp > last_stored):
+                    values = {name: getattr(metric, name) for name in HISTORY_FIELDS}
+                    self.history_store.append(values, timestamp=stamp)
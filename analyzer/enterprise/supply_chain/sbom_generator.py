@@ -25,6 +25,8 @@ from pathlib import Path
 import subprocess
 from typing import Dict, List, Optional
 
+from analyzer.optimization.digest_service import ArtifactDigestService, get_digest_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,9 +56,11 @@ class SBOMMetadata:
 
 
 class SBOMGenerator:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, digest_service: Optional[ArtifactDigestService] = None):
         self.project_root = Path(project_root)
+        self.digest_service = digest_service or get_digest_service(self.project_root)
         self.components: List[Component] = []
+        self.file_components: List[Component] = []
         self.metadata = SBOMMetadata(timestamp=datetime.now().isoformat())
 
     def scan_dependencies(self) -> List[Component]:
@@ -77,6 +81,16 @@ class SBOMGenerator:
         self.components = components
         return components
 
+    def scan_source_files(self, suffixes: Optional[List[str]] = None) -> List[Component]:
+        """Add a ``file`` component with a SHA-256 hash for every in-scope source file."""
+        digests = self.digest_service.digest_tree(self.project_root, suffixes=tuple(suffixes or [".py"]))
+        self.file_components = [
+            Component(name=relative_path, version="", type="file", hashes={"sha-256": digest})
+            for relative_path, digest in digests.items()
+        ]
+        self.digest_service.save()
+        return self.file_components
+
     def _scan_requirements(self, req_file: Path) -> List[Component]:
         components = []
 
@@ -173,7 +187,7 @@ class SBOMGenerator:
                         else []
                     ),
                 }
-                for comp in self.components
+                for comp in self.components + self.file_components
             ],
         }
 
@@ -212,6 +226,16 @@ class SBOMGenerator:
                 }
                 for comp in self.components
             ],
+            "files": [
+                {
+                    "SPDXID": f"SPDXRef-File-{index}",
+                    "fileName": f"./{comp.name}",
+                    "checksums": [{"algorithm": "SHA256", "checksumValue": comp.hashes["sha-256"]}],
+                    "licenseConcluded": "NOASSERTION",
+                    "copyrightText": "NOASSERTION",
+                }
+                for index, comp in enumerate(self.file_components)
+            ],
             "relationships": (
                 [
                     {
@@ -271,6 +295,7 @@ def main():
     parser.add_argument("--output-cyclonedx", default="sbom-cyclonedx.json", help="CycloneDX output file")
     parser.add_argument("--output-spdx", default="sbom-spdx.json", help="SPDX output file")
     parser.add_argument("--enrich-licenses", action="store_true", help="Detect and add license information")
+    parser.add_argument("--include-files", action="store_true", help="Add hashed source files as components")
 
     args = parser.parse_args()
 
@@ -280,6 +305,9 @@ def main():
     if args.enrich_licenses:
         generator.enrich_with_licenses()
 
+    if args.include_files:
+        generator.scan_source_files()
+
     logger.info("Found %s components", len(generator.components))
 
     if args.format in ["cyclonedx", "both"]:
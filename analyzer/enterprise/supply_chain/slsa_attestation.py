@@ -32,6 +32,8 @@ from pathlib import Path
 import subprocess
 from typing import Any, Dict, List, Optional, Tuple
 
+from analyzer.optimization.digest_service import READ_CHUNK_BYTES, ArtifactDigestService, get_digest_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,32 +77,27 @@ class SLSAAttestationGenerator:
     SLSA_PREDICATE_TYPE_V1 = "https://slsa.dev/provenance/v1"
     IN_TOTO_STATEMENT_TYPE = "https://in-toto.io/Statement/v0.1"
 
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, digest_service: Optional[ArtifactDigestService] = None):
         self.project_root = Path(project_root)
+        self.digest_service = digest_service or get_digest_service(self.project_root)
         self.materials: List[BuildMaterial] = []
         self.artifacts: List[BuildArtifact] = []
 
     def collect_build_materials(self) -> List[BuildMaterial]:
         materials = []
 
-        source_files = list(self.project_root.glob("**/*.py"))
-
-        for source_file in source_files[:50]:
-            try:
-                file_hash = self._calculate_file_hash(source_file)
-                materials.append(
-                    BuildMaterial(
-                        uri=f"file://{source_file.relative_to(self.project_root)}", digest={"sha256": file_hash}
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Could not hash {source_file}: {e}")
+        # Every in-scope source file, hashed in parallel through the shared
+        # digest cache (unchanged files are only stat'ed on warm runs).
+        source_digests = self.digest_service.digest_tree(self.project_root, suffixes=(".py",))
+        for relative_path, file_hash in source_digests.items():
+            materials.append(BuildMaterial(uri=f"file://{relative_path}", digest={"sha256": file_hash}))
 
         requirements_file = self.project_root / "requirements.txt"
         if requirements_file.exists():
             req_hash = self._calculate_file_hash(requirements_file)
             materials.append(BuildMaterial(uri="file://requirements.txt", digest={"sha256": req_hash}))
 
+        self.digest_service.save()
         self.materials = materials
         return materials
 
@@ -127,11 +124,13 @@ class SLSAAttestationGenerator:
         return artifacts
 
     def _calculate_file_hash(self, file_path: Path, algorithm: str = "sha256") -> str:
-        hasher = hashlib.new(algorithm)
-
         try:
+            if algorithm == "sha256":
+                return self.digest_service.digest_file(file_path)
+
+            hasher = hashlib.new(algorithm)
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
+                for chunk in iter(lambda: f.read(READ_CHUNK_BYTES), b""):
                     hasher.update(chunk)
             return hasher.hexdigest()
         except Exception as e:
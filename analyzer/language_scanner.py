@@ -0,0 +1,203 @@
+"""
+Single-pass source scanners for the regex-based language strategies.
+
+Each scanner is one compiled alternation (comments, strings, numbers,
+braces, statement ends, function headers) driven by a single ``finditer``
+over the whole file. Comment and string state fall out of the tokenizer, so
+literals and braces inside comments or strings are never counted, and magic
+literals, function boundaries and parameter lists are emitted together.
+"""
+
+from dataclasses import dataclass, field
+import re
+from typing import FrozenSet, List, Optional, Pattern, Tuple
+
+# Numbers that are never treated as magic literals
+NON_MAGIC_NUMBERS = frozenset({"0", "1"})
+# Strings need at least this many characters between the quotes to be flagged
+MIN_MAGIC_STRING_LENGTH = 3
+
+
+@dataclass
+class LiteralToken:
+    """A magic literal candidate found outside comments."""
+
+    line_number: int
+    column: int
+    text: str
+    literal_type: str  # 'number' or 'string'
+
+
+@dataclass
+class FunctionSpan:
+    """A function body delimited by balanced braces."""
+
+    name: str
+    start_line: int
+    end_line: int
+
+    @property
+    def length(self) -> int:
+        return self.end_line - self.start_line + 1
+
+
+@dataclass
+class ParameterList:
+    """A function header parameter list."""
+
+    name: str
+    line_number: int
+    column: int
+    parameters: str
+    code_snippet: str
+
+
+@dataclass
+class ScanResult:
+    """Everything the language strategies need from one pass over a file."""
+
+    literals: List[LiteralToken] = field(default_factory=list)
+    functions: List[FunctionSpan] = field(default_factory=list)
+    parameter_lists: List[ParameterList] = field(default_factory=list)
+
+
+class SourceScanner:
+    """
+    Compiled single-pass scanner for a brace-delimited language.
+
+    The token pattern must define the groups ``comment``, ``string``,
+    ``number``, ``open``, ``close``, ``end``, ``newline``; every other
+    top-level group is a function header exposing ``<group>_name`` and
+    ``<group>_params``.
+    """
+
+    def __init__(
+        self,
+        token_pattern: str,
+        magic_string_quotes: str = "\"'`",
+        rejected_names: FrozenSet[str] = frozenset(),
+    ):
+        self.pattern: Pattern[str] = re.compile(token_pattern, re.MULTILINE)
+        self.magic_string_quotes = magic_string_quotes
+        self.rejected_names = rejected_names
+
+    def scan(self, source: str) -> ScanResult:
+        """
+        Scan a whole source file once.
+
+        Args:
+            source: File contents
+
+        Returns:
+            ScanResult with literal candidates, closed function spans and
+            header parameter lists
+        """
+        result = ScanResult()
+        literals = result.literals
+        line_number = 1
+        line_start = 0
+        depth = 0
+
+        # Outermost function being tracked: (name, start_line, depth before its body)
+        pending: Optional[Tuple[str, int]] = None
+        active: Optional[Tuple[str, int, int]] = None
+
+        for match in self.pattern.finditer(source):
+            kind = match.lastgroup
+
+            if kind == "newline":
+                line_number += 1
+                line_start = match.end()
+            elif kind == "number" or kind == "string":
+                self._add_literal(kind, match, line_number, line_start, literals)
+                if kind == "string":
+                    text = match.group()
+                    newlines = text.count("\n")
+                    if newlines:
+                        line_number += newlines
+                        line_start = match.start() + text.rfind("\n") + 1
+            elif kind == "comment":
+                text = match.group()
+                newlines = text.count("\n")
+                if newlines:
+                    line_number += newlines
+                    line_start = match.start() + text.rfind("\n") + 1
+            elif kind == "open":
+                if pending is not None and active is None:
+                    active = (pending[0], pending[1], depth)
+                pending = None
+                depth += 1
+            elif kind == "close":
+                depth = max(0, depth - 1)
+                if active is not None and depth <= active[2]:
+                    result.functions.append(FunctionSpan(active[0], active[1], line_number))
+                    active = None
+            elif kind == "end":
+                # Prototype or expression-bodied function: no brace-delimited body
+                pending = None
+            else:
+                header = match.group()
+                name = match.group(f"{kind}_name") or ""
+                if name not in self.rejected_names and header.split(None, 1)[0] not in self.rejected_names:
+                    params = match.group(f"{kind}_params")
+                    line_end = source.find("\n", match.start())
+                    snippet = source[line_start : line_end if line_end != -1 else len(source)].strip()
+                    result.parameter_lists.append(
+                        ParameterList(name, line_number, match.start() - line_start, params, snippet)
+                    )
+                    if active is None:
+                        pending = (name or snippet[:50], line_number)
+
+                # Literals inside the header (default values, call arguments) still count
+                line_number, line_start = self._scan_header_literals(
+                    source, match.start(), match.end(), line_number, line_start, literals
+                )
+
+        return result
+
+    def _add_literal(
+        self, kind: str, match: "re.Match[str]", line_number: int, line_start: int, literals: List[LiteralToken]
+    ) -> None:
+        text = match.group()
+        if kind == "number":
+            if text not in NON_MAGIC_NUMBERS:
+                literals.append(LiteralToken(line_number, match.start() - line_start, text, "number"))
+        elif text[0] in self.magic_string_quotes and len(text) - 2 >= MIN_MAGIC_STRING_LENGTH and "\n" not in text:
+            literals.append(LiteralToken(line_number, match.start() - line_start, text, "string"))
+
+    def _scan_header_literals(
+        self, source: str, start: int, end: int, line_number: int, line_start: int, literals: List[LiteralToken]
+    ) -> Tuple[int, int]:
+        """Emit literals inside a header match and return the updated line position."""
+        # Skip the header alternative itself so the inner scan sees plain tokens
+        position = start + 1
+        for match in self.pattern.finditer(source, position, end):
+            kind = match.lastgroup
+            if kind == "newline":
+                line_number += 1
+                line_start = match.end()
+            elif kind == "number" or kind == "string":
+                self._add_literal(kind, match, line_number, line_start, literals)
+        return line_number, line_start
+
+
+_NUMBER = r"(?P<number>\b(?:0[xX][0-9a-fA-F]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)[UuLlFfNn]*\b)"
+_COMMON_TAIL = r"|(?P<open>\{)|(?P<close>\})|(?P<end>;)|(?P<newline>\n)"
+
+JAVASCRIPT_SCANNER = SourceScanner(
+    r"(?P<comment>//[^\n]*|/\*[\s\S]*?\*/)"
+    r"|(?P<string>\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\[\s\S])*`)"
+    r"|(?P<header_fn>\bfunction\b\s*\*?\s*(?P<header_fn_name>[A-Za-z_$][\w$]*)?\s*\((?P<header_fn_params>[^()]*)\))"
+    r"|(?P<header_arrow>\b(?:const|let|var)\s+(?P<header_arrow_name>[A-Za-z_$][\w$]*)\s*=\s*(?:async\s*)?"
+    r"\((?P<header_arrow_params>[^()]*)\)\s*=>)" + "|" + _NUMBER + _COMMON_TAIL,
+    magic_string_quotes="\"'",
+)
+
+C_SCANNER = SourceScanner(
+    r"(?P<comment>//[^\n]*|/\*[\s\S]*?\*/|^[ \t]*#(?:[^\n\\]|\\[\s\S])*)"
+    r"|(?P<string>\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\\\n]|\\.)*')"
+    r"|(?P<header_fn>^[ \t]*(?:[A-Za-z_]\w*[ \t\*]+)+\**(?P<header_fn_name>[A-Za-z_]\w*)[ \t]*"
+    r"\((?P<header_fn_params>[^()]*)\))" + "|" + _NUMBER + _COMMON_TAIL,
+    magic_string_quotes='"',
+    rejected_names=frozenset({"if", "for", "while", "switch", "return", "sizeof", "do", "else", "case"}),
+)
@@ -3,10 +3,11 @@ Language-specific strategy implementations for connascence detection.
 Consolidates duplicate algorithms across JavaScript and C language detection.
 """
 
+from functools import lru_cache
 import logging
 from pathlib import Path
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from utils.types import ConnascenceViolation
 
@@ -17,6 +18,7 @@ try:
         NASA_PARAMETER_THRESHOLD,
         REGEX_PATTERNS,
     )
+    from .language_scanner import C_SCANNER, JAVASCRIPT_SCANNER, ScanResult, SourceScanner
 except ImportError:
     # Fallback when running as script
     from constants import (
@@ -25,27 +27,84 @@ except ImportError:
         NASA_PARAMETER_THRESHOLD,
         REGEX_PATTERNS,
     )
+    from language_scanner import C_SCANNER, JAVASCRIPT_SCANNER, ScanResult, SourceScanner
 
 
 # ConnascenceViolation now imported from utils.types
 
 
+@lru_cache(maxsize=1)
+def get_formal_grammar_engine():
+    """Return the process-wide FormalGrammarEngine (built on first use)."""
+    try:
+        from .formal_grammar import FormalGrammarEngine
+    except ImportError:
+        from formal_grammar import FormalGrammarEngine
+
+    return FormalGrammarEngine()
+
+
 class LanguageStrategy:
     """Base strategy for language-specific connascence detection."""
 
     def __init__(self, language_name: str):
         self.language_name = language_name
         self.logger = logging.getLogger(__name__)
+        self._last_scan: Optional[Tuple[str, ScanResult]] = None
+
+    def get_scanner(self) -> Optional[SourceScanner]:
+        """Return the compiled single-pass scanner for this language, if any."""
+        return None
+
+    def scan(self, source_lines: List[str]) -> Optional[ScanResult]:
+        """
+        Scan source once and share the result across the detect_* methods.
+
+        Args:
+            source_lines: File contents split into lines
+
+        Returns:
+            ScanResult, or None when the language has no compiled scanner
+        """
+        scanner = self.get_scanner()
+        if scanner is None:
+            return None
+
+        source = "\n".join(source_lines)
+        if self._last_scan is not None and self._last_scan[0] == source:
+            return self._last_scan[1]
+
+        result = scanner.scan(source)
+        self._last_scan = (source, result)
+        return result
+
+    def analyze_source(self, file_path: Path, source_lines: List[str]) -> List[ConnascenceViolation]:
+        """Run magic literal, god function and parameter coupling detection together."""
+        return (
+            self.detect_magic_literals(file_path, source_lines)
+            + self.detect_god_functions(file_path, source_lines)
+            + self.detect_parameter_coupling(file_path, source_lines)
+        )
 
     def detect_magic_literals(self, file_path: Path, source_lines: List[str]) -> List[ConnascenceViolation]:
         """Detect magic literals using formal grammar analysis when possible."""
         violations = []
 
+        scan_result = self.scan(source_lines)
+        if scan_result is not None:
+            for literal in scan_result.literals:
+                if literal.literal_type == "string" and self.is_excluded_string_literal(literal.text):
+                    continue
+                violations.append(
+                    self._create_scanned_literal_violation(
+                        file_path, literal, source_lines[literal.line_number - 1].strip()
+                    )
+                )
+            return violations
+
         # Try to use formal grammar analyzer first
         try:
-            from .formal_grammar import FormalGrammarEngine
-
-            engine = FormalGrammarEngine()
+            engine = get_formal_grammar_engine()
             source_code = "\n".join(source_lines)
             matches = engine.analyze_file(str(file_path), source_code, self.language_name)
 
@@ -85,6 +144,18 @@ class LanguageStrategy:
     def detect_god_functions(self, file_path: Path, source_lines: List[str]) -> List[ConnascenceViolation]:
         """Detect god functions using language-specific patterns."""
         violations = []
+
+        scan_result = self.scan(source_lines)
+        if scan_result is not None:
+            for function in scan_result.functions:
+                if function.length > GOD_OBJECT_LOC_THRESHOLD // 10:  # 50 lines threshold
+                    violations.append(
+                        self._create_god_function_violation(
+                            file_path, function.start_line, function.name, function.length
+                        )
+                    )
+            return violations
+
         function_detector = self.get_function_detector()
 
         in_function = False
@@ -118,6 +189,19 @@ class LanguageStrategy:
     def detect_parameter_coupling(self, file_path: Path, source_lines: List[str]) -> List[ConnascenceViolation]:
         """Detect parameter coupling using language-specific patterns."""
         violations = []
+
+        scan_result = self.scan(source_lines)
+        if scan_result is not None:
+            for header in scan_result.parameter_lists:
+                param_count = self.count_parameters(header.parameters)
+                if param_count > NASA_PARAMETER_THRESHOLD:
+                    violations.append(
+                        self._create_parameter_violation(
+                            file_path, header.line_number, header.column, param_count, header.code_snippet
+                        )
+                    )
+            return violations
+
         param_detector = self.get_parameter_detector()
 
         for line_num, line in enumerate(source_lines, 1):
@@ -237,6 +321,20 @@ class LanguageStrategy:
             context={"literal_type": literal_type, "value": match.group()},
         )
 
+    def _create_scanned_literal_violation(self, file_path: Path, literal, code_snippet: str) -> ConnascenceViolation:
+        """Create a magic literal violation from a scanner token."""
+        return ConnascenceViolation(
+            type="connascence_of_meaning",
+            severity="medium",
+            file_path=str(file_path),
+            line_number=literal.line_number,
+            column=literal.column,
+            description=DETECTION_MESSAGES["magic_literal"].format(value=literal.text),
+            recommendation=f"Extract to a {self.get_constant_recommendation()}",
+            code_snippet=code_snippet,
+            context={"literal_type": literal.literal_type, "value": literal.text},
+        )
+
     def _create_god_function_violation(
         self, file_path: Path, line_num: int, function_name: str, length: int
     ) -> ConnascenceViolation:
@@ -280,6 +378,9 @@ class JavaScriptStrategy(LanguageStrategy):
     def __init__(self):
         super().__init__("javascript")
 
+    def get_scanner(self) -> SourceScanner:
+        return JAVASCRIPT_SCANNER
+
     def get_magic_literal_patterns(self) -> Dict[str, re.Pattern]:
         return {"numeric": re.compile(r"\b(?!0\b|1\b|-1\b)\d+\.?\d*\b"), "string": re.compile(r"""["'][^"']{3,}["']""")}
 
@@ -307,6 +408,9 @@ class CStrategy(LanguageStrategy):
     def __init__(self):
         super().__init__("c")
 
+    def get_scanner(self) -> SourceScanner:
+        return C_SCANNER
+
     def get_magic_literal_patterns(self) -> Dict[str, re.Pattern]:
         return {"numeric": re.compile(r"\b(?!0\b|1\b|-1\b)\d+[UuLl]*\b"), "string": re.compile(r'"[^"]{3,}"')}
 
@@ -1,4 +1,5 @@
 from .compliance_forecaster import ComplianceForecast, ComplianceForecaster, ComplianceSnapshot
+from .online_trend import OnlineTrend
 from .quality_predictor import QualityPrediction, QualityPredictor, QualitySnapshot
 from .theater_classifier import ClassificationResult, TheaterClassifier, TheaterFeatures
 
@@ -7,6 +8,7 @@ __all__ = [
     "ComplianceForecast",
     "ComplianceForecaster",
     "ComplianceSnapshot",
+    "OnlineTrend",
     "QualityPrediction",
     "QualityPredictor",
     "QualitySnapshot",
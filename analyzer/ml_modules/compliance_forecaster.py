@@ -11,6 +11,9 @@ Forecasting Capabilities:
 - Compliance gap analysis and remediation estimates
 - Audit risk assessment
 
+Category trends are least-squares lines kept as running statistics, so adding
+a snapshot is O(1) and replaying a long history costs one pass.
+
 @module ComplianceForecaster
 @compliance NASA-POT10, DFARS, NIST-SSDF
 """
@@ -19,18 +22,11 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
 import logging
-from typing import Dict, List, Optional
-
-logger = logging.getLogger(__name__)
+from typing import Dict, Iterable, List, Optional
 
-try:
-    import numpy as np
-    from sklearn.linear_model import LinearRegression
+from .online_trend import OnlineTrend
 
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-    logger.warning("scikit-learn not available, using rule-based forecasting")
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -59,67 +55,56 @@ class ComplianceForecast:
 class ComplianceForecaster:
     CERTIFICATION_THRESHOLD = 0.95
     CATEGORIES = ["code", "testing", "security", "documentation"]
+    MIN_FIT_SNAPSHOTS = 3
 
     def __init__(self):
         self.history: List[ComplianceSnapshot] = []
-        self.models: Dict[str, any] = {}
-        self.is_fitted = False
+        self.trend = OnlineTrend(["overall", *self.CATEGORIES])
 
-        if SKLEARN_AVAILABLE:
-            for category in ["overall", *self.CATEGORIES]:
-                self.models[category] = LinearRegression()
+    @property
+    def is_fitted(self) -> bool:
+        return len(self.trend) >= self.MIN_FIT_SNAPSHOTS
 
     def add_snapshot(self, snapshot: ComplianceSnapshot):
         self.history.append(snapshot)
+        self.trend.update(self._parse_timestamp(snapshot.timestamp).timestamp(), self._targets(snapshot))
+
+    def add_snapshots(self, snapshots: Iterable[ComplianceSnapshot]):
+        """Add a batch of snapshots with one vectorized trend update."""
+        snapshots = list(snapshots)
+        self.history.extend(snapshots)
+        self.trend.extend(
+            [self._parse_timestamp(s.timestamp).timestamp() for s in snapshots],
+            [self._targets(s) for s in snapshots],
+        )
 
-        if len(self.history) >= 3:
-            self._fit_models()
-
-    def _fit_models(self):
-        if not SKLEARN_AVAILABLE or len(self.history) < 3:
-            return
-
-        timestamps = np.array([self._parse_timestamp(s.timestamp).timestamp() for s in self.history])
-        X = timestamps.reshape(-1, 1)
-
-        y_overall = np.array([s.nasa_compliance for s in self.history])
-        self.models["overall"].fit(X, y_overall)
-
-        y_code = np.array([s.code_compliance for s in self.history])
-        self.models["code"].fit(X, y_code)
-
-        y_testing = np.array([s.testing_compliance for s in self.history])
-        self.models["testing"].fit(X, y_testing)
-
-        y_security = np.array([s.security_compliance for s in self.history])
-        self.models["security"].fit(X, y_security)
-
-        y_documentation = np.array([s.documentation_compliance for s in self.history])
-        self.models["documentation"].fit(X, y_documentation)
-
-        self.is_fitted = True
+    @staticmethod
+    def _targets(snapshot: ComplianceSnapshot) -> List[float]:
+        return [
+            snapshot.nasa_compliance,
+            snapshot.code_compliance,
+            snapshot.testing_compliance,
+            snapshot.security_compliance,
+            snapshot.documentation_compliance,
+        ]
 
     def forecast(self, target_date: Optional[str] = None, days_ahead: int = 30) -> ComplianceForecast:
         target_dt = self._parse_timestamp(target_date) if target_date else datetime.now() + timedelta(days=days_ahead)
 
-        if SKLEARN_AVAILABLE and self.is_fitted:
-            return self._sklearn_forecast(target_dt)
+        if self.is_fitted:
+            return self._trend_forecast(target_dt)
         else:
             return self._simple_forecast(target_dt)
 
-    def _sklearn_forecast(self, target_dt: datetime) -> ComplianceForecast:
+    def _trend_forecast(self, target_dt: datetime) -> ComplianceForecast:
         if not self.history:
             return self._default_forecast(target_dt)
 
-        X_future = np.array([[target_dt.timestamp()]])
-
-        forecasted_overall = float(self.models["overall"].predict(X_future)[0])
-        forecasted_overall = max(0.0, min(1.0, forecasted_overall))
-
-        forecasted_categories = {}
-        for category in self.CATEGORIES:
-            pred = float(self.models[category].predict(X_future)[0])
-            forecasted_categories[category] = max(0.0, min(1.0, pred))
+        overall, *categories = self.trend.predict(target_dt.timestamp())
+        forecasted_overall = max(0.0, min(1.0, overall))
+        forecasted_categories = {
+            category: max(0.0, min(1.0, pred)) for category, pred in zip(self.CATEGORIES, categories)
+        }
 
         compliance_gaps = self._identify_gaps(forecasted_overall, forecasted_categories)
 
@@ -331,10 +316,7 @@ def main():
         history_data = json.load(f)
 
     forecaster = ComplianceForecaster()
-
-    for snapshot_data in history_data:
-        snapshot = ComplianceSnapshot(**snapshot_data)
-        forecaster.add_snapshot(snapshot)
+    forecaster.add_snapshots(ComplianceSnapshot(**snapshot_data) for snapshot_data in history_data)
 
     forecast = forecaster.forecast(target_date=args.target_date, days_ahead=args.days_ahead)
 
@@ -0,0 +1,106 @@
+"""
+Online Trend Model
+==================
+
+Least-squares trend lines kept as running sufficient statistics.
+
+The forecasters regress each metric on time. Rather than refitting over the
+whole history for every snapshot, the model keeps the mean of the timestamps
+and, per target, the mean and the co-moment with time (Welford updates):
+
+- Adding a snapshot is O(1)
+- Bulk loads compute the same statistics in one vectorized pass and merge
+  them into the running state
+- Coefficients are derived lazily, when a forecast asks for them
+
+With ``ridge_alpha=0`` the fit equals ordinary least squares
+(``LinearRegression``); otherwise it equals ``Ridge(alpha)`` on standardized
+time, the setup the quality predictor used.
+
+@module OnlineTrend
+"""
+
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class OnlineTrend:
+    """Linear trends of several targets over one shared time axis."""
+
+    def __init__(self, targets: Sequence[str], ridge_alpha: float = 0.0):
+        self.targets = tuple(targets)
+        self.ridge_alpha = ridge_alpha
+        self.count = 0
+        self._mean_x = 0.0
+        self._m2_x = 0.0
+        self._mean_y = [0.0] * len(self.targets)
+        self._comoment = [0.0] * len(self.targets)
+        self._slopes: Optional[List[float]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def update(self, x: float, ys: Sequence[float]) -> None:
+        """Add one observation of every target at time ``x``."""
+        self.count += 1
+        dx = x - self._mean_x
+        self._mean_x += dx / self.count
+        self._m2_x += dx * (x - self._mean_x)
+        for index, y in enumerate(ys):
+            self._mean_y[index] += (y - self._mean_y[index]) / self.count
+            self._comoment[index] += dx * (y - self._mean_y[index])
+        self._slopes = None
+
+    def extend(self, xs: Sequence[float], rows: Sequence[Sequence[float]]) -> None:
+        """Add many observations; ``rows[i]`` holds the targets observed at ``xs[i]``."""
+        if not len(xs):
+            return
+        if not NUMPY_AVAILABLE:
+            for x, ys in zip(xs, rows):
+                self.update(x, ys)
+            return
+
+        x_batch = np.asarray(xs, dtype=float)
+        y_batch = np.asarray(rows, dtype=float).reshape(len(x_batch), len(self.targets))
+        batch_count = len(x_batch)
+        batch_mean_x = float(x_batch.mean())
+        batch_mean_y = y_batch.mean(axis=0)
+        centered_x = x_batch - batch_mean_x
+        batch_m2_x = float(centered_x @ centered_x)
+        batch_comoment = centered_x @ (y_batch - batch_mean_y)
+
+        # Merge the batch statistics into the running ones (pairwise update)
+        total = self.count + batch_count
+        weight = self.count * batch_count / total
+        delta_x = batch_mean_x - self._mean_x
+        for index in range(len(self.targets)):
+            delta_y = float(batch_mean_y[index]) - self._mean_y[index]
+            self._comoment[index] += float(batch_comoment[index]) + delta_x * delta_y * weight
+            self._mean_y[index] += delta_y * batch_count / total
+        self._m2_x += batch_m2_x + delta_x * delta_x * weight
+        self._mean_x += delta_x * batch_count / total
+        self.count = total
+        self._slopes = None
+
+    def predict(self, x: float) -> List[float]:
+        """Trend value of every target at time ``x``."""
+        if self._slopes is None:
+            self._slopes = self._fit()
+        offset = x - self._mean_x
+        return [mean + slope * offset for mean, slope in zip(self._mean_y, self._slopes)]
+
+    def _fit(self) -> List[float]:
+        if self.count == 0 or self._m2_x <= 0.0:
+            # No spread in time: the best fit is flat at the mean
+            return [0.0] * len(self.targets)
+        denominator = self._m2_x * (1.0 + self.ridge_alpha / self.count)
+        return [comoment / denominator for comoment in self._comoment]
+
+
+__all__ = ["OnlineTrend"]
@@ -16,27 +16,22 @@ Models:
 - Regression models for quality metrics
 - Anomaly detection for quality degradation
 
+Regressions are ridge trend lines on standardized time, kept as running
+statistics so each snapshot is an O(1) update.
+
 @module QualityPredictor
-@requires scikit-learn>=1.0.0
 """
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
 import logging
-from typing import List, Tuple
-
-logger = logging.getLogger(__name__)
+import statistics
+from typing import Iterable, List, Tuple
 
-try:
-    import numpy as np
-    from sklearn.linear_model import LinearRegression, Ridge
-    from sklearn.preprocessing import StandardScaler
+from .online_trend import OnlineTrend
 
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-    logger.warning("scikit-learn not available, using simple trend analysis")
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -62,67 +57,49 @@ class QualityPrediction:
 
 
 class QualityPredictor:
+    MIN_FIT_SNAPSHOTS = 5
+    RIDGE_ALPHA = 1.0
+
     def __init__(self):
         self.history: List[QualitySnapshot] = []
-        self.model_nasa = None
-        self.model_sigma = None
-        self.model_violations = None
-        self.scaler = None
-        self.is_fitted = False
-
-        if SKLEARN_AVAILABLE:
-            self.model_nasa = Ridge(alpha=1.0)
-            self.model_sigma = Ridge(alpha=1.0)
-            self.model_violations = Ridge(alpha=1.0)
-            self.scaler = StandardScaler()
+        self.trend = OnlineTrend(["nasa_compliance", "sigma_level", "total_violations"], ridge_alpha=self.RIDGE_ALPHA)
+
+    @property
+    def is_fitted(self) -> bool:
+        return len(self.trend) >= self.MIN_FIT_SNAPSHOTS
 
     def add_snapshot(self, snapshot: QualitySnapshot):
         self.history.append(snapshot)
+        self.trend.update(self._parse_timestamp(snapshot.timestamp).timestamp(), self._targets(snapshot))
+
+    def add_snapshots(self, snapshots: Iterable[QualitySnapshot]):
+        """Add a batch of snapshots with one vectorized trend update."""
+        snapshots = list(snapshots)
+        self.history.extend(snapshots)
+        self.trend.extend(
+            [self._parse_timestamp(s.timestamp).timestamp() for s in snapshots],
+            [self._targets(s) for s in snapshots],
+        )
 
-        if len(self.history) >= 5:
-            self._fit_models()
-
-    def _fit_models(self):
-        if not SKLEARN_AVAILABLE or len(self.history) < 3:
-            return
-
-        timestamps = np.array([self._parse_timestamp(s.timestamp) for s in self.history])
-        time_deltas = timestamps - timestamps[0]
-
-        X = time_deltas.reshape(-1, 1)
-
-        y_nasa = np.array([s.nasa_compliance for s in self.history])
-        y_sigma = np.array([s.sigma_level for s in self.history])
-        y_violations = np.array([s.total_violations for s in self.history])
-
-        X_scaled = self.scaler.fit_transform(X)
-
-        self.model_nasa.fit(X_scaled, y_nasa)
-        self.model_sigma.fit(X_scaled, y_sigma)
-        self.model_violations.fit(X_scaled, y_violations)
-
-        self.is_fitted = True
+    @staticmethod
+    def _targets(snapshot: QualitySnapshot) -> List[float]:
+        return [snapshot.nasa_compliance, snapshot.sigma_level, snapshot.total_violations]
 
     def predict_future(self, days_ahead: int = 7) -> QualityPrediction:
-        if SKLEARN_AVAILABLE and self.is_fitted:
-            return self._sklearn_predict(days_ahead)
+        if self.is_fitted:
+            return self._trend_predict(days_ahead)
         else:
             return self._simple_trend_predict(days_ahead)
 
-    def _sklearn_predict(self, days_ahead: int) -> QualityPrediction:
+    def _trend_predict(self, days_ahead: int) -> QualityPrediction:
         if not self.history:
             return self._default_prediction()
 
         last_timestamp = self._parse_timestamp(self.history[-1].timestamp)
-        first_timestamp = self._parse_timestamp(self.history[0].timestamp)
-
-        future_time_delta = (last_timestamp - first_timestamp) + timedelta(days=days_ahead)
-        X_future = np.array([[future_time_delta.total_seconds()]])
-        X_future_scaled = self.scaler.transform(X_future)
-
-        pred_nasa = float(self.model_nasa.predict(X_future_scaled)[0])
-        pred_sigma = float(self.model_sigma.predict(X_future_scaled)[0])
-        pred_violations = int(max(0, self.model_violations.predict(X_future_scaled)[0]))
+        pred_nasa, pred_sigma, pred_violations = self.trend.predict(
+            (last_timestamp + timedelta(days=days_ahead)).timestamp()
+        )
+        pred_violations = int(max(0, pred_violations))
 
         pred_nasa = max(0.0, min(1.0, pred_nasa))
         pred_sigma = max(1.0, min(6.0, pred_sigma))
@@ -146,7 +123,7 @@ class QualityPredictor:
 
         recommendations = self._generate_recommendations(pred_nasa, pred_sigma, pred_violations, trend)
 
-        std_nasa = np.std([s.nasa_compliance for s in self.history[-5:]])
+        std_nasa = statistics.pstdev([s.nasa_compliance for s in self.history[-5:]])
         confidence_interval = (max(0.0, pred_nasa - 1.96 * std_nasa), min(1.0, pred_nasa + 1.96 * std_nasa))
 
         return QualityPrediction(
@@ -264,10 +241,7 @@ def main():
         history_data = json.load(f)
 
     predictor = QualityPredictor()
-
-    for snapshot_data in history_data:
-        snapshot = QualitySnapshot(**snapshot_data)
-        predictor.add_snapshot(snapshot)
+    predictor.add_snapshots(QualitySnapshot(**snapshot_data) for snapshot_data in history_data)
 
     prediction = predictor.predict_future(args.days_ahead)
 
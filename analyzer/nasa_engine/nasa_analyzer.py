@@ -55,6 +55,8 @@ class NASAAnalyzer:
         self.assertions: List[ast.Assert] = []
         self.malloc_calls: List[ast.Call] = []
         self.return_checks: List[ast.AST] = []
+        # Tree handed in by the caller for the file under analysis, if any
+        self._shared_tree: Optional[ast.AST] = None
 
         # NASA Rule 5: State validation assertion
         assert self.rules_config is not None, "rules_config must be initialized"
@@ -124,35 +126,28 @@ class NASAAnalyzer:
 
         return config
 
-    def analyze_file(self, file_path: str, source_code: Optional[str] = None) -> List[ConnascenceViolation]:
-        """Analyze a single file for NASA compliance. NASA Rule 4 compliant."""
+    def analyze_file(
+        self, file_path: str, source_code: Optional[str] = None, tree: Optional[ast.AST] = None
+    ) -> List[ConnascenceViolation]:
+        """Analyze a single file for NASA compliance. NASA Rule 4 compliant.
+
+        When ``tree`` is given (already parsed from ``source_code`` by the caller)
+        every rule check reuses it instead of reading or parsing the file again.
+        """
         # NASA Rule 5: Input validation assertions
         assert file_path is not None, "file_path cannot be None"
         assert isinstance(file_path, str), "file_path must be a string"
 
         self._clear_analysis_state()
+        self._shared_tree = tree
 
-        try:
-            # Use cached AST if available, otherwise parse provided source
-            if CACHE_AVAILABLE and source_code is None:
-                tree = cached_ast_tree(file_path)
-                if not tree:
-                    return []
-            else:
-                # Use provided source code or read from file
-                if source_code is None:
-                    if CACHE_AVAILABLE:
-                        source_code = cached_file_content(file_path)
-                    else:
-                        with open(file_path, encoding="utf-8") as f:
-                            source_code = f.read()
-
-                if not source_code:
-                    return []
-
-                tree = ast.parse(source_code)
-        except (SyntaxError, FileNotFoundError, PermissionError):
-            return []  # Skip files with errors
+        if tree is None:
+            try:
+                tree = self._load_tree(file_path, source_code)
+            except (SyntaxError, FileNotFoundError, PermissionError):
+                return []  # Skip files with errors
+            if not tree:
+                return []
 
         # Collect AST elements for analysis
         self._collect_ast_elements(tree)
@@ -179,6 +174,25 @@ class NASAAnalyzer:
 
         return all_violations
 
+    def _load_tree(self, file_path: str, source_code: Optional[str]) -> Optional[ast.AST]:
+        """Parse the file under analysis, preferring the shared file cache. NASA Rule 4 compliant."""
+        # Use cached AST if available, otherwise parse provided source
+        if CACHE_AVAILABLE and source_code is None:
+            return cached_ast_tree(file_path)
+
+        # Use provided source code or read from file
+        if source_code is None:
+            if CACHE_AVAILABLE:
+                source_code = cached_file_content(file_path)
+            else:
+                with open(file_path, encoding="utf-8") as f:
+                    source_code = f.read()
+
+        if not source_code:
+            return None
+
+        return ast.parse(source_code)
+
     def _collect_ast_elements(self, tree: ast.AST) -> None:
         """Collect relevant AST elements for analysis."""
         # NASA Rule 5: Input validation assertions
@@ -356,13 +370,14 @@ class NASAAnalyzer:
         unchecked_calls = []
 
         try:
-            # Use cached file content if available
-            if CACHE_AVAILABLE:
+            # Reuse the caller's tree; otherwise use cached file content if available
+            tree = self._shared_tree
+            if tree is None and CACHE_AVAILABLE:
                 source_code = cached_file_content(file_path)
                 if not source_code:
                     return
                 tree = cached_ast_tree(file_path)
-            else:
+            elif tree is None:
                 if not Path(file_path).exists():
                     return
                 with open(file_path, encoding="utf-8") as f:
@@ -13,6 +13,7 @@ Key Features:
 - Comprehensive error handling
 """
 
+from .digest_service import ArtifactDigestService, get_digest_service, hash_file_sha256
 from .file_cache import (
     CacheEntry,
     CacheStats,
@@ -24,19 +25,37 @@ from .file_cache import (
     clear_global_cache,
     get_global_cache,
 )
-from .performance_benchmark import PerformanceBenchmark
+from .memory_budget import MemoryBudget, estimate_file_cost_mb, get_global_memory_budget
+from .timeseries_store import TimeSeriesStore, WindowStats
 
 __all__ = [
+    "ArtifactDigestService",
     "CacheEntry",
     "CacheStats",
     "FileContentCache",
+    "MemoryBudget",
     "PerformanceBenchmark",
+    "TimeSeriesStore",
+    "WindowStats",
     "cached_ast_tree",
     "cached_file_content",
     "cached_file_lines",
     "cached_python_files",
     "clear_global_cache",
+    "estimate_file_cost_mb",
+    "get_digest_service",
     "get_global_cache",
+    "get_global_memory_budget",
+    "hash_file_sha256",
 ]
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name):
+    # The benchmark pulls in the whole unified analyzer; import it on demand
+    if name == "PerformanceBenchmark":
+        from .performance_benchmark import PerformanceBenchmark
+
+        return PerformanceBenchmark
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
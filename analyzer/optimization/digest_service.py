@@ -0,0 +1,293 @@
+"""
+Artifact Digest Service
+=======================
+
+Shared SHA-256 digest service for supply-chain attestations, SBOMs and the
+analysis result caches.
+
+- Hashes files in parallel (hashlib releases the GIL on large buffers)
+- Uses mmap for large files and a single read for small ones
+- Keeps a persistent digest cache keyed by (inode, size, mtime_ns), so a
+  warm run only stats files and re-hashes the ones that actually changed
+- A relative cache path is resolved against the project root, so runs from
+  any subdirectory share one cache
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIGEST_CACHE = ".connascence_cache/digests.json"
+# Files or directories marking the root of a project
+PROJECT_ROOT_MARKERS = (".git", "pyproject.toml", "setup.py")
+DEFAULT_EXCLUDE_DIRS = frozenset(
+    {".git", ".hg", ".svn", "__pycache__", "node_modules", ".venv", "venv", ".tox", ".connascence_cache"}
+)
+
+# Files at or above this size are hashed through mmap.
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+# Chunk size for the fallback streaming path (mmap unavailable).
+READ_CHUNK_BYTES = 4 * 1024 * 1024
+
+StatKey = Tuple[int, int, int]
+
+
+def _stat_key(stat_result: os.stat_result) -> StatKey:
+    return (stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+
+
+def find_project_root(start: Union[str, Path, None] = None) -> Path:
+    """Nearest directory at or above ``start`` (default: cwd) holding a project marker, else ``start``."""
+    start_path = Path(start).resolve() if start else Path.cwd().resolve()
+    for directory in (start_path, *start_path.parents):
+        if any((directory / marker).exists() for marker in PROJECT_ROOT_MARKERS):
+            return directory
+    return start_path
+
+
+def hash_file_sha256(file_path: Union[str, Path], size: Optional[int] = None) -> str:
+    """
+    Hash a file with SHA-256 using the cheapest read strategy for its size.
+
+    Args:
+        file_path: File to hash
+        size: File size if already known from a stat call
+
+    Returns:
+        Hex digest
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        if size is None:
+            size = os.fstat(handle.fileno()).st_size
+
+        if size >= MMAP_THRESHOLD_BYTES:
+            try:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hasher.update(mapped)
+                return hasher.hexdigest()
+            except (OSError, ValueError):
+                handle.seek(0)
+                for chunk in iter(lambda: handle.read(READ_CHUNK_BYTES), b""):
+                    hasher.update(chunk)
+                return hasher.hexdigest()
+
+        hasher.update(handle.read())
+    return hasher.hexdigest()
+
+
+class ArtifactDigestService:
+    """
+    Parallel file hashing with a persistent (inode, size, mtime_ns) cache.
+
+    Thread-safe. Call ``save()`` (or use the service as a context manager) to
+    persist newly computed digests.
+    """
+
+    def __init__(
+        self,
+        cache_path: Union[str, Path, None] = DEFAULT_DIGEST_CACHE,
+        max_workers: Optional[int] = None,
+        project_root: Union[str, Path, None] = None,
+    ):
+        """
+        Initialize the digest service.
+
+        Args:
+            cache_path: JSON file for the persistent digest cache (None disables persistence)
+            max_workers: Hashing threads (defaults to CPU count)
+            project_root: Base for a relative ``cache_path`` (defaults to ``find_project_root()``)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        if self.cache_path is not None and not self.cache_path.is_absolute():
+            self.cache_path = (Path(project_root) if project_root else find_project_root()) / self.cache_path
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self._entries: Dict[str, Tuple[StatKey, str]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def __enter__(self) -> "ArtifactDigestService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.save()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, encoding="utf-8") as handle:
+                raw = json.load(handle)
+            self._entries = {path: (tuple(entry[:3]), entry[3]) for path, entry in raw.get("entries", {}).items()}
+        except (OSError, ValueError, TypeError, IndexError) as e:
+            logger.debug(f"Ignoring unreadable digest cache {self.cache_path}: {e}")
+            self._entries = {}
+
+    def save(self) -> None:
+        """Persist the digest cache if anything changed."""
+        if not self.cache_path or not self._dirty:
+            return
+        with self._lock:
+            payload = {"entries": {path: [*key, digest] for path, (key, digest) in self._entries.items()}}
+            self._dirty = False
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to save digest cache {self.cache_path}: {e}")
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+
+    def digest_file(self, file_path: Union[str, Path]) -> str:
+        """Return the SHA-256 hex digest of a file (cached by stat key)."""
+        return self.digest_many([file_path])[str(Path(file_path).resolve())]
+
+    def digest_many(self, file_paths: Iterable[Union[str, Path]]) -> Dict[str, str]:
+        """
+        Hash many files in parallel.
+
+        Args:
+            file_paths: Files to hash
+
+        Returns:
+            Mapping of resolved absolute path to hex digest; unreadable files
+            are omitted
+        """
+        results: Dict[str, str] = {}
+        to_hash: List[Tuple[str, StatKey]] = []
+        hits = 0
+
+        for file_path in file_paths:
+            path_str = str(Path(file_path).resolve())
+            try:
+                key = _stat_key(os.stat(path_str))
+            except OSError as e:
+                logger.debug(f"Cannot stat {path_str}: {e}")
+                continue
+
+            cached = self._entries.get(path_str)
+            if cached is not None and cached[0] == key:
+                results[path_str] = cached[1]
+                hits += 1
+            else:
+                to_hash.append((path_str, key))
+
+        with self._lock:
+            self.hits += hits
+            self.misses += len(to_hash)
+        if not to_hash:
+            return results
+
+        if len(to_hash) == 1 or self.max_workers == 1:
+            computed = [self._hash_one(item) for item in to_hash]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="digest") as executor:
+                computed = list(executor.map(self._hash_one, to_hash))
+
+        with self._lock:
+            for (path_str, key), digest in zip(to_hash, computed):
+                if digest is None:
+                    continue
+                self._entries[path_str] = (key, digest)
+                results[path_str] = digest
+            self._dirty = True
+
+        return results
+
+    @staticmethod
+    def _hash_one(item: Tuple[str, StatKey]) -> Optional[str]:
+        path_str, key = item
+        try:
+            return hash_file_sha256(path_str, size=key[1])
+        except OSError as e:
+            logger.warning(f"Could not hash {path_str}: {e}")
+            return None
+
+    def digest_tree(
+        self,
+        root: Union[str, Path],
+        suffixes: Optional[Sequence[str]] = (".py",),
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS,
+    ) -> Dict[str, str]:
+        """
+        Hash every in-scope file under ``root``.
+
+        Args:
+            root: Directory to scan
+            suffixes: File suffixes in scope (None for all files)
+            exclude_dirs: Directory names never descended into
+
+        Returns:
+            Mapping of POSIX path relative to ``root`` to hex digest, sorted by path
+        """
+        root_path = Path(root).resolve()
+        files = list(iter_tree_files(root_path, suffixes, exclude_dirs))
+        digests = self.digest_many(files)
+
+        relative = {}
+        for file_path in files:
+            digest = digests.get(str(file_path))
+            if digest is not None:
+                relative[file_path.relative_to(root_path).as_posix()] = digest
+        return dict(sorted(relative.items()))
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def iter_tree_files(
+    root: Path, suffixes: Optional[Sequence[str]] = (".py",), exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS
+) -> Iterable[Path]:
+    """Walk ``root`` (pruning excluded directories) and yield in-scope files."""
+    excluded = set(exclude_dirs)
+    suffix_set = tuple(suffixes) if suffixes else None
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in excluded]
+        for filename in filenames:
+            if suffix_set is None or filename.endswith(suffix_set):
+                yield Path(dirpath) / filename
+
+
+_global_services: Dict[Path, ArtifactDigestService] = {}
+# Project root found for each starting directory, so repeat lookups skip the walk
+_project_roots: Dict[str, Path] = {}
+_global_lock = threading.Lock()
+
+
+def get_digest_service(project_root: Union[str, Path, None] = None) -> ArtifactDigestService:
+    """
+    Return the process-wide digest service for a project (created on first use).
+
+    Args:
+        project_root: Any directory inside the project (defaults to the cwd);
+            the cache lives under the enclosing project root
+    """
+    start = str(project_root) if project_root else os.getcwd()
+    with _global_lock:
+        root = _project_roots.get(start)
+        if root is None:
+            root = _project_roots[start] = find_project_root(start)
+        service = _global_services.get(root)
+        if service is None:
+            service = _global_services[root] = ArtifactDigestService(project_root=root)
+        return service
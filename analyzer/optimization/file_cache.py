@@ -16,6 +16,7 @@ from collections import OrderedDict
 from dataclasses import dataclass, field
 from functools import lru_cache
 import hashlib
+import math
 from pathlib import Path
 import threading
 from threading import RLock
@@ -301,6 +302,32 @@ class FileContentCache:
             if oldest_path in self._file_mtimes:
                 del self._file_mtimes[oldest_path]
 
+    def shrink(self, fraction: float) -> int:
+        """Evict the least recently used ``fraction`` of file entries; returns the count evicted."""
+        assert 0.0 < fraction <= 1.0, "fraction must be in (0, 1]"
+        with self._lock:
+            count = math.ceil(len(self._cache) * fraction)
+            for _ in range(count):
+                oldest_path, oldest_entry = self._cache.popitem(last=False)
+                self._stats.memory_usage -= oldest_entry.file_size
+                self._stats.evictions += 1
+                self._file_mtimes.pop(oldest_path, None)
+            return count
+
+    def shrink_ast_cache(self, fraction: float) -> int:
+        """Drop the oldest ``fraction`` of parsed trees; returns the count dropped."""
+        assert 0.0 < fraction <= 1.0, "fraction must be in (0, 1]"
+        with self._lock:
+            count = math.ceil(len(self._ast_cache) * fraction)
+            dropped = set(list(self._ast_cache.keys())[:count])
+            for content_hash in dropped:
+                del self._ast_cache[content_hash]
+            # Entries hold the same trees; release those references too
+            for entry in self._cache.values():
+                if entry.ast_tree is not None and entry.content_hash in dropped:
+                    entry.ast_tree = None
+            return count
+
     def clear_cache(self) -> None:
         """Clear all cached data."""
         with self._lock:
@@ -0,0 +1,435 @@
+"""
+Memory Budget and Admission Control
+===================================
+
+A memory budget that analysis pipelines obey instead of only being warned about.
+
+MemoryMonitor samples RSS and raises alerts; the budget turns those readings
+into backpressure:
+
+- Every file (or chunk) is admitted against an estimated cost derived from its
+  size or AST node count. Work is admitted while the projected usage plus its
+  cost fits the budget; otherwise the submitter waits for in-flight work to
+  finish. The projection is the RSS sampled before the in-flight work started
+  plus its reservations, or live RSS when that is higher, so memory that
+  in-flight work already allocated is not counted twice.
+- Before waiting, registered caches are asked to shed entries, cheapest to
+  rebuild first.
+- ``parallelism()`` scales worker counts down while the budget is tight.
+
+Something is always admitted when nothing is in flight, so a run degrades to
+sequential processing rather than stalling or being OOM-killed.
+
+NASA Rule 7: Bounded resource usage with explicit limits.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import gc
+import inspect
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Union
+import weakref
+
+import psutil
+
+from .memory_monitor import MemoryMonitor, get_global_memory_monitor
+
+logger = logging.getLogger(__name__)
+
+BUDGET_ENV_VAR = "CONNASCENCE_MEMORY_BUDGET_MB"
+# Share of the container or machine memory used when no budget is configured
+DEFAULT_BUDGET_FRACTION = 0.8
+# Fixed per-file overhead (detector state, result objects)
+FILE_BASE_COST_MB = 0.5
+# Parsed Python source takes roughly this many times its size in memory
+AST_BYTES_PER_SOURCE_BYTE = 12
+AST_BYTES_PER_NODE = 600
+# Pressure (usage / limit) above which parallelism is reduced
+HALF_PARALLELISM_PRESSURE = 0.75
+SINGLE_WORKER_PRESSURE = 0.9
+# Shed priorities: lower values are cheaper to rebuild and are shed first
+SHED_PRIORITY_FILE_CONTENT = 10
+SHED_PRIORITY_AST = 20
+SHED_PRIORITY_RESULTS = 30
+SHED_FRACTIONS = (0.5, 1.0)
+MIN_SHED_INTERVAL_SECONDS = 0.5
+
+_CGROUP_LIMIT_FILES = (
+    "/sys/fs/cgroup/memory.max",  # cgroup v2
+    "/sys/fs/cgroup/memory/memory.limit_in_bytes",  # cgroup v1
+)
+
+
+def default_budget_mb() -> float:
+    """Budget from the environment, else a share of the container or machine memory."""
+    configured = os.environ.get(BUDGET_ENV_VAR)
+    if configured:
+        try:
+            return float(configured)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {BUDGET_ENV_VAR}={configured!r}")
+
+    available = psutil.virtual_memory().total
+    for limit_file in _CGROUP_LIMIT_FILES:
+        try:
+            raw = Path(limit_file).read_text().strip()
+        except OSError:
+            continue
+        if raw.isdigit():
+            # Unlimited cgroups report a huge number; the machine total still applies
+            available = min(available, int(raw))
+            break
+
+    return available * DEFAULT_BUDGET_FRACTION / (1024 * 1024)
+
+
+def estimate_file_cost_mb(size_bytes: int, node_count: Optional[int] = None) -> float:
+    """Estimated peak memory for analyzing one file, from its AST node count or its size."""
+    if node_count is not None:
+        variable = node_count * AST_BYTES_PER_NODE
+    else:
+        variable = size_bytes * AST_BYTES_PER_SOURCE_BYTE
+    return FILE_BASE_COST_MB + variable / (1024 * 1024)
+
+
+def estimate_files_cost_mb(file_paths: List[Union[str, Path]]) -> float:
+    """Estimated cost of a group of files; missing files count only the base cost."""
+    total = 0.0
+    for file_path in file_paths:
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            size = 0
+        total += estimate_file_cost_mb(size)
+    return total
+
+
+def cache_name(prefix: str, owner: object) -> str:
+    """Registration name unique to ``owner``, so each instance's cache is shed on its own."""
+    return f"{prefix}:{id(owner):x}"
+
+
+@dataclass
+class _Shedder:
+    name: str
+    # Resolves to the shed callback, or None once its owner was garbage collected
+    resolve: Callable[[], Optional[Callable[[float], int]]]
+    priority: int
+
+
+@dataclass
+class BudgetStats:
+    """Counters describing how hard the budget had to work."""
+
+    admitted: int = 0
+    waits: int = 0
+    sheds: int = 0
+    entries_shed: int = 0
+    peak_usage_mb: float = 0.0
+    peak_reserved_mb: float = 0.0
+    shed_by_cache: Dict[str, int] = field(default_factory=dict)
+
+
+class MemoryBudget:
+    """
+    Admission control for analysis work against a memory limit.
+
+    Thread-safe. Producers call ``acquire``/``release`` (or ``admit``) around
+    each unit of work; caches register a shed callback that drops a fraction
+    of their entries and returns how many it dropped.
+    """
+
+    def __init__(
+        self,
+        limit_mb: Optional[float] = None,
+        monitor=None,
+        rss_sampler: Optional[Callable[[], float]] = None,
+        sample_interval: float = 0.05,
+        include_children: bool = True,
+    ):
+        """
+        Initialize memory budget.
+
+        Args:
+            limit_mb: Budget in MB; defaults to ``default_budget_mb()``
+            monitor: MemoryMonitor whose alerts trigger shedding and whose
+                sampler provides live RSS
+            rss_sampler: Callable returning current RSS in MB (overrides monitor)
+            sample_interval: Seconds a reading is reused before sampling again
+            include_children: Count worker processes in the live RSS
+        """
+        self.limit_mb = limit_mb if limit_mb is not None else default_budget_mb()
+        if self.limit_mb <= 0:
+            raise ValueError(f"limit_mb must be positive, got {self.limit_mb}")
+
+        self.sample_interval = sample_interval
+        self.include_children = include_children
+        if rss_sampler is not None:
+            self._sampler = rss_sampler
+        else:
+            sampling_monitor = monitor if monitor is not None else MemoryMonitor()
+            self._sampler = lambda: sampling_monitor.current_rss_mb(include_children=self.include_children)
+
+        self._condition = threading.Condition()
+        self._reserved_mb = 0.0
+        self._in_flight = 0
+        # RSS before the current in-flight work began (lowered when RSS falls below it)
+        self._baseline_mb = 0.0
+        self._last_sample = 0.0
+        self._last_sample_time = 0.0
+        self._last_shed_time = 0.0
+        self._shedders: List[_Shedder] = []
+        self.stats = BudgetStats()
+
+        if monitor is not None:
+            monitor.add_alert_callback(self._handle_memory_alert)
+
+    # ------------------------------------------------------------------
+    # Cache registration and shedding
+    # ------------------------------------------------------------------
+
+    def register_cache(self, name: str, shed: Callable[[float], int], priority: int) -> None:
+        """
+        Register a cache; ``shed(fraction)`` drops that share of its entries.
+
+        Bound methods are held weakly: the budget never keeps an analyzer
+        alive, and a collected owner's entry is dropped. Instances register
+        under ``cache_name(prefix, self)`` so they do not replace each other.
+        """
+        assert callable(shed), "shed must be callable"
+        if inspect.ismethod(shed):
+            resolve = weakref.WeakMethod(shed)
+        else:
+            resolve = lambda: shed  # noqa: E731
+        with self._condition:
+            self._shedders = [s for s in self._shedders if s.name != name and s.resolve() is not None]
+            self._shedders.append(_Shedder(name, resolve, priority))
+            self._shedders.sort(key=lambda s: s.priority)
+
+    def unregister_cache(self, name: str) -> None:
+        with self._condition:
+            self._shedders = [s for s in self._shedders if s.name != name]
+
+    def registered_caches(self) -> List[str]:
+        """Names of registered caches whose owners are still alive, in shed order."""
+        with self._condition:
+            self._shedders = [s for s in self._shedders if s.resolve() is not None]
+            return [s.name for s in self._shedders]
+
+    def relieve(self, needed_mb: float = 0.0) -> int:
+        """
+        Shed caches in priority order until ``needed_mb`` fits the budget.
+
+        Each cache first drops half its entries, then the rest, before the
+        next cache is touched. Returns the number of entries dropped.
+        """
+        with self._condition:
+            now = time.time()
+            if now - self._last_shed_time < MIN_SHED_INTERVAL_SECONDS:
+                return 0
+            self._last_shed_time = now
+            shedders = list(self._shedders)
+
+        dropped = 0
+        for fraction in SHED_FRACTIONS:
+            for shedder in shedders:
+                if self._fits(needed_mb, fresh=True):
+                    return dropped
+                shed = shedder.resolve()
+                if shed is None:
+                    continue
+                try:
+                    count = shed(fraction) or 0
+                except Exception as e:
+                    logger.error(f"Cache shed failed for {shedder.name}: {e}")
+                    continue
+                if count:
+                    dropped += count
+                    gc.collect()
+                    with self._condition:
+                        self.stats.entries_shed += count
+                        self.stats.shed_by_cache[shedder.name] = self.stats.shed_by_cache.get(shedder.name, 0) + count
+
+        with self._condition:
+            self.stats.sheds += 1
+        if dropped:
+            logger.info(f"Memory budget shed {dropped} cache entries")
+        return dropped
+
+    # ------------------------------------------------------------------
+    # Admission control
+    # ------------------------------------------------------------------
+
+    def try_acquire(self, cost_mb: float) -> bool:
+        """
+        Admit work without waiting.
+
+        When it does not fit, caches are shed first; False only when it still
+        does not fit and other work is in flight to wait for.
+        """
+        with self._condition:
+            if self._fits(cost_mb):
+                self._reserve(cost_mb)
+                return True
+
+        self.relieve(cost_mb)
+        with self._condition:
+            if self._in_flight and not self._fits(cost_mb, fresh=True):
+                return False
+            self._reserve(cost_mb)
+            return True
+
+    def acquire(self, cost_mb: float, timeout: Optional[float] = None) -> bool:
+        """
+        Admit work of estimated ``cost_mb``, waiting while it does not fit.
+
+        Returns False only when ``timeout`` expires first.
+        """
+        with self._condition:
+            if self._fits(cost_mb):
+                self._reserve(cost_mb)
+                return True
+
+        self.relieve(cost_mb)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            if self._in_flight and not self._fits(cost_mb, fresh=True):
+                self.stats.waits += 1
+            while self._in_flight and not self._fits(cost_mb, fresh=True):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                # Re-check on release, and periodically since RSS also moves on its own
+                self._condition.wait(min(remaining, 1.0) if remaining is not None else 1.0)
+            self._reserve(cost_mb)
+            return True
+
+    def release(self, cost_mb: float) -> None:
+        """Return the reservation of finished work."""
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._reserved_mb = max(0.0, self._reserved_mb - cost_mb)
+            # Finished work changed RSS; sample again before the next decision
+            self._last_sample_time = 0.0
+            self._condition.notify_all()
+
+    @contextmanager
+    def admit(self, cost_mb: float) -> Iterator[None]:
+        """Context manager around ``acquire``/``release``."""
+        self.acquire(cost_mb)
+        try:
+            yield
+        finally:
+            self.release(cost_mb)
+
+    # ------------------------------------------------------------------
+    # Readings
+    # ------------------------------------------------------------------
+
+    def current_usage_mb(self, fresh: bool = False) -> float:
+        """Live RSS, reusing a reading younger than ``sample_interval``."""
+        now = time.monotonic()
+        if fresh or now - self._last_sample_time >= self.sample_interval:
+            try:
+                self._last_sample = float(self._sampler())
+            except Exception as e:
+                logger.debug(f"RSS sampling failed: {e}")
+            self._last_sample_time = now
+            self.stats.peak_usage_mb = max(self.stats.peak_usage_mb, self._last_sample)
+            if self._in_flight:
+                self._baseline_mb = min(self._baseline_mb, self._last_sample)
+        return self._last_sample
+
+    def projected_usage_mb(self, fresh: bool = False) -> float:
+        """
+        Usage once in-flight work reaches its estimates.
+
+        In-flight work shows up in live RSS as it allocates, so its
+        reservations are added to the RSS sampled before it started rather
+        than to live RSS; live RSS wins when the work outgrew its estimates.
+        """
+        usage = self.current_usage_mb(fresh)
+        if not self._in_flight:
+            return usage
+        return max(usage, self._baseline_mb + self._reserved_mb)
+
+    @property
+    def reserved_mb(self) -> float:
+        return self._reserved_mb
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def pressure(self) -> float:
+        """Share of the budget taken by the projected usage."""
+        return self.projected_usage_mb() / self.limit_mb
+
+    def parallelism(self, max_workers: int) -> int:
+        """Number of workers to run right now, given the budget pressure."""
+        pressure = self.pressure()
+        if pressure >= SINGLE_WORKER_PRESSURE:
+            return 1
+        if pressure >= HALF_PARALLELISM_PRESSURE:
+            return max(1, max_workers // 2)
+        return max(1, max_workers)
+
+    def get_report(self) -> Dict[str, float]:
+        with self._condition:
+            return {
+                "limit_mb": self.limit_mb,
+                "current_usage_mb": self._last_sample,
+                "baseline_mb": self._baseline_mb if self._in_flight else self._last_sample,
+                "reserved_mb": self._reserved_mb,
+                "in_flight": self._in_flight,
+                "peak_usage_mb": self.stats.peak_usage_mb,
+                "peak_reserved_mb": self.stats.peak_reserved_mb,
+                "admitted": self.stats.admitted,
+                "waits": self.stats.waits,
+                "sheds": self.stats.sheds,
+                "entries_shed": self.stats.entries_shed,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _fits(self, cost_mb: float, fresh: bool = False) -> bool:
+        return self.projected_usage_mb(fresh) + cost_mb <= self.limit_mb
+
+    def _reserve(self, cost_mb: float) -> None:
+        if not self._in_flight:
+            # _fits sampled RSS just before; it holds none of the new work yet
+            self._baseline_mb = self._last_sample
+        self._in_flight += 1
+        self._reserved_mb += cost_mb
+        self.stats.admitted += 1
+        self.stats.peak_reserved_mb = max(self.stats.peak_reserved_mb, self._reserved_mb)
+
+    def _handle_memory_alert(self, alert_type: str, context: Dict) -> None:
+        if alert_type == "MEMORY_CRITICAL":
+            self.relieve(self.limit_mb)
+        elif alert_type == "MEMORY_HIGH":
+            # Make room for the budget's own low-pressure headroom
+            self.relieve(self.limit_mb * (1 - HALF_PARALLELISM_PRESSURE))
+
+
+# Global budget shared by the analysis pipelines
+_global_budget: Optional[MemoryBudget] = None
+_budget_lock = threading.Lock()
+
+
+def get_global_memory_budget() -> MemoryBudget:
+    """Get or create the global memory budget, driven by the global memory monitor."""
+    global _global_budget
+
+    with _budget_lock:
+        if _global_budget is None:
+            _global_budget = MemoryBudget(monitor=get_global_memory_monitor())
+
+    return _global_budget
@@ -284,6 +284,23 @@ class MemoryMonitor:
         assert callable(callback), "callback must be callable"
         self._emergency_cleanup_callbacks.append(callback)
 
+    def current_rss_mb(self, include_children: bool = False) -> float:
+        """Sample resident memory right now, optionally including worker processes."""
+        if not self._process:
+            return 0.0
+        try:
+            rss = self._process.memory_info().rss
+            if include_children:
+                for child in self._process.children(recursive=True):
+                    try:
+                        rss += child.memory_info().rss
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue  # Worker exited between listing and sampling
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            logger.debug(f"RSS sampling failed: {e}")
+            return 0.0
+        return rss / 1024 / 1024
+
     def _monitoring_loop(self) -> None:
         """Main monitoring loop (runs in background thread)."""
         logger.info("Memory monitoring loop started")
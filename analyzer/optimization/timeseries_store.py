@@ -0,0 +1,396 @@
+"""
+Append-Only Time-Series Store
+=============================
+
+Shared history store for drift, Six Sigma and trend telemetry.
+
+- Measurements are fixed-width binary records (timestamp plus one float per
+  field) appended to a single file; recording a measurement never rewrites
+  history
+- Records are kept in timestamp order, so the file is its own time index:
+  range queries binary-search the record offsets and read only the window
+- Rolling aggregates (count, mean, stddev per trailing window, plus an EWMA
+  per field) are updated incrementally on append and kept in a small state
+  file, so anomaly and trend queries cost O(window) or less regardless of how
+  much history has accumulated
+"""
+
+from dataclasses import dataclass
+import json
+import logging
+import math
+import os
+from pathlib import Path
+import struct
+import threading
+import time
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CNXTS001"
+FORMAT_VERSION = 1
+# magic, version, field count, header size (records start at header size)
+HEADER = struct.Struct("<8sHHI")
+TIMESTAMP = struct.Struct("<d")
+
+DAY_SECONDS = 86400.0
+DEFAULT_WINDOWS = (7 * DAY_SECONDS, 30 * DAY_SECONDS)
+DEFAULT_EWMA_ALPHA = 0.2
+
+
+@dataclass
+class WindowStats:
+    """Summary statistics of one field over a time window."""
+
+    count: int
+    mean: float
+    stddev: float  # Sample standard deviation; 0.0 with fewer than two points
+
+
+class _Window:
+    """Running sums over the records at or after ``cut``."""
+
+    def __init__(self, seconds: float, field_count: int):
+        self.seconds = seconds
+        self.start = 0
+        self.cut = float("-inf")
+        self.sums = [0.0] * field_count
+        self.squares = [0.0] * field_count
+
+    def add(self, values: Sequence[float], sign: float = 1.0) -> None:
+        for index, value in enumerate(values):
+            self.sums[index] += sign * value
+            self.squares[index] += sign * value * value
+
+    def stats(self, end: int, field_index: int) -> WindowStats:
+        count = end - self.start
+        if count <= 0:
+            return WindowStats(0, 0.0, 0.0)
+        total = self.sums[field_index]
+        mean = total / count
+        if count < 2:
+            return WindowStats(count, mean, 0.0)
+        variance = max(0.0, (self.squares[field_index] - total * total / count) / (count - 1))
+        return WindowStats(count, mean, math.sqrt(variance))
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "seconds": self.seconds,
+            "start": self.start,
+            "cut": None if math.isinf(self.cut) else self.cut,
+            "sums": self.sums,
+            "squares": self.squares,
+        }
+
+
+class TimeSeriesStore:
+    """Append-only store of timestamped numeric measurements."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        name: str,
+        fields: Sequence[str],
+        windows: Sequence[float] = DEFAULT_WINDOWS,
+        ewma_alpha: float = DEFAULT_EWMA_ALPHA,
+    ):
+        """
+        Args:
+            directory: Directory holding ``<name>.tsdb`` and its state file
+            name: Series name
+            fields: Field names, fixed for the life of the file
+            windows: Trailing window lengths in seconds whose aggregates are
+                maintained on append
+            ewma_alpha: Smoothing factor of the per-field EWMA
+        """
+        if not fields:
+            raise ValueError("A time series needs at least one field")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / f"{name}.tsdb"
+        self.state_path = self.directory / f"{name}.tsdb.state"
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.ewma_alpha = ewma_alpha
+
+        self._field_index = {field: index for index, field in enumerate(self.fields)}
+        self._record = struct.Struct(f"<d{len(self.fields)}d")
+        self._lock = threading.RLock()
+        self._windows = {float(seconds): _Window(float(seconds), len(self.fields)) for seconds in windows}
+        self._ewma: List[Optional[float]] = [None] * len(self.fields)
+
+        self._header_size = self._open_file()
+        self._count = (os.fstat(self._file.fileno()).st_size - self._header_size) // self._record.size
+        self._last_timestamp = self._timestamp_at(self._count - 1) if self._count else float("-inf")
+        if not self._load_state():
+            self._rebuild_state()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, values: Mapping[str, float], timestamp: Optional[float] = None) -> float:
+        """
+        Append one measurement and fold it into the rolling aggregates.
+
+        Missing fields are stored as 0.0. Timestamps earlier than the last
+        record are moved up to it so the file stays time-ordered.
+
+        Returns:
+            The timestamp the record was stored under
+        """
+        row = [float(values.get(field, 0.0)) for field in self.fields]
+        with self._lock:
+            stamp = time.time() if timestamp is None else float(timestamp)
+            if stamp < self._last_timestamp:
+                logger.debug(f"{self.path.name}: out-of-order timestamp {stamp} stored as {self._last_timestamp}")
+                stamp = self._last_timestamp
+
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(self._record.pack(stamp, *row))
+            self._file.flush()
+            self._count += 1
+            self._last_timestamp = stamp
+
+            for window in self._windows.values():
+                if stamp < window.cut:
+                    # Already outside a window a query has advanced past
+                    window.start = self._count
+                    continue
+                window.add(row)
+                self._advance(window, stamp - window.seconds)
+            self._update_ewma(row)
+            self._save_state()
+            return stamp
+
+    def truncate_before(self, timestamp: float) -> int:
+        """Drop records older than ``timestamp``; returns how many were removed."""
+        with self._lock:
+            first = self._bisect(timestamp)
+            if first == 0:
+                return 0
+
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            self._file.seek(0)
+            header = self._file.read(self._header_size)
+            self._file.seek(self._header_size + first * self._record.size)
+            with open(tmp_path, "wb") as handle:
+                handle.write(header)
+                while True:
+                    chunk = self._file.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    handle.write(chunk)
+            self._file.close()
+            os.replace(tmp_path, self.path)
+
+            self._open_file()
+            self._count -= first
+            self._rebuild_state()
+            return first
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        return self._last_timestamp if self._count else None
+
+    def count_since(self, since: float) -> int:
+        """Number of records at or after ``since`` (O(log n))."""
+        with self._lock:
+            return self._count - self._bisect(since)
+
+    def records(
+        self, since: Optional[float] = None, until: Optional[float] = None
+    ) -> Iterator[Tuple[float, Dict[str, float]]]:
+        """Records in ``[since, until]`` as ``(timestamp, {field: value})``, oldest first."""
+        for row in self._read_range(since, until):
+            yield row[0], dict(zip(self.fields, row[1:]))
+
+    def series(
+        self, field: str, since: Optional[float] = None, until: Optional[float] = None
+    ) -> Tuple[List[float], List[float]]:
+        """Timestamps and values of one field in ``[since, until]``."""
+        index = self._field_index[field] + 1
+        rows = self._read_range(since, until)
+        return [row[0] for row in rows], [row[index] for row in rows]
+
+    def window_stats(self, field: str, seconds: float, now: Optional[float] = None) -> WindowStats:
+        """
+        Count, mean and sample stddev of ``field`` over records at or after ``now - seconds``.
+
+        Maintained windows answer in O(1) amortized; other lengths scan the
+        window's records.
+        """
+        field_index = self._field_index[field]
+        cut = (time.time() if now is None else now) - seconds
+        with self._lock:
+            window = self._windows.get(float(seconds))
+            if window is not None and cut >= window.cut:
+                self._advance(window, cut)
+                return window.stats(self._count, field_index)
+
+        _, values = self.series(field, since=cut)
+        if not values:
+            return WindowStats(0, 0.0, 0.0)
+        mean = math.fsum(values) / len(values)
+        if len(values) < 2:
+            return WindowStats(len(values), mean, 0.0)
+        variance = math.fsum((value - mean) ** 2 for value in values) / (len(values) - 1)
+        return WindowStats(len(values), mean, math.sqrt(variance))
+
+    def ewma(self, field: str) -> Optional[float]:
+        """Exponentially weighted moving average of ``field``, or None when empty."""
+        return self._ewma[self._field_index[field]]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _open_file(self) -> int:
+        """Open (creating if needed) the series file and validate its header."""
+        names = "\0".join(self.fields).encode("utf-8")
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            with open(self.path, "wb") as handle:
+                handle.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(self.fields), HEADER.size + len(names)) + names)
+
+        self._file = open(self.path, "r+b")
+        magic, version, field_count, header_size = HEADER.unpack(self._file.read(HEADER.size))
+        stored = self._file.read(header_size - HEADER.size).decode("utf-8").split("\0")
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._file.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} time-series file")
+        if field_count != len(self.fields) or tuple(stored) != self.fields:
+            self._file.close()
+            raise ValueError(f"{self.path} holds fields {stored}, not {list(self.fields)}")
+
+        # Drop a partially written trailing record left by an interrupted append
+        size = os.fstat(self._file.fileno()).st_size
+        whole = header_size + (size - header_size) // self._record.size * self._record.size
+        if whole != size:
+            self._file.truncate(whole)
+        self._header_size = header_size
+        return header_size
+
+    def _timestamp_at(self, index: int) -> float:
+        self._file.seek(self._header_size + index * self._record.size)
+        return TIMESTAMP.unpack(self._file.read(TIMESTAMP.size))[0]
+
+    def _bisect(self, timestamp: float, low: int = 0, after: bool = False) -> int:
+        """Index of the first record at (or, with ``after``, past) ``timestamp``."""
+        high = self._count
+        while low < high:
+            middle = (low + high) // 2
+            stamp = self._timestamp_at(middle)
+            if stamp < timestamp or (after and stamp == timestamp):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _read_rows(self, start: int, end: int) -> List[Tuple[float, ...]]:
+        if end <= start:
+            return []
+        self._file.seek(self._header_size + start * self._record.size)
+        data = self._file.read((end - start) * self._record.size)
+        return list(self._record.iter_unpack(data))
+
+    def _read_range(self, since: Optional[float], until: Optional[float]) -> List[Tuple[float, ...]]:
+        with self._lock:
+            start = 0 if since is None else self._bisect(since)
+            end = self._count if until is None else self._bisect(until, low=start, after=True)
+            return self._read_rows(start, end)
+
+    def _advance(self, window: _Window, cut: float) -> None:
+        """Move a window's start past records older than ``cut``, subtracting them."""
+        if cut <= window.cut:
+            return
+        start = self._bisect(cut, low=window.start)
+        for row in self._read_rows(window.start, start):
+            window.add(row[1:], sign=-1.0)
+        window.start = start
+        window.cut = cut
+        if window.start == self._count:
+            # Nothing left in the window; reset to avoid carrying rounding error
+            window.sums = [0.0] * len(self.fields)
+            window.squares = [0.0] * len(self.fields)
+
+    def _update_ewma(self, row: Sequence[float]) -> None:
+        for index, value in enumerate(row):
+            previous = self._ewma[index]
+            if previous is None:
+                self._ewma[index] = value
+            else:
+                self._ewma[index] = self.ewma_alpha * value + (1 - self.ewma_alpha) * previous
+
+    def _rebuild_state(self) -> None:
+        """Recompute all aggregates with one pass over the file."""
+        self._ewma = [None] * len(self.fields)
+        self._windows = {seconds: _Window(seconds, len(self.fields)) for seconds in self._windows}
+        self._last_timestamp = self._timestamp_at(self._count - 1) if self._count else float("-inf")
+
+        batch = 4096
+        for start in range(0, self._count, batch):
+            for row in self._read_rows(start, min(start + batch, self._count)):
+                self._update_ewma(row[1:])
+        for window in self._windows.values():
+            window.start = self._bisect(self._last_timestamp - window.seconds) if self._count else 0
+            window.cut = self._last_timestamp - window.seconds
+            for row in self._read_rows(window.start, self._count):
+                window.add(row[1:])
+        self._save_state()
+
+    def _load_state(self) -> bool:
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+
+        windows = {float(entry["seconds"]): entry for entry in state.get("windows", [])}
+        if (
+            state.get("count") != self._count
+            or state.get("fields") != list(self.fields)
+            or state.get("ewma_alpha") != self.ewma_alpha
+            or set(windows) != set(self._windows)
+        ):
+            return False
+
+        for seconds, window in self._windows.items():
+            entry = windows[seconds]
+            window.start = entry["start"]
+            window.cut = float(entry["cut"]) if entry["cut"] is not None else float("-inf")
+            window.sums = [float(value) for value in entry["sums"]]
+            window.squares = [float(value) for value in entry["squares"]]
+        self._ewma = state["ewma"]
+        return True
+
+    def _save_state(self) -> None:
+        state = {
+            "count": self._count,
+            "fields": list(self.fields),
+            "ewma_alpha": self.ewma_alpha,
+            "ewma": self._ewma,
+            "windows": [window.to_dict() for window in self._windows.values()],
+        }
+
+        tmp_path = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            # The state is derived data; it is rebuilt from the series on the next open
+            logger.warning(f"Failed to save {self.state_path.name}: {e}")
+
+
+__all__ = ["DAY_SECONDS", "TimeSeriesStore", "WindowStats"]
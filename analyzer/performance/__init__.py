@@ -16,5 +16,13 @@ Performance enhancement module.
 """
 
 from .parallel_analyzer import ParallelAnalysisConfig, ParallelAnalysisResult, ParallelConnascenceAnalyzer
+from .worker_controller import WorkerController, WorkerSettings, WorkerSettingsStore
 
-__all__ = ["ParallelAnalysisConfig", "ParallelAnalysisResult", "ParallelConnascenceAnalyzer"]
+__all__ = [
+    "ParallelAnalysisConfig",
+    "ParallelAnalysisResult",
+    "ParallelConnascenceAnalyzer",
+    "WorkerController",
+    "WorkerSettings",
+    "WorkerSettingsStore",
+]
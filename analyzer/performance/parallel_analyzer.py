@@ -24,7 +24,7 @@ This module provides parallel analysis capabilities while maintaining compatibil
 with the existing single-threaded analyzer infrastructure.
 """
 
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 import logging
 import multiprocessing as mp
@@ -37,6 +37,9 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from fixes.phase0.production_safe_assertions import ProductionAssert
 import psutil
 
+from analyzer.optimization.memory_budget import MemoryBudget, estimate_files_cost_mb, get_global_memory_budget
+from analyzer.performance.worker_controller import WorkerController
+
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -72,6 +75,9 @@ class ParallelAnalysisConfig:
     use_processes: bool = True  # True for CPU-bound tasks
     timeout_seconds: int = 300  # 5 minutes
     memory_limit_mb: int = 1024  # 1GB per worker
+    memory_budget_mb: Optional[float] = None  # Whole-run budget; None shares the global budget
+    adaptive_workers: bool = True  # Tune the worker count during the run and remember it per project
+    max_workers_ceiling: Optional[int] = None  # None: CPU count for processes, twice that for threads
     enable_profiling: bool = False
     worker_initialization_timeout: int = 30
 
@@ -115,11 +121,17 @@ class ParallelConnascenceAnalyzer:
         self.config = config or ParallelAnalysisConfig()
         self.base_analyzer = UnifiedConnascenceAnalyzer()
         self.metrics_collector = DashboardMetrics()
+        self.memory_budget = (
+            MemoryBudget(limit_mb=self.config.memory_budget_mb)
+            if self.config.memory_budget_mb
+            else get_global_memory_budget()
+        )
 
         # Performance tracking
         self.execution_stats = {}
         self.worker_pool = None
         self.resource_monitor = None
+        self.worker_controller: Optional[WorkerController] = None
 
         logger.info(f"Parallel analyzer initialized with {self.config.max_workers} workers")
 
@@ -165,8 +177,10 @@ class ParallelConnascenceAnalyzer:
 
             logger.info(f"Processing {len(files_to_analyze)} files in {len(file_chunks)} chunks")
 
-            # Execute parallel analysis
-            chunk_results, chunk_times = self._execute_parallel_chunks(file_chunks, policy_preset, options)
+            # Execute parallel analysis, starting from the worker count remembered for this project
+            controller = self._create_worker_controller(project_path)
+            chunk_results, chunk_times = self._execute_parallel_chunks(file_chunks, policy_preset, options, controller)
+            controller.save()
 
             # Combine results from all chunks
             combined_result = self._combine_chunk_results(chunk_results, project_path, policy_preset, start_time)
@@ -190,7 +204,7 @@ class ParallelConnascenceAnalyzer:
                 efficiency=performance_metrics["efficiency"],
                 peak_memory_mb=resource_stats.get("peak_memory_mb", 0),
                 avg_cpu_percent=resource_stats.get("avg_cpu_percent", 0),
-                worker_count=self.config.max_workers,
+                worker_count=controller.best_workers,
                 worker_results=chunk_results,
                 chunk_processing_times=chunk_times,
                 coordination_overhead_ms=performance_metrics["coordination_overhead"],
@@ -257,7 +271,7 @@ class ParallelConnascenceAnalyzer:
             "duplication_clusters": all_duplication_clusters,
             "execution_time_ms": total_time * 1000,
             "parallel_processing": True,
-            "worker_count": self.config.max_workers,
+            "worker_count": self.worker_controller.best_workers,
             "chunk_count": len(file_chunks),
         }
 
@@ -370,44 +384,102 @@ class ParallelConnascenceAnalyzer:
 
         return chunks
 
+    def _create_worker_controller(self, project_path: Optional[Path] = None) -> WorkerController:
+        """Worker controller for one run; fixed at ``max_workers`` when adaptation is off."""
+        if not self.config.adaptive_workers:
+            workers = self.config.max_workers
+            return WorkerController(workers, min_workers=workers, max_workers=workers)
+
+        cpu_count = mp.cpu_count()
+        ceiling = self.config.max_workers_ceiling or (cpu_count if self.config.use_processes else 2 * cpu_count)
+        settings = {"max_workers": max(ceiling, self.config.max_workers), "memory_budget": self.memory_budget}
+        if project_path is None:
+            return WorkerController(self.config.max_workers, **settings)
+        return WorkerController.for_project(
+            project_path, self.config.use_processes, self.config.max_workers, **settings
+        )
+
     def _execute_parallel_chunks(
-        self, file_chunks: List[List[Path]], policy_preset: str, options: Dict[str, Any]
+        self,
+        file_chunks: List[List[Path]],
+        policy_preset: str,
+        options: Dict[str, Any],
+        controller: Optional[WorkerController] = None,
     ) -> Tuple[List[Dict], List[float]]:
-        """Execute analysis on file chunks in parallel."""
+        """
+        Execute analysis on file chunks in parallel.
+
+        The worker controller decides how many chunks run at once from the
+        throughput and machine load it observes. Chunks are submitted only
+        while the memory budget admits their estimated cost, and a tight
+        budget narrows the controller's choice further, so the pool never
+        holds the whole project at once.
+        """
 
         chunk_results = []
         chunk_times = []
+        budget = self.memory_budget
+        controller = controller or self._create_worker_controller()
+        self.worker_controller = controller
+        deadline = time.monotonic() + self.config.timeout_seconds
 
         executor_class = ProcessPoolExecutor if self.config.use_processes else ThreadPoolExecutor
 
-        with executor_class(max_workers=self.config.max_workers) as executor:
-            # Submit all chunks for processing
-            future_to_chunk = {
-                executor.submit(self._analyze_chunk, chunk, policy_preset, options): i
-                for i, chunk in enumerate(file_chunks)
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_chunk, timeout=self.config.timeout_seconds):
-                chunk_index = future_to_chunk[future]
-
-                try:
-                    start_time = time.time()
-                    result = future.result()
-                    processing_time = time.time() - start_time
+        with executor_class(max_workers=controller.max_workers) as executor:
+            # future -> (chunk index, reserved cost, submit time)
+            in_flight: Dict[Any, Tuple[int, float, float]] = {}
+            next_chunk = 0
 
-                    chunk_results.append(result)
-                    chunk_times.append(processing_time)
-
-                    logger.debug(f"Chunk {chunk_index} completed in {processing_time:.2f}s")
-
-                except Exception as e:
-                    logger.error(f"Chunk {chunk_index} failed: {e}")
-                    # Add empty result to maintain ordering
-                    chunk_results.append(
-                        {"error": str(e), "violations": [], "nasa_violations": [], "duplication_clusters": []}
-                    )
-                    chunk_times.append(0.0)
+            try:
+                while next_chunk < len(file_chunks) or in_flight:
+                    target = budget.parallelism(controller.workers)
+                    while next_chunk < len(file_chunks) and len(in_flight) < target:
+                        chunk = file_chunks[next_chunk]
+                        cost = estimate_files_cost_mb(chunk)
+                        if in_flight:
+                            admitted = budget.try_acquire(cost)
+                        else:
+                            admitted = budget.acquire(cost, timeout=deadline - time.monotonic())
+                        if not admitted:
+                            break  # Wait for running chunks to free memory
+                        future = executor.submit(self._analyze_chunk, chunk, policy_preset, options)
+                        in_flight[future] = (next_chunk, cost, time.time())
+                        next_chunk += 1
+
+                    remaining = deadline - time.monotonic()
+                    done, _ = wait(in_flight, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+                    if not done:
+                        raise TimeoutError(f"Chunks still running after {self.config.timeout_seconds}s")
+
+                    for future in done:
+                        chunk_index, cost, submitted_at = in_flight.pop(future)
+                        budget.release(cost)
+                        controller.record(len(file_chunks[chunk_index]))
+                        processing_time = time.time() - submitted_at
+
+                        try:
+                            result = future.result()
+                            chunk_results.append(result)
+                            chunk_times.append(processing_time)
+
+                            logger.debug(f"Chunk {chunk_index} completed in {processing_time:.2f}s")
+
+                        except Exception as e:
+                            logger.error(f"Chunk {chunk_index} failed: {e}")
+                            # Add empty result to maintain ordering
+                            chunk_results.append(
+                                {
+                                    "error": str(e),
+                                    "violations": [],
+                                    "nasa_violations": [],
+                                    "duplication_clusters": [],
+                                }
+                            )
+                            chunk_times.append(0.0)
+            finally:
+                for future, (_index, cost, _submitted_at) in in_flight.items():
+                    future.cancel()
+                    budget.release(cost)
 
         return chunk_results, chunk_times
 
@@ -0,0 +1,262 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+"""
+Adaptive Worker-Count Controller
+================================
+
+Chooses how many analysis chunks run at once while a parallel run is in
+progress, instead of fixing the count from the CPU count up front.
+
+Every window the controller compares files/sec with the previous window and
+reads CPU utilisation, load average and memory headroom:
+
+- Congestion (memory headroom low, or load average well above the CPU count
+  because other jobs share the machine) halves the worker count.
+- Otherwise workers are added one at a time while CPU is not saturated, and
+  the last step is undone once it stops improving throughput (hill climbing
+  towards the knee of the curve).
+
+The best setting found is stored per project in ``.connascence_cache`` and
+used as the starting point of the next run.
+"""
+
+from dataclasses import asdict, dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SETTINGS_FILE = ".connascence_cache/worker_settings.json"
+WINDOW_SECONDS = 1.0
+# Relative throughput gain a step must bring to be kept
+THROUGHPUT_TOLERANCE = 0.05
+CPU_SATURATED_PERCENT = 90.0
+# Load average per CPU above which the machine counts as oversubscribed
+OVERLOAD_LOAD_PER_CPU = 1.5
+MIN_MEMORY_HEADROOM = 0.15
+DECREASE_FACTOR = 0.5
+# Windows to wait after a decrease or a rejected step before probing again
+HOLD_WINDOWS = 3
+
+
+@dataclass
+class WorkerSettings:
+    """Settings remembered for one project between runs."""
+
+    workers: int
+    files_per_second: float
+    updated_at: float
+
+
+class WorkerSettingsStore:
+    """
+    Per-project JSON store of the worker count that worked best.
+
+    Entries are keyed by pool kind and CPU count, so a laptop and a CI runner
+    sharing a checkout do not overwrite each other.
+    """
+
+    def __init__(self, project_path: Union[str, Path], settings_file: str = DEFAULT_SETTINGS_FILE):
+        self.path = Path(project_path) / settings_file
+
+    @staticmethod
+    def key(use_processes: bool) -> str:
+        return f"{'processes' if use_processes else 'threads'}:{os.cpu_count() or 1}"
+
+    def load(self, key: str) -> Optional[WorkerSettings]:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                entry = json.load(handle).get("entries", {}).get(key)
+            return WorkerSettings(**entry) if entry else None
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable worker settings {self.path}: {e}")
+            return None
+
+    def save(self, key: str, settings: WorkerSettings) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+            payload.setdefault("entries", {})
+        except (OSError, ValueError):
+            payload = {"entries": {}}
+        payload["entries"][key] = asdict(settings)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save worker settings {self.path}: {e}")
+
+
+class WorkerController:
+    """
+    AIMD / hill-climbing controller for the number of concurrent workers.
+
+    Not thread-safe; the scheduling loop owns it and calls ``record`` as
+    chunks complete.
+    """
+
+    def __init__(
+        self,
+        initial_workers: int,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        window_seconds: float = WINDOW_SECONDS,
+        memory_budget=None,
+        clock: Callable[[], float] = time.monotonic,
+        cpu_sampler: Optional[Callable[[], float]] = None,
+        load_sampler: Optional[Callable[[], float]] = None,
+        headroom_sampler: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Initialize worker controller.
+
+        Args:
+            initial_workers: Worker count to start with
+            min_workers: Lower bound
+            max_workers: Upper bound (defaults to twice the CPU count)
+            window_seconds: Seconds of completions per decision
+            memory_budget: MemoryBudget whose pressure defines memory headroom
+            clock: Monotonic clock
+            cpu_sampler: Returns CPU utilisation in percent
+            load_sampler: Returns load average per CPU
+            headroom_sampler: Returns free memory as a fraction (0-1)
+        """
+        self.max_workers = max_workers or 2 * (os.cpu_count() or 1)
+        self.min_workers = max(1, min(min_workers, self.max_workers))
+        if window_seconds <= 0:
+            raise ValueError(f"window_seconds must be positive, got {window_seconds}")
+
+        self._workers = self._clamp(initial_workers)
+        self.window_seconds = window_seconds
+        self.memory_budget = memory_budget
+        self._clock = clock
+        self._cpu = cpu_sampler or self._sample_cpu
+        self._load = load_sampler or self._sample_load
+        self._headroom = headroom_sampler or self._sample_headroom
+
+        self._window_start = clock()
+        self._window_files = 0
+        self._previous_throughput: Optional[float] = None
+        self._last_step = 0
+        self._hold = 0
+        self.best_workers = self._workers
+        self.best_throughput = 0.0
+        self.history: List[Dict[str, Any]] = []
+        self._store: Optional[WorkerSettingsStore] = None
+        self._store_key = ""
+
+        if cpu_sampler is None:
+            psutil.cpu_percent(interval=None)  # Prime the non-blocking sampler
+
+    @classmethod
+    def for_project(
+        cls, project_path: Union[str, Path], use_processes: bool, default_workers: int, **kwargs
+    ) -> "WorkerController":
+        """Controller starting from the worker count remembered for this project."""
+        store = WorkerSettingsStore(project_path)
+        key = WorkerSettingsStore.key(use_processes)
+        settings = store.load(key)
+        controller = cls(settings.workers if settings else default_workers, **kwargs)
+        controller._store, controller._store_key = store, key
+        if settings:
+            logger.info(f"Starting with {controller.workers} workers remembered for {project_path}")
+        return controller
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def record(self, files: int) -> int:
+        """Count completed files; decide at the end of each window. Returns the worker count."""
+        self._window_files += files
+        elapsed = self._clock() - self._window_start
+        if elapsed >= self.window_seconds:
+            self._adjust(self._window_files / elapsed)
+            self._window_start = self._clock()
+            self._window_files = 0
+        return self._workers
+
+    def save(self) -> None:
+        """Remember the best worker count for the project this controller was created for."""
+        if self._store is None or self.best_throughput <= 0:
+            return
+        settings = WorkerSettings(self.best_workers, round(self.best_throughput, 3), time.time())
+        self._store.save(self._store_key, settings)
+
+    def _adjust(self, throughput: float) -> None:
+        if throughput > self.best_throughput:
+            self.best_throughput, self.best_workers = throughput, self._workers
+
+        cpu, load, headroom = self._cpu(), self._load(), self._headroom()
+        previous = self._previous_throughput
+        workers, reason = self._workers, "hold"
+
+        if headroom < MIN_MEMORY_HEADROOM or (load > OVERLOAD_LOAD_PER_CPU and not self._hold):
+            # Load average lags, so one decrease per hold period is enough
+            workers, reason = int(self._workers * DECREASE_FACTOR), "congested"
+            self._hold = HOLD_WINDOWS
+        elif self._last_step > 0 and previous is not None and throughput < previous * (1 + THROUGHPUT_TOLERANCE):
+            workers, reason = self._workers - 1, "no_gain"
+            self._hold = HOLD_WINDOWS
+        elif self._hold:
+            self._hold -= 1
+        elif cpu < CPU_SATURATED_PERCENT:
+            workers, reason = self._workers + 1, "probe"
+
+        workers = self._clamp(workers)
+        self._last_step = workers - self._workers
+        self.history.append(
+            {
+                "workers": self._workers,
+                "files_per_second": round(throughput, 3),
+                "cpu_percent": cpu,
+                "load_per_cpu": round(load, 3),
+                "memory_headroom": round(headroom, 3),
+                "decision": reason,
+                "next_workers": workers,
+            }
+        )
+        if workers != self._workers:
+            logger.debug(f"Worker count {self._workers} -> {workers} ({reason}, {throughput:.1f} files/s)")
+        self._workers = workers
+        self._previous_throughput = throughput
+
+    def _clamp(self, workers: int) -> int:
+        return max(self.min_workers, min(self.max_workers, workers))
+
+    @staticmethod
+    def _sample_cpu() -> float:
+        return psutil.cpu_percent(interval=None)
+
+    @staticmethod
+    def _sample_load() -> float:
+        try:
+            return os.getloadavg()[0] / (os.cpu_count() or 1)
+        except (AttributeError, OSError):
+            return 0.0  # Not available on Windows
+
+    def _sample_headroom(self) -> float:
+        if self.memory_budget is not None:
+            return max(0.0, 1.0 - self.memory_budget.pressure())
+        memory = psutil.virtual_memory()
+        return memory.available / memory.total
@@ -6,17 +6,35 @@ This module provides a unified interface for running all quality checks
 and producing consolidated reports with actionable insights.
 """
 
+import ast
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
+import logging
+import os
 from pathlib import Path
 import sys
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 import yaml
 
 # Import ClarityLinter for integration
 from analyzer.clarity_linter import ClarityLinter
+from analyzer.optimization.digest_service import DEFAULT_EXCLUDE_DIRS, iter_tree_files
+
+logger = logging.getLogger(__name__)
+
+# Analyzer families in report order, with the labels used in progress output
+ANALYZER_FAMILIES = ("clarity_linter", "connascence_analyzer", "nasa_standards")
+ANALYZER_LABELS = {
+    "clarity_linter": "Clarity Linter",
+    "connascence_analyzer": "Connascence Analyzer",
+    "nasa_standards": "NASA Standards",
+}
+
+# Below this many files the process pool costs more than it saves
+SHARED_PARSE_PARALLEL_THRESHOLD = 32
 
 
 @dataclass
@@ -81,6 +99,273 @@ class AnalysisResult:
         }
 
 
+@dataclass
+class FileAnalysis:
+    """Violations found in one file by each analyzer family"""
+
+    file: str
+    violations: Dict[str, List[Violation]] = field(default_factory=dict)
+    parsed: bool = True
+
+
+def discover_python_files(
+    project_path: Path, exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS
+) -> List[Path]:
+    """
+    Find every Python file under the project once, in sorted order.
+
+    Args:
+        project_path: Project root (or a single file)
+        exclude_dirs: Directory names never descended into
+
+    Returns:
+        Sorted list of Python file paths
+    """
+    project_path = Path(project_path)
+    if project_path.is_file():
+        return [project_path] if project_path.suffix == ".py" else []
+    return sorted(iter_tree_files(project_path, (".py",), exclude_dirs))
+
+
+def _violation_dicts(raw_violations: Optional[Iterable[Any]]) -> List[Dict]:
+    """Normalize analyzer output (dicts, dataclasses or plain objects) to dicts"""
+    violation_dicts = []
+    for violation in raw_violations or []:
+        if isinstance(violation, dict):
+            violation_dicts.append(violation)
+        elif hasattr(violation, "to_dict"):
+            violation_dicts.append(violation.to_dict())
+        else:
+            violation_dicts.append(vars(violation))
+    return violation_dicts
+
+
+def _clarity_violation(cv: Any) -> Violation:
+    """Convert a ClarityViolation to a unified Violation"""
+    return Violation(
+        rule_id=cv.rule_id,
+        message=cv.description,
+        file=str(cv.file_path),
+        line=cv.line_number,
+        column=cv.column or None,
+        severity=cv.severity,
+        category="clarity",
+        code_snippet=cv.code_snippet,
+        fix_suggestion=cv.recommendation,
+        source_analyzer="clarity_linter",
+    )
+
+
+def _connascence_violation(v: Dict, file_path: Path) -> Violation:
+    """Convert a connascence analyzer violation dict to a unified Violation"""
+    return Violation(
+        rule_id=v.get("rule_id") or v.get("type") or "CONNASCENCE",
+        message=v.get("description")
+        or v.get("message")
+        or v.get("type")
+        or "Connascence violation detected",
+        file=v.get("file_path") or str(file_path),
+        line=v.get("line_number", v.get("line", 0)),
+        column=v.get("column"),
+        severity=v.get("severity", "medium"),
+        category=v.get("category", "design"),
+        code_snippet=v.get("code_snippet"),
+        fix_suggestion=v.get("recommendation")
+        or v.get("fix_suggestion"),
+        connascence_type=v.get("connascence_type") or v.get("type"),
+        source_analyzer="connascence_analyzer",
+    )
+
+
+def _nasa_violation(v: Dict, file_path: Path) -> Violation:
+    """Convert a NASA analyzer violation dict to a unified Violation"""
+    return Violation(
+        rule_id=v.get("rule_id") or v.get("type") or "NASA_RULE",
+        message=v.get("description")
+        or v.get("message")
+        or v.get("type")
+        or "NASA standards violation detected",
+        file=v.get("file_path") or str(file_path),
+        line=v.get("line_number", v.get("line", 0)),
+        column=v.get("column"),
+        severity=v.get("severity", "medium"),
+        category=v.get("category", "reliability"),
+        code_snippet=v.get("code_snippet"),
+        fix_suggestion=v.get("recommendation")
+        or v.get("fix_suggestion"),
+        nasa_mapping=v.get("nasa_mapping") or v.get("type"),
+        source_analyzer="nasa_standards",
+    )
+
+
+class SharedParseRunner:
+    """
+    Runs all enabled analyzer families on one read and one parse of a file.
+
+    Instances are built once per process: in the gate itself for small
+    projects, and once per worker when files are spread over a process pool.
+    """
+
+    def __init__(
+        self,
+        enabled: Sequence[str],
+        clarity_linter: Optional[ClarityLinter] = None,
+        clarity_config_path: Optional[Path] = None,
+        verbose: bool = False,
+    ):
+        """
+        Load the analyzer for each requested family.
+
+        Args:
+            enabled: Analyzer families to run
+            clarity_linter: Already-initialized ClarityLinter to reuse
+            clarity_config_path: Config for a new ClarityLinter when none is given
+            verbose: Print a note for each family that could not be loaded
+        """
+        self.verbose = verbose
+        self.clarity_linter = None
+        self.connascence_analyzer = None
+        self.nasa_analyzer = None
+
+        if "clarity_linter" in enabled:
+            self.clarity_linter = clarity_linter or self._load(
+                "clarity_linter", lambda: ClarityLinter(clarity_config_path)
+            )
+        if "connascence_analyzer" in enabled:
+            self.connascence_analyzer = self._load("connascence_analyzer", self._connascence_factory)
+        if "nasa_standards" in enabled:
+            self.nasa_analyzer = self._load("nasa_standards", self._nasa_factory)
+
+        loaded = {
+            "clarity_linter": self.clarity_linter,
+            "connascence_analyzer": self.connascence_analyzer,
+            "nasa_standards": self.nasa_analyzer,
+        }
+        self.enabled = tuple(family for family in ANALYZER_FAMILIES if loaded[family] is not None)
+
+    @property
+    def clarity_config_path(self) -> Optional[Path]:
+        return self.clarity_linter.config_path if self.clarity_linter else None
+
+    @staticmethod
+    def _connascence_factory():
+        from analyzer.connascence_analyzer import ConnascenceAnalyzer
+
+        return ConnascenceAnalyzer()
+
+    @staticmethod
+    def _nasa_factory():
+        from analyzer.nasa_engine.nasa_analyzer import NASAAnalyzer
+
+        return NASAAnalyzer()
+
+    def _load(self, family: str, factory):
+        try:
+            return factory()
+        except Exception as e:
+            if self.verbose:
+                print(f"[{ANALYZER_LABELS[family]}] Skipped - import failed: {e}")
+            return None
+
+    def analyze(self, file_path: Path) -> FileAnalysis:
+        """
+        Read and parse one file, then run every loaded analyzer on the tree.
+
+        Args:
+            file_path: Python file to analyze
+
+        Returns:
+            FileAnalysis with violations grouped by analyzer family
+        """
+        outcome = FileAnalysis(file=str(file_path))
+        try:
+            source_code = file_path.read_text(encoding="utf-8")
+            tree = ast.parse(source_code, filename=str(file_path))
+        except (OSError, UnicodeDecodeError, SyntaxError, ValueError) as e:
+            logger.debug("Skipping %s: %s", file_path, e)
+            outcome.parsed = False
+            return outcome
+
+        if self.clarity_linter and self.clarity_linter._should_analyze_file(file_path):
+            outcome.violations["clarity_linter"] = [
+                _clarity_violation(cv)
+                for cv in self.clarity_linter.analyze_source(file_path, source_code, tree)
+            ]
+        if self.connascence_analyzer:
+            outcome.violations["connascence_analyzer"] = [
+                _connascence_violation(v, file_path)
+                for v in _violation_dicts(self._run_connascence(file_path, source_code, tree))
+            ]
+        if self.nasa_analyzer:
+            outcome.violations["nasa_standards"] = [
+                _nasa_violation(v, file_path)
+                for v in _violation_dicts(self._run_nasa(file_path, source_code, tree))
+            ]
+        return outcome
+
+    def _run_connascence(self, file_path: Path, source_code: str, tree: ast.AST) -> List[Any]:
+        analyzer = self.connascence_analyzer
+        try:
+            analyze_source = getattr(analyzer, "analyze_source", None)
+            if analyze_source:
+                return analyze_source(source_code, file_path, tree=tree)
+            analyze_fn = getattr(analyzer, "analyze", None)
+            if analyze_fn:
+                return analyze_fn(source_code, str(file_path))
+            analyze_file_fn = getattr(analyzer, "analyze_file", None)
+            if analyze_file_fn:
+                return analyze_file_fn(file_path)
+        except Exception as e:
+            logger.debug("Connascence analysis failed for %s: %s", file_path, e)
+        return []
+
+    def _run_nasa(self, file_path: Path, source_code: str, tree: ast.AST) -> List[Any]:
+        try:
+            return self.nasa_analyzer.analyze_file(str(file_path), source_code=source_code, tree=tree)
+        except Exception as e:
+            logger.debug("NASA analysis failed for %s: %s", file_path, e)
+            return []
+
+
+_worker_runner: Optional[SharedParseRunner] = None
+
+
+def _init_shared_parse_worker(enabled: Sequence[str], clarity_config_path: Optional[Path]) -> None:
+    """Build the per-process analyzers once (process-pool initializer)"""
+    global _worker_runner
+    _worker_runner = SharedParseRunner(enabled, clarity_config_path=clarity_config_path)
+
+
+def _shared_parse_file(file_path: Path) -> FileAnalysis:
+    """Analyze one file with this worker's analyzers (process-pool worker)"""
+    return _worker_runner.analyze(file_path)
+
+
+def _run_shared_parse_jobs(
+    runner: SharedParseRunner,
+    files: List[Path],
+    workers: int,
+    threshold: int = SHARED_PARSE_PARALLEL_THRESHOLD,
+) -> List[FileAnalysis]:
+    """Analyze files in order, fanning out across processes for larger projects."""
+    workers = min(workers, len(files))
+    if workers <= 1 or len(files) < threshold:
+        return [runner.analyze(file_path) for file_path in files]
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_shared_parse_worker,
+            initargs=(runner.enabled, runner.clarity_config_path),
+        ) as executor:
+            chunksize = max(1, len(files) // (workers * 4))
+            # map() yields in submission order, so the merge stays deterministic
+            return list(executor.map(_shared_parse_file, files, chunksize=chunksize))
+    except (OSError, RuntimeError) as e:
+        logger.debug("Quality gate process pool unavailable, running serially: %s", e)
+        return [runner.analyze(file_path) for file_path in files]
+
+
 class UnifiedQualityGate:
     """
     Unified Quality Gate that orchestrates multiple analyzers:
@@ -131,6 +416,10 @@ class UnifiedQualityGate:
                 "max_medium": 10,
                 "max_low": 20,
             },
+            "execution": {
+                "workers": None,
+                "parallel_threshold": SHARED_PARSE_PARALLEL_THRESHOLD,
+            },
         }
 
     def analyze_project(
@@ -161,14 +450,7 @@ class UnifiedQualityGate:
         }
 
         # Run analyzers
-        if self.config["analyzers"]["clarity_linter"]["enabled"]:
-            self._run_clarity_linter(project_path)
-
-        if self.config["analyzers"]["connascence_analyzer"]["enabled"]:
-            self._run_connascence_analyzer(project_path)
-
-        if self.config["analyzers"]["nasa_standards"]["enabled"]:
-            self._run_nasa_standards(project_path)
+        self._run_shared_analysis(project_path)
 
         # Calculate metrics and scores
         self._calculate_metrics()
@@ -180,190 +462,53 @@ class UnifiedQualityGate:
 
         return self.results
 
-    def _run_clarity_linter(self, project_path: Path) -> None:
+    def _run_shared_analysis(self, project_path: Path) -> None:
         """
-        Run Clarity Linter analysis with real implementation.
-
-        Integrates the ClarityLinter orchestrator which coordinates:
-        - ThinHelperDetector
-        - UselessIndirectionDetector
-        - CallChainDepthDetector
-        - PoorNamingDetector
-        - CommentIssuesDetector
-        """
-        print("[Clarity Linter] Starting analysis...")
+        Run every enabled analyzer family in a single pass over the project.
 
-        if not self.clarity_linter:
-            print("[Clarity Linter] Skipped - not initialized")
+        Files are discovered once, and each file is read and parsed once with
+        the tree shared by the Clarity Linter, Connascence Analyzer and NASA
+        Standards checks. Larger projects fan out across processes; results are
+        merged in sorted file order so reports are identical run to run.
+        """
+        runner = SharedParseRunner(
+            self._enabled_families(),
+            clarity_linter=self.clarity_linter,
+            verbose=True,
+        )
+        if not runner.enabled:
             return
 
-        try:
-            # Run actual clarity linter analysis
-            clarity_violations_raw = self.clarity_linter.analyze_project(project_path)
-
-            # Convert ClarityViolation objects to Violation objects
-            for cv in clarity_violations_raw:
-                violation = Violation(
-                    rule_id=cv.rule_id,
-                    message=cv.message,
-                    file=str(cv.file_path),
-                    line=cv.line_number,
-                    column=cv.column_number,
-                    severity=cv.severity,
-                    category=cv.category,
-                    code_snippet=cv.code_snippet,
-                    fix_suggestion=cv.fix_suggestion,
-                    source_analyzer="clarity_linter",
-                )
-                self.results.violations.append(violation)
-
-            # Get summary metrics
-            summary = self.clarity_linter.get_summary()
-            print(f"[Clarity Linter] Analyzed {summary['total_files_analyzed']} files")
-            print(f"[Clarity Linter] Found {summary['total_violations_found']} violations")
+        files = discover_python_files(project_path)
+        execution = self.config.get("execution") or {}
+        workers = execution.get("workers") or os.cpu_count() or 1
+        threshold = execution.get("parallel_threshold", SHARED_PARSE_PARALLEL_THRESHOLD)
+        print(f"[UnifiedQualityGate] Analyzing {len(files)} files ({', '.join(runner.enabled)})")
 
-        except Exception as e:
-            print(f"[Clarity Linter] Error during analysis: {e}")
-            import traceback
-            traceback.print_exc()
+        outcomes = _run_shared_parse_jobs(runner, files, workers, threshold)
 
-    def _run_connascence_analyzer(self, project_path: Path) -> None:
-        """
-        Run Connascence Analyzer.
-        """
-        print("[Connascence Analyzer] Starting analysis...")
+        by_family: Dict[str, List[Violation]] = {family: [] for family in ANALYZER_FAMILIES}
+        for outcome in outcomes:
+            for family, violations in outcome.violations.items():
+                by_family[family].extend(violations)
 
-        try:
-            from analyzer.connascence_analyzer import ConnascenceAnalyzer
-        except Exception as e:
-            print(
-                f"[Connascence Analyzer] Skipped - import failed: {e}"
-            )
-            return
+        # Clarity violations are reported project-wide by file and line, as ClarityLinter does
+        by_family["clarity_linter"].sort(key=lambda v: (v.file, v.line))
 
-        analyzer = ConnascenceAnalyzer()
-        violations_found = 0
-
-        for file_path in project_path.rglob("*.py"):
-            try:
-                source_code = file_path.read_text(encoding="utf-8")
-            except Exception:
-                continue
-
-            try:
-                analyze_fn = getattr(analyzer, "analyze", None)
-                if analyze_fn:
-                    raw_violations = analyze_fn(source_code, str(file_path))
-                else:
-                    analyze_file_fn = getattr(analyzer, "analyze_file", None)
-                    if analyze_file_fn:
-                        raw_violations = analyze_file_fn(file_path)
-                    else:
-                        continue
-            except Exception:
-                continue
-
-            violation_dicts = []
-            for violation in raw_violations or []:
-                if isinstance(violation, dict):
-                    violation_dicts.append(violation)
-                elif hasattr(violation, "to_dict"):
-                    violation_dicts.append(violation.to_dict())
-                else:
-                    violation_dicts.append(vars(violation))
-
-            for v in violation_dicts:
-                violation = Violation(
-                    rule_id=v.get("rule_id") or v.get("type") or "CONNASCENCE",
-                    message=v.get("description")
-                    or v.get("message")
-                    or v.get("type")
-                    or "Connascence violation detected",
-                    file=v.get("file_path") or str(file_path),
-                    line=v.get("line_number", v.get("line", 0)),
-                    column=v.get("column"),
-                    severity=v.get("severity", "medium"),
-                    category=v.get("category", "design"),
-                    code_snippet=v.get("code_snippet"),
-                    fix_suggestion=v.get("recommendation")
-                    or v.get("fix_suggestion"),
-                    connascence_type=v.get("connascence_type") or v.get("type"),
-                    source_analyzer="connascence_analyzer",
-                )
-                self.results.violations.append(violation)
-                violations_found += 1
-
-        print(f"[Connascence Analyzer] Found {violations_found} violations")
-
-    def _run_nasa_standards(self, project_path: Path) -> None:
-        """
-        Run NASA Standards compliance check.
-        """
-        print("[NASA Standards] Starting compliance check...")
+        for family in runner.enabled:
+            self.results.violations.extend(by_family[family])
+            print(f"[{ANALYZER_LABELS[family]}] Found {len(by_family[family])} violations")
 
-        try:
-            from analyzer.nasa_engine.nasa_analyzer import NASAAnalyzer
-        except Exception as e:
-            print(
-                f"[NASA Standards] Skipped - import failed: {e}"
-            )
-            return
+        self.results.metadata["files_analyzed"] = sum(1 for outcome in outcomes if outcome.parsed)
 
-        analyzer = NASAAnalyzer()
-        violations_found = 0
-
-        for file_path in project_path.rglob("*.py"):
-            try:
-                source_code = file_path.read_text(encoding="utf-8")
-            except Exception:
-                continue
-
-            try:
-                analyze_fn = getattr(analyzer, "analyze", None)
-                if analyze_fn:
-                    raw_violations = analyze_fn(source_code)
-                else:
-                    analyze_file_fn = getattr(analyzer, "analyze_file", None)
-                    if analyze_file_fn:
-                        raw_violations = analyze_file_fn(
-                            str(file_path), source_code=source_code
-                        )
-                    else:
-                        continue
-            except Exception:
-                continue
-
-            violation_dicts = []
-            for violation in raw_violations or []:
-                if isinstance(violation, dict):
-                    violation_dicts.append(violation)
-                elif hasattr(violation, "to_dict"):
-                    violation_dicts.append(violation.to_dict())
-                else:
-                    violation_dicts.append(vars(violation))
-
-            for v in violation_dicts:
-                violation = Violation(
-                    rule_id=v.get("rule_id") or v.get("type") or "NASA_RULE",
-                    message=v.get("description")
-                    or v.get("message")
-                    or v.get("type")
-                    or "NASA standards violation detected",
-                    file=v.get("file_path") or str(file_path),
-                    line=v.get("line_number", v.get("line", 0)),
-                    column=v.get("column"),
-                    severity=v.get("severity", "medium"),
-                    category=v.get("category", "reliability"),
-                    code_snippet=v.get("code_snippet"),
-                    fix_suggestion=v.get("recommendation")
-                    or v.get("fix_suggestion"),
-                    nasa_mapping=v.get("nasa_mapping") or v.get("type"),
-                    source_analyzer="nasa_standards",
-                )
-                self.results.violations.append(violation)
-                violations_found += 1
-
-        print(f"[NASA Standards] Found {violations_found} violations")
+    def _enabled_families(self) -> List[str]:
+        """Analyzer families switched on in the configuration, in report order"""
+        analyzers = self.config.get("analyzers", {})
+        return [
+            family
+            for family in ANALYZER_FAMILIES
+            if analyzers.get(family, {}).get("enabled", False)
+        ]
 
     def _calculate_metrics(self) -> None:
         """Calculate quality metrics from violations"""
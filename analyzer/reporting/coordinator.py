@@ -18,6 +18,7 @@ Unified Reporting Coordinator
 Central coordinator for all reporting formats that leverages existing infrastructure:
 - JSON export (existing: reporting/json_export.py)
 - SARIF export (existing: reporting/sarif_export.py)
+- NDJSON export for downstream tools (one violation per line)
 - Markdown summaries (existing: reporting/md_summary.py)
 - HTML dashboard (existing: dashboard/)
 - CLI outputs (existing: cli/)
@@ -29,10 +30,11 @@ while maintaining compatibility with all existing components.
 
 from __future__ import annotations
 
+import io
 import logging
 from pathlib import Path
 import sys
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, TextIO, Union
 
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -66,8 +68,24 @@ class UnifiedReportingCoordinator:
         "csv",  # Spreadsheet-compatible
         "xml",  # Enterprise integration
         "summary",  # Executive summary
+        "ndjson",  # One JSON record per line for downstream tools
     ]
 
+    # Formats written incrementally to a file handle instead of built in memory
+    STREAMING_FORMATS = ("json", "sarif", "ndjson")
+
+    EXTENSION_MAP = {
+        "json": "json",
+        "sarif": "sarif",
+        "markdown": "md",
+        "html": "html",
+        "text": "txt",
+        "csv": "csv",
+        "xml": "xml",
+        "summary": "txt",
+        "ndjson": "ndjson",
+    }
+
     def __init__(self):
         """Initialize the reporting coordinator with all format handlers."""
 
@@ -121,6 +139,8 @@ class UnifiedReportingCoordinator:
             content = self._generate_xml_report(analysis_result, options)
         elif format_type == "summary":
             content = self._generate_summary_report(analysis_result, options)
+        elif format_type == "ndjson":
+            content = self._generate_ndjson_report(analysis_result, options)
         else:
             raise ValueError(f"Format handler not implemented: {format_type}")
 
@@ -136,6 +156,56 @@ class UnifiedReportingCoordinator:
 
         return content
 
+    def write_report(
+        self,
+        analysis_result: UnifiedAnalysisResult,
+        format_type: str,
+        output_path: Union[str, Path],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """
+        Write a report straight to a file.
+
+        JSON, SARIF and NDJSON are streamed violation by violation, so peak
+        memory does not grow with the number of violations; other formats are
+        rendered in memory as in ``generate_report``.
+
+        Args:
+            analysis_result: Results from unified analysis
+            format_type: Target format ('json', 'sarif', 'ndjson', ...)
+            output_path: File path to write the report to
+            options: Additional formatting options
+
+        Returns:
+            Path of the written report
+        """
+        if format_type not in self.SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported format: {format_type}. Supported: {self.SUPPORTED_FORMATS}")
+
+        output_path = Path(output_path)
+        if format_type not in self.STREAMING_FORMATS:
+            self.generate_report(analysis_result, format_type, output_path, options)
+            return output_path
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            self.stream_report(analysis_result, format_type, f)
+
+        logger.info(f"Report streamed to {output_path}")
+        return output_path
+
+    def stream_report(self, analysis_result: UnifiedAnalysisResult, format_type: str, fp: TextIO) -> None:
+        """Serialize a JSON, SARIF or NDJSON report incrementally to an open text handle."""
+        legacy_result = self._convert_to_legacy_format(analysis_result)
+        if format_type == "json":
+            self.json_reporter.write(legacy_result, fp)
+        elif format_type == "sarif":
+            self.sarif_reporter.write(legacy_result, fp)
+        elif format_type == "ndjson":
+            self.json_reporter.write_ndjson(legacy_result, fp)
+        else:
+            raise ValueError(f"Format cannot be streamed: {format_type}. Streaming: {self.STREAMING_FORMATS}")
+
     def generate_multi_format_report(
         self,
         analysis_result: UnifiedAnalysisResult,
@@ -166,23 +236,11 @@ class UnifiedReportingCoordinator:
                 logger.warning(f"Skipping unsupported format: {format_type}")
                 continue
 
-            # Determine file extension
-            extension_map = {
-                "json": "json",
-                "sarif": "sarif",
-                "markdown": "md",
-                "html": "html",
-                "text": "txt",
-                "csv": "csv",
-                "xml": "xml",
-                "summary": "txt",
-            }
-
-            extension = extension_map.get(format_type, format_type)
+            extension = self.EXTENSION_MAP.get(format_type, format_type)
             output_file = output_dir / f"{base_filename}.{extension}"
 
             try:
-                self.generate_report(analysis_result, format_type, output_file)
+                self.write_report(analysis_result, format_type, output_file)
                 generated_files[format_type] = str(output_file)
                 logger.info(f"Generated {format_type} report: {output_file}")
             except Exception as e:
@@ -315,6 +373,12 @@ class UnifiedReportingCoordinator:
         legacy_result = self._convert_to_legacy_format(analysis_result)
         return self.sarif_reporter.generate(legacy_result)
 
+    def _generate_ndjson_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+        """Generate newline-delimited JSON (metadata, one line per violation, summary)."""
+        buffer = io.StringIO()
+        self.stream_report(analysis_result, "ndjson", buffer)
+        return buffer.getvalue()
+
     def _generate_markdown_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
         """Generate Markdown report using existing MarkdownReporter."""
         legacy_result = self._convert_to_legacy_format(analysis_result)
@@ -663,12 +727,12 @@ PRIORITY ACTIONS:
 
         class MockAnalysisResult:
             def __init__(self, unified_result):
-                self.violations = []
-
-                # Convert violations to legacy format
-                for violation in unified_result.connascence_violations:
-                    mock_violation = MockViolation(violation)
-                    self.violations.append(mock_violation)
+                # Converted lazily, one violation at a time, so streaming writers
+                # never hold a second copy of every violation
+                self.violations = _LegacyViolationView(unified_result.connascence_violations, MockViolation)
+                self.file_stats = {}
+                self.budget_status = None
+                self.baseline_comparison = None
 
                 self.project_root = unified_result.project_path
                 self.timestamp = unified_result.timestamp
@@ -717,5 +781,24 @@ PRIORITY ACTIONS:
         return MockAnalysisResult(analysis_result)
 
 
+class _LegacyViolationView(Sequence):
+    """Read-only sequence converting violation dicts on access."""
+
+    def __init__(self, violation_dicts: List[Dict[str, Any]], factory):
+        self._violation_dicts = violation_dicts
+        self._factory = factory
+
+    def __len__(self) -> int:
+        return len(self._violation_dicts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._factory(v) for v in self._violation_dicts[index]]
+        return self._factory(self._violation_dicts[index])
+
+    def __iter__(self):
+        return (self._factory(v) for v in self._violation_dicts)
+
+
 # Singleton instance for global access
 reporting_coordinator = UnifiedReportingCoordinator()
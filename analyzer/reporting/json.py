@@ -18,10 +18,58 @@ Generates stable, agent-friendly JSON reports with deterministic ordering
 and comprehensive metadata for tool integration.
 """
 
+import io
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, TextIO
 
 from analyzer.ast_engine.core_analyzer import AnalysisResult, Violation
+from analyzer.reporting.streaming import JSONStreamWriter, write_ndjson_records
+
+# Quality gate limits applied in policy_compliance
+MAX_HIGH_VIOLATIONS = 10
+MAX_TOTAL_VIOLATIONS = 100
+TOP_FILES_LIMIT = 10
+
+
+class ViolationTally:
+    """Running aggregates over violations; memory grows with files, not violations."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_weight = 0.0
+        self.by_type: Dict[str, int] = {}
+        self.by_severity: Dict[str, int] = {}
+        self.by_locality: Dict[str, int] = {}
+        self.file_stats: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, violation: Violation) -> None:
+        self.count += 1
+        self.total_weight += violation.weight
+
+        type_key = violation.type.value
+        self.by_type[type_key] = self.by_type.get(type_key, 0) + 1
+        severity_key = violation.severity.value
+        self.by_severity[severity_key] = self.by_severity.get(severity_key, 0) + 1
+        self.by_locality[violation.locality] = self.by_locality.get(violation.locality, 0) + 1
+
+        stats = self.file_stats.get(violation.file_path)
+        if stats is None:
+            stats = self.file_stats[violation.file_path] = {
+                "file_path": violation.file_path,
+                "violation_count": 0,
+                "total_weight": 0.0,
+                "severity_breakdown": {},
+            }
+        stats["violation_count"] += 1
+        stats["total_weight"] += violation.weight
+        stats["severity_breakdown"][severity_key] = stats["severity_breakdown"].get(severity_key, 0) + 1
+
+    @classmethod
+    def from_violations(cls, violations: Iterable[Violation]) -> "ViolationTally":
+        tally = cls()
+        for violation in violations:
+            tally.add(violation)
+        return tally
 
 
 class JSONReporter:
@@ -32,17 +80,72 @@ class JSONReporter:
 
     def generate(self, result: AnalysisResult) -> str:
         """Generate JSON report from analysis result."""
-        report = {
-            "schema_version": self.schema_version,
-            "metadata": self._create_metadata(result),
-            "summary": self._create_summary(result),
-            "violations": [self._serialize_violation(v) for v in result.violations],
-            "file_stats": result.file_stats,
-            "policy_compliance": self._create_policy_compliance(result),
-        }
+        buffer = io.StringIO()
+        self.write(result, buffer)
+        return buffer.getvalue()
 
-        # Ensure deterministic ordering
-        return json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False)
+    def write(self, result: AnalysisResult, fp: TextIO) -> None:
+        """
+        Stream the JSON report to a file handle.
+
+        Aggregates are computed in one pass over the violations, then each
+        violation is serialized and written as it is visited, so no report-sized
+        dict or string is ever built. Output matches ``json.dumps(report,
+        indent=2, sort_keys=True)`` byte for byte.
+
+        Args:
+            result: Analysis result to report
+            fp: Text file handle to write to
+        """
+        tally = ViolationTally.from_violations(result.violations)
+
+        # Keys in sorted order for deterministic output
+        writer = JSONStreamWriter(fp, indent=2, sort_keys=True, ensure_ascii=False)
+        writer.begin_object()
+        writer.field("file_stats", result.file_stats)
+        writer.field("metadata", self._create_metadata(result))
+        writer.field("policy_compliance", self._create_policy_compliance(result, tally))
+        writer.field("schema_version", self.schema_version)
+        writer.field("summary", self._create_summary(result, tally))
+        writer.begin_array("violations")
+        writer.items(self._serialize_violation(v) for v in result.violations)
+        writer.close()
+
+    def open_stream(self, fp: TextIO, result: AnalysisResult) -> "JSONReportStream":
+        """Start a report whose violations are added one at a time as they arrive."""
+        return JSONReportStream(self, fp, result)
+
+    def write_ndjson(self, result: AnalysisResult, fp: TextIO) -> int:
+        """
+        Write the report as newline-delimited JSON for downstream tools.
+
+        The first line is a ``metadata`` record, followed by one ``violation``
+        record per violation and a closing ``summary`` record.
+
+        Returns:
+            Number of violation records written
+        """
+        tally = ViolationTally()
+        metadata = {"record_type": "metadata", "schema_version": self.schema_version, **self._create_metadata(result)}
+        write_ndjson_records(fp, [metadata])
+
+        def violation_records():
+            for violation in result.violations:
+                tally.add(violation)
+                yield {"record_type": "violation", **self._serialize_violation(violation)}
+
+        written = write_ndjson_records(fp, violation_records())
+        write_ndjson_records(
+            fp,
+            [
+                {
+                    "record_type": "summary",
+                    **self._create_summary(result, tally),
+                    "policy_compliance": self._create_policy_compliance(result, tally),
+                }
+            ],
+        )
+        return written
 
     def _create_metadata(self, result: AnalysisResult) -> Dict[str, Any]:
         """Create report metadata."""
@@ -62,49 +165,28 @@ class JSONReporter:
             "environment": {"python_version": "3.11+", "platform": "multi-platform"},
         }
 
-    def _create_summary(self, result: AnalysisResult) -> Dict[str, Any]:
+    def _create_summary(self, result: AnalysisResult, tally: Optional[ViolationTally] = None) -> Dict[str, Any]:
         """Create summary statistics."""
-        violations = result.violations
-
-        # Count by type
-        by_type = {}
-        for violation in violations:
-            type_key = violation.type.value
-            by_type[type_key] = by_type.get(type_key, 0) + 1
-
-        # Count by severity
-        by_severity = {}
-        for violation in violations:
-            severity_key = violation.severity.value
-            by_severity[severity_key] = by_severity.get(severity_key, 0) + 1
-
-        # Count by locality
-        by_locality = {}
-        for violation in violations:
-            locality_key = violation.locality
-            by_locality[locality_key] = by_locality.get(locality_key, 0) + 1
+        if tally is None:
+            tally = ViolationTally.from_violations(result.violations)
 
-        # Calculate weights
-        total_weight = sum(v.weight for v in violations)
-        avg_weight = total_weight / len(violations) if violations else 0
-
-        # File distribution
-        files_with_violations = len({v.file_path for v in violations})
+        total_weight = tally.total_weight
+        avg_weight = total_weight / tally.count if tally.count else 0
 
         return {
-            "total_violations": len(violations),
+            "total_violations": tally.count,
             "total_weight": round(total_weight, 2),
             "average_weight": round(avg_weight, 2),
-            "files_with_violations": files_with_violations,
-            "violations_by_type": dict(sorted(by_type.items())),
-            "violations_by_severity": dict(sorted(by_severity.items())),
-            "violations_by_locality": dict(sorted(by_locality.items())),
-            "top_files": self._get_top_problematic_files(violations)[:10],
+            "files_with_violations": len(tally.file_stats),
+            "violations_by_type": dict(sorted(tally.by_type.items())),
+            "violations_by_severity": dict(sorted(tally.by_severity.items())),
+            "violations_by_locality": dict(sorted(tally.by_locality.items())),
+            "top_files": self._get_top_problematic_files(tally)[:TOP_FILES_LIMIT],
             "quality_metrics": {
                 "connascence_index": round(total_weight, 2),
-                "violations_per_file": round(len(violations) / max(1, result.total_files_analyzed), 2),
-                "critical_violations": by_severity.get("critical", 0),
-                "high_violations": by_severity.get("high", 0),
+                "violations_per_file": round(tally.count / max(1, result.total_files_analyzed), 2),
+                "critical_violations": tally.by_severity.get("critical", 0),
+                "high_violations": tally.by_severity.get("high", 0),
             },
         }
 
@@ -134,29 +216,25 @@ class JSONReporter:
             "context": violation.context or {},
         }
 
-    def _create_policy_compliance(self, result: AnalysisResult) -> Dict[str, Any]:
+    def _create_policy_compliance(
+        self, result: AnalysisResult, tally: Optional[ViolationTally] = None
+    ) -> Dict[str, Any]:
         """Create policy compliance information."""
-        compliance = {
+        if tally is None:
+            tally = ViolationTally.from_violations(result.violations)
+
+        return {
             "policy_preset": result.policy_preset,
             "budget_status": result.budget_status,
             "baseline_comparison": result.baseline_comparison,
-            "quality_gates": {},
-        }
-
-        # Calculate quality gate status
-        violations = result.violations
-        critical_violations = sum(1 for v in violations if v.severity.value == "critical")
-        high_violations = sum(1 for v in violations if v.severity.value == "high")
-
-        # Basic quality gates
-        compliance["quality_gates"] = {
-            "no_critical_violations": critical_violations == 0,
-            "max_high_violations": high_violations <= 10,  # Configurable
-            "total_violations_acceptable": len(violations) <= 100,  # Configurable
+            # Basic quality gates
+            "quality_gates": {
+                "no_critical_violations": tally.by_severity.get("critical", 0) == 0,
+                "max_high_violations": tally.by_severity.get("high", 0) <= MAX_HIGH_VIOLATIONS,
+                "total_violations_acceptable": tally.count <= MAX_TOTAL_VIOLATIONS,
+            },
         }
 
-        return compliance
-
     def export_results(self, result, output_file=None):
         """Export results to JSON format.
 
@@ -167,50 +245,71 @@ class JSONReporter:
         Returns:
             JSON string if output_file is None, otherwise writes to file.
         """
-        # Handle both dict and AnalysisResult objects
-        if isinstance(result, dict):
-            # Convert dict result to JSON-friendly format
-            json_output = json.dumps(result, indent=2, sort_keys=True, ensure_ascii=False)
-        else:
-            # Use the generate method for AnalysisResult objects
-            json_output = self.generate(result)
-
         if output_file:
-            # Write to file
+            # Stream straight to the file instead of building the report string
             with open(output_file, "w", encoding="utf-8") as f:
-                f.write(json_output)
-        else:
-            # Return JSON string
-            return json_output
+                if isinstance(result, dict):
+                    json.dump(result, f, indent=2, sort_keys=True, ensure_ascii=False)
+                else:
+                    self.write(result, f)
+            return None
+
+        # Handle both dict and AnalysisResult objects
+        if isinstance(result, dict):
+            return json.dumps(result, indent=2, sort_keys=True, ensure_ascii=False)
+        return self.generate(result)
 
-    def _get_top_problematic_files(self, violations: List[Violation]) -> List[Dict[str, Any]]:
+    def _get_top_problematic_files(self, tally: ViolationTally) -> List[Dict[str, Any]]:
         """Get files with the most violations, sorted by weight."""
-        file_stats = {}
+        # Sort by total weight, then by violation count
+        sorted_files = sorted(
+            tally.file_stats.values(), key=lambda x: (x["total_weight"], x["violation_count"]), reverse=True
+        )
 
-        for violation in violations:
-            file_path = violation.file_path
-            if file_path not in file_stats:
-                file_stats[file_path] = {
-                    "file_path": file_path,
-                    "violation_count": 0,
-                    "total_weight": 0.0,
-                    "severity_breakdown": {},
-                }
+        # Round weights for cleaner output (copies, so the tally stays exact)
+        return [{**file_stat, "total_weight": round(file_stat["total_weight"], 2)} for file_stat in sorted_files]
 
-            stats = file_stats[file_path]
-            stats["violation_count"] += 1
-            stats["total_weight"] += violation.weight
 
-            severity = violation.severity.value
-            stats["severity_breakdown"][severity] = stats["severity_breakdown"].get(severity, 0) + 1
+class JSONReportStream:
+    """
+    JSON report written while violations are still arriving.
 
-        # Sort by total weight, then by violation count
-        sorted_files = sorted(
-            file_stats.values(), key=lambda x: (x["total_weight"], x["violation_count"]), reverse=True
-        )
+    Violations are serialized as soon as they are added; the summary, file
+    stats and policy compliance sections are written from running aggregates
+    when the stream is closed, after the violations array.
+    """
+
+    def __init__(self, reporter: JSONReporter, fp: TextIO, result: AnalysisResult):
+        self._reporter = reporter
+        self._result = result
+        self._tally = ViolationTally()
+        self._writer = JSONStreamWriter(fp, indent=2, sort_keys=True, ensure_ascii=False)
+        self._writer.begin_object()
+        self._writer.field("schema_version", reporter.schema_version)
+        self._writer.field("metadata", reporter._create_metadata(result))
+        self._writer.begin_array("violations")
 
-        # Round weights for cleaner output
-        for file_stat in sorted_files:
-            file_stat["total_weight"] = round(file_stat["total_weight"], 2)
+    def add(self, violation: Violation) -> None:
+        self._tally.add(violation)
+        self._writer.item(self._reporter._serialize_violation(violation))
 
-        return sorted_files
+    def add_many(self, violations: Iterable[Violation]) -> None:
+        for violation in violations:
+            self.add(violation)
+
+    def close(self) -> None:
+        """Finish the violations array and write the aggregate sections."""
+        if self._writer is None:
+            return
+        writer, self._writer = self._writer, None
+        writer.end_array()
+        writer.field("file_stats", self._result.file_stats)
+        writer.field("summary", self._reporter._create_summary(self._result, self._tally))
+        writer.field("policy_compliance", self._reporter._create_policy_compliance(self._result, self._tally))
+        writer.close()
+
+    def __enter__(self) -> "JSONReportStream":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -21,14 +21,19 @@ SARIF 2.1.0 Specification: https://docs.oasis-open.org/sarif/sarif/v2.1.0/
 """
 
 from datetime import datetime
+import io
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, TextIO
 import uuid
 
 from analyzer.ast_engine.core_analyzer import AnalysisResult, Violation
+from analyzer.reporting.streaming import JSONStreamWriter
 from analyzer.thresholds import ConnascenceType
 
+SARIF_SCHEMA_URI = "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+
 
 class SARIFReporter:
     """SARIF 2.1.0 report generator."""
@@ -38,19 +43,55 @@ class SARIFReporter:
         self.tool_version = "1.0.0"
         self.tool_uri = "https://github.com/connascence/connascence-analyzer"
         self.organization = "Connascence Analytics"
+        self._rules: Optional[List[Dict[str, Any]]] = None
+        self._rule_indexes: Dict[str, int] = {}
+
+    @property
+    def rules(self) -> List[Dict[str, Any]]:
+        """Rule definitions, built once per reporter."""
+        if self._rules is None:
+            self._build_rule_table()
+        return self._rules
+
+    def _build_rule_table(self) -> None:
+        # Rule indexes are precomputed so each result is an O(1) lookup
+        self._rules = self._create_rules()
+        self._rule_indexes = {rule["id"]: index for index, rule in enumerate(self._rules)}
 
     def generate(self, result: AnalysisResult) -> str:
         """Generate SARIF report from analysis result."""
-        sarif_report = {
-            "$schema": "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json",
-            "version": "2.1.0",
-            "runs": [self._create_run(result)],
-        }
+        buffer = io.StringIO()
+        self.write(result, buffer)
+        return buffer.getvalue()
+
+    def write(self, result: AnalysisResult, fp: TextIO) -> None:
+        """
+        Stream the SARIF report to a file handle.
+
+        Results are serialized one violation at a time; the output matches
+        ``json.dumps(report, indent=2, ensure_ascii=False)`` byte for byte.
+
+        Args:
+            result: Analysis result to report
+            fp: Text file handle to write to
+        """
+        with self.open_stream(fp, result) as stream:
+            stream.add_many(result.violations)
 
-        return json.dumps(sarif_report, indent=2, ensure_ascii=False)
+    def open_stream(self, fp: TextIO, result: AnalysisResult) -> "SARIFReportStream":
+        """Start a SARIF report whose results are added as violations arrive."""
+        return SARIFReportStream(self, fp, self._create_run_header(result), self._create_run_properties(result))
 
     def _create_run(self, result: AnalysisResult) -> Dict[str, Any]:
         """Create the main SARIF run object."""
+        return {
+            **self._create_run_header(result),
+            "results": [self._create_result(violation) for violation in result.violations],
+            "properties": self._create_run_properties(result),
+        }
+
+    def _create_run_header(self, result: AnalysisResult) -> Dict[str, Any]:
+        """Run members that precede the results array."""
         return {
             "tool": self._create_tool(),
             "automationDetails": {
@@ -73,14 +114,16 @@ class SARIFReporter:
                     "workingDirectory": {"uri": f"file://{result.project_root}"},
                 }
             ],
-            "results": [self._create_result(violation) for violation in result.violations],
-            "properties": {
-                "analysisType": "connascence",
-                "totalFilesAnalyzed": result.total_files_analyzed,
-                "analysisDurationMs": result.analysis_duration_ms,
-                "summaryMetrics": result.summary_metrics,
-                "policyPreset": result.policy_preset,
-            },
+        }
+
+    def _create_run_properties(self, result: AnalysisResult) -> Dict[str, Any]:
+        """Run properties written after the results array."""
+        return {
+            "analysisType": "connascence",
+            "totalFilesAnalyzed": result.total_files_analyzed,
+            "analysisDurationMs": result.analysis_duration_ms,
+            "summaryMetrics": result.summary_metrics,
+            "policyPreset": result.policy_preset,
         }
 
     def _create_tool(self) -> Dict[str, Any]:
@@ -100,7 +143,7 @@ class SARIFReporter:
                         "and dynamic forms (Execution, Timing, Value, Identity) of connascence."
                     )
                 },
-                "rules": self._create_rules(),
+                "rules": self.rules,
                 "notifications": [
                     {
                         "id": "CFG001",
@@ -283,6 +326,9 @@ class SARIFReporter:
                 "context": violation.context,
             },
         }
+        if result["ruleIndex"] is None:
+            # Types without a rule definition are reported by ruleId only
+            del result["ruleIndex"]
 
         # Add code snippet if available
         if violation.code_snippet:
@@ -301,21 +347,11 @@ class SARIFReporter:
         mapping = {"low": "note", "medium": "warning", "high": "error", "critical": "error"}
         return mapping.get(severity, "warning")
 
-    def _get_rule_index(self, connascence_type: ConnascenceType) -> int:
-        """Get the index of a rule in the rules array."""
-        # This would map to actual rule positions
-        type_order = [
-            ConnascenceType.NAME,
-            ConnascenceType.TYPE,
-            ConnascenceType.MEANING,
-            ConnascenceType.POSITION,
-            ConnascenceType.ALGORITHM,
-            ConnascenceType.EXECUTION,
-            ConnascenceType.TIMING,
-            ConnascenceType.VALUE,
-            ConnascenceType.IDENTITY,
-        ]
-        return type_order.index(connascence_type)
+    def _get_rule_index(self, connascence_type: ConnascenceType) -> Optional[int]:
+        """Get the index of a rule in the rules array (None when no rule exists)."""
+        if self._rules is None:
+            self._build_rule_table()
+        return self._rule_indexes.get(f"CON_{connascence_type.value}")
 
     def _normalize_path(self, file_path: str) -> str:
         """Normalize file path for SARIF."""
@@ -355,55 +391,49 @@ class SARIFReporter:
         Returns:
             SARIF JSON string if output_file is None, otherwise writes to file.
         """
-        # Handle both dict and AnalysisResult objects
-        if isinstance(result, dict):
-            # Convert dict result to SARIF-compatible format
-            sarif_output = self._convert_dict_to_sarif(result)
-        else:
-            # Use the generate method for AnalysisResult objects
-            sarif_output = self.generate(result)
-
         if output_file:
-            # Write to file
+            # Stream straight to the file instead of building the report string
             with open(output_file, "w", encoding="utf-8") as f:
-                f.write(sarif_output)
-        else:
-            # Return SARIF string
-            return sarif_output
+                if isinstance(result, dict):
+                    self._write_dict_sarif(result, f)
+                else:
+                    self.write(result, f)
+            return None
+
+        # Handle both dict and AnalysisResult objects
+        if isinstance(result, dict):
+            return self._convert_dict_to_sarif(result)
+        return self.generate(result)
 
     def _convert_dict_to_sarif(self, result_dict):
         """Convert dict-based analysis result to SARIF format."""
-        # Create a minimal SARIF report from dict results
-        violations = result_dict.get("violations", [])
+        buffer = io.StringIO()
+        self._write_dict_sarif(result_dict, buffer)
+        return buffer.getvalue()
 
-        sarif_report = {
-            "$schema": "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json",
-            "version": "2.1.0",
-            "runs": [
+    def _write_dict_sarif(self, result_dict: Dict[str, Any], fp: TextIO) -> None:
+        """Stream a minimal SARIF report for dict-based analysis results."""
+        header = {
+            "tool": self._create_tool(),
+            "automationDetails": {
+                "id": f"connascence/{uuid.uuid4()}",
+                "description": {"text": "Connascence analysis for Python codebases"},
+            },
+            "invocations": [
                 {
-                    "tool": self._create_tool(),
-                    "automationDetails": {
-                        "id": f"connascence/{uuid.uuid4()}",
-                        "description": {"text": "Connascence analysis for Python codebases"},
-                    },
-                    "invocations": [
-                        {
-                            "executionSuccessful": result_dict.get("success", True),
-                            "startTimeUtc": f"{datetime.now().isoformat()}Z",
-                            "workingDirectory": {"uri": f"file://{result_dict.get('path', '.')}"},
-                        }
-                    ],
-                    "results": [self._create_result_from_dict(violation) for violation in violations],
-                    "properties": {
-                        "analysisType": "connascence",
-                        "policyPreset": result_dict.get("policy", "default"),
-                        "summaryMetrics": result_dict.get("summary", {}),
-                    },
+                    "executionSuccessful": result_dict.get("success", True),
+                    "startTimeUtc": f"{datetime.now().isoformat()}Z",
+                    "workingDirectory": {"uri": f"file://{result_dict.get('path', '.')}"},
                 }
             ],
         }
-
-        return json.dumps(sarif_report, indent=2, ensure_ascii=False)
+        properties = {
+            "analysisType": "connascence",
+            "policyPreset": result_dict.get("policy", "default"),
+            "summaryMetrics": result_dict.get("summary", {}),
+        }
+        with SARIFReportStream(self, fp, header, properties) as stream:
+            stream.add_results(self._create_result_from_dict(v) for v in result_dict.get("violations", []))
 
     def _create_result_from_dict(self, violation_dict):
         """Create SARIF result from violation dictionary."""
@@ -441,3 +471,59 @@ class SARIFReporter:
         }
 
         return result
+
+
+class SARIFReportStream:
+    """
+    SARIF report written while violations are still arriving.
+
+    The run header (tool, rules, invocations) is written on open, each result
+    as soon as it is added, and the run properties on close.
+    """
+
+    def __init__(
+        self, reporter: SARIFReporter, fp: TextIO, run_header: Dict[str, Any], run_properties: Dict[str, Any]
+    ):
+        self._reporter = reporter
+        self._properties = run_properties
+        self.results_written = 0
+        self._writer: Optional[JSONStreamWriter] = JSONStreamWriter(fp, indent=2, ensure_ascii=False)
+        self._writer.begin_object()
+        self._writer.field("$schema", SARIF_SCHEMA_URI)
+        self._writer.field("version", SARIF_VERSION)
+        self._writer.begin_array("runs")
+        self._writer.begin_object()
+        for key, value in run_header.items():
+            self._writer.field(key, value)
+        self._writer.begin_array("results")
+
+    def add(self, violation: Violation) -> None:
+        self.add_result(self._reporter._create_result(violation))
+
+    def add_many(self, violations: Iterable[Violation]) -> None:
+        for violation in violations:
+            self.add(violation)
+
+    def add_result(self, result: Dict[str, Any]) -> None:
+        """Append an already-built SARIF result object."""
+        self._writer.item(result)
+        self.results_written += 1
+
+    def add_results(self, results: Iterable[Dict[str, Any]]) -> None:
+        for result in results:
+            self.add_result(result)
+
+    def close(self) -> None:
+        """Finish the results array and write the run properties."""
+        if self._writer is None:
+            return
+        writer, self._writer = self._writer, None
+        writer.end_array()
+        writer.field("properties", self._properties)
+        writer.close()
+
+    def __enter__(self) -> "SARIFReportStream":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
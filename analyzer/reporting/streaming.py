@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+"""
+Incremental JSON Writers for Large Reports
+
+Reports with millions of violations used to be built as one nested dict and
+serialized with a single ``json.dumps``, holding the full object graph and the
+full string at once. ``JSONStreamWriter`` instead writes containers piece by
+piece to a file handle, serializing each array element as it arrives, so peak
+memory is bounded by the largest single element.
+
+The output is byte-identical to ``json.dumps`` with the same ``indent``,
+``sort_keys`` and ``ensure_ascii`` settings, provided callers emit object keys
+in the order ``json.dumps`` would (sorted when ``sort_keys`` is set).
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+
+class JSONStreamWriter:
+    """Write a single JSON document incrementally to a text file handle."""
+
+    def __init__(
+        self,
+        fp: TextIO,
+        indent: Optional[int] = 2,
+        sort_keys: bool = False,
+        ensure_ascii: bool = True,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            fp: Text file handle to write to
+            indent: Indentation width, or None for single-line output
+            sort_keys: Sort keys of values passed to ``field``/``item``
+            ensure_ascii: Escape non-ASCII characters
+        """
+        self._fp = fp
+        self._indent = indent
+        self._ensure_ascii = ensure_ascii
+        # One encoder reused for every value; json.dumps would build a new one per call
+        self._encoder = json.JSONEncoder(indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+        # One entry per open container: number of members written so far
+        self._counts: List[int] = []
+        self._closers: List[str] = []
+
+    # ------------------------------------------------------------------
+    # Containers
+    # ------------------------------------------------------------------
+    def begin_object(self, key: Optional[str] = None) -> None:
+        """Open an object, as a member of the enclosing object when ``key`` is given."""
+        self._open("{", "}", key)
+
+    def end_object(self) -> None:
+        self._close()
+
+    def begin_array(self, key: Optional[str] = None) -> None:
+        """Open an array, as a member of the enclosing object when ``key`` is given."""
+        self._open("[", "]", key)
+
+    def end_array(self) -> None:
+        self._close()
+
+    # ------------------------------------------------------------------
+    # Members
+    # ------------------------------------------------------------------
+    def field(self, key: str, value: Any) -> None:
+        """Write ``"key": value`` into the open object."""
+        self._start_member(key)
+        self._write_value(value)
+
+    def item(self, value: Any) -> None:
+        """Write one element into the open array."""
+        self._start_member(None)
+        self._write_value(value)
+
+    def items(self, values: Iterable[Any]) -> int:
+        """Write every element of ``values`` into the open array; returns the count."""
+        count = 0
+        for value in values:
+            self.item(value)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        """Close every container still open."""
+        while self._counts:
+            self._close()
+
+    # ------------------------------------------------------------------
+    # Layout helpers
+    # ------------------------------------------------------------------
+    def _newline(self, depth: int) -> str:
+        if self._indent is None:
+            return ""
+        return "\n" + " " * (self._indent * depth)
+
+    def _start_member(self, key: Optional[str]) -> None:
+        if self._counts:
+            if self._counts[-1]:
+                self._fp.write("," if self._indent is not None else ", ")
+            self._counts[-1] += 1
+            self._fp.write(self._newline(len(self._counts)))
+        if key is not None:
+            self._fp.write(json.dumps(key, ensure_ascii=self._ensure_ascii) + ": ")
+
+    def _open(self, opener: str, closer: str, key: Optional[str]) -> None:
+        if self._counts or key is not None:
+            self._start_member(key)
+        self._fp.write(opener)
+        self._counts.append(0)
+        self._closers.append(closer)
+
+    def _close(self) -> None:
+        count = self._counts.pop()
+        closer = self._closers.pop()
+        if count:
+            self._fp.write(self._newline(len(self._counts)))
+        self._fp.write(closer)
+
+    def _write_value(self, value: Any) -> None:
+        encoded = self._encoder.encode(value)
+        depth = len(self._counts)
+        if self._indent is not None and depth:
+            # JSON strings never contain raw newlines, so this only re-indents structure
+            encoded = encoded.replace("\n", self._newline(depth))
+        self._fp.write(encoded)
+
+
+def write_ndjson_records(fp: TextIO, records: Iterable[Dict[str, Any]], ensure_ascii: bool = False) -> int:
+    """
+    Write newline-delimited JSON, one compact record per line.
+
+    Args:
+        fp: Text file handle to write to
+        records: Records to serialize, consumed lazily
+        ensure_ascii: Escape non-ASCII characters
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    for record in records:
+        fp.write(json.dumps(record, ensure_ascii=ensure_ascii, separators=(",", ":")))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+__all__ = ["JSONStreamWriter", "write_ndjson_records"]
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+"""
+Standard error format shared by the analyzer, CLI and MCP server.
+
+Kept free of analyzer dependencies so that front ends can report errors
+without importing the unified analyzer.
+"""
+
+from dataclasses import asdict, dataclass
+import logging
+from typing import Any, Dict, List, Optional
+
+from fixes.phase0.production_safe_assertions import ProductionAssert
+
+try:
+    from .constants import ERROR_CODE_MAPPING, ERROR_SEVERITY
+except ImportError:
+    from constants import ERROR_CODE_MAPPING, ERROR_SEVERITY
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StandardError:
+    """Standard error response format across all integrations."""
+
+    code: int
+    message: str
+    severity: str
+    timestamp: str
+    integration: str
+    error_id: Optional[str] = None
+    context: Optional[Dict[str, Any]] = None
+    correlation_id: Optional[str] = None
+    file_path: Optional[str] = None
+    line_number: Optional[int] = None
+    suggestions: Optional[List[str]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
+
+
+class ErrorHandler:
+    """Centralized error handling for all integrations."""
+
+    def __init__(self, integration: str = "analyzer"):
+        self.integration = integration
+        self.correlation_id = self._generate_correlation_id()
+
+    def _generate_correlation_id(self) -> str:
+        """Generate unique correlation ID for error tracking."""
+        import uuid
+
+        return str(uuid.uuid4())[:8]
+
+    def create_error(
+        self,
+        error_type: str,
+        message: str,
+        severity: str = ERROR_SEVERITY["MEDIUM"],
+        context: Optional[Dict[str, Any]] = None,
+        file_path: Optional[str] = None,
+        line_number: Optional[int] = None,
+        suggestions: Optional[List[str]] = None,
+    ) -> StandardError:
+        """Create standardized error response."""
+        from datetime import datetime
+
+        error_code = ERROR_CODE_MAPPING.get(error_type, ERROR_CODE_MAPPING["INTERNAL_ERROR"])
+
+        return StandardError(
+            code=error_code,
+            message=message,
+            severity=severity,
+            timestamp=datetime.now().isoformat(),
+            integration=self.integration,
+            error_id=error_type,
+            context=context or {},
+            correlation_id=self.correlation_id,
+            file_path=file_path,
+            line_number=line_number,
+            suggestions=suggestions,
+        )
+
+    def handle_exception(
+        self, exception: Exception, context: Optional[Dict[str, Any]] = None, file_path: Optional[str] = None
+    ) -> StandardError:
+        """Convert exception to standardized error."""
+        # Map common exceptions to error types
+        exception_mapping = {
+            FileNotFoundError: "FILE_NOT_FOUND",
+            PermissionError: "PERMISSION_DENIED",
+            SyntaxError: "SYNTAX_ERROR",
+            TimeoutError: "TIMEOUT_ERROR",
+            MemoryError: "MEMORY_ERROR",
+            ValueError: "ANALYSIS_FAILED",
+            ImportError: "DEPENDENCY_MISSING",
+        }
+
+        error_type = exception_mapping.get(type(exception), "INTERNAL_ERROR")
+        severity = (
+            ERROR_SEVERITY["HIGH"]
+            if error_type in ["FILE_NOT_FOUND", "PERMISSION_DENIED"]
+            else ERROR_SEVERITY["MEDIUM"]
+        )
+
+        return self.create_error(
+            error_type=error_type, message=str(exception), severity=severity, context=context, file_path=file_path
+        )
+
+    def log_error(self, error: StandardError):
+        """Log error with appropriate level."""
+
+        ProductionAssert.not_none(error, "error")
+
+        log_level_mapping = {
+            ERROR_SEVERITY["CRITICAL"]: logger.critical,
+            ERROR_SEVERITY["HIGH"]: logger.error,
+            ERROR_SEVERITY["MEDIUM"]: logger.warning,
+            ERROR_SEVERITY["LOW"]: logger.info,
+            ERROR_SEVERITY["INFO"]: logger.info,
+        }
+
+        log_func = log_level_mapping.get(error.severity, logger.error)
+        log_func(f"[{error.integration}:{error.correlation_id}] {error.message} (Code: {error.code})")
+
+        if error.file_path:
+            log_func(f"  File: {error.file_path}:{error.line_number or 0}")
+        if error.suggestions:
+            log_func(f"  Suggestions: {', '.join(error.suggestions)}")
@@ -33,6 +33,14 @@ except ImportError:
     get_global_cache = None
     CACHE_INTEGRATION_AVAILABLE = False
 
+try:
+    from ..optimization.digest_service import get_digest_service
+
+    DIGEST_SERVICE_AVAILABLE = True
+except ImportError:
+    get_digest_service = None
+    DIGEST_SERVICE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -131,6 +139,8 @@ class IncrementalCache:
         # Dependency tracking
         self._dependency_graph: Dict[str, DependencyNode] = {}
         self._file_hashes: Dict[str, str] = {}
+        # Raw-bytes digest of the file each text hash was computed from
+        self._raw_digests: Dict[str, str] = {}
         self._hash_to_files: Dict[str, Set[str]] = defaultdict(set)
 
         # Delta tracking
@@ -171,25 +181,44 @@ class IncrementalCache:
         file_path_str = str(file_path)
         current_time = time.time()
 
-        with self._lock:
-            # Calculate hashes
-            old_hash = self._file_hashes.get(file_path_str)
-            new_hash = None
-            new_size = 0
-
-            if new_content is not None:
-                new_hash = hashlib.sha256(new_content.encode("utf-8")).hexdigest()[:16]
-                new_size = len(new_content)
-            elif Path(file_path).exists():
-                # Read file if content not provided
+        # Hash outside the lock; only the bookkeeping below is serialised
+        new_hash = None
+        new_size = 0
+        raw_digest = None
+
+        if new_content is not None:
+            new_hash = hashlib.sha256(new_content.encode("utf-8")).hexdigest()[:16]
+            new_size = len(new_content)
+        elif Path(file_path).exists():
+            if old_content is None and DIGEST_SERVICE_AVAILABLE:
+                # The shared stat-keyed digest cache tells whether the bytes
+                # changed since the text hash was taken without reading the file.
                 try:
-                    with open(file_path, encoding="utf-8") as f:
-                        new_content = f.read()
-                        new_hash = hashlib.sha256(new_content.encode("utf-8")).hexdigest()[:16]
-                        new_size = len(new_content)
+                    raw_digest = get_digest_service().digest_file(file_path)
                 except Exception as e:
-                    logger.warning(f"Failed to read {file_path}: {e}")
-                    new_hash = "error"
+                    logger.debug(f"Digest cache unavailable for {file_path}: {e}")
+                with self._lock:
+                    if raw_digest is not None and self._raw_digests.get(file_path_str) == raw_digest:
+                        return None
+
+            # Read file if content not provided; hashes and sizes always use
+            # the decoded text so every path agrees on the same representation.
+            try:
+                with open(file_path, encoding="utf-8") as f:
+                    new_content = f.read()
+                    new_hash = hashlib.sha256(new_content.encode("utf-8")).hexdigest()[:16]
+                    new_size = len(new_content)
+            except Exception as e:
+                logger.warning(f"Failed to read {file_path}: {e}")
+                new_hash = "error"
+                raw_digest = None
+
+        with self._lock:
+            old_hash = self._file_hashes.get(file_path_str)
+            if raw_digest is not None:
+                self._raw_digests[file_path_str] = raw_digest
+            else:
+                self._raw_digests.pop(file_path_str, None)
 
             # Determine change type
             if old_hash is None and new_hash:
@@ -495,6 +524,7 @@ class IncrementalCache:
 
             # Remove file hash tracking
             old_hash = self._file_hashes.pop(file_path_str, None)
+            self._raw_digests.pop(file_path_str, None)
             if old_hash:
                 self._hash_to_files[old_hash].discard(file_path_str)
 
@@ -572,3 +602,4 @@ def clear_incremental_cache() -> None:
             _global_incremental_cache._partial_results.clear()
             _global_incremental_cache._dependency_graph.clear()
             _global_incremental_cache._file_hashes.clear()
+            _global_incremental_cache._raw_digests.clear()
@@ -20,11 +20,20 @@ from collections import defaultdict, deque
 from dataclasses import dataclass, field
 import hashlib
 import logging
+import math
 from pathlib import Path
 import threading
 import time
 from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set, Union
 
+from ..optimization.memory_budget import (
+    SHED_PRIORITY_RESULTS,
+    MemoryBudget,
+    cache_name,
+    estimate_file_cost_mb,
+    get_global_memory_budget,
+)
+
 # File watching capabilities
 try:
     from watchdog.events import FileSystemEvent, FileSystemEventHandler
@@ -65,6 +74,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Seconds between admission checks while the memory budget is exhausted
+ADMISSION_POLL_SECONDS = 0.05
+
 
 @dataclass
 class FileChange:
@@ -262,6 +274,7 @@ class StreamProcessor:
         max_queue_size: int = 1000,
         max_workers: int = 4,
         cache_size: int = 10000,
+        memory_budget: Optional[MemoryBudget] = None,
     ):
         """
         Initialize stream processor.
@@ -271,6 +284,7 @@ class StreamProcessor:
             max_queue_size: Maximum analysis request queue size (NASA Rule 7)
             max_workers: Maximum concurrent worker threads
             cache_size: Maximum cache entries to maintain
+            memory_budget: Budget requests are admitted against (default: global budget)
         """
         assert 10 <= max_queue_size <= 50000, "max_queue_size must be 10-50000"
         assert 1 <= max_workers <= 16, "max_workers must be 1-16"
@@ -295,6 +309,13 @@ class StreamProcessor:
         self._cache_access_times: Dict[str, float] = {}
         self.cache_size = cache_size
 
+        # Memory backpressure
+        self.memory_budget = memory_budget or get_global_memory_budget()
+        self.memory_budget.register_cache(
+            cache_name("stream_results", self), self.shed_result_cache, SHED_PRIORITY_RESULTS
+        )
+        self._active_requests = 0
+
         # Dependency tracking
         self._file_dependencies: Dict[str, Set[str]] = defaultdict(set)
         self._reverse_dependencies: Dict[str, Set[str]] = defaultdict(set)
@@ -312,6 +333,7 @@ class StreamProcessor:
             "processing_time_ms": 0,
             "queue_overflows": 0,
             "dependency_invalidations": 0,
+            "memory_waits": 0,
         }
 
         # Result callbacks
@@ -442,7 +464,13 @@ class StreamProcessor:
                 request = await asyncio.wait_for(self._processing_queue.get(), timeout=1.0)
 
                 async with self._worker_semaphore:
-                    await self._process_request(request)
+                    cost = await self._admit(request)
+                    self._active_requests += 1
+                    try:
+                        await self._process_request(request)
+                    finally:
+                        self._active_requests -= 1
+                        self.memory_budget.release(cost)
 
             except asyncio.TimeoutError:
                 continue  # Normal timeout, check if still running
@@ -452,6 +480,20 @@ class StreamProcessor:
 
         logger.debug(f"Worker stopped: {asyncio.current_task().get_name()}")
 
+    async def _admit(self, request: AnalysisRequest) -> float:
+        """Wait until the memory budget admits the request; returns the reserved cost."""
+        cost = sum(estimate_file_cost_mb(change.size_bytes) for change in request.file_changes)
+        waited = False
+        while True:
+            # Fewer requests run concurrently while the budget is tight
+            allowed = self.memory_budget.parallelism(self.max_workers)
+            if self._active_requests < allowed and self.memory_budget.try_acquire(cost):
+                return cost
+            if not waited:
+                waited = True
+                self._stats["memory_waits"] += 1
+            await asyncio.sleep(ADMISSION_POLL_SECONDS)
+
     async def _process_request(self, request: AnalysisRequest) -> None:
         """
         Process individual analysis request.
@@ -676,6 +718,15 @@ class StreamProcessor:
             self._result_cache.pop(cache_key, None)
             self._cache_access_times.pop(cache_key, None)
 
+    def shed_result_cache(self, fraction: float) -> int:
+        """Drop the least recently used ``fraction`` of cached results; returns the count dropped."""
+        sorted_entries = sorted(self._cache_access_times.copy().items(), key=lambda x: x[1])
+        evict_count = math.ceil(len(sorted_entries) * fraction)
+        for cache_key, _ in sorted_entries[:evict_count]:
+            self._result_cache.pop(cache_key, None)
+            self._cache_access_times.pop(cache_key, None)
+        return evict_count
+
     async def _emit_results(self, results: List[AnalysisResult]) -> None:
         """Emit analysis results to callbacks and queues."""
         for result in results:
@@ -737,6 +788,7 @@ class StreamProcessor:
             "results_pending": self._results_queue.qsize(),
             "queue_overflows": self._stats["queue_overflows"],
             "dependency_invalidations": self._stats["dependency_invalidations"],
+            "memory_waits": self._stats["memory_waits"],
         }
 
     async def __aenter__(self):
@@ -10,18 +10,44 @@ Theater Types:
 - Metrics Inflation: Hardcoded perfect scores, impossible metrics
 - Documentation Theater: TODO placeholders instead of real docs
 - Quality Facade: Comments claiming fixes without actual implementation
+
+Each file is parsed once and walked once; the text patterns share one keyword
+scan, and match offsets are mapped to line numbers through a newline-offset
+index. ``analyze_directory`` fans files out across processes.
 """
 
 import ast
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 import os
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from analyzer.optimization.digest_service import iter_tree_files
 
 logger = logging.getLogger(__name__)
 
+# Below this many files analyze_directory stays in-process
+THEATER_PARALLEL_THRESHOLD = 16
+
+# One scan finds every place a text pattern can start; the anchored pattern
+# for that keyword then confirms the match
+# (zero-width, so keywords that overlap, like "successcore", are all seen)
+TEXT_KEYWORDS = re.compile(r"(?=(?P<except>except)|(?i:coverage|score|success|quality))")
+BARE_EXCEPT = re.compile(r"except[^\S\n]*:")
+EXCEPT_PASS = re.compile(r"except[^:]*:\s*\n\s*pass")
+# Checked in this order, as separate patterns, so overlapping matches are kept
+METRIC_PATTERNS = (
+    re.compile(r"coverage.*=.*100", re.IGNORECASE),
+    re.compile(r"score.*=.*1\.0", re.IGNORECASE),
+    re.compile(r"success.*=.*True", re.IGNORECASE),
+    re.compile(r'quality.*=.*"excellent"', re.IGNORECASE),
+)
+
 
 class TheaterType(Enum):
     TEST_GAMING = "test_gaming"
@@ -50,6 +76,27 @@ class TheaterPattern:
     confidence: float
 
 
+@dataclass
+class _FunctionFacts:
+    """What one function's subtree contains, gathered during the shared walk."""
+
+    node: ast.FunctionDef
+    has_raise: bool = False
+    returns_value: bool = False
+    has_assert: bool = False
+    true_asserts: List[ast.Assert] = field(default_factory=list)
+
+
+class LineIndex:
+    """Maps character offsets to 1-based line numbers by bisecting newline offsets."""
+
+    def __init__(self, content: str):
+        self._newlines = [match.start() for match in re.finditer("\n", content)]
+
+    def line_of(self, offset: int) -> int:
+        return bisect_left(self._newlines, offset) + 1
+
+
 @dataclass
 class RealityValidationResult:
     is_valid: bool
@@ -64,107 +111,18 @@ class TheaterDetector:
         self.patterns = []
 
     def detect_test_gaming(self, file_path: str, content: str) -> List[TheaterPattern]:
-        patterns = []
-
         try:
             tree = ast.parse(content)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
-                    if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
-                        patterns.append(
-                            TheaterPattern(
-                                pattern_type=TheaterType.TEST_GAMING,
-                                severity=SeverityLevel.HIGH,
-                                file_path=file_path,
-                                line_number=node.lineno,
-                                description="Empty test function - no actual testing",
-                                evidence={"function_name": node.name, "body_length": len(node.body)},
-                                recommendation="Implement actual test logic or remove empty test",
-                                confidence=0.95,
-                            )
-                        )
-
-                    for stmt in ast.walk(node):
-                        if isinstance(stmt, ast.Assert) and isinstance(stmt.test, ast.Constant):
-                            if stmt.test.value is True:
-                                patterns.append(
-                                    TheaterPattern(
-                                        pattern_type=TheaterType.TEST_GAMING,
-                                        severity=SeverityLevel.CRITICAL,
-                                        file_path=file_path,
-                                        line_number=stmt.lineno,
-                                        description="Test always passes with assert True",
-                                        evidence={"function_name": node.name, "assertion": "True"},
-                                        recommendation="Replace with meaningful assertions",
-                                        confidence=0.98,
-                                    )
-                                )
-
         except SyntaxError as e:
             logger.warning("Could not parse %s: %s", file_path, e)
-
-        return patterns
+            return []
+        return self._scan_tree(file_path, tree)[TheaterType.TEST_GAMING]
 
     def detect_error_masking(self, file_path: str, content: str) -> List[TheaterPattern]:
-        patterns = []
-
-        if re.search(r"except\s*:", content):
-            for i, line in enumerate(content.split("\n"), 1):
-                if re.search(r"except\s*:", line):
-                    patterns.append(
-                        TheaterPattern(
-                            pattern_type=TheaterType.ERROR_MASKING,
-                            severity=SeverityLevel.HIGH,
-                            file_path=file_path,
-                            line_number=i,
-                            description="Bare except clause masks all errors",
-                            evidence={"line": line.strip()},
-                            recommendation="Catch specific exceptions and handle appropriately",
-                            confidence=0.9,
-                        )
-                    )
-
-        except_pass_pattern = r"except[^:]*:\s*\n\s*pass"
-        for match in re.finditer(except_pass_pattern, content, re.MULTILINE):
-            line_num = content[: match.start()].count("\n") + 1
-            patterns.append(
-                TheaterPattern(
-                    pattern_type=TheaterType.ERROR_MASKING,
-                    severity=SeverityLevel.CRITICAL,
-                    file_path=file_path,
-                    line_number=line_num,
-                    description="Exception silently ignored with pass",
-                    evidence={"match": match.group()},
-                    recommendation="Log error or handle appropriately",
-                    confidence=0.95,
-                )
-            )
-
-        return patterns
+        return self._scan_text(file_path, content)[TheaterType.ERROR_MASKING]
 
     def detect_metrics_inflation(self, file_path: str, content: str) -> List[TheaterPattern]:
-        patterns = []
-
-        success_patterns = [r"coverage.*=.*100", r"score.*=.*1\.0", r"success.*=.*True", r'quality.*=.*"excellent"']
-
-        for pattern in success_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                line_num = content[: match.start()].count("\n") + 1
-                patterns.append(
-                    TheaterPattern(
-                        pattern_type=TheaterType.METRICS_INFLATION,
-                        severity=SeverityLevel.MEDIUM,
-                        file_path=file_path,
-                        line_number=line_num,
-                        description="Hardcoded perfect metrics detected",
-                        evidence={"match": match.group()},
-                        recommendation="Calculate metrics dynamically from real data",
-                        confidence=0.7,
-                    )
-                )
-
-        return patterns
+        return self._scan_text(file_path, content)[TheaterType.METRICS_INFLATION]
 
     def detect_all_patterns(self, file_path: str) -> List[TheaterPattern]:
         if not os.path.exists(file_path):
@@ -177,184 +135,355 @@ class TheaterDetector:
             logger.error("Could not read %s: %s", file_path, e)
             return []
 
-        all_patterns = []
-        all_patterns.extend(self.detect_test_gaming(file_path, content))
-        all_patterns.extend(self.detect_error_masking(file_path, content))
-        all_patterns.extend(self.detect_metrics_inflation(file_path, content))
+        text = self._scan_text(file_path, content)
         try:
             tree = ast.parse(content)
         except SyntaxError as e:
             logger.warning("Could not parse %s: %s", file_path, e)
-            return all_patterns
-        all_patterns.extend(self.detect_documentation_theater(file_path, content, tree))
-        all_patterns.extend(self.detect_quality_facade(file_path, content, tree))
+            return text[TheaterType.ERROR_MASKING] + text[TheaterType.METRICS_INFLATION]
 
-        return all_patterns
+        return self._merge(self._scan_tree(file_path, tree), text)
 
     def detect_documentation_theater(self, file_path: str, content: str, tree: ast.AST) -> List[TheaterPattern]:
         """Detect documentation that doesn't match code reality."""
-        patterns = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                docstring = ast.get_docstring(node)
-                if not docstring:
-                    continue
-
-                body_without_docstring = node.body[1:] if node.body else []
-                if len(body_without_docstring) <= 1:
-                    if body_without_docstring and isinstance(body_without_docstring[0], ast.Pass):
-                        if len(docstring) > 100:
-                            patterns.append(
-                                TheaterPattern(
-                                    pattern_type=TheaterType.DOCUMENTATION_THEATER,
-                                    severity=SeverityLevel.HIGH,
-                                    file_path=file_path,
-                                    line_number=node.lineno,
-                                    description=f"Function '{node.name}' has elaborate docstring but empty body",
-                                    evidence={"docstring_length": len(docstring)},
-                                    recommendation="Implement function logic or trim documentation",
-                                    confidence=0.9,
-                                )
-                            )
-
-                if "raises" in docstring.lower():
-                    has_raise = any(isinstance(n, ast.Raise) for n in ast.walk(node))
-                    if not has_raise:
-                        patterns.append(
-                            TheaterPattern(
-                                pattern_type=TheaterType.DOCUMENTATION_THEATER,
-                                severity=SeverityLevel.MEDIUM,
-                                file_path=file_path,
-                                line_number=node.lineno,
-                                description=f"Function '{node.name}' docstring claims exceptions but none raised",
-                                evidence={"docstring": docstring[:120]},
-                                recommendation="Update docstring or add real exception handling",
-                                confidence=0.75,
-                            )
-                        )
-
-                if "returns" in docstring.lower():
-                    returns_value = any(
-                        isinstance(n, ast.Return) and n.value is not None for n in ast.walk(node)
-                    )
-                    if not returns_value:
-                        patterns.append(
-                            TheaterPattern(
-                                pattern_type=TheaterType.DOCUMENTATION_THEATER,
-                                severity=SeverityLevel.MEDIUM,
-                                file_path=file_path,
-                                line_number=node.lineno,
-                                description=f"Function '{node.name}' docstring claims return value but returns None",
-                                evidence={"docstring": docstring[:120]},
-                                recommendation="Update return behavior or docstring",
-                                confidence=0.75,
-                            )
-                        )
-
-        return patterns
+        return self._scan_tree(file_path, tree)[TheaterType.DOCUMENTATION_THEATER]
 
     def detect_quality_facade(self, file_path: str, content: str, tree: ast.AST) -> List[TheaterPattern]:
         """Detect quality practices that are facade only."""
-        patterns = []
+        return self._scan_tree(file_path, tree)[TheaterType.QUALITY_FACADE]
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ExceptHandler):
-                if node.body:
-                    first_stmt = node.body[0]
-                    if isinstance(first_stmt, ast.Pass):
-                        patterns.append(
-                            TheaterPattern(
-                                pattern_type=TheaterType.QUALITY_FACADE,
-                                severity=SeverityLevel.HIGH,
-                                file_path=file_path,
-                                line_number=node.lineno,
-                                description="Exception caught but silently ignored (pass)",
-                                evidence={"handler": ast.dump(node, include_attributes=False)},
-                                recommendation="Handle or log exceptions explicitly",
-                                confidence=0.9,
-                            )
-                        )
-                    elif isinstance(first_stmt, ast.Expr) and isinstance(first_stmt.value, ast.Constant):
-                        patterns.append(
-                            TheaterPattern(
-                                pattern_type=TheaterType.QUALITY_FACADE,
-                                severity=SeverityLevel.MEDIUM,
-                                file_path=file_path,
-                                line_number=node.lineno,
-                                description="Exception handler only contains a comment literal",
-                                evidence={"comment": str(first_stmt.value.value)},
-                                recommendation="Replace comments with real exception handling",
-                                confidence=0.7,
-                            )
-                        )
+    def detect_all(self, source: str, file_path: str = "<unknown>") -> List[TheaterPattern]:
+        """Run all theater detection methods on provided source."""
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return []
 
-            if isinstance(node, ast.FunctionDef):
-                is_public = not node.name.startswith("_")
-                has_return_annotation = node.returns is not None
-                has_arg_annotations = any(arg.annotation for arg in node.args.args)
-                if is_public and has_return_annotation and not has_arg_annotations:
-                    patterns.append(
-                        TheaterPattern(
-                            pattern_type=TheaterType.QUALITY_FACADE,
-                            severity=SeverityLevel.LOW,
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            description=f"Function '{node.name}' has return type hint but no parameter hints",
-                            evidence={"function": node.name},
-                            recommendation="Add parameter type hints for consistency",
-                            confidence=0.6,
-                        )
+        return self._merge(self._scan_tree(file_path, tree), self._scan_text(file_path, source))
+
+    def analyze_directory(self, directory: str, max_workers: Optional[int] = None) -> List[TheaterPattern]:
+        """
+        Run ``detect_all_patterns`` on every Python file under ``directory``.
+
+        Files are spread across a process pool once there are enough of them;
+        results keep the directory walk order either way.
+        """
+        files = [str(path) for path in iter_tree_files(directory)]
+        workers = min(max_workers or os.cpu_count() or 1, len(files))
+
+        if workers <= 1 or len(files) < THEATER_PARALLEL_THRESHOLD:
+            results = [self.detect_all_patterns(file_path) for file_path in files]
+        else:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunksize = max(1, len(files) // (workers * 4))
+                    results = list(executor.map(_detect_file, files, chunksize=chunksize))
+            except (OSError, RuntimeError) as e:
+                logger.debug("Theater process pool unavailable, running serially: %s", e)
+                results = [self.detect_all_patterns(file_path) for file_path in files]
+
+        return [pattern for patterns in results for pattern in patterns]
+
+    @staticmethod
+    def _merge(tree_patterns: Dict[TheaterType, List[TheaterPattern]], text_patterns: Dict[TheaterType, List[TheaterPattern]]) -> List[TheaterPattern]:
+        return (
+            tree_patterns[TheaterType.TEST_GAMING]
+            + text_patterns[TheaterType.ERROR_MASKING]
+            + text_patterns[TheaterType.METRICS_INFLATION]
+            + tree_patterns[TheaterType.DOCUMENTATION_THEATER]
+            + tree_patterns[TheaterType.QUALITY_FACADE]
+        )
+
+    # ------------------------------------------------------------------
+    # Text patterns: one keyword scan, line numbers from a newline index
+    # ------------------------------------------------------------------
+
+    def _scan_text(self, file_path: str, content: str) -> Dict[TheaterType, List[TheaterPattern]]:
+        lines = LineIndex(content)
+        bare_lines: List[int] = []
+        except_passes: List[Tuple[int, str]] = []
+        metric_matches: List[List[Tuple[int, str]]] = [[] for _ in METRIC_PATTERNS]
+        # Each pattern resumes after its previous match, like a separate finditer
+        except_pass_end = 0
+        metric_ends = [0] * len(METRIC_PATTERNS)
+
+        for keyword in TEXT_KEYWORDS.finditer(content):
+            position = keyword.start()
+            if keyword.group("except"):
+                if BARE_EXCEPT.match(content, position):
+                    line = lines.line_of(position)
+                    if not bare_lines or bare_lines[-1] != line:
+                        bare_lines.append(line)
+                if position >= except_pass_end:
+                    match = EXCEPT_PASS.match(content, position)
+                    if match:
+                        except_passes.append((lines.line_of(position), match.group()))
+                        except_pass_end = match.end()
+                continue
+
+            for index, pattern in enumerate(METRIC_PATTERNS):
+                if position >= metric_ends[index]:
+                    match = pattern.match(content, position)
+                    if match:
+                        metric_matches[index].append((lines.line_of(position), match.group()))
+                        metric_ends[index] = match.end()
+
+        masking = []
+        if bare_lines:
+            source_lines = content.split("\n")
+            for line in bare_lines:
+                masking.append(
+                    TheaterPattern(
+                        pattern_type=TheaterType.ERROR_MASKING,
+                        severity=SeverityLevel.HIGH,
+                        file_path=file_path,
+                        line_number=line,
+                        description="Bare except clause masks all errors",
+                        evidence={"line": source_lines[line - 1].strip()},
+                        recommendation="Catch specific exceptions and handle appropriately",
+                        confidence=0.9,
                     )
-
-            if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
-                has_assert = any(
-                    isinstance(n, ast.Assert)
-                    or (isinstance(n, ast.Call) and isinstance(n.func, ast.Attribute) and n.func.attr.startswith("assert"))
-                    for n in ast.walk(node)
                 )
-                if not has_assert:
-                    patterns.append(
+        for line, text in except_passes:
+            masking.append(
+                TheaterPattern(
+                    pattern_type=TheaterType.ERROR_MASKING,
+                    severity=SeverityLevel.CRITICAL,
+                    file_path=file_path,
+                    line_number=line,
+                    description="Exception silently ignored with pass",
+                    evidence={"match": text},
+                    recommendation="Log error or handle appropriately",
+                    confidence=0.95,
+                )
+            )
+
+        inflation = [
+            TheaterPattern(
+                pattern_type=TheaterType.METRICS_INFLATION,
+                severity=SeverityLevel.MEDIUM,
+                file_path=file_path,
+                line_number=line,
+                description="Hardcoded perfect metrics detected",
+                evidence={"match": text},
+                recommendation="Calculate metrics dynamically from real data",
+                confidence=0.7,
+            )
+            for matches in metric_matches
+            for line, text in matches
+        ]
+
+        return {TheaterType.ERROR_MASKING: masking, TheaterType.METRICS_INFLATION: inflation}
+
+    # ------------------------------------------------------------------
+    # AST patterns: one breadth-first walk (same order as ast.walk)
+    # ------------------------------------------------------------------
+
+    def _scan_tree(self, file_path: str, tree: ast.AST) -> Dict[TheaterType, List[TheaterPattern]]:
+        functions: List[_FunctionFacts] = []
+        # Quality facade findings in walk order; test functions are resolved after the walk
+        facade: List[Any] = []
+
+        queue = deque([(tree, ())])
+        while queue:
+            node, enclosing = queue.popleft()
+
+            if isinstance(node, ast.Raise):
+                for facts in enclosing:
+                    facts.has_raise = True
+            elif isinstance(node, ast.Return):
+                if node.value is not None:
+                    for facts in enclosing:
+                        facts.returns_value = True
+            elif isinstance(node, ast.Assert):
+                for facts in enclosing:
+                    facts.has_assert = True
+                if isinstance(node.test, ast.Constant) and node.test.value is True:
+                    for facts in enclosing:
+                        facts.true_asserts.append(node)
+            elif isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Attribute) and node.func.attr.startswith("assert"):
+                    for facts in enclosing:
+                        facts.has_assert = True
+            elif isinstance(node, ast.ExceptHandler):
+                handler_pattern = self._handler_facade(file_path, node)
+                if handler_pattern:
+                    facade.append(handler_pattern)
+            elif isinstance(node, ast.FunctionDef):
+                facts = _FunctionFacts(node)
+                functions.append(facts)
+                hint_pattern = self._type_hint_facade(file_path, node)
+                if hint_pattern:
+                    facade.append(hint_pattern)
+                if node.name.startswith("test_"):
+                    facade.append(facts)
+                enclosing = enclosing + (facts,)
+
+            queue.extend((child, enclosing) for child in ast.iter_child_nodes(node))
+
+        gaming = []
+        documentation = []
+        for facts in functions:
+            if facts.node.name.startswith("test_"):
+                gaming.extend(self._test_gaming_patterns(file_path, facts))
+            documentation.extend(self._documentation_patterns(file_path, facts))
+
+        facade_patterns = []
+        for entry in facade:
+            if isinstance(entry, _FunctionFacts):
+                if not entry.has_assert:
+                    facade_patterns.append(
                         TheaterPattern(
                             pattern_type=TheaterType.QUALITY_FACADE,
                             severity=SeverityLevel.HIGH,
                             file_path=file_path,
-                            line_number=node.lineno,
-                            description=f"Test '{node.name}' has no assertions",
-                            evidence={"function": node.name},
+                            line_number=entry.node.lineno,
+                            description=f"Test '{entry.node.name}' has no assertions",
+                            evidence={"function": entry.node.name},
                             recommendation="Add meaningful assertions to tests",
                             confidence=0.85,
                         )
                     )
+            else:
+                facade_patterns.append(entry)
 
+        return {
+            TheaterType.TEST_GAMING: gaming,
+            TheaterType.DOCUMENTATION_THEATER: documentation,
+            TheaterType.QUALITY_FACADE: facade_patterns,
+        }
+
+    def _test_gaming_patterns(self, file_path: str, facts: _FunctionFacts) -> List[TheaterPattern]:
+        node = facts.node
+        patterns = []
+        if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
+            patterns.append(
+                TheaterPattern(
+                    pattern_type=TheaterType.TEST_GAMING,
+                    severity=SeverityLevel.HIGH,
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    description="Empty test function - no actual testing",
+                    evidence={"function_name": node.name, "body_length": len(node.body)},
+                    recommendation="Implement actual test logic or remove empty test",
+                    confidence=0.95,
+                )
+            )
+
+        for stmt in facts.true_asserts:
+            patterns.append(
+                TheaterPattern(
+                    pattern_type=TheaterType.TEST_GAMING,
+                    severity=SeverityLevel.CRITICAL,
+                    file_path=file_path,
+                    line_number=stmt.lineno,
+                    description="Test always passes with assert True",
+                    evidence={"function_name": node.name, "assertion": "True"},
+                    recommendation="Replace with meaningful assertions",
+                    confidence=0.98,
+                )
+            )
         return patterns
 
-    def detect_all(self, source: str, file_path: str = "<unknown>") -> List[TheaterPattern]:
-        """Run all theater detection methods on provided source."""
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
+    def _documentation_patterns(self, file_path: str, facts: _FunctionFacts) -> List[TheaterPattern]:
+        node = facts.node
+        docstring = ast.get_docstring(node)
+        if not docstring:
             return []
 
         patterns = []
-        patterns.extend(self.detect_test_gaming(file_path, source))
-        patterns.extend(self.detect_error_masking(file_path, source))
-        patterns.extend(self.detect_metrics_inflation(file_path, source))
-        patterns.extend(self.detect_documentation_theater(file_path, source, tree))
-        patterns.extend(self.detect_quality_facade(file_path, source, tree))
-        return patterns
+        body_without_docstring = node.body[1:] if node.body else []
+        if len(body_without_docstring) <= 1:
+            if body_without_docstring and isinstance(body_without_docstring[0], ast.Pass):
+                if len(docstring) > 100:
+                    patterns.append(
+                        TheaterPattern(
+                            pattern_type=TheaterType.DOCUMENTATION_THEATER,
+                            severity=SeverityLevel.HIGH,
+                            file_path=file_path,
+                            line_number=node.lineno,
+                            description=f"Function '{node.name}' has elaborate docstring but empty body",
+                            evidence={"docstring_length": len(docstring)},
+                            recommendation="Implement function logic or trim documentation",
+                            confidence=0.9,
+                        )
+                    )
 
-    def analyze_directory(self, directory: str) -> List[TheaterPattern]:
-        all_patterns = []
+        lowered = docstring.lower()
+        if "raises" in lowered and not facts.has_raise:
+            patterns.append(
+                TheaterPattern(
+                    pattern_type=TheaterType.DOCUMENTATION_THEATER,
+                    severity=SeverityLevel.MEDIUM,
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    description=f"Function '{node.name}' docstring claims exceptions but none raised",
+                    evidence={"docstring": docstring[:120]},
+                    recommendation="Update docstring or add real exception handling",
+                    confidence=0.75,
+                )
+            )
 
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = os.path.join(root, file)
-                    patterns = self.detect_all_patterns(file_path)
-                    all_patterns.extend(patterns)
+        if "returns" in lowered and not facts.returns_value:
+            patterns.append(
+                TheaterPattern(
+                    pattern_type=TheaterType.DOCUMENTATION_THEATER,
+                    severity=SeverityLevel.MEDIUM,
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    description=f"Function '{node.name}' docstring claims return value but returns None",
+                    evidence={"docstring": docstring[:120]},
+                    recommendation="Update return behavior or docstring",
+                    confidence=0.75,
+                )
+            )
+
+        return patterns
 
-        return all_patterns
+    def _handler_facade(self, file_path: str, node: ast.ExceptHandler) -> Optional[TheaterPattern]:
+        if not node.body:
+            return None
+        first_stmt = node.body[0]
+        if isinstance(first_stmt, ast.Pass):
+            return TheaterPattern(
+                pattern_type=TheaterType.QUALITY_FACADE,
+                severity=SeverityLevel.HIGH,
+                file_path=file_path,
+                line_number=node.lineno,
+                description="Exception caught but silently ignored (pass)",
+                evidence={"handler": ast.dump(node, include_attributes=False)},
+                recommendation="Handle or log exceptions explicitly",
+                confidence=0.9,
+            )
+        if isinstance(first_stmt, ast.Expr) and isinstance(first_stmt.value, ast.Constant):
+            return TheaterPattern(
+                pattern_type=TheaterType.QUALITY_FACADE,
+                severity=SeverityLevel.MEDIUM,
+                file_path=file_path,
+                line_number=node.lineno,
+                description="Exception handler only contains a comment literal",
+                evidence={"comment": str(first_stmt.value.value)},
+                recommendation="Replace comments with real exception handling",
+                confidence=0.7,
+            )
+        return None
+
+    def _type_hint_facade(self, file_path: str, node: ast.FunctionDef) -> Optional[TheaterPattern]:
+        is_public = not node.name.startswith("_")
+        has_return_annotation = node.returns is not None
+        has_arg_annotations = any(arg.annotation for arg in node.args.args)
+        if is_public and has_return_annotation and not has_arg_annotations:
+            return TheaterPattern(
+                pattern_type=TheaterType.QUALITY_FACADE,
+                severity=SeverityLevel.LOW,
+                file_path=file_path,
+                line_number=node.lineno,
+                description=f"Function '{node.name}' has return type hint but no parameter hints",
+                evidence={"function": node.name},
+                recommendation="Add parameter type hints for consistency",
+                confidence=0.6,
+            )
+        return None
 
     def generate_report(self, patterns: List[TheaterPattern]) -> Dict[str, Any]:
         severity_counts = {s.value: 0 for s in SeverityLevel}
@@ -382,3 +511,8 @@ class TheaterDetector:
                 for p in patterns
             ],
         }
+
+
+def _detect_file(file_path: str) -> List[TheaterPattern]:
+    """Process-pool worker for ``TheaterDetector.analyze_directory``."""
+    return TheaterDetector().detect_all_patterns(file_path)
@@ -27,7 +27,9 @@ This provides a single entry point for all connascence analysis functionality.
 """
 
 import ast
+from contextlib import nullcontext
 from dataclasses import asdict, dataclass
+from functools import cached_property
 import json
 import logging
 from pathlib import Path
@@ -36,118 +38,138 @@ from typing import Any, Dict, List, Optional, Union
 
 from fixes.phase0.production_safe_assertions import ProductionAssert
 
-# Import optimization components
-try:
-    from .optimization.file_cache import (
-        FileContentCache,
-        cached_ast_tree,
-        cached_file_content,
-        cached_file_lines,
-        cached_python_files,
-        get_global_cache,
+from .component_registry import ComponentRegistry
+from .standard_errors import ErrorHandler, StandardError
+
+# Optional and heavy components are resolved on first use (see component_registry).
+# Each entry lists the package-relative module first and the script-mode module second.
+_lazy = ComponentRegistry(package=__package__ or "analyzer")
+
+
+def _register_from(group, modules, names, required=False):
+    for name in names:
+        attribute, alias = name if isinstance(name, tuple) else (name, name)
+        _lazy.register(alias, *[(module, attribute) for module in modules], group=group, required=required)
+
+
+_register_from(
+    "cache",
+    [".optimization.file_cache", "optimization.file_cache"],
+    [
+        "FileContentCache",
+        "cached_ast_tree",
+        "cached_file_content",
+        "cached_file_lines",
+        "cached_python_files",
+        "get_global_cache",
+    ],
+)
+_register_from(
+    "monitoring",
+    [".optimization.memory_monitor", "optimization.memory_monitor"],
+    ["MemoryMonitor", "MemoryWatcher", "get_global_memory_monitor", "start_global_monitoring", "stop_global_monitoring"],
+)
+_register_from(
+    "monitoring",
+    [".optimization.memory_budget", "optimization.memory_budget"],
+    [
+        "SHED_PRIORITY_AST",
+        "SHED_PRIORITY_FILE_CONTENT",
+        "cache_name",
+        "estimate_file_cost_mb",
+        "get_global_memory_budget",
+    ],
+)
+_register_from(
+    "monitoring",
+    [".optimization.resource_manager", "optimization.resource_manager"],
+    [
+        "cleanup_all_resources",
+        "get_global_resource_manager",
+        "get_resource_report",
+        "managed_ast_tree",
+        "managed_file_handle",
+    ],
+)
+_register_from(
+    "streaming",
+    [".streaming.incremental_cache", "streaming.incremental_cache"],
+    ["IncrementalCache", "get_global_incremental_cache"],
+)
+_register_from(
+    "streaming",
+    [".streaming.stream_processor", "streaming.stream_processor"],
+    ["AnalysisRequest", "AnalysisResult", "StreamProcessor", "create_stream_processor", "process_file_changes_stream"],
+)
+
+# Core analyzer components (Phase 1-5) - required, but only imported when used
+for _name, _module, _attribute in [
+    ("GodObjectOrchestrator", "ast_engine.analyzer_orchestrator", "AnalyzerOrchestrator"),
+    ("ConnascenceASTAnalyzer", "check_connascence", "ConnascenceAnalyzer"),
+    ("TimingDetector", "detectors.timing_detector", "TimingDetector"),
+    ("MECEAnalyzer", "dup_detection.mece_analyzer", "MECEAnalyzer"),
+    ("NASAAnalyzer", "nasa_engine.nasa_analyzer", "NASAAnalyzer"),
+    ("ConnascencePatternOptimizer", "optimization.ast_optimizer", "ConnascencePatternOptimizer"),
+    ("RefactoredConnascenceDetector", "refactored_detector", "RefactoredConnascenceDetector"),
+    ("SmartIntegrationEngine", "smart_integration_engine", "SmartIntegrationEngine"),
+    ("ArchitecturalAnalyzer", "architectural_analysis", "ArchitecturalAnalyzer"),
+    ("default_graph_cache", "architectural_analysis", "default_graph_cache"),
+]:
+    _lazy.register(_name, (f".{_module}", _attribute), (_module, _attribute), group="core", required=True)
+
+# New architecture components (refactored for NASA Rule 4 compliance)
+for _name, _module, _attribute in [
+    ("CacheManager", "cache_manager", "CacheManager"),
+    ("MetricsCollector", "metrics_collector", "MetricsCollector"),
+    ("ReportGenerator", "report_generator", "ReportGenerator"),
+    ("ArchStreamProcessor", "stream_processor", "StreamProcessor"),
+    # Phase 7: New coordinators for God Object decomposition
+    ("MonitoringCoordinator", "monitoring_coordinator", "MonitoringCoordinator"),
+    ("StreamingCoordinator", "streaming_coordinator", "StreamingCoordinator"),
+    ("ResultBuilder", "result_builder", "ResultBuilder"),
+]:
+    _lazy.register(_name, (f".architecture.{_module}", _attribute), group="architecture")
+
+# Refactored coordinator (recommended for new code)
+_lazy.register("UnifiedCoordinator", (".unified_coordinator", "UnifiedCoordinator"), group="coordinator")
+
+# Tree-Sitter backend
+for _name in ("LanguageSupport", "TreeSitterBackend"):
+    _lazy.register(
+        _name,
+        ("..grammar.backends.tree_sitter_backend", _name),
+        ("grammar.backends.tree_sitter_backend", _name),
+        group="tree_sitter",
     )
 
-    CACHE_AVAILABLE = True
-except ImportError:
-    CACHE_AVAILABLE = False
+# Optional integrations
+_lazy.register("FailureDetectionSystem", (".failure_detection_system", "FailureDetectionSystem"))
+_lazy.register("NASAPowerOfTenIntegration", ("..mcp.nasa_integration", "NASAPowerOfTenIntegration"))
+_lazy.register("BudgetTracker", ("..policy.budgets", "BudgetTracker"))
+_lazy.register("PolicyManager", ("..policy.manager", "PolicyManager"))
 
-# Import memory monitoring and resource management
-try:
-    from .optimization.memory_monitor import (
-        MemoryMonitor,
-        MemoryWatcher,
-        get_global_memory_monitor,
-        start_global_monitoring,
-        stop_global_monitoring,
-    )
-    from .optimization.resource_manager import (
-        cleanup_all_resources,
-        get_global_resource_manager,
-        get_resource_report,
-        managed_ast_tree,
-        managed_file_handle,
-    )
+# Legacy availability flags, now evaluated on first access
+_AVAILABILITY_FLAGS = {
+    "CACHE_AVAILABLE": "cache",
+    "ADVANCED_MONITORING_AVAILABLE": "monitoring",
+    "STREAMING_AVAILABLE": "streaming",
+    "ARCHITECTURE_AVAILABLE": "architecture",
+    "COORDINATOR_AVAILABLE": "coordinator",
+}
 
-    ADVANCED_MONITORING_AVAILABLE = True
-except ImportError:
-    ADVANCED_MONITORING_AVAILABLE = False
 
-# Import streaming and incremental analysis components
-try:
-    from .streaming.incremental_cache import IncrementalCache, get_global_incremental_cache
-    from .streaming.stream_processor import (
-        AnalysisRequest,
-        AnalysisResult,
-        StreamProcessor,
-        create_stream_processor,
-        process_file_changes_stream,
-    )
+def __getattr__(name: str) -> Any:
+    """Resolve lazily registered components for ``from analyzer.unified_analyzer import X``."""
+    if name in _AVAILABILITY_FLAGS:
+        return _lazy.available(_AVAILABILITY_FLAGS[name])
+    if name in _lazy:
+        return _lazy.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    STREAMING_AVAILABLE = True
-except ImportError:
-    STREAMING_AVAILABLE = False
 
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Core analyzer components (Phase 1-5) - now all in analyzer/
-try:
-    from .ast_engine.analyzer_orchestrator import AnalyzerOrchestrator as GodObjectOrchestrator
-    from .check_connascence import ConnascenceAnalyzer as ConnascenceASTAnalyzer
-    from .detectors.timing_detector import TimingDetector
-    from .dup_detection.mece_analyzer import MECEAnalyzer
-    from .nasa_engine.nasa_analyzer import NASAAnalyzer
-    from .optimization.ast_optimizer import ConnascencePatternOptimizer
-    from .refactored_detector import RefactoredConnascenceDetector
-    from .smart_integration_engine import SmartIntegrationEngine
-except ImportError:
-    # Fallback when running as script
-    from ast_engine.analyzer_orchestrator import AnalyzerOrchestrator as GodObjectOrchestrator
-    from check_connascence import ConnascenceAnalyzer as ConnascenceASTAnalyzer
-    from dup_detection.mece_analyzer import MECEAnalyzer
-    from nasa_engine.nasa_analyzer import NASAAnalyzer
-    from optimization.ast_optimizer import ConnascencePatternOptimizer
-    from refactored_detector import RefactoredConnascenceDetector
-    from smart_integration_engine import SmartIntegrationEngine
-
-# Import new architecture components (refactored for NASA Rule 4 compliance)
-try:
-    from .architecture.cache_manager import CacheManager
-    from .architecture.metrics_collector import MetricsCollector
-    from .architecture.report_generator import ReportGenerator
-    from .architecture.stream_processor import StreamProcessor as ArchStreamProcessor
-    # Phase 7: New coordinators for God Object decomposition
-    from .architecture.monitoring_coordinator import MonitoringCoordinator
-    from .architecture.streaming_coordinator import StreamingCoordinator
-    from .architecture.result_builder import ResultBuilder
-    ARCHITECTURE_AVAILABLE = True
-except ImportError:
-    ARCHITECTURE_AVAILABLE = False
-    CacheManager = None
-    MetricsCollector = None
-    ReportGenerator = None
-    ArchStreamProcessor = None
-    MonitoringCoordinator = None
-    StreamingCoordinator = None
-    ResultBuilder = None
-
-# Import refactored coordinator (recommended for new code)
-try:
-    from .unified_coordinator import UnifiedCoordinator
-    COORDINATOR_AVAILABLE = True
-except ImportError:
-    COORDINATOR_AVAILABLE = False
-    UnifiedCoordinator = None
-
-# Try to import Tree-Sitter backend with fallback
-try:
-    from ..grammar.backends.tree_sitter_backend import LanguageSupport, TreeSitterBackend
-except ImportError:
-    try:
-        from grammar.backends.tree_sitter_backend import LanguageSupport, TreeSitterBackend
-    except ImportError:
-        TreeSitterBackend = None
-        LanguageSupport = None
 try:
     from .constants import (
         CACHE_CLEANUP_AGE_SECONDS,
@@ -193,48 +215,9 @@ except ImportError:
         VIOLATION_WEIGHTS,
     )
 
-# Try to import optional components with fallbacks
-try:
-    from .failure_detection_system import FailureDetectionSystem
-except ImportError:
-    FailureDetectionSystem = None
-
-try:
-    from ..mcp.nasa_integration import NASAPowerOfTenIntegration
-except ImportError:
-    NASAPowerOfTenIntegration = None
-
-try:
-    from ..policy.budgets import BudgetTracker
-    from ..policy.manager import PolicyManager
-except ImportError:
-    PolicyManager = None
-    BudgetTracker = None
-
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class StandardError:
-    """Standard error response format across all integrations."""
-
-    code: int
-    message: str
-    severity: str
-    timestamp: str
-    integration: str
-    error_id: Optional[str] = None
-    context: Optional[Dict[str, Any]] = None
-    correlation_id: Optional[str] = None
-    file_path: Optional[str] = None
-    line_number: Optional[int] = None
-    suggestions: Optional[List[str]] = None
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return asdict(self)
-
-
 @dataclass
 class UnifiedAnalysisResult:
     """Complete analysis result from all Phase 1-6 components."""
@@ -287,96 +270,6 @@ class UnifiedAnalysisResult:
         return any(error.severity == ERROR_SEVERITY["CRITICAL"] for error in self.errors)
 
 
-class ErrorHandler:
-    """Centralized error handling for all integrations."""
-
-    def __init__(self, integration: str = "analyzer"):
-        self.integration = integration
-        self.correlation_id = self._generate_correlation_id()
-
-    def _generate_correlation_id(self) -> str:
-        """Generate unique correlation ID for error tracking."""
-        import uuid
-
-        return str(uuid.uuid4())[:8]
-
-    def create_error(
-        self,
-        error_type: str,
-        message: str,
-        severity: str = ERROR_SEVERITY["MEDIUM"],
-        context: Optional[Dict[str, Any]] = None,
-        file_path: Optional[str] = None,
-        line_number: Optional[int] = None,
-        suggestions: Optional[List[str]] = None,
-    ) -> StandardError:
-        """Create standardized error response."""
-        from datetime import datetime
-
-        error_code = ERROR_CODE_MAPPING.get(error_type, ERROR_CODE_MAPPING["INTERNAL_ERROR"])
-
-        return StandardError(
-            code=error_code,
-            message=message,
-            severity=severity,
-            timestamp=datetime.now().isoformat(),
-            integration=self.integration,
-            error_id=error_type,
-            context=context or {},
-            correlation_id=self.correlation_id,
-            file_path=file_path,
-            line_number=line_number,
-            suggestions=suggestions,
-        )
-
-    def handle_exception(
-        self, exception: Exception, context: Optional[Dict[str, Any]] = None, file_path: Optional[str] = None
-    ) -> StandardError:
-        """Convert exception to standardized error."""
-        # Map common exceptions to error types
-        exception_mapping = {
-            FileNotFoundError: "FILE_NOT_FOUND",
-            PermissionError: "PERMISSION_DENIED",
-            SyntaxError: "SYNTAX_ERROR",
-            TimeoutError: "TIMEOUT_ERROR",
-            MemoryError: "MEMORY_ERROR",
-            ValueError: "ANALYSIS_FAILED",
-            ImportError: "DEPENDENCY_MISSING",
-        }
-
-        error_type = exception_mapping.get(type(exception), "INTERNAL_ERROR")
-        severity = (
-            ERROR_SEVERITY["HIGH"]
-            if error_type in ["FILE_NOT_FOUND", "PERMISSION_DENIED"]
-            else ERROR_SEVERITY["MEDIUM"]
-        )
-
-        return self.create_error(
-            error_type=error_type, message=str(exception), severity=severity, context=context, file_path=file_path
-        )
-
-    def log_error(self, error: StandardError):
-        """Log error with appropriate level."""
-
-        ProductionAssert.not_none(error, "error")
-
-        log_level_mapping = {
-            ERROR_SEVERITY["CRITICAL"]: logger.critical,
-            ERROR_SEVERITY["HIGH"]: logger.error,
-            ERROR_SEVERITY["MEDIUM"]: logger.warning,
-            ERROR_SEVERITY["LOW"]: logger.info,
-            ERROR_SEVERITY["INFO"]: logger.info,
-        }
-
-        log_func = log_level_mapping.get(error.severity, logger.error)
-        log_func(f"[{error.integration}:{error.correlation_id}] {error.message} (Code: {error.code})")
-
-        if error.file_path:
-            log_func(f"  File: {error.file_path}:{error.line_number or 0}")
-        if error.suggestions:
-            log_func(f"  Suggestions: {', '.join(error.suggestions)}")
-
-
 class ComponentInitializer:
     """Handles initialization of optional components with fallbacks."""
 
@@ -384,7 +277,7 @@ class ComponentInitializer:
     def init_smart_engine():
         """Initialize smart integration engine with fallback."""
         try:
-            return SmartIntegrationEngine()
+            return _lazy.SmartIntegrationEngine()
         except Exception as e:
             logger.debug(f"SmartIntegrationEngine initialization failed: {e}")
             return None
@@ -392,9 +285,9 @@ class ComponentInitializer:
     @staticmethod
     def init_failure_detector():
         """Initialize failure detector with fallback."""
-        if FailureDetectionSystem:
+        if _lazy.FailureDetectionSystem:
             try:
-                return FailureDetectionSystem()
+                return _lazy.FailureDetectionSystem()
             except Exception as e:
                 logger.debug(f"FailureDetectionSystem initialization failed: {e}")
                 return None
@@ -403,9 +296,9 @@ class ComponentInitializer:
     @staticmethod
     def init_nasa_integration():
         """Initialize NASA integration with fallback."""
-        if NASAPowerOfTenIntegration:
+        if _lazy.NASAPowerOfTenIntegration:
             try:
-                return NASAPowerOfTenIntegration()
+                return _lazy.NASAPowerOfTenIntegration()
             except Exception as e:
                 logger.debug(f"NASAPowerOfTenIntegration initialization failed: {e}")
                 return None
@@ -414,9 +307,9 @@ class ComponentInitializer:
     @staticmethod
     def init_policy_manager():
         """Initialize policy manager with fallback."""
-        if PolicyManager:
+        if _lazy.PolicyManager:
             try:
-                return PolicyManager()
+                return _lazy.PolicyManager()
             except Exception as e:
                 logger.debug(f"PolicyManager initialization failed: {e}")
                 return None
@@ -425,9 +318,9 @@ class ComponentInitializer:
     @staticmethod
     def init_budget_tracker():
         """Initialize budget tracker with fallback."""
-        if BudgetTracker:
+        if _lazy.BudgetTracker:
             try:
-                return BudgetTracker()
+                return _lazy.BudgetTracker()
             except Exception as e:
                 logger.debug(f"BudgetTracker initialization failed: {e}")
                 return None
@@ -524,14 +417,14 @@ class UnifiedConnascenceAnalyzer:
         self.error_handler = ErrorHandler("analyzer")
 
         # Initialize streaming components if available and requested
-        self.stream_processor: Optional[StreamProcessor] = None
-        self.incremental_cache: Optional[IncrementalCache] = None
-        if STREAMING_AVAILABLE and analysis_mode in ["streaming", "hybrid"]:
+        self.stream_processor: Optional["StreamProcessor"] = None
+        self.incremental_cache: Optional["IncrementalCache"] = None
+        if _lazy.available("streaming") and analysis_mode in ["streaming", "hybrid"]:
             self._initialize_streaming_components()
 
         # Initialize enhanced file cache for optimized I/O with intelligent warming
         self.file_cache = (
-            FileContentCache(max_memory=100 * 1024 * 1024) if CACHE_AVAILABLE else None
+            _lazy.FileContentCache(max_memory=100 * 1024 * 1024) if _lazy.available("cache") else None
         )  # 100MB for large projects
         self._cache_stats = {"hits": 0, "misses": 0, "warm_requests": 0, "batch_loads": 0}
         self._analysis_patterns = {}  # Track file access patterns for intelligent caching
@@ -540,75 +433,151 @@ class UnifiedConnascenceAnalyzer:
         # Initialize advanced monitoring and resource management
         self.memory_monitor = None
         self.resource_manager = None
-        if ADVANCED_MONITORING_AVAILABLE:
-            self.memory_monitor = get_global_memory_monitor()
-            self.resource_manager = get_global_resource_manager()
+        if _lazy.available("monitoring"):
+            self.memory_monitor = _lazy.get_global_memory_monitor()
+            self.resource_manager = _lazy.get_global_resource_manager()
             self._setup_monitoring_and_cleanup_hooks()
 
-        # Initialize new architecture components (NASA Rule 4 compliant)
-        # These delegate caching, metrics, reporting, and streaming to specialized components
-        self.arch_cache_manager = None
-        self.arch_metrics_collector = None
-        self.arch_report_generator = None
-        self.arch_stream_processor = None
-
-        if ARCHITECTURE_AVAILABLE:
-            try:
-                self.arch_cache_manager = CacheManager(config={"max_memory": 100 * 1024 * 1024})
-                self.arch_metrics_collector = MetricsCollector()
-                self.arch_report_generator = ReportGenerator(config={"version": "1.0.0"})
-                self.arch_stream_processor = ArchStreamProcessor(config=streaming_config or {})
-                # Phase 7: Initialize new coordinators for God Object decomposition
-                self.monitoring_coordinator = MonitoringCoordinator(
-                    config={},
-                    memory_monitor=self.memory_monitor,
-                    resource_manager=self.resource_manager,
-                    file_cache=self.file_cache,
-                ) if MonitoringCoordinator else None
-                self.streaming_coordinator = StreamingCoordinator(
-                    config=streaming_config or {},
-                    stream_processor=self.stream_processor,
-                    incremental_cache=self.incremental_cache,
-                ) if StreamingCoordinator else None
-                self.result_builder = ResultBuilder(config={}) if ResultBuilder else None
-                logger.info("Architecture components initialized successfully (including Phase 7 coordinators)")
-            except Exception as e:
-                logger.warning(f"Architecture component initialization failed: {e}")
+        # Files are admitted against the memory budget, which sheds file contents before parsed trees
+        self.memory_budget = _lazy.get_global_memory_budget() if _lazy.available("monitoring") else None
+        if self.memory_budget and self.file_cache:
+            self.memory_budget.register_cache(
+                _lazy.cache_name("unified_file_content", self.file_cache),
+                self.file_cache.shrink,
+                _lazy.SHED_PRIORITY_FILE_CONTENT,
+            )
+            self.memory_budget.register_cache(
+                _lazy.cache_name("unified_ast", self.file_cache),
+                self.file_cache.shrink_ast_cache,
+                _lazy.SHED_PRIORITY_AST,
+            )
 
         # Load configuration (simplified)
         self.config = self._load_config(config_path)
 
-        # Initialize core analyzers (always available)
+        # Import graph of the project being analyzed, fed with the detector pass's parsed trees
+        self._architecture: Optional["ArchitecturalAnalyzer"] = None
+
+        # Architecture components, core analyzers, optional integrations and
+        # helper classes are lazy properties: each is imported and built the
+        # first time an analysis path touches it.
+        logger.info("Unified Connascence Analyzer initialized (components load on first use)")
+
+    # ------------------------------------------------------------------
+    # Lazily constructed components
+    # ------------------------------------------------------------------
+
+    def _build_architecture_component(self, name: str, factory):
+        """Build an architecture component, returning None when unavailable."""
+        component_class = _lazy.get(name)
+        if component_class is None:
+            return None
         try:
-            self.ast_analyzer = ConnascenceASTAnalyzer()
-            self.god_object_orchestrator = GodObjectOrchestrator()  # Renamed for clarity
-            self.mece_analyzer = MECEAnalyzer()
+            return factory(component_class)
+        except Exception as e:
+            logger.warning(f"Architecture component {name} initialization failed: {e}")
+            return None
+
+    # New architecture components (NASA Rule 4 compliant)
+    # These delegate caching, metrics, reporting, and streaming to specialized components
+    @cached_property
+    def arch_cache_manager(self):
+        return self._build_architecture_component(
+            "CacheManager", lambda cls: cls(config={"max_memory": 100 * 1024 * 1024})
+        )
+
+    @cached_property
+    def arch_metrics_collector(self):
+        return self._build_architecture_component("MetricsCollector", lambda cls: cls())
+
+    @cached_property
+    def arch_report_generator(self):
+        return self._build_architecture_component("ReportGenerator", lambda cls: cls(config={"version": "1.0.0"}))
+
+    @cached_property
+    def arch_stream_processor(self):
+        return self._build_architecture_component(
+            "ArchStreamProcessor", lambda cls: cls(config=self.streaming_config or {})
+        )
+
+    # Phase 7: Coordinators for God Object decomposition
+    @cached_property
+    def monitoring_coordinator(self):
+        return self._build_architecture_component(
+            "MonitoringCoordinator",
+            lambda cls: cls(
+                config={},
+                memory_monitor=self.memory_monitor,
+                resource_manager=self.resource_manager,
+                file_cache=self.file_cache,
+            ),
+        )
+
+    @cached_property
+    def streaming_coordinator(self):
+        return self._build_architecture_component(
+            "StreamingCoordinator",
+            lambda cls: cls(
+                config=self.streaming_config or {},
+                stream_processor=self.stream_processor,
+                incremental_cache=self.incremental_cache,
+            ),
+        )
+
+    @cached_property
+    def result_builder(self):
+        return self._build_architecture_component("ResultBuilder", lambda cls: cls(config={}))
+
+    def _build_core_analyzer(self, name: str):
+        """Build a core analyzer (always available); failures are logged and re-raised."""
+        try:
+            return _lazy.get(name)()
         except Exception as e:
             error = self.error_handler.handle_exception(e, {"component": "core_analyzers"})
             self.error_handler.log_error(error)
             raise
 
-        # Initialize optional components
-        initializer = ComponentInitializer()
-        self.smart_engine = initializer.init_smart_engine()
-        self.failure_detector = initializer.init_failure_detector()
-        self.nasa_integration = initializer.init_nasa_integration()
-        self.policy_manager = initializer.init_policy_manager()
-        self.budget_tracker = initializer.init_budget_tracker()
+    @cached_property
+    def ast_analyzer(self):
+        return self._build_core_analyzer("ConnascenceASTAnalyzer")
 
-        # Initialize helper classes
-        self.metrics_calculator = MetricsCalculator()
-        self.recommendation_generator = RecommendationGenerator()
+    @cached_property
+    def god_object_orchestrator(self):
+        return self._build_core_analyzer("GodObjectOrchestrator")
 
-        components_loaded = ["AST Analyzer", "Orchestrator", "MECE Analyzer"]
-        if self.smart_engine:
-            components_loaded.append("Smart Engine")
-        if self.failure_detector:
-            components_loaded.append("Failure Detector")
-        if self.nasa_integration:
-            components_loaded.append("NASA Integration")
+    @cached_property
+    def mece_analyzer(self):
+        return self._build_core_analyzer("MECEAnalyzer")
+
+    # Optional components
+    @cached_property
+    def smart_engine(self):
+        return ComponentInitializer.init_smart_engine()
+
+    @cached_property
+    def failure_detector(self):
+        return ComponentInitializer.init_failure_detector()
+
+    @cached_property
+    def nasa_integration(self):
+        return ComponentInitializer.init_nasa_integration()
+
+    @cached_property
+    def policy_manager(self):
+        return ComponentInitializer.init_policy_manager()
+
+    @cached_property
+    def budget_tracker(self):
+        return ComponentInitializer.init_budget_tracker()
 
-        logger.info(f"Unified Connascence Analyzer initialized with: {', '.join(components_loaded)}")
+    # Helper classes
+    @cached_property
+    def metrics_calculator(self):
+        return MetricsCalculator()
+
+    @cached_property
+    def recommendation_generator(self):
+        return RecommendationGenerator()
 
     def analyze_project(
         self,
@@ -679,7 +648,7 @@ class UnifiedConnascenceAnalyzer:
             self._optimize_cache_for_future_runs()
 
         # Log memory and resource management reports
-        if ADVANCED_MONITORING_AVAILABLE:
+        if _lazy.available("monitoring"):
             self._log_comprehensive_monitoring_report()
 
         self._log_analysis_completion(result, analysis_time)
@@ -696,7 +665,7 @@ class UnifiedConnascenceAnalyzer:
                 project_path, self._analyze_project_batch, policy_preset, options
             )
         # Fallback: inline implementation (legacy support)
-        if not STREAMING_AVAILABLE or not self.stream_processor:
+        if not _lazy.available("streaming") or not self.stream_processor:
             logger.warning("Streaming mode requested but not available, falling back to batch")
             return self._analyze_project_batch(project_path, policy_preset, options)
 
@@ -727,7 +696,7 @@ class UnifiedConnascenceAnalyzer:
                 project_path, self._analyze_project_batch, policy_preset, options
             )
         # Fallback: inline implementation (legacy support)
-        if not STREAMING_AVAILABLE or not self.stream_processor:
+        if not _lazy.available("streaming") or not self.stream_processor:
             logger.warning("Hybrid mode requested but streaming not available, using batch only")
             return self._analyze_project_batch(project_path, policy_preset, options)
 
@@ -750,8 +719,10 @@ class UnifiedConnascenceAnalyzer:
         # Direct implementation since orchestrator_component is disabled
         logger.info("Running analysis phases with direct fallback implementation")
 
-        # Run AST analysis
+        # Run AST analysis; its parsed trees also update the cached import graph
+        self._architecture = self._build_architectural_analyzer(project_path)
         connascence_violations = self._run_ast_analysis(project_path)
+        connascence_violations.extend(self._run_architecture_analysis(project_path))
 
         # Run duplication analysis if MECE analyzer available
         duplication_violations = []
@@ -774,6 +745,30 @@ class UnifiedConnascenceAnalyzer:
 
         return {"connascence": connascence_violations, "duplication": duplication_violations, "nasa": nasa_violations}
 
+    def _build_architectural_analyzer(self, project_path: Path):
+        """Architectural analyzer for a project directory, persisting its import graph per project."""
+        if not project_path.is_dir():
+            return None
+        try:
+            return _lazy.ArchitecturalAnalyzer(
+                str(project_path), graph_cache=str(_lazy.default_graph_cache(project_path))
+            )
+        except Exception as e:
+            logger.warning(f"Architectural analyzer initialization failed: {e}")
+            return None
+
+    def _run_architecture_analysis(self, project_path: Path) -> List[Dict[str, Any]]:
+        """Detect cycles, layer and coupling issues; modules already parsed this run are not parsed again."""
+        architecture, self._architecture = self._architecture, None
+        if architecture is None:
+            return []
+        try:
+            results = architecture.analyze_directory(str(project_path))
+        except Exception as e:
+            logger.warning(f"Architecture analysis failed: {e}")
+            return []
+        return [self._violation_to_dict(v) for v in results]
+
     def _run_ast_analysis(self, project_path: Path) -> List[Dict[str, Any]]:
         """Run core AST analysis phases."""
         logger.info("Phase 1-2: Running core AST analysis with enhanced detectors")
@@ -808,57 +803,77 @@ class UnifiedConnascenceAnalyzer:
             self._batch_preload_files(python_files[:15])  # Pre-load top 15 files
 
         for py_file in python_files:
-            if self._should_analyze_file(py_file):
-                try:
-                    # Enhanced: Use cache with access pattern tracking
-                    if self.file_cache:
-                        source_code = self._get_cached_content_with_tracking(py_file)
-                        source_lines = self._get_cached_lines_with_tracking(py_file)
-                    else:
-                        with open(py_file, encoding="utf-8") as f:
-                            source_code = f.read()
-                            source_lines = source_code.splitlines()
-
-                    if not source_code:
-                        continue
+            if not self._should_analyze_file(py_file):
+                continue
+            try:
+                # Enhanced: Use cache with access pattern tracking
+                if self.file_cache:
+                    source_code = self._get_cached_content_with_tracking(py_file)
+                    source_lines = self._get_cached_lines_with_tracking(py_file)
+                else:
+                    with open(py_file, encoding="utf-8") as f:
+                        source_code = f.read()
+                        source_lines = source_code.splitlines()
+
+                if not source_code:
+                    continue
 
-                    # Enhanced: Use cached AST with intelligent fallback
-                    if self.file_cache:
-                        tree = self.file_cache.get_ast_tree(py_file)
-                        if tree:
-                            self._cache_stats["hits"] += 1
-                        else:
-                            self._cache_stats["misses"] += 1
+                # Enhanced: Use cached AST with intelligent fallback
+                if self.file_cache:
+                    tree = self.file_cache.get_ast_tree(py_file)
+                    if tree:
+                        self._cache_stats["hits"] += 1
                     else:
-                        try:
-                            tree = ast.parse(source_code)
-                        except SyntaxError:
-                            continue  # Skip files with syntax errors
+                        self._cache_stats["misses"] += 1
+                else:
+                    try:
+                        tree = ast.parse(source_code)
+                    except SyntaxError:
+                        continue  # Skip files with syntax errors
 
-                    if not tree:
-                        continue
+                if not tree:
+                    continue
+                if self._architecture is not None:
+                    self._architecture.update_module(str(py_file), source_code, tree)
 
+                # The parsed tree is already in live RSS; detection is admitted on its node count
+                with self._memory_admission(py_file, tree):
                     # Run RefactoredConnascenceDetector (includes all 5 specialized detectors)
-                    refactored_detector = RefactoredConnascenceDetector(str(py_file), source_lines)
+                    refactored_detector = _lazy.RefactoredConnascenceDetector(str(py_file), source_lines)
                     file_violations = refactored_detector.detect_all_violations(tree)
 
-                    # Convert violations to dict format
-                    refactored_violations.extend([self._violation_to_dict(v) for v in file_violations])
+                # Convert violations to dict format
+                refactored_violations.extend([self._violation_to_dict(v) for v in file_violations])
 
-                except Exception as e:
-                    logger.debug(f"Failed to analyze {py_file} with refactored detector: {e}")
-                    continue
+            except Exception as e:
+                logger.debug(f"Failed to analyze {py_file} with refactored detector: {e}")
+                continue
 
         logger.info(f"Found {len(refactored_violations)} violations from specialized detectors")
         return refactored_violations
 
+    def _memory_admission(self, py_file: Path, tree: Optional[ast.AST] = None):
+        """
+        Reserve the memory budget for one file; over budget, caches are shed before it runs.
+
+        The estimate uses the AST node count when the parsed tree is given, else the file size.
+        """
+        if not self.memory_budget:
+            return nullcontext()
+        try:
+            size = py_file.stat().st_size
+        except OSError:
+            size = 0
+        node_count = sum(1 for _ in ast.walk(tree)) if tree is not None else None
+        return self.memory_budget.admit(_lazy.estimate_file_cost_mb(size, node_count=node_count))
+
     def _run_ast_optimizer_analysis(self, project_path: Path) -> List[Dict[str, Any]]:
         """Run AST optimizer pattern analysis using ConnascencePatternOptimizer."""
         logger.info("Running AST optimizer connascence pattern analysis")
         optimizer_violations = []
 
         # Initialize AST optimizer
-        ast_optimizer = ConnascencePatternOptimizer()
+        ast_optimizer = _lazy.ConnascencePatternOptimizer()
 
         # Enhanced: Reuse prioritized Python files list for optimal cache benefits
         python_files = self._get_prioritized_python_files(project_path)
@@ -941,70 +956,48 @@ class UnifiedConnascenceAnalyzer:
             "caching": self.file_cache is not None,
         }
 
-    def _run_tree_sitter_nasa_analysis(self) -> List[Dict[str, Any]]:
+    def _run_tree_sitter_nasa_analysis(self, project_path: Optional[Path] = None) -> List[Dict[str, Any]]:
         """Run Tree-Sitter NASA rule analysis for goto, exec/eval, function pointer detection."""
         tree_sitter_violations = []
 
-        if not TreeSitterBackend or not LanguageSupport:
+        if not _lazy.TreeSitterBackend or not _lazy.LanguageSupport:
             return tree_sitter_violations
 
         try:
-            # Initialize Tree-Sitter backend
-            backend = TreeSitterBackend()
+            # Probe once in-process; workers build their own backend
+            backend = _lazy.TreeSitterBackend()
 
             if not backend.is_available():
                 logger.info("Tree-Sitter backend not fully available, skipping NASA rule detection")
                 return tree_sitter_violations
 
-            # Find source code files (Python, C, JavaScript)
-            project_path = Path(".")  # Placeholder - should be passed from context
-            language_files = {
-                LanguageSupport.PYTHON: list(project_path.rglob("*.py")),
-                LanguageSupport.C: list(project_path.rglob("*.c")) + list(project_path.rglob("*.h")),
-                LanguageSupport.JAVASCRIPT: list(project_path.rglob("*.js")) + list(project_path.rglob("*.ts")),
-            }
-
-            for language, files in language_files.items():
-                for file_path in files:
-                    if self._should_analyze_file(file_path):
-                        try:
-                            with open(file_path, encoding="utf-8") as f:
-                                source_code = f.read()
+            project_path = Path(project_path) if project_path is not None else Path(".")
+            supported = {language.value for language in backend.supported_languages()}
+            jobs = [
+                (str(file_path), language_value)
+                for file_path, language_value in _discover_tree_sitter_files(project_path, supported)
+                if self._should_analyze_file(file_path)
+            ]
 
-                            # Parse with Tree-Sitter
-                            parse_result = backend.parse(source_code, language)
-
-                            if parse_result.success and parse_result.ast:
-                                # Run NASA overlay validation
-                                validation_result = backend.validate(
-                                    source_code,
-                                    language,
-                                    overlay="nasa_c_safety" if language == LanguageSupport.C else "nasa_python_safety",
-                                )
-
-                                # Convert Tree-Sitter violations to standard format
-                                for violation in validation_result.overlay_violations:
-                                    tree_sitter_violation = {
-                                        "id": f"tree_sitter_{violation.get('rule', 'unknown')}_{violation.get('line', 0)}",
-                                        "rule_id": violation.get("rule", "nasa_tree_sitter"),
-                                        "type": violation.get("type", "nasa_compliance"),
-                                        "severity": violation.get("severity", "high"),
-                                        "description": violation.get("message", "NASA rule violation"),
-                                        "file_path": str(file_path),
-                                        "line_number": violation.get("line", 0),
-                                        "column": violation.get("column", 0),
-                                        "weight": self._severity_to_weight(violation.get("severity", "high")),
-                                        "context": {
-                                            "analysis_engine": "tree_sitter",
-                                            "language": language.value,
-                                            "nasa_rule": violation.get("rule", "unknown"),
-                                        },
-                                    }
-                                    tree_sitter_violations.append(tree_sitter_violation)
-
-                        except Exception as e:
-                            logger.debug(f"Failed Tree-Sitter analysis of {file_path}: {e}")
-                            continue
+            for file_path, language_value, violations in _run_tree_sitter_jobs(jobs):
+                for violation in violations:
+                    tree_sitter_violation = {
+                        "id": f"tree_sitter_{violation.get('rule', 'unknown')}_{violation.get('line', 0)}",
+                        "rule_id": violation.get("rule", "nasa_tree_sitter"),
+                        "type": violation.get("type", "nasa_compliance"),
+                        "severity": violation.get("severity", "high"),
+                        "description": violation.get("message", "NASA rule violation"),
+                        "file_path": file_path,
+                        "line_number": violation.get("line", 0),
+                        "column": violation.get("column", 0),
+                        "weight": self._severity_to_weight(violation.get("severity", "high")),
+                        "context": {
+                            "analysis_engine": "tree_sitter",
+                            "language": language_value,
+                            "nasa_rule": violation.get("rule", "unknown"),
+                        },
+                    }
+                    tree_sitter_violations.append(tree_sitter_violation)
 
         except Exception as e:
             logger.warning(f"Tree-Sitter NASA analysis failed: {e}")
@@ -1018,7 +1011,7 @@ class UnifiedConnascenceAnalyzer:
 
         try:
             # Initialize NASA analyzer
-            nasa_analyzer = NASAAnalyzer()
+            nasa_analyzer = _lazy.NASAAnalyzer()
 
             # Use provided project path or current directory
             if project_path is None:
@@ -1179,9 +1172,9 @@ class UnifiedConnascenceAnalyzer:
         nasa_violations.extend(dedicated_nasa_violations)
 
         # Also run Tree-Sitter NASA rule detection if available
-        if TreeSitterBackend and LanguageSupport:
+        if _lazy.TreeSitterBackend and _lazy.LanguageSupport:
             logger.info("Running Tree-Sitter NASA rule detection")
-            tree_sitter_violations = self._run_tree_sitter_nasa_analysis()
+            tree_sitter_violations = self._run_tree_sitter_nasa_analysis(project_path)
             nasa_violations.extend(tree_sitter_violations)
 
         if self.nasa_integration:
@@ -1455,13 +1448,13 @@ class UnifiedConnascenceAnalyzer:
         Setup memory monitoring and resource cleanup hooks.
         Delegates to MonitoringCoordinator if available (Phase 7 decomposition).
         """
-        # Phase 7: Delegate to MonitoringCoordinator if available
-        if hasattr(self, 'monitoring_coordinator') and self.monitoring_coordinator:
+        if not (self.memory_monitor and self.resource_manager):
+            return
+        # Phase 7: Delegate to MonitoringCoordinator; monitoring is on, so build it now
+        if self.monitoring_coordinator:
             self.monitoring_coordinator.setup_hooks()
             return
         # Fallback: inline implementation (legacy support)
-        if not (self.memory_monitor and self.resource_manager):
-            return
         self.memory_monitor.add_alert_callback(self._handle_memory_alert)
         self.memory_monitor.add_emergency_cleanup_callback(self._emergency_memory_cleanup)
         self.resource_manager.add_cleanup_hook(self._cleanup_analysis_resources)
@@ -1695,7 +1688,7 @@ class UnifiedConnascenceAnalyzer:
         """
         try:
             # Get global incremental cache instance
-            self.incremental_cache = get_global_incremental_cache()
+            self.incremental_cache = _lazy.get_global_incremental_cache()
 
             # Create analyzer factory for stream processor
             def analyzer_factory():
@@ -1712,7 +1705,7 @@ class UnifiedConnascenceAnalyzer:
             }
 
             # Create stream processor
-            self.stream_processor = create_stream_processor(analyzer_factory=analyzer_factory, **stream_config)
+            self.stream_processor = _lazy.create_stream_processor(analyzer_factory=analyzer_factory, **stream_config)
 
             # Setup streaming callbacks if configured
             if "result_callback" in self.streaming_config:
@@ -1789,7 +1782,7 @@ class UnifiedConnascenceAnalyzer:
         if hasattr(self, 'streaming_coordinator') and self.streaming_coordinator:
             return self.streaming_coordinator.get_streaming_stats()
         # Fallback: inline implementation (legacy support)
-        stats = {"streaming_available": STREAMING_AVAILABLE}
+        stats = {"streaming_available": _lazy.available("streaming")}
 
         if self.stream_processor:
             stats.update(self.stream_processor.get_stats())
@@ -1944,7 +1937,7 @@ class UnifiedConnascenceAnalyzer:
     def _get_nasa_analyzer(self):
         """Get NASA analyzer instance. NASA Rule 4 compliant."""
         try:
-            return NASAAnalyzer()
+            return _lazy.NASAAnalyzer()
         except Exception as e:
             logger.warning(f"Failed to initialize NASA analyzer: {e}")
             return None
@@ -2363,6 +2356,89 @@ class UnifiedConnascenceAnalyzer:
         return temp_handler.handle_exception(exception, context)
 
 
+# Tree-Sitter NASA pass: file suffix -> language, with fallbacks when a grammar is missing
+TREE_SITTER_SUFFIX_LANGUAGES = {
+    ".py": ("python",),
+    ".c": ("c",),
+    ".h": ("c",),
+    ".js": ("javascript",),
+    ".mjs": ("javascript",),
+    ".ts": ("typescript", "javascript"),
+    ".tsx": ("typescript", "javascript"),
+}
+TREE_SITTER_SKIP_DIRS = frozenset(
+    {"__pycache__", ".git", ".pytest_cache", ".mypy_cache", ".ruff_cache", ".tox", ".venv", "venv", "node_modules"}
+)
+# Below this many files the process pool costs more than it saves
+TREE_SITTER_PARALLEL_THRESHOLD = 16
+
+_worker_tree_sitter_backend = None
+
+
+def _discover_tree_sitter_files(project_path: Path, supported: set):
+    """Yield (file_path, language value) for Tree-Sitter analyzable files under project_path."""
+    import os
+
+    if project_path.is_file():
+        candidates = [project_path]
+    else:
+        candidates = []
+        for dirpath, dirnames, filenames in os.walk(project_path):
+            dirnames[:] = [name for name in dirnames if name not in TREE_SITTER_SKIP_DIRS]
+            candidates.extend(Path(dirpath) / filename for filename in filenames)
+
+    for file_path in sorted(candidates):
+        for language_value in TREE_SITTER_SUFFIX_LANGUAGES.get(file_path.suffix, ()):
+            if language_value in supported:
+                yield file_path, language_value
+                break
+
+
+def _tree_sitter_nasa_file(job):
+    """Parse one file once and run the NASA overlay on the resulting tree (process-pool worker)."""
+    global _worker_tree_sitter_backend
+    file_path, language_value = job
+
+    try:
+        if _worker_tree_sitter_backend is None:
+            _worker_tree_sitter_backend = _lazy.TreeSitterBackend({"tree_cache_size": 0})
+        backend = _worker_tree_sitter_backend
+        language = _lazy.LanguageSupport(language_value)
+
+        with open(file_path, encoding="utf-8") as f:
+            source_code = f.read()
+
+        parse_result = backend.parse(source_code, language)
+        if not parse_result.success or not parse_result.ast:
+            return file_path, language_value, []
+
+        overlay = "nasa_c_safety" if language == _lazy.LanguageSupport.C else "nasa_python_safety"
+        validation_result = backend.validate(source_code, language, overlay=overlay, parse_result=parse_result)
+        return file_path, language_value, validation_result.overlay_violations
+    except Exception as e:
+        logger.debug(f"Failed Tree-Sitter analysis of {file_path}: {e}")
+        return file_path, language_value, []
+
+
+def _run_tree_sitter_jobs(jobs: List[tuple]):
+    """Run Tree-Sitter NASA jobs, fanning out across processes for larger projects."""
+    import os
+
+    workers = min(os.cpu_count() or 1, len(jobs))
+    if workers <= 1 or len(jobs) < TREE_SITTER_PARALLEL_THRESHOLD:
+        return [_tree_sitter_nasa_file(job) for job in jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            return list(executor.map(_tree_sitter_nasa_file, jobs, chunksize=chunksize))
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Tree-Sitter process pool unavailable, running serially: {e}")
+        return [_tree_sitter_nasa_file(job) for job in jobs]
+
+
 def loadConnascenceSystem():
     """
     Entry point for VS Code extension integration.
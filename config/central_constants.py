@@ -299,6 +299,8 @@ class MCPConstants:
     TOOL_ANALYZE_WORKSPACE: Final[str] = "analyze_workspace"
     TOOL_GET_VIOLATIONS: Final[str] = "get_violations"
     TOOL_HEALTH_CHECK: Final[str] = "health_check"
+    TOOL_GET_WORKSPACE_RESULTS: Final[str] = "get_workspace_results"
+    TOOL_CANCEL_WORKSPACE_JOB: Final[str] = "cancel_workspace_job"
 
     # Default configurations
     DEFAULT_RATE_LIMIT: Final[int] = 60  # requests per minute
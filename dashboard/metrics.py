@@ -5,6 +5,11 @@ Historical Metrics and Trend Analysis for Connascence Safety Analyzer
 
 Tracks analysis results over time and generates trend dashboards
 for continuous monitoring of code quality metrics.
+
+Every run is appended to an append-only time series (``trends.tsdb``), which
+keeps the full history for trend directions; ``trends.json`` only keeps the
+latest entries shown in the dashboard table. Entries of a ``trends.json``
+written before the time series existed are imported on first use.
 """
 
 import argparse
@@ -14,6 +19,20 @@ from pathlib import Path
 import sys
 from typing import Any, Dict, List
 
+from analyzer.optimization.timeseries_store import TimeSeriesStore
+
+# Numeric metrics kept in the time series
+TREND_FIELDS = (
+    "nasa_score",
+    "nasa_violations",
+    "total_violations",
+    "critical_violations",
+    "god_objects",
+    "mece_score",
+    "mece_duplications",
+    "overall_quality",
+    "files_analyzed",
+)
 
 class MetricsTrendAnalyzer:
     """Analyzes and tracks metrics trends over time."""
@@ -22,7 +41,26 @@ class MetricsTrendAnalyzer:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
         self.trends_file = self.storage_dir / "trends.json"
+        self.store = TimeSeriesStore(self.storage_dir, "trends", TREND_FIELDS)
         self.current_metrics = {}
+        if not len(self.store) and self.trends_file.exists():
+            self._import_legacy_entries()
+
+    def _import_legacy_entries(self) -> None:
+        """Copy the entries of a pre-store ``trends.json`` into the time series."""
+        entries = []
+        for entry in self.load_historical_data().get("entries", []):
+            try:
+                stamp = datetime.fromisoformat(entry["timestamp"].replace("Z", "+00:00")).timestamp()
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+            entries.append((stamp, entry))
+
+        entries.sort(key=lambda item: item[0])
+        for stamp, entry in entries:
+            self.store.append({field: entry.get(field) or 0 for field in TREND_FIELDS}, timestamp=stamp)
+        if entries:
+            print(f"✅ Imported {len(entries)} historical entries from {self.trends_file}")
 
     def load_historical_data(self) -> Dict[str, Any]:
         """Load historical metrics data."""
@@ -117,7 +155,8 @@ class MetricsTrendAnalyzer:
         current_metrics = self.extract_metrics_from_results(nasa_results, connascence_results, mece_results)
         current_metrics["commit_sha"] = commit_sha
 
-        # Add to historical data
+        # Append to the full history, then to the table entries
+        self.store.append({field: current_metrics.get(field) or 0 for field in TREND_FIELDS})
         historical_data["entries"].append(current_metrics)
         historical_data["metadata"]["last_updated"] = datetime.now().isoformat()
 
@@ -184,11 +223,13 @@ class MetricsTrendAnalyzer:
             print("⚠️ No data in specified date range, using all available data...")
             filtered_entries = entries[-min(30, len(entries)) :]  # Last 30 entries
 
-        # Calculate trends
-        nasa_scores = [e.get("nasa_score", 0) for e in filtered_entries]
-        critical_violations = [e.get("critical_violations", 0) for e in filtered_entries]
-        total_violations = [e.get("total_violations", 0) for e in filtered_entries]
-        mece_scores = [e.get("mece_score", 0) for e in filtered_entries]
+        # Calculate trends from the time series window when it has data
+        window = [values for _, values in self.store.records(since=cutoff_date.timestamp())]
+        trend_entries = window or filtered_entries
+        nasa_scores = [e.get("nasa_score", 0) for e in trend_entries]
+        critical_violations = [e.get("critical_violations", 0) for e in trend_entries]
+        total_violations = [e.get("total_violations", 0) for e in trend_entries]
+        mece_scores = [e.get("mece_score", 0) for e in trend_entries]
 
         trends = {
             "nasa_score": self.calculate_trend_direction(nasa_scores),
@@ -19,15 +19,22 @@ working directly with AST structures and validating results through grammar.
 Integrates with Refactoring.Guru techniques for systematic code improvements.
 """
 
+import bisect
 from dataclasses import dataclass
+import difflib
 from enum import Enum
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .backends.tree_sitter_backend import LanguageSupport, NodeInfo, TreeSitterBackend
 from .overlay_manager import OverlayManager
 
 
+# Replaced blocks up to this size are diffed per character so that edits on
+# the same line (two magic numbers, say) do not conflict
+_CHAR_DIFF_LIMIT = 2000
+
+
 class RefactoringTechnique(Enum):
     """Canonical refactoring techniques from Refactoring.Guru."""
 
@@ -93,6 +100,15 @@ class RefactoringCandidate:
             self.ast_nodes = []
 
 
+@dataclass
+class TextEdit:
+    """Replacement of ``original[start:end]``, with offsets into the original source."""
+
+    start: int
+    end: int
+    replacement: str
+
+
 @dataclass
 class RefactoringResult:
     """Result of applying a refactoring."""
@@ -220,40 +236,57 @@ class ASTSafeRefactoring:
     def batch_apply_refactorings(
         self, candidates: List[RefactoringCandidate], code: str, language: LanguageSupport
     ) -> RefactoringResult:
-        """Apply multiple refactorings in dependency order."""
-        current_code = code
-        all_changes = []
-        all_warnings = []
+        """Apply multiple refactorings in dependency order.
+
+        Every candidate is computed against the original source and turned into
+        text edits. Candidates whose edits overlap an earlier candidate's are
+        skipped with a warning. The rest are applied in one pass and validated
+        once. Only when that validation fails are the candidates bisected to
+        find the ones that break the result.
+        """
+        errors = []
+        warnings = []
+        failed_technique = None
+        planned: List[Tuple[RefactoringCandidate, List[TextEdit]]] = []
+        claimed: List[Tuple[int, int]] = []
+
+        # Sort candidates by dependency and safety impact; earlier ones win conflicts
+        for candidate in self._sort_candidates_by_dependency(candidates):
+            handler = self._technique_handlers.get(candidate.technique)
+            if handler is None:
+                errors.append(f"Technique {candidate.technique.value} not implemented")
+                failed_technique = failed_technique or candidate.technique
+                continue
+            try:
+                edits = self._compute_edits(code, handler(code, candidate, language))
+            except Exception as e:
+                errors.append(f"Refactoring failed: {e!s}")
+                failed_technique = failed_technique or candidate.technique
+                continue
 
-        # Sort candidates by dependency and safety impact
-        sorted_candidates = self._sort_candidates_by_dependency(candidates)
+            if not edits:
+                continue
+            if any(self._overlaps_claimed(edit, claimed) for edit in edits):
+                warnings.append(f"Skipped conflicting refactoring: {candidate.description}")
+                continue
 
-        for candidate in sorted_candidates:
-            result = self.apply_refactoring(candidate, current_code, language)
+            for edit in edits:
+                bisect.insort(claimed, (edit.start, edit.end))
+            planned.append((candidate, edits))
 
-            if result.success:
-                current_code = result.refactored_code
-                all_changes.extend(result.changes_applied)
-                all_warnings.extend(result.warnings)
-            else:
-                # Stop on first failure to maintain consistency
-                return RefactoringResult(
-                    success=False,
-                    technique=candidate.technique,
-                    original_code=code,
-                    refactored_code=current_code,
-                    changes_applied=all_changes,
-                    validation_errors=result.validation_errors,
-                    warnings=all_warnings,
-                )
+        accepted, rejected, validation = self._validate_batch(code, planned, language)
+        for candidate, candidate_errors in rejected:
+            errors.extend(candidate_errors)
+            failed_technique = failed_technique or candidate.technique
 
         return RefactoringResult(
-            success=True,
-            technique=RefactoringTechnique.EXTRACT_METHOD,  # Representative
+            success=not errors,
+            technique=failed_technique or RefactoringTechnique.EXTRACT_METHOD,  # Representative
             original_code=code,
-            refactored_code=current_code,
-            changes_applied=all_changes,
-            warnings=all_warnings,
+            refactored_code=self._apply_edits(code, accepted),
+            changes_applied=validation.get("changes", []),
+            validation_errors=errors,
+            warnings=warnings + validation.get("warnings", []),
         )
 
     def _initialize_handlers(self):
@@ -630,6 +663,105 @@ class FunctionParameters:
 
         return {"success": True, "errors": errors, "warnings": warnings, "changes": changes}
 
+    def _compute_edits(self, original: str, refactored: str) -> List[TextEdit]:
+        """Express a handler's output as non-overlapping edits of the original source."""
+        if refactored == original:
+            return []
+
+        original_lines = original.splitlines(keepends=True)
+        refactored_lines = refactored.splitlines(keepends=True)
+        original_offsets = [0]
+        for line in original_lines:
+            original_offsets.append(original_offsets[-1] + len(line))
+        refactored_offsets = [0]
+        for line in refactored_lines:
+            refactored_offsets.append(refactored_offsets[-1] + len(line))
+
+        edits = []
+        matcher = difflib.SequenceMatcher(None, original_lines, refactored_lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            start, end = original_offsets[i1], original_offsets[i2]
+            replacement = refactored[refactored_offsets[j1] : refactored_offsets[j2]]
+
+            if tag == "replace" and end - start + len(replacement) <= _CHAR_DIFF_LIMIT:
+                block = original[start:end]
+                chars = difflib.SequenceMatcher(None, block, replacement, autojunk=False)
+                for char_tag, a1, a2, b1, b2 in chars.get_opcodes():
+                    if char_tag != "equal":
+                        edits.append(TextEdit(start + a1, start + a2, replacement[b1:b2]))
+            else:
+                edits.append(TextEdit(start, end, replacement))
+
+        return edits
+
+    def _overlaps_claimed(self, edit: TextEdit, claimed: List[Tuple[int, int]]) -> bool:
+        """Check an edit against already claimed, mutually compatible ranges.
+
+        Ranges conflict when they share characters or when an insertion falls
+        strictly inside a replaced range. Insertions at the same offset do not
+        conflict; they are applied in candidate order. Compatible ranges sorted
+        by start also have sorted ends, so only one neighbour needs checking.
+        """
+        position = bisect.bisect_left(claimed, (edit.end,))
+        return position > 0 and claimed[position - 1][1] > edit.start
+
+    def _apply_edits(self, code: str, planned: List[Tuple[RefactoringCandidate, List[TextEdit]]]) -> str:
+        """Apply the edits of several candidates to the original source in one pass."""
+        ordered = sorted(
+            (edit.start, edit.end, order, edit.replacement)
+            for order, (_, edits) in enumerate(planned)
+            for edit in edits
+        )
+        pieces = []
+        cursor = 0
+        for start, end, _, replacement in ordered:
+            pieces.append(code[cursor:start])
+            pieces.append(replacement)
+            cursor = end
+        pieces.append(code[cursor:])
+        return "".join(pieces)
+
+    def _validate_batch(
+        self, code: str, planned: List[Tuple[RefactoringCandidate, List[TextEdit]]], language: LanguageSupport
+    ) -> Tuple[List[Tuple[RefactoringCandidate, List[TextEdit]]], List[Tuple[RefactoringCandidate, List[str]]], Dict]:
+        """Validate all planned candidates at once, bisecting only if the combined result fails.
+
+        Returns the accepted candidates, the rejected ones with their errors and
+        the validation of the accepted result.
+        """
+        accepted = []
+        rejected = []
+        validation: Dict[str, Any] = {}
+        if not planned:
+            return accepted, rejected, validation
+
+        def settle(pending, known_invalid=False):
+            nonlocal validation
+            if not known_invalid:
+                trial = self._apply_edits(code, accepted + pending)
+                result = self._validate_refactoring_result(code, trial, language, True)
+                if result["success"]:
+                    accepted.extend(pending)
+                    validation = result
+                    return
+                if len(pending) == 1:
+                    rejected.append((pending[0][0], result.get("errors", [])))
+                    return
+            middle = len(pending) // 2
+            settle(pending[:middle])
+            settle(pending[middle:])
+
+        combined = self._validate_refactoring_result(code, self._apply_edits(code, planned), language, True)
+        if combined["success"]:
+            return list(planned), rejected, combined
+        if len(planned) == 1:
+            return accepted, [(planned[0][0], combined.get("errors", []))], validation
+
+        settle(planned, known_invalid=True)
+        return accepted, rejected, validation
+
     def _sort_candidates_by_dependency(self, candidates: List[RefactoringCandidate]) -> List[RefactoringCandidate]:
         """Sort refactoring candidates by dependency order."""
         # Simple sorting by safety impact and effort
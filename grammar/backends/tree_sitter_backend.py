@@ -24,9 +24,11 @@ This backend enables:
 - Grammar overlay enforcement
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
 
 from fixes.phase0.production_safe_assertions import ProductionAssert
 
@@ -156,6 +158,12 @@ class TreeSitterBackend:
         self._languages: Dict[LanguageSupport, Language] = {}
         self._grammar_cache: Dict[str, Dict] = {}
 
+        # Parse results keyed by (language, content hash), LRU-bounded
+        self._tree_cache: "OrderedDict[Tuple[LanguageSupport, str], ParseResult]" = OrderedDict()
+        self._tree_cache_size = self.config.get("tree_cache_size", 256)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
         # Initialize supported languages
         self._initialize_languages()
 
@@ -174,10 +182,36 @@ class TreeSitterBackend:
         return list(self._parsers.keys())
 
     def parse(self, code: str, language: LanguageSupport) -> ParseResult:
-        """Parse code using tree-sitter."""
+        """Parse code using tree-sitter (cached by content hash)."""
         if language not in self._parsers:
             return ParseResult(success=False, errors=[{"message": f"Language {language.value} not supported"}])
 
+        cache_key = (language, hashlib.sha256(code.encode("utf8")).hexdigest())
+        cached = self._tree_cache.get(cache_key)
+        if cached is not None:
+            self._tree_cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        result = self._parse_uncached(code, language)
+        self._remember(cache_key, result)
+        return result
+
+    def _remember(self, cache_key: Tuple[LanguageSupport, str], result: ParseResult) -> None:
+        """Store a parse result in the LRU tree cache."""
+        if self._tree_cache_size <= 0:
+            return
+        self._tree_cache[cache_key] = result
+        self._tree_cache.move_to_end(cache_key)
+        while len(self._tree_cache) > self._tree_cache_size:
+            self._tree_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop cached parse results."""
+        self._tree_cache.clear()
+
+    def _parse_uncached(self, code: str, language: LanguageSupport) -> ParseResult:
         import time
 
         start_time = time.time()
@@ -211,9 +245,20 @@ class TreeSitterBackend:
                 parsing_time_ms=(time.time() - start_time) * 1000,
             )
 
-    def validate(self, code: str, language: LanguageSupport, overlay: Optional[str] = None) -> ValidationResult:
-        """Validate code against grammar and optional overlay."""
-        parse_result = self.parse(code, language)
+    def validate(
+        self,
+        code: str,
+        language: LanguageSupport,
+        overlay: Optional[str] = None,
+        parse_result: Optional[ParseResult] = None,
+    ) -> ValidationResult:
+        """Validate code against grammar and optional overlay.
+
+        Pass ``parse_result`` when the caller already parsed ``code`` to avoid
+        parsing it a second time.
+        """
+        if parse_result is None:
+            parse_result = self.parse(code, language)
 
         if not parse_result.success:
             return ValidationResult(valid=False, violations=[{"type": "parse_error", "errors": parse_result.errors}])
@@ -233,6 +278,14 @@ class TreeSitterBackend:
             overlay_violations=overlay_violations,
         )
 
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get tree cache statistics."""
+        return {
+            "entries": len(self._tree_cache),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+        }
+
     def get_next_tokens(self, prefix: str, language: LanguageSupport, overlay: Optional[str] = None) -> List[str]:
         """Get valid next tokens for constrained generation."""
         # This would implement constrained decoding by:
@@ -367,7 +420,7 @@ class TreeSitterBackend:
     def _initialize_languages(self):
         """Initialize tree-sitter parsers for supported languages."""
         # Load real tree-sitter language grammars
-        supported = [LanguageSupport.C, LanguageSupport.PYTHON, LanguageSupport.JAVASCRIPT]
+        supported = [LanguageSupport.C, LanguageSupport.PYTHON, LanguageSupport.JAVASCRIPT, LanguageSupport.TYPESCRIPT]
 
         for lang in supported:
             try:
@@ -427,9 +480,11 @@ class TreeSitterBackend:
                 )
 
             for child in node.children:
-                find_errors(child)
+                # Skip error-free subtrees entirely
+                if getattr(child, "has_error", True):
+                    find_errors(child)
 
-        if ast and TREE_SITTER_AVAILABLE:
+        if ast and TREE_SITTER_AVAILABLE and getattr(ast, "has_error", True):
             find_errors(ast)
 
         return errors
@@ -17,19 +17,31 @@ Grammar Overlay Manager
 Manages grammar overlays that restrict language features for safety profiles.
 Overlays can ban constructs (like goto), limit complexity, or enforce patterns
 required by safety standards like General Safety Standards.
+
+Overlays are compiled once into a node-type dispatch table, so validating a
+tree is a single walk over its nodes regardless of how many rules apply.
+Compiled overlays are cached until an overlay file changes on disk; the
+overlay directory is checked for changes at most once per
+``reload_check_interval`` seconds, or immediately through ``reload()``.
+
+Pattern rules report a violation on every node of their ``node_types``
+whose text matches the rule's ``regex``.
 """
 
-from dataclasses import dataclass
-import functools
+from dataclasses import dataclass, field
 import json
-import operator
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+import re
+import time
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
 
 import yaml
 
 from .backends.tree_sitter_backend import LanguageSupport
 
+# Minimum seconds between checks of the overlay directory for changed files
+RELOAD_CHECK_INTERVAL_SECONDS = 2.0
+
 
 @dataclass
 class OverlayRule:
@@ -67,13 +79,42 @@ class GrammarOverlay:
             self.metadata = {}
 
 
+@dataclass
+class CompiledOverlay:
+    """An overlay with inheritance resolved and rules indexed by AST node type."""
+
+    overlay_id: str
+    rules: List[OverlayRule]
+    dispatch: Dict[str, List[Tuple[OverlayRule, Optional[Pattern]]]] = field(default_factory=dict)
+    banned: Set[str] = field(default_factory=set)
+    limits: Dict[str, int] = field(default_factory=dict)
+
+
 class OverlayManager:
     """Manages grammar overlays for safety and quality enforcement."""
 
-    def __init__(self, overlay_directory: Optional[Path] = None):
+    OVERLAY_FILE_PATTERNS = ("*.yml", "*.json")
+
+    def __init__(
+        self,
+        overlay_directory: Optional[Path] = None,
+        reload_check_interval: float = RELOAD_CHECK_INTERVAL_SECONDS,
+    ):
+        """
+        Load built-in and file overlays.
+
+        Args:
+            overlay_directory: Directory of ``*.yml``/``*.json`` overlays
+            reload_check_interval: Minimum seconds between checks for changed
+                overlay files (0 checks on every compile)
+        """
         self.overlay_directory = overlay_directory or Path(__file__).parent / "overlays"
+        self.reload_check_interval = reload_check_interval
         self._overlays: Dict[str, GrammarOverlay] = {}
-        self._rule_cache: Dict[str, Dict[str, List[OverlayRule]]] = {}
+        self._compiled: Dict[str, CompiledOverlay] = {}
+        self._file_overlay_ids: Set[str] = set()
+        self._files_signature: Tuple = ()
+        self._next_reload_check = time.monotonic() + reload_check_interval
 
         # Initialize built-in overlays
         self._load_builtin_overlays()
@@ -81,6 +122,7 @@ class OverlayManager:
         # Load external overlays if directory exists
         if self.overlay_directory.exists():
             self._load_external_overlays()
+        self._files_signature = self._overlay_files_signature()
 
     def get_overlay(self, overlay_id: str) -> Optional[GrammarOverlay]:
         """Get overlay by ID."""
@@ -94,63 +136,84 @@ class OverlayManager:
         return [overlay_id for overlay_id, overlay in self._overlays.items() if overlay.language == language]
 
     def get_rules_for_overlay(self, overlay_id: str) -> List[OverlayRule]:
-        """Get all rules for an overlay, including inherited rules."""
-        if overlay_id not in self._overlays:
-            return []
-
-        # Use cache if available
-        if overlay_id in self._rule_cache:
-            return functools.reduce(operator.iadd, self._rule_cache[overlay_id].values(), [])
-
-        overlay = self._overlays[overlay_id]
-        all_rules = []
-
-        # Collect inherited rules first
-        for parent_id in overlay.inherits:
-            parent_rules = self.get_rules_for_overlay(parent_id)
-            all_rules.extend(parent_rules)
+        """Get all rules for an overlay, including inherited rules.
 
-        # Add overlay's own rules
-        all_rules.extend(overlay.rules)
-
-        # Cache the result
-        self._rule_cache[overlay_id] = {"all": all_rules}
-
-        return all_rules
+        The list is shared with the compiled overlay and must not be modified.
+        """
+        compiled = self.compile_overlay(overlay_id)
+        return compiled.rules if compiled else []
 
     def get_banned_constructs(self, overlay_id: str) -> Set[str]:
         """Get set of banned constructs for overlay."""
-        rules = self.get_rules_for_overlay(overlay_id)
-        banned = set()
-
-        for rule in rules:
-            if rule.rule_type == "ban":
-                banned.add(rule.target)
-
-        return banned
+        compiled = self.compile_overlay(overlay_id)
+        return set(compiled.banned) if compiled else set()
 
     def get_complexity_limits(self, overlay_id: str) -> Dict[str, int]:
         """Get complexity limits defined by overlay."""
-        rules = self.get_rules_for_overlay(overlay_id)
-        limits = {}
+        compiled = self.compile_overlay(overlay_id)
+        return dict(compiled.limits) if compiled else {}
 
-        for rule in rules:
-            if rule.rule_type == "limit" and "max_value" in rule.parameters:
-                limits[rule.target] = rule.parameters["max_value"]
+    def compile_overlay(self, overlay_id: str) -> Optional[CompiledOverlay]:
+        """Get the compiled form of an overlay, compiling it on first use."""
+        self._reload_if_changed()
+        if overlay_id not in self._overlays:
+            return None
+
+        compiled = self._compiled.get(overlay_id)
+        if compiled is None:
+            compiled = self._compile(overlay_id)
+            self._compiled[overlay_id] = compiled
+        return compiled
+
+    def reload(self) -> bool:
+        """
+        Check the overlay directory now instead of waiting for the next interval.
+
+        Returns:
+            True when overlay files changed and were reloaded
+        """
+        self._next_reload_check = time.monotonic() + self.reload_check_interval
+        signature = self._overlay_files_signature()
+        if signature == self._files_signature:
+            return False
+
+        # Files may have been removed or may have shadowed a built-in overlay
+        for overlay_id in self._file_overlay_ids:
+            self._overlays.pop(overlay_id, None)
+        self._file_overlay_ids.clear()
+        self._load_builtin_overlays()
+        self._load_external_overlays()
 
-        return limits
+        self._files_signature = signature
+        self._compiled.clear()
+        return True
 
     def validate_code_against_overlay(self, ast_nodes: List[Any], overlay_id: str) -> List[Dict[str, Any]]:
-        """Validate AST nodes against overlay rules."""
-        if overlay_id not in self._overlays:
+        """Validate AST nodes and their descendants against overlay rules in one pass."""
+        compiled = self.compile_overlay(overlay_id)
+        if compiled is None:
             return [{"error": f"Overlay {overlay_id} not found"}]
 
         violations = []
-        rules = self.get_rules_for_overlay(overlay_id)
+        dispatch = compiled.dispatch
+        if not dispatch:
+            return violations
+
+        stack = list(reversed(ast_nodes))
+        while stack:
+            node = stack.pop()
+            node_type = getattr(node, "type", None)
+            if node_type is None:
+                continue
 
-        for rule in rules:
-            rule_violations = self._check_rule_against_nodes(rule, ast_nodes)
-            violations.extend(rule_violations)
+            for rule, regex in dispatch.get(node_type, ()):
+                violation = self._check_rule_against_node(rule, node, regex)
+                if violation:
+                    violations.append(violation)
+
+            children = getattr(node, "children", None)
+            if children:
+                stack.extend(reversed(children))
 
         return violations
 
@@ -161,8 +224,8 @@ class OverlayManager:
 
         self._overlays[overlay.id] = overlay
 
-        # Clear cache since we have a new overlay
-        self._rule_cache.clear()
+        # Overlays may inherit from the new one; recompile on next use
+        self._compiled.clear()
 
         return True
 
@@ -321,22 +384,69 @@ class OverlayManager:
         if not self.overlay_directory.exists():
             return
 
-        for file_path in self.overlay_directory.glob("*.yml"):
-            try:
-                overlay = self._load_overlay_from_file(file_path)
-                if overlay:
-                    self._overlays[overlay.id] = overlay
-            except Exception:
-                # Skip invalid overlay files
-                continue
+        for pattern in self.OVERLAY_FILE_PATTERNS:
+            for file_path in self.overlay_directory.glob(pattern):
+                try:
+                    overlay = self._load_overlay_from_file(file_path)
+                    if overlay:
+                        self._overlays[overlay.id] = overlay
+                        self._file_overlay_ids.add(overlay.id)
+                except Exception:
+                    # Skip invalid overlay files
+                    continue
+
+    def _overlay_files_signature(self) -> Tuple:
+        """Name, modification time and size of every overlay file."""
+        if not self.overlay_directory.exists():
+            return ()
+
+        signature = []
+        for pattern in self.OVERLAY_FILE_PATTERNS:
+            for file_path in self.overlay_directory.glob(pattern):
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                signature.append((file_path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(signature))
+
+    def _reload_if_changed(self):
+        """Reload file overlays when they changed, checking at most once per interval."""
+        if time.monotonic() >= self._next_reload_check:
+            self.reload()
+
+    def _compile(self, overlay_id: str, visiting: Optional[Set[str]] = None) -> CompiledOverlay:
+        """Resolve inheritance and build the node-type dispatch table for an overlay."""
+        visiting = visiting or set()
+        visiting.add(overlay_id)
+        overlay = self._overlays[overlay_id]
+        rules = []
 
-        for file_path in self.overlay_directory.glob("*.json"):
-            try:
-                overlay = self._load_overlay_from_file(file_path)
-                if overlay:
-                    self._overlays[overlay.id] = overlay
-            except Exception:
-                continue
+        # Collect inherited rules first; unknown or cyclic parents are skipped
+        for parent_id in overlay.inherits:
+            if parent_id in self._overlays and parent_id not in visiting:
+                rules.extend(self._compile(parent_id, visiting).rules)
+
+        # Add overlay's own rules
+        rules.extend(overlay.rules)
+
+        compiled = CompiledOverlay(overlay_id=overlay_id, rules=rules)
+        for rule in rules:
+            if rule.rule_type == "ban":
+                compiled.banned.add(rule.target)
+                compiled.dispatch.setdefault(rule.target, []).append((rule, None))
+            elif rule.rule_type == "limit" and "max_value" in rule.parameters:
+                compiled.limits[rule.target] = rule.parameters["max_value"]
+            elif rule.rule_type == "pattern" and rule.parameters.get("regex"):
+                try:
+                    regex = re.compile(rule.parameters["regex"])
+                except re.error:
+                    # Skip rules with invalid expressions
+                    continue
+                for node_type in rule.parameters.get("node_types", [rule.target]):
+                    compiled.dispatch.setdefault(node_type, []).append((rule, regex))
+
+        return compiled
 
     def _load_overlay_from_file(self, file_path: Path) -> Optional[GrammarOverlay]:
         """Load overlay from YAML or JSON file."""
@@ -398,36 +508,29 @@ class OverlayManager:
             "metadata": overlay.metadata,
         }
 
-    def _check_rule_against_nodes(self, rule: OverlayRule, ast_nodes: List[Any]) -> List[Dict[str, Any]]:
-        """Check a single rule against AST nodes."""
-        violations = []
-
-        for node in ast_nodes:
-            violation = self._check_rule_against_node(rule, node)
-            if violation:
-                violations.append(violation)
-
-        return violations
-
-    def _check_rule_against_node(self, rule: OverlayRule, node: Any) -> Optional[Dict[str, Any]]:
-        """Check rule against a single AST node."""
-        # This would implement specific rule checking logic
-        # For now, we'll do basic pattern matching
-
-        if not hasattr(node, "type"):
+    def _check_rule_against_node(
+        self, rule: OverlayRule, node: Any, regex: Optional[Pattern] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Check a rule dispatched on the node's type against that node."""
+        if rule.rule_type == "ban":
+            message = f"Banned construct: {rule.target}"
+        elif regex is not None:
+            text = getattr(node, "text", b"") or b""
+            if isinstance(text, bytes):
+                text = text.decode("utf-8", errors="replace")
+            if not regex.search(text):
+                return None
+            message = rule.parameters.get("message", f"Pattern violation: {rule.target}")
+        else:
             return None
 
-        if rule.rule_type == "ban" and node.type == rule.target:
-            return {
-                "rule_id": rule.id,
-                "rule_name": rule.name,
-                "severity": rule.severity,
-                "message": f"Banned construct: {rule.target}",
-                "line": getattr(node, "start_point", (0, 0))[0] + 1,
-                "column": getattr(node, "start_point", (0, 0))[1],
-                "type": "overlay_violation",
-            }
-
-        # Add more rule checking logic here
-
-        return None
+        start_point = getattr(node, "start_point", (0, 0))
+        return {
+            "rule_id": rule.id,
+            "rule_name": rule.name,
+            "severity": rule.severity,
+            "message": message,
+            "line": start_point[0] + 1,
+            "column": start_point[1],
+            "type": "overlay_violation",
+        }
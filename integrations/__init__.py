@@ -43,6 +43,7 @@ try:
         create_all_integrations,
         get_available_integrations,
     )
+    from .batch_executor import BatchToolExecutor, ToolResultCache
     from .tool_coordinator import ToolCoordinator
     from .unified_base import IntegrationResult, IntegrationType, UnifiedBaseIntegration
 except ImportError as e:
@@ -84,6 +85,8 @@ BaseIntegration = UnifiedBaseIntegration  # Legacy alias
 __all__ = [
     "INTEGRATION_REGISTRY",
     "BanditIntegration",
+    # Batched execution
+    "BatchToolExecutor",
     # Legacy compatibility
     "BaseIntegration",
     # Specific integrations
@@ -93,6 +96,7 @@ __all__ = [
     "MyPyIntegration",
     "RadonIntegration",
     "RuffIntegration",
+    "ToolResultCache",
     # Coordination
     "ToolCoordinator",
     # New consolidated architecture
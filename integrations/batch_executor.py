@@ -0,0 +1,391 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+
+"""
+Batched External Tool Execution
+===============================
+
+Runs external tools (pylint, mypy, ruff, ...) over many files per invocation
+instead of spawning one subprocess per file, executes the invocations
+concurrently under a CPU budget and splits the combined output back into
+per-file results.
+
+Per-file results are cached on disk, keyed by file content hash, tool name,
+tool version and tool configuration hash, so warm runs only hand changed
+files to the external tool.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import subprocess
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from config.central_constants import ExitCode, PerformanceLimits
+
+if TYPE_CHECKING:
+    from .unified_base import IntegrationResult, UnifiedBaseIntegration
+
+logger = logging.getLogger(__name__)
+
+# Conservative argv budget: Windows caps the command line at 32767 chars and
+# some POSIX systems limit a single argv string set well below ARG_MAX.
+DEFAULT_MAX_ARGV_CHARS = 30000
+DEFAULT_MAX_FILES_PER_INVOCATION = 500
+DEFAULT_CACHE_DIR = ".connascence_cache/tools"
+
+
+def hash_file_content(file_path: Union[str, Path]) -> Optional[str]:
+    """Return the SHA-256 hex digest of a file's bytes, or None if unreadable."""
+    try:
+        with open(file_path, "rb") as handle:
+            return hashlib.sha256(handle.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def hash_tool_config(config: Dict[str, Any], additional_args: Optional[Sequence[str]] = None) -> str:
+    """Return a stable hash of a tool's configuration and extra arguments."""
+    payload = json.dumps({"config": config, "args": list(additional_args or [])}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ToolResultCache:
+    """
+    On-disk cache of per-file tool results.
+
+    Entries are JSON files sharded by key prefix under ``cache_dir/<tool>/``.
+    The key combines file content hash, tool name, tool version and tool
+    configuration hash, so editing a file, upgrading the tool or changing its
+    configuration all miss naturally without explicit invalidation.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(content_hash: str, tool_name: str, tool_version: str, config_hash: str) -> str:
+        """Combine the cache key components into a single digest."""
+        raw = f"{tool_name}\0{tool_version}\0{config_hash}\0{content_hash}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, tool_name: str, key: str) -> Path:
+        return self.cache_dir / tool_name / key[:2] / f"{key}.json"
+
+    def get(self, tool_name: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result payload, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        entry_path = self._entry_path(tool_name, key)
+        try:
+            with open(entry_path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return payload
+
+    def put(self, tool_name: str, key: str, payload: Dict[str, Any]) -> None:
+        """Store a result payload atomically (write to temp file, then rename)."""
+        if not self.enabled:
+            return
+
+        entry_path = self._entry_path(tool_name, key)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.debug(f"Failed to write tool cache entry {entry_path}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "cache_dir": str(self.cache_dir),
+        }
+
+
+def chunk_files_for_argv(
+    file_paths: Sequence[str],
+    base_argv_chars: int,
+    max_argv_chars: int = DEFAULT_MAX_ARGV_CHARS,
+    max_files: int = DEFAULT_MAX_FILES_PER_INVOCATION,
+) -> List[List[str]]:
+    """
+    Split files into invocation chunks bounded by command-line length.
+
+    Args:
+        file_paths: Files to distribute
+        base_argv_chars: Characters already used by the tool command and flags
+        max_argv_chars: Upper bound on the total command-line length
+        max_files: Upper bound on files per invocation
+
+    Returns:
+        List of file chunks; a single over-long path still gets its own chunk
+    """
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    current_chars = base_argv_chars
+
+    for path in file_paths:
+        cost = len(path) + 1
+        if current and (current_chars + cost > max_argv_chars or len(current) >= max_files):
+            chunks.append(current)
+            current = []
+            current_chars = base_argv_chars
+        current.append(path)
+        current_chars += cost
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class BatchToolExecutor:
+    """
+    Batching, concurrent and cached executor for a single integration.
+
+    The integration supplies the command line, the output parser and the
+    issue-to-file mapping; the executor decides which files actually need to
+    run, how many files go into each invocation and how many invocations run
+    at once.
+    """
+
+    def __init__(
+        self,
+        integration: "UnifiedBaseIntegration",
+        cache: Optional[ToolResultCache] = None,
+        cpu_budget: Optional[int] = None,
+        max_argv_chars: int = DEFAULT_MAX_ARGV_CHARS,
+        max_files_per_invocation: int = DEFAULT_MAX_FILES_PER_INVOCATION,
+    ):
+        self.integration = integration
+        self.cache = cache if cache is not None else ToolResultCache()
+        self.cpu_budget = max(1, cpu_budget or os.cpu_count() or 1)
+        self.max_argv_chars = max_argv_chars
+        self.max_files_per_invocation = max_files_per_invocation
+        self.invocations = 0
+        self._stats_lock = threading.Lock()
+
+    def run(
+        self, file_paths: Sequence[Union[str, Path]], additional_args: Optional[List[str]] = None
+    ) -> Dict[str, "IntegrationResult"]:
+        """
+        Analyze files, serving unchanged files from cache.
+
+        Args:
+            file_paths: Files to analyze
+            additional_args: Extra tool arguments (part of the cache key)
+
+        Returns:
+            Dictionary mapping each input path (as given) to its result
+        """
+        integration = self.integration
+        tool_name = integration.tool_name
+        tool_version = integration.get_version()
+        config_hash = hash_tool_config(integration.config, additional_args)
+
+        results: Dict[str, IntegrationResult] = {}
+        pending: Dict[str, Tuple[str, Optional[str]]] = {}
+
+        for file_path in file_paths:
+            path_str = str(file_path)
+            content_hash = hash_file_content(path_str)
+            key = ToolResultCache.make_key(content_hash, tool_name, tool_version, config_hash) if content_hash else None
+            cached = self.cache.get(tool_name, key) if key else None
+            if cached is not None:
+                results[path_str] = self._result_from_cache(cached, path_str)
+            else:
+                pending[path_str] = (path_str, key)
+
+        if not pending:
+            return results
+
+        base_argv = integration._build_batch_command([], additional_args)
+        base_chars = sum(len(arg) + 1 for arg in base_argv)
+        chunks = chunk_files_for_argv(
+            list(pending), base_chars, self.max_argv_chars, self.max_files_per_invocation
+        )
+
+        workers = min(self.cpu_budget, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{tool_name}-batch") as executor:
+            futures = {executor.submit(self._run_chunk, chunk, additional_args): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk_results = future.result()
+                for path_str, (result, cacheable) in chunk_results.items():
+                    results[path_str] = result
+                    key = pending[path_str][1]
+                    if cacheable and key:
+                        self.cache.put(tool_name, key, self._result_to_cache(result))
+
+        return results
+
+    def _run_chunk(
+        self, chunk: List[str], additional_args: Optional[List[str]]
+    ) -> Dict[str, Tuple["IntegrationResult", bool]]:
+        """Run one tool invocation over a chunk and split its output per file."""
+        from .unified_base import IntegrationResult
+
+        integration = self.integration
+        cmd = integration._build_batch_command(chunk, additional_args)
+        start_time = time.time()
+        with self._stats_lock:
+            self.invocations += 1
+
+        try:
+            completed = integration._run_command(cmd, timeout=PerformanceLimits.MAX_ANALYSIS_TIME_SECONDS)
+        except subprocess.TimeoutExpired:
+            error = f"Analysis timed out after {PerformanceLimits.MAX_ANALYSIS_TIME_SECONDS}s"
+            return self._failed_chunk(chunk, error, "timeout", time.time() - start_time)
+        except Exception as e:
+            return self._failed_chunk(chunk, str(e), str(e), time.time() - start_time)
+
+        execution_time = time.time() - start_time
+        issues = integration._parse_output(completed.stdout, completed.stderr)
+        issues_by_file = self._split_issues(chunk, issues)
+        any_issues = any(issues_by_file.values())
+
+        # A non-zero exit without any attributable issue is a tool failure
+        # (crash, bad flag, config error): report it everywhere, cache nothing.
+        if completed.returncode != 0 and not any_issues:
+            return {
+                path: (
+                    IntegrationResult(
+                        success=False,
+                        exit_code=completed.returncode,
+                        stdout=completed.stdout,
+                        stderr=completed.stderr,
+                        issues=[],
+                        metadata={**integration._get_metadata(path), "batch_size": len(chunk), "cached": False},
+                        execution_time=execution_time,
+                    ),
+                    False,
+                )
+                for path in chunk
+            }
+
+        per_file_time = execution_time / len(chunk)
+        lookup = self._path_lookup(chunk)
+        stdout_by_file = self._split_lines(lookup, completed.stdout)
+        stderr_by_file = self._split_lines(lookup, completed.stderr)
+        chunk_results = {}
+        for path in chunk:
+            file_issues = issues_by_file[path]
+            exit_code = completed.returncode if file_issues else ExitCode.SUCCESS
+            chunk_results[path] = (
+                IntegrationResult(
+                    success=exit_code == ExitCode.SUCCESS,
+                    exit_code=exit_code,
+                    stdout="\n".join(stdout_by_file[path]),
+                    stderr="\n".join(stderr_by_file[path]),
+                    issues=file_issues,
+                    metadata={**integration._get_metadata(path), "batch_size": len(chunk), "cached": False},
+                    execution_time=per_file_time,
+                ),
+                True,
+            )
+        return chunk_results
+
+    def _split_issues(self, chunk: List[str], issues: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Attribute parsed issues to chunk files by normalized path."""
+        lookup = self._path_lookup(chunk)
+        issues_by_file: Dict[str, List[Dict[str, Any]]] = {path: [] for path in chunk}
+        for issue in issues:
+            owner = self._owner(lookup, self.integration._issue_file(issue))
+            if owner is not None:
+                issues_by_file[owner].append(issue)
+        return issues_by_file
+
+    def _split_lines(self, lookup: Dict[str, str], output: str) -> Dict[str, List[str]]:
+        """Attribute raw output lines to chunk files by the path field each line names."""
+        lines_by_file: Dict[str, List[str]] = {path: [] for path in lookup.values()}
+        for line in output.splitlines():
+            owner = self._owner(lookup, self.integration._line_file(line))
+            if owner is not None:
+                lines_by_file[owner].append(line)
+        return lines_by_file
+
+    @staticmethod
+    def _path_lookup(chunk: List[str]) -> Dict[str, str]:
+        lookup = {}
+        for path in chunk:
+            lookup[path] = path
+            lookup[os.path.normpath(path)] = path
+            lookup[os.path.abspath(path)] = path
+        return lookup
+
+    @staticmethod
+    def _owner(lookup: Dict[str, str], file_path: Optional[str]) -> Optional[str]:
+        """Chunk file that ``file_path`` names exactly (after normalization), if any."""
+        if not file_path:
+            return None
+        owner = lookup.get(file_path) or lookup.get(os.path.normpath(file_path))
+        if owner is None:
+            owner = lookup.get(os.path.abspath(file_path))
+        return owner
+
+    def _failed_chunk(
+        self, chunk: List[str], stderr: str, error: str, execution_time: float
+    ) -> Dict[str, Tuple["IntegrationResult", bool]]:
+        from .unified_base import IntegrationResult
+
+        return {
+            path: (
+                IntegrationResult(
+                    success=False,
+                    exit_code=ExitCode.ERROR,
+                    stdout="",
+                    stderr=stderr,
+                    issues=[],
+                    metadata={"error": error, "batch_size": len(chunk)},
+                    execution_time=execution_time,
+                ),
+                False,
+            )
+            for path in chunk
+        }
+
+    @staticmethod
+    def _result_to_cache(result: "IntegrationResult") -> Dict[str, Any]:
+        payload = asdict(result)
+        payload.pop("metadata", None)
+        return payload
+
+    def _result_from_cache(self, payload: Dict[str, Any], path_str: str) -> "IntegrationResult":
+        from .unified_base import IntegrationResult
+
+        metadata = {**self.integration._get_metadata(path_str), "cached": True}
+        return IntegrationResult(
+            success=payload["success"],
+            exit_code=payload["exit_code"],
+            stdout=payload.get("stdout", ""),
+            stderr=payload.get("stderr", ""),
+            issues=payload.get("issues", []),
+            metadata=metadata,
+            execution_time=0.0,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return executor and cache statistics."""
+        return {"invocations": self.invocations, "cpu_budget": self.cpu_budget, "cache": self.cache.get_stats()}
@@ -67,6 +67,22 @@ class BlackIntegration(UnifiedBaseIntegration):
 
         return issues
 
+    def _issue_file(self, issue: Dict[str, Any]) -> Optional[str]:
+        """Black reports files only inside its 'would reformat <path>' messages."""
+        message = issue.get("message", "")
+        if message.startswith("would reformat "):
+            return message[len("would reformat ") :].strip()
+        return issue.get("file")
+
+    def _line_file(self, line: str) -> Optional[str]:
+        """Black names the file after 'would reformat' or 'error: cannot format'."""
+        line = line.strip()
+        if line.startswith("would reformat "):
+            return line[len("would reformat ") :]
+        if line.startswith("error: cannot format "):
+            return line[len("error: cannot format ") :].split(": ", 1)[0]
+        return None
+
 
 class MyPyIntegration(UnifiedBaseIntegration):
     """MyPy static type checker integration."""
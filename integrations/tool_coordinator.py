@@ -19,11 +19,15 @@ with connascence analysis for comprehensive code quality assessment.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
+import inspect
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
+from .tool_scheduler import DEFAULT_HISTORY_PATH, ScheduledJob, ToolRuntimeHistory, ToolScheduler
 
 # Import from consolidated integrations
 try:
@@ -59,6 +63,9 @@ except ImportError as e:
     BuildFlagsIntegration = MinimalIntegration
 
 
+CONNASCENCE_JOB = "connascence"
+
+
 @dataclass
 class ToolResult:
     """Result from a single tool execution."""
@@ -99,6 +106,15 @@ class ToolCoordinator:
         # Tool availability cache
         self._tool_availability: Optional[Dict[str, bool]] = None
 
+        # Central CPU-budgeted scheduler shared by all tools and the
+        # in-process connascence analysis
+        self.scheduler = ToolScheduler(
+            cpu_budget=self.config.get("cpu_budget"),
+            history=ToolRuntimeHistory(self.config.get("runtime_history_path", DEFAULT_HISTORY_PATH)),
+        )
+        self._last_timings: Dict[str, Dict[str, float]] = {}
+        self._connascence_worker_cpu = 0.0
+
     async def analyze_project(
         self, project_path: Path, enabled_tools: Optional[Set[str]] = None, include_connascence: bool = True
     ) -> IntegratedAnalysis:
@@ -106,47 +122,15 @@ class ToolCoordinator:
         project_path = Path(project_path)
         enabled_tools = enabled_tools or set(self.tools.keys())
 
-        # Check tool availability
+        tool_results: Dict[str, ToolResult] = {}
+        connascence_results: Dict[str, Any] = {}
+        async for update in self.analyze_project_stream(project_path, enabled_tools, include_connascence):
+            tool_results = update["tool_results"]
+            connascence_results = update["connascence_results"]
+
         available_tools = await self._check_tool_availability()
         enabled_tools = enabled_tools.intersection(set(available_tools.keys()))
 
-        # Run tools concurrently
-        async with asyncio.TaskGroup() as group:
-            tasks = {}
-
-            for tool_name in enabled_tools:
-                if available_tools.get(tool_name, False):
-                    task = group.create_task(self._run_tool(tool_name, project_path), name=f"run_{tool_name}")
-                    tasks[tool_name] = task
-
-        # Collect results
-        tool_results = {}
-        for tool_name, task in tasks.items():
-            try:
-                tool_results[tool_name] = await task
-            except Exception as e:
-                tool_results[tool_name] = ToolResult(
-                    tool_name=tool_name, success=False, execution_time=0.0, results={}, error_message=str(e)
-                )
-
-        # Run connascence analysis if requested
-        connascence_results = {}
-        if include_connascence:
-            try:
-                from ..analyzer.ast_engine.core_analyzer import ConnascenceASTAnalyzer
-
-                analyzer = ConnascenceASTAnalyzer()
-                analysis_result = analyzer.analyze_directory(project_path)
-                violations = analysis_result.violations  # Extract violations from AnalysisResult
-
-                connascence_results = {
-                    "violations": [self._violation_to_dict(v) for v in violations],
-                    "summary": self._create_connascence_summary(violations),
-                    "analysis_result": analysis_result,  # Include full analysis result
-                }
-            except Exception as e:
-                connascence_results = {"error": str(e)}
-
         # Correlate results and generate recommendations
         correlations = self._correlate_results(connascence_results, tool_results)
         recommendations = self._generate_recommendations(connascence_results, tool_results, correlations)
@@ -159,6 +143,8 @@ class ToolCoordinator:
             "total_execution_time": sum(r.execution_time for r in tool_results.values()),
             "project_path": str(project_path),
             "enabled_tools": list(enabled_tools),
+            "cpu_budget": self.scheduler.cpu_budget,
+            "tool_timings": dict(self._last_timings),
         }
 
         return IntegratedAnalysis(
@@ -170,10 +156,101 @@ class ToolCoordinator:
             execution_summary=execution_summary,
         )
 
+    async def analyze_project_stream(
+        self, project_path: Path, enabled_tools: Optional[Set[str]] = None, include_connascence: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run tools and connascence analysis under the shared CPU budget.
+
+        Yields an update every time a job finishes, containing the finished
+        job's name, all results so far and the correlations that can already
+        be computed from them, so consumers can correlate and display tool
+        output without waiting for the slowest tool.
+        """
+        project_path = Path(project_path)
+        enabled_tools = enabled_tools or set(self.tools.keys())
+
+        available_tools = await self._check_tool_availability()
+        jobs = [
+            ScheduledJob(
+                name=tool_name,
+                func=functools.partial(self._run_tool_sync, tool_name, project_path),
+                parallelism=self._tool_parallelism(tool_name),
+                cpu_meter=self._child_cpu_meter(tool_name),
+            )
+            for tool_name in sorted(enabled_tools)
+            if available_tools.get(tool_name, False)
+        ]
+        if include_connascence:
+            jobs.append(
+                ScheduledJob(
+                    name=CONNASCENCE_JOB,
+                    func=functools.partial(self._run_connascence_analysis, project_path),
+                    parallelism=self._tool_parallelism(CONNASCENCE_JOB),
+                    cpu_meter=lambda: self._connascence_worker_cpu,
+                )
+            )
+
+        tool_results: Dict[str, ToolResult] = {}
+        connascence_results: Dict[str, Any] = {}
+        self._last_timings = {}
+
+        async for outcome in self.scheduler.run(jobs):
+            self._last_timings[outcome.name] = {
+                "wall_time": outcome.wall_time,
+                "cpu_time": outcome.cpu_time,
+                "granted_cores": outcome.granted_cores,
+            }
+            if outcome.name == CONNASCENCE_JOB:
+                connascence_results = outcome.result if outcome.error is None else {"error": outcome.error}
+            elif outcome.error is not None:
+                tool_results[outcome.name] = ToolResult(
+                    tool_name=outcome.name,
+                    success=False,
+                    execution_time=outcome.wall_time,
+                    results={},
+                    error_message=outcome.error,
+                )
+            else:
+                tool_results[outcome.name] = outcome.result
+
+            yield {
+                "completed": outcome.name,
+                "tool_results": dict(tool_results),
+                "connascence_results": connascence_results,
+                "correlations": self._correlate_results(connascence_results, tool_results),
+            }
+
+    def _tool_parallelism(self, tool_name: str) -> int:
+        """
+        Cores a tool should be granted: explicit config first, then the
+        history's suggestion from previous runs, then a single core.
+        """
+        tool_config = self.config.get(tool_name, {})
+        if isinstance(tool_config, dict) and tool_config.get("parallelism"):
+            return int(tool_config["parallelism"])
+
+        suggested = self.scheduler.history.suggested_parallelism(tool_name)
+        return suggested if suggested is not None else 1
+
+    def _child_cpu_meter(self, tool_name: str) -> Optional[Callable[[], float]]:
+        """CPU meter for the subprocesses of one tool, when the integration measures them."""
+        tool = self.tools.get(tool_name)
+        if tool is None or not hasattr(tool, "child_cpu_time"):
+            return None
+        return lambda: tool.child_cpu_time
+
+    def close(self) -> None:
+        """Shut down the scheduler's worker threads."""
+        self.scheduler.shutdown()
+
     async def _run_tool(self, tool_name: str, project_path: Path) -> ToolResult:
         """Run a single tool analysis."""
-        import time
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._run_tool_sync, tool_name, project_path, 1)
 
+    def _run_tool_sync(self, tool_name: str, project_path: Path, granted_cores: int) -> ToolResult:
+        """Run a single tool analysis in a scheduler worker thread."""
         tool = self.tools.get(tool_name)
         if not tool:
             return ToolResult(
@@ -184,17 +261,17 @@ class ToolCoordinator:
                 error_message=f"Tool {tool_name} not available",
             )
 
+        # Tools that size their own worker pools get the scheduler's grant for
+        # this call instead of the machine's core count.
+        kwargs = {"max_parallel": granted_cores} if self._accepts_max_parallel(tool) else {}
+
         start_time = time.time()
 
         try:
-            # Run tool analysis
             if hasattr(tool, "analyze_async"):
-                results = await tool.analyze_async(project_path)
+                results = asyncio.run(tool.analyze_async(project_path, **kwargs))
             else:
-                # Run synchronous tool in thread pool
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor() as executor:
-                    results = await loop.run_in_executor(executor, tool.analyze, project_path)
+                results = tool.analyze(project_path, **kwargs)
 
             execution_time = time.time() - start_time
 
@@ -206,6 +283,32 @@ class ToolCoordinator:
                 tool_name=tool_name, success=False, execution_time=execution_time, results={}, error_message=str(e)
             )
 
+    @staticmethod
+    def _accepts_max_parallel(tool: Any) -> bool:
+        analyze = getattr(tool, "analyze_async", None) or getattr(tool, "analyze", None)
+        try:
+            return "max_parallel" in inspect.signature(analyze).parameters
+        except (TypeError, ValueError):
+            return False
+
+    def _run_connascence_analysis(self, project_path: Path, granted_cores: int) -> Dict[str, Any]:
+        """Run the connascence analysis as a scheduled job on the granted cores."""
+        try:
+            from analyzer.ast_engine.core_analyzer import ConnascenceASTAnalyzer
+
+            analyzer = ConnascenceASTAnalyzer()
+            analysis_result = analyzer.analyze_directory(project_path, max_workers=granted_cores)
+            self._connascence_worker_cpu += analysis_result.worker_cpu_time
+            violations = analysis_result.violations  # Extract violations from AnalysisResult
+
+            return {
+                "violations": [self._violation_to_dict(v) for v in violations],
+                "summary": self._create_connascence_summary(violations),
+                "analysis_result": analysis_result,  # Include full analysis result
+            }
+        except Exception as e:
+            return {"error": str(e)}
+
     async def _check_tool_availability(self) -> Dict[str, bool]:
         """Check which tools are available in the environment."""
         if self._tool_availability is not None:
@@ -0,0 +1,282 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+
+"""
+CPU-Budgeted Tool Scheduler
+===========================
+
+Central scheduler for the external tools and in-process analysis run by
+``ToolCoordinator``. Each job declares how many cores it can use; the
+scheduler hands out a single global CPU budget, starts the longest jobs
+first (critical-path / LPT ordering) and back-fills idle cores with shorter
+jobs. Results are yielded as soon as each job finishes so downstream steps
+can consume them incrementally.
+
+Per-job wall and CPU time are persisted between runs, so the ordering and the
+parallelism estimates improve with every run. CPU time counts the job's own
+thread plus whatever its ``cpu_meter`` reports for the processes it started
+(``run_subprocess`` measures a single child with ``wait4``), so overlapping
+tools do not pollute each other's readings.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import subprocess
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_PATH = ".connascence_cache/tool_runtimes.json"
+DEFAULT_RUNTIME_ESTIMATE = 1.0
+HISTORY_SMOOTHING = 0.3
+# A job using at least this share of its granted cores is offered one more next run
+SATURATION_THRESHOLD = 0.8
+
+
+@dataclass
+class ScheduledJob:
+    """A unit of work competing for the shared CPU budget."""
+
+    name: str
+    func: Callable[[int], Any]
+    parallelism: int = 1
+    estimated_runtime: Optional[float] = None
+    # Cumulative CPU seconds of the processes this job started (None: own thread only)
+    cpu_meter: Optional[Callable[[], float]] = None
+
+
+@dataclass
+class JobOutcome:
+    """Outcome of a scheduled job, yielded as soon as the job finishes."""
+
+    name: str
+    result: Any
+    error: Optional[str]
+    wall_time: float
+    cpu_time: float
+    granted_cores: int
+
+
+class ToolRuntimeHistory:
+    """
+    Persistent per-tool runtime statistics.
+
+    Wall time, CPU time and observed parallelism are tracked as exponentially
+    weighted moving averages so a single slow run does not dominate.
+    """
+
+    def __init__(self, history_path: Union[str, Path, None] = DEFAULT_HISTORY_PATH):
+        self.history_path = Path(history_path) if history_path else None
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.history_path or not self.history_path.exists():
+            return
+        try:
+            with open(self.history_path, encoding="utf-8") as handle:
+                data = json.load(handle)
+            if isinstance(data, dict):
+                self._stats = data
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable tool runtime history {self.history_path}: {e}")
+
+    def save(self) -> None:
+        """Persist the history; failures are logged and otherwise ignored."""
+        if not self.history_path:
+            return
+        try:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                payload = json.dumps(self._stats, indent=2, sort_keys=True)
+            tmp_path = self.history_path.with_suffix(".tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.history_path)
+        except OSError as e:
+            logger.debug(f"Failed to save tool runtime history: {e}")
+
+    def record(self, name: str, wall_time: float, cpu_time: float, granted_cores: int = 1) -> None:
+        """Fold one observation into the moving averages."""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                self._stats[name] = {
+                    "wall_time": wall_time,
+                    "cpu_time": cpu_time,
+                    "granted_cores": granted_cores,
+                    "runs": 1,
+                }
+                return
+            alpha = HISTORY_SMOOTHING
+            stats["wall_time"] = alpha * wall_time + (1 - alpha) * stats["wall_time"]
+            stats["cpu_time"] = alpha * cpu_time + (1 - alpha) * stats["cpu_time"]
+            stats["granted_cores"] = granted_cores
+            stats["runs"] = stats.get("runs", 0) + 1
+
+    def expected_runtime(self, name: str) -> Optional[float]:
+        """Return the smoothed wall time for a job, or None if never seen."""
+        stats = self._stats.get(name)
+        return stats["wall_time"] if stats else None
+
+    def observed_parallelism(self, name: str) -> Optional[float]:
+        """Return average CPU time / wall time, i.e. cores actually used."""
+        stats = self._stats.get(name)
+        if not stats or stats["wall_time"] <= 0:
+            return None
+        return stats["cpu_time"] / stats["wall_time"]
+
+    def suggested_parallelism(self, name: str) -> Optional[int]:
+        """
+        Cores to grant next run, or None if never seen.
+
+        A job can never use more cores than it was granted, so one that
+        saturated its grant is offered one more core to probe whether it
+        scales further; otherwise it gets the cores it actually used.
+        """
+        observed = self.observed_parallelism(name)
+        if observed is None:
+            return None
+        granted = int(self._stats[name].get("granted_cores", 1))
+        if observed >= granted * SATURATION_THRESHOLD:
+            return granted + 1
+        return max(1, round(observed))
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+
+class _MeasuredPopen(subprocess.Popen):
+    """Popen that keeps the CPU time of the child it reaps (POSIX; Windows never calls ``_try_wait``)."""
+
+    child_cpu_time = 0.0
+
+    def _try_wait(self, wait_flags):
+        try:
+            pid, status, usage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            # Same fallback as Popen: the child was reaped elsewhere
+            return (self.pid, 0)
+        if pid == self.pid:
+            self.child_cpu_time = usage.ru_utime + usage.ru_stime
+        return (pid, status)
+
+
+def run_subprocess(
+    cmd: Sequence[str], timeout: Optional[float] = None, cwd: Union[str, Path, None] = None
+) -> Tuple[subprocess.CompletedProcess, float]:
+    """
+    Run a command like ``subprocess.run(capture_output=True, text=True)``.
+
+    Returns:
+        The completed process and the CPU seconds used by that child alone
+        (0.0 where ``wait4`` is unavailable)
+
+    Raises:
+        subprocess.TimeoutExpired: After killing the child
+    """
+    with _MeasuredPopen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=cwd) as process:
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr), process.child_cpu_time
+
+
+class ToolScheduler:
+    """
+    Runs jobs under a global CPU budget with critical-path ordering.
+
+    A job holds ``min(parallelism, cpu_budget)`` cores while it runs and is
+    told how many it was granted, so tools that spawn their own workers can
+    size their pools to the grant instead of to the whole machine.
+    """
+
+    def __init__(self, cpu_budget: Optional[int] = None, history: Optional[ToolRuntimeHistory] = None):
+        self.cpu_budget = max(1, cpu_budget or os.cpu_count() or 1)
+        self.history = history if history is not None else ToolRuntimeHistory()
+        self._executor = ThreadPoolExecutor(max_workers=self.cpu_budget, thread_name_prefix="tool-scheduler")
+
+    def order_jobs(self, jobs: List[ScheduledJob]) -> List[ScheduledJob]:
+        """Order jobs longest-expected-runtime first (ties broken by name)."""
+
+        def expected(job: ScheduledJob) -> float:
+            history_estimate = self.history.expected_runtime(job.name)
+            if history_estimate is not None:
+                return history_estimate
+            return job.estimated_runtime if job.estimated_runtime is not None else DEFAULT_RUNTIME_ESTIMATE
+
+        return sorted(jobs, key=lambda job: (-expected(job), job.name))
+
+    async def run(self, jobs: List[ScheduledJob]) -> AsyncIterator[JobOutcome]:
+        """
+        Execute jobs and yield each outcome as soon as it finishes.
+
+        Args:
+            jobs: Jobs to run
+
+        Yields:
+            JobOutcome per job, in completion order
+        """
+        pending = self.order_jobs(jobs)
+        running: Dict[asyncio.Future, int] = {}
+        free_cores = self.cpu_budget
+        loop = asyncio.get_running_loop()
+
+        try:
+            while pending or running:
+                # Start jobs in critical-path order, back-filling free cores
+                # with shorter jobs that fit.
+                for job in list(pending):
+                    grant = min(max(1, job.parallelism), self.cpu_budget)
+                    if grant <= free_cores or not running:
+                        pending.remove(job)
+                        free_cores -= grant
+                        future = loop.run_in_executor(self._executor, self._execute, job, grant)
+                        running[future] = grant
+                    if free_cores <= 0:
+                        break
+
+                done, _ = await asyncio.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    free_cores += running.pop(future)
+                    outcome = future.result()
+                    self.history.record(outcome.name, outcome.wall_time, outcome.cpu_time, outcome.granted_cores)
+                    yield outcome
+        finally:
+            self.history.save()
+
+    def _execute(self, job: ScheduledJob, grant: int) -> JobOutcome:
+        """Run one job in a worker thread and measure its wall/CPU time."""
+        start_wall = time.perf_counter()
+        start_thread_cpu = time.thread_time()
+        start_child_cpu = job.cpu_meter() if job.cpu_meter else 0.0
+        result, error = None, None
+
+        try:
+            result = job.func(grant)
+        except Exception as e:
+            logger.warning(f"Scheduled job {job.name} failed: {e}")
+            error = str(e)
+
+        wall_time = time.perf_counter() - start_wall
+        cpu_time = time.thread_time() - start_thread_cpu
+        if job.cpu_meter:
+            cpu_time += job.cpu_meter() - start_child_cpu
+        return JobOutcome(
+            name=job.name, result=result, error=error, wall_time=wall_time, cpu_time=cpu_time, granted_cores=grant
+        )
+
+    def shutdown(self) -> None:
+        """Release the worker threads; running jobs finish in the background."""
+        self._executor.shutdown(wait=False)
@@ -13,6 +13,7 @@ This eliminates the architectural fragmentation identified in the MECE report.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -23,6 +24,7 @@ import subprocess
 
 # Import central constants
 import sys
+import threading
 from typing import Any, Dict, List, Optional, Union
 
 from fixes.phase0.production_safe_assertions import ProductionAssert
@@ -30,8 +32,14 @@ from fixes.phase0.production_safe_assertions import ProductionAssert
 sys.path.append(str(Path(__file__).parent.parent))
 from config.central_constants import ExitCode, PerformanceLimits
 
+from .batch_executor import DEFAULT_CACHE_DIR, BatchToolExecutor, ToolResultCache
+from .tool_scheduler import run_subprocess
+
 logger = logging.getLogger(__name__)
 
+# "path:line[:col]: ..." prefix of a linter output line; the path may contain ':' (Windows drives)
+_LINE_PATH_PATTERN = re.compile(r"^(?P<path>.+?):\d+(?::\d+)?:")
+
 
 class IntegrationType(Enum):
     """Types of external tool integrations."""
@@ -85,6 +93,9 @@ class UnifiedBaseIntegration(ABC):
         self.config = config or {}
         self._version_cache: Optional[str] = None
         self._availability_cache: Optional[bool] = None
+        self._batch_executor: Optional[BatchToolExecutor] = None
+        self._child_cpu_time = 0.0
+        self._child_cpu_lock = threading.Lock()
         self.logger = logging.getLogger(f"{__name__}.{self.tool_name}")
 
     # =================================================================
@@ -240,40 +251,78 @@ class UnifiedBaseIntegration(ABC):
             )
 
     def batch_analyze(
-        self, file_paths: List[Union[str, Path]], max_parallel: Optional[int] = None
+        self,
+        file_paths: List[Union[str, Path]],
+        max_parallel: Optional[int] = None,
+        additional_args: Optional[List[str]] = None,
     ) -> Dict[str, IntegrationResult]:
         """
-        Analyze multiple files with optional parallel processing.
+        Analyze multiple files with batched, parallel and cached execution.
+
+        Files are passed to the tool many per invocation (bounded by argv
+        length), invocations run concurrently under ``max_parallel`` and the
+        combined output is split back into per-file results. Unchanged files
+        are served from the on-disk result cache. Tools that cannot take
+        several files at once fall back to one invocation per file.
 
         Args:
             file_paths: List of paths to analyze
-            max_parallel: Maximum parallel analyses (defaults to config)
+            max_parallel: Maximum concurrent tool invocations (CPU budget)
+            additional_args: Additional command line arguments
 
         Returns:
             Dictionary mapping file paths to results
         """
-        max_parallel = max_parallel or PerformanceLimits.MAX_CONCURRENT_ANALYSES
-        results = {}
+        max_parallel = max_parallel or self.config.get("max_parallel") or PerformanceLimits.MAX_CONCURRENT_ANALYSES
 
-        # For now, implement sequential processing
-        # TODO: Add parallel processing with ThreadPoolExecutor
-        for file_path in file_paths:
+        if not self.is_available():
+            return {str(file_path): self.run_analysis(file_path, additional_args) for file_path in file_paths}
+
+        if self.supports_batching:
+            executor = self._get_batch_executor(max_parallel)
             try:
-                results[str(file_path)] = self.run_analysis(file_path)
+                return executor.run(file_paths, additional_args)
             except Exception as e:
-                self.logger.error(f"Failed to analyze {file_path}: {e}")
-                results[str(file_path)] = IntegrationResult(
-                    success=False,
-                    exit_code=ExitCode.ERROR,
-                    stdout="",
-                    stderr=str(e),
-                    issues=[],
-                    metadata={"error": str(e)},
-                    execution_time=0.0,
-                )
+                self.logger.error(f"Batched {self.tool_name} run failed, falling back to per-file analysis: {e}")
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+            futures = {pool.submit(self.run_analysis, file_path, additional_args): file_path for file_path in file_paths}
+            for future, file_path in futures.items():
+                try:
+                    results[str(file_path)] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to analyze {file_path}: {e}")
+                    results[str(file_path)] = IntegrationResult(
+                        success=False,
+                        exit_code=ExitCode.ERROR,
+                        stdout="",
+                        stderr=str(e),
+                        issues=[],
+                        metadata={"error": str(e)},
+                        execution_time=0.0,
+                    )
 
         return results
 
+    def analyze(self, project_path: Union[str, Path], max_parallel: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze every Python file under ``project_path`` with ``batch_analyze``.
+
+        Args:
+            project_path: Project root directory
+            max_parallel: Maximum concurrent tool invocations for this call
+
+        Returns:
+            Combined issues of all files
+        """
+        file_paths = sorted(str(path) for path in Path(project_path).rglob("*.py"))
+        results = self.batch_analyze(file_paths, max_parallel=max_parallel)
+        return {
+            "issues": [issue for result in results.values() for issue in result.issues],
+            "files_analyzed": len(results),
+        }
+
     def get_info(self) -> Dict[str, Any]:
         """Get comprehensive information about the integration."""
         return {
@@ -308,9 +357,55 @@ class UnifiedBaseIntegration(ABC):
 
         self.logger.debug(f"Running command: {' '.join(shlex.quote(arg) for arg in cmd)}")
 
-        return subprocess.run(
-            cmd, capture_output=True, text=True, timeout=timeout, cwd=cwd, check=False  # Don't raise on non-zero exit
-        )
+        # Don't raise on non-zero exit; the child's own CPU time feeds the scheduler
+        completed, cpu_time = run_subprocess(cmd, timeout=timeout, cwd=cwd)
+        with self._child_cpu_lock:
+            self._child_cpu_time += cpu_time
+        return completed
+
+    @property
+    def child_cpu_time(self) -> float:
+        """CPU seconds used by every command this integration has run, batches included."""
+        with self._child_cpu_lock:
+            return self._child_cpu_time
+
+    @property
+    def supports_batching(self) -> bool:
+        """Whether the tool accepts many file arguments in one invocation."""
+        return self.config.get("batching", True)
+
+    def _build_batch_command(self, file_paths: List[str], additional_args: Optional[List[str]] = None) -> List[str]:
+        """Build the command line for one invocation over several files."""
+        cmd = [self.tool_command]
+        if additional_args:
+            cmd.extend(additional_args)
+        cmd.extend(file_paths)
+        return cmd
+
+    def _issue_file(self, issue: Dict[str, Any]) -> Optional[str]:
+        """
+        Return the file an issue belongs to, used to split batched output.
+        Subclasses whose parsed issues do not carry a ``file`` key override this.
+        """
+        return issue.get("file")
+
+    def _line_file(self, line: str) -> Optional[str]:
+        """
+        Return the file a raw output line refers to, used to split batched stdout/stderr.
+        The default reads the ``path:line[:col]:`` prefix used by most linters.
+        """
+        match = _LINE_PATH_PATTERN.match(line)
+        return match.group("path") if match else None
+
+    def _get_batch_executor(self, max_parallel: int) -> "BatchToolExecutor":
+        """Return the (lazily created) batch executor for this integration."""
+        if self._batch_executor is None or self._batch_executor.cpu_budget != max_parallel:
+            cache = ToolResultCache(
+                cache_dir=self.config.get("tool_cache_dir", DEFAULT_CACHE_DIR),
+                enabled=self.config.get("tool_cache", True),
+            )
+            self._batch_executor = BatchToolExecutor(self, cache=cache, cpu_budget=max_parallel)
+        return self._batch_executor
 
     def _parse_version(self, version_output: str) -> str:
         """
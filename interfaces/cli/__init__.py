@@ -1,7 +1,12 @@
 # SPDX-License-Identifier: MIT
 """Simple flake8-style CLI for connascence analysis."""
 
-from .simple_cli import main
-
 __version__ = "2.0.0"
 __all__ = ["main"]
+
+
+def main(*args, **kwargs):
+    """Entry point for the simple CLI, imported on first call."""
+    from .simple_cli import main as simple_main
+
+    return simple_main(*args, **kwargs)
@@ -24,7 +24,7 @@ from pathlib import Path
 import subprocess
 import sys
 import time
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 # License validation availability flag
 LICENSE_VALIDATION_AVAILABLE = False
@@ -42,6 +42,7 @@ from analyzer.constants import (
     resolve_policy_name,
     validate_policy_name,
 )
+from analyzer.diff_scope import FileChanges, parse_unified_diff
 
 # Import analyzer components at module level to avoid import-time issues
 try:
@@ -64,7 +65,7 @@ except ImportError:
     BaselineManager = None
 
 try:
-    from analyzer.unified_analyzer import ErrorHandler, StandardError
+    from analyzer.standard_errors import ErrorHandler, StandardError
 except ImportError:
     # Fallback for environments where unified analyzer isn't available
     class StandardError:
@@ -191,47 +192,68 @@ class ScanDiffCommandHandler(BaseCommandHandler):
         except ValueError:
             return ExitCode.CONFIGURATION_ERROR
 
-        changed_files, exit_code = self._collect_changed_files(base_ref, head_ref)
+        profile = getattr(args, "policy", "service-defaults")
+        full_files = getattr(args, "full_files", False)
+        changes, exit_code = self._collect_changes(base_ref, head_ref)
         if exit_code is not None:
             return exit_code
 
-        if not changed_files:
+        if not changes:
             print("No Python files changed in diff", file=sys.stderr)
             return ExitCode.SUCCESS
 
-        violation_map, files_analyzed, analysis_time = self.cli._run_analysis_for_files(
-            changed_files,
-            getattr(args, "policy", "service-defaults"),
-        )
+        # Hunk line numbers refer to the head revision, so analyze that, not the working tree
+        def read_source(path: str) -> str:
+            return self._read_at_ref(head_ref, path)
+
+        scoped_files = 0
+        if full_files:
+            violation_map, files_analyzed, analysis_time = self.cli._run_analysis_for_files(
+                list(changes), profile, read_source=read_source
+            )
+        else:
+            violation_map, files_analyzed, scoped_files, analysis_time = self.cli._run_analysis_for_changes(
+                changes, profile, read_source=read_source
+            )
 
         findings = self.cli._flatten_violation_map(violation_map, min_severity)
         payload = self.cli._format_analysis_result(
             findings,
             files_analyzed=files_analyzed,
-            profile=getattr(args, "policy", "service-defaults"),
+            profile=profile,
             target=f"diff {base_ref}..{head_ref}",
             analysis_time=analysis_time,
         )
         payload["metadata"] = {
             "base": base_ref,
             "head": head_ref,
-            "changed_files": len(changed_files),
+            "changed_files": len(changes),
+            "changed_lines": sum(c.changed_line_count for c in changes.values()),
+            "scoped_files": scoped_files,
+            "full_files": files_analyzed - scoped_files,
             "severity_filter": min_severity,
         }
 
         self.cli._emit_result(payload, getattr(args, "format", "text"), getattr(args, "output", None))
         return ExitCode.SUCCESS if not findings else ExitCode.GENERAL_ERROR
 
-    def _collect_changed_files(self, base_ref: str, head_ref: str) -> Tuple[List[str], Optional[int]]:
-        cmd = ["git", "diff", "--name-only", base_ref, head_ref]
+    def _collect_changes(self, base_ref: str, head_ref: str) -> Tuple[Dict[str, FileChanges], Optional[int]]:
+        cmd = ["git", "diff", "-U0", "--no-color", "--no-ext-diff", base_ref, head_ref]
         result = subprocess.run(cmd, capture_output=True, text=True, check=False)
         if result.returncode != 0:
             print(f"git diff failed: {result.stderr.strip()}", file=sys.stderr)
-            return [], ExitCode.RUNTIME_ERROR
+            return {}, ExitCode.RUNTIME_ERROR
 
-        files = [line.strip() for line in result.stdout.splitlines() if line.strip().endswith(".py")]
-        existing = [f for f in files if Path(f).exists()]
-        return existing, None
+        return parse_unified_diff(result.stdout), None
+
+    @staticmethod
+    def _read_at_ref(ref: str, path: str) -> str:
+        """File contents at ``ref``, decoded like ``open(..., encoding="utf-8")``."""
+        cmd = ["git", "show", f"{ref}:{path}"]
+        result = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", check=False)
+        if result.returncode != 0:
+            raise OSError(f"git show {ref}:{path} failed: {result.stderr.strip()}")
+        return result.stdout
 
 
 class BaselineCommandHandler(BaseCommandHandler):
@@ -427,6 +449,40 @@ class MCPCommandHandler(BaseCommandHandler):
             return ExitCode.RUNTIME_ERROR
 
 
+class DaemonCommandHandler(BaseCommandHandler):
+    """Handler for the opt-in warm analysis daemon."""
+
+    def handle(self, args: argparse.Namespace) -> int:
+        from analyzer import cli_daemon
+
+        if not cli_daemon.DAEMON_SUPPORTED:
+            print("The analysis daemon requires Unix domain sockets", file=sys.stderr)
+            return ExitCode.RUNTIME_ERROR
+
+        socket_path = Path(args.socket) if getattr(args, "socket", None) else None
+        command = getattr(args, "daemon_command", None)
+        if command == "start":
+            if cli_daemon.start_daemon(socket_path, idle_timeout=args.idle_timeout):
+                print(f"[daemon] listening on {socket_path or cli_daemon.default_socket_path()}")
+                return ExitCode.SUCCESS
+            print("[daemon] failed to start", file=sys.stderr)
+            return ExitCode.RUNTIME_ERROR
+        if command == "stop":
+            if cli_daemon.send_command("shutdown", socket_path) is None:
+                print("[daemon] not running")
+            return ExitCode.SUCCESS
+        if command == "status":
+            stats = cli_daemon.send_command("stats", socket_path)
+            if stats is None:
+                print("[daemon] not running")
+                return ExitCode.GENERAL_ERROR
+            print(json.dumps(stats, indent=2))
+            return ExitCode.SUCCESS
+
+        print("Unknown daemon subcommand", file=sys.stderr)
+        return ExitCode.INVALID_ARGUMENTS
+
+
 class MockHandler:
     """Mock handler for commands not yet implemented."""
     def handle(self, *args, **kwargs):
@@ -447,6 +503,7 @@ class ConnascenceCLI:
         self.baseline_handler = BaselineCommandHandler(self)
         self.autofix_handler = AutofixCommandHandler(self)
         self.mcp_handler = MCPCommandHandler(self)
+        self.daemon_handler = DaemonCommandHandler(self)
         self.license_validator = None
         self.policy_manager = PolicyManager() if PolicyManager else None
 
@@ -458,6 +515,11 @@ class ConnascenceCLI:
         parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
         parser.add_argument("--version", action="version", version="connascence 2.0.0")
         parser.add_argument("--skip-license-check", action="store_true", help="Skip license validation")
+        parser.add_argument(
+            "--daemon",
+            action="store_true",
+            help="Run through the warm background analysis daemon (also enabled by CONNASCENCE_DAEMON=1)",
+        )
 
         # Create subparsers for commands
         subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -582,6 +644,11 @@ class ConnascenceCLI:
         )
         diff_parser.add_argument("--output", "-o", type=str, help="Output file path")
         diff_parser.add_argument("--severity", type=str, help="Minimum severity level to report")
+        diff_parser.add_argument(
+            "--full-files",
+            action="store_true",
+            help="Report every violation in changed files instead of only those on changed lines",
+        )
 
         # Baseline command
         baseline_parser = subparsers.add_parser("baseline", help="Manage baseline")
@@ -633,6 +700,17 @@ class ConnascenceCLI:
         # MCP status subcommand
         status_parser = mcp_subparsers.add_parser("status", help="Show MCP server status")
 
+        # Analysis daemon commands
+        daemon_parser = subparsers.add_parser("daemon", help="Manage the warm background analysis daemon")
+        daemon_subparsers = daemon_parser.add_subparsers(dest="daemon_command", help="Daemon commands")
+        daemon_start_parser = daemon_subparsers.add_parser("start", help="Start the daemon in the background")
+        daemon_start_parser.add_argument(
+            "--idle-timeout", type=float, default=900.0, help="Shut down after this many idle seconds (default: 900)"
+        )
+        daemon_subparsers.add_parser("stop", help="Stop the running daemon")
+        daemon_subparsers.add_parser("status", help="Show daemon status and cache statistics")
+        daemon_parser.add_argument("--socket", type=str, help="Daemon socket path")
+
         # License command
         license_parser = subparsers.add_parser("license", help="License management")
         license_parser.add_argument("action", choices=["validate", "check"], help="License action")
@@ -762,6 +840,8 @@ class ConnascenceCLI:
                 return self.autofix_handler.handle(parsed_args)
             elif parsed_args.command == "mcp":
                 return self.mcp_handler.handle(parsed_args)
+            elif parsed_args.command == "daemon":
+                return self.daemon_handler.handle(parsed_args)
             elif parsed_args.command in ["explain", "license"]:
                 # These commands just return success for now
                 return ExitCode.SUCCESS
@@ -864,20 +944,22 @@ class ConnascenceCLI:
         self,
         files: Iterable[Path],
         profile: str,
+        read_source: Optional[Callable[[str], str]] = None,
     ) -> Tuple[Dict[str, List[Any]], int, float]:
-        thresholds = self._get_threshold_config(profile)
-        analyzer = ConnascenceASTAnalyzer(thresholds=thresholds)
         violation_map: Dict[str, List[Any]] = {}
         start = time.time()
         files_analyzed = 0
 
         for file_path in files:
             path_obj = Path(file_path)
-            if not path_obj.exists():
+            if read_source is None and not path_obj.exists():
                 continue
             self._stream_progress(f"[scan] Analyzing {path_obj}")
             try:
-                violations = analyzer.analyze_file(path_obj)
+                if read_source is None:
+                    violations = self.analysis_helper.analyze_file_cached(path_obj, profile)
+                else:
+                    violations = self.analysis_helper.analyze_source(read_source(str(file_path)), path_obj, profile)
             except Exception as exc:  # pragma: no cover - analyzer failures are rare
                 error = self.error_handler.create_error(
                     "ANALYSIS_FAILED",
@@ -894,6 +976,44 @@ class ConnascenceCLI:
         analysis_time = time.time() - start
         return violation_map, files_analyzed, analysis_time
 
+    def _run_analysis_for_changes(
+        self,
+        changes: Dict[str, FileChanges],
+        profile: str,
+        read_source: Optional[Callable[[str], str]] = None,
+    ) -> Tuple[Dict[str, List[Any]], int, int, float]:
+        violation_map: Dict[str, List[Any]] = {}
+        start = time.time()
+        files_analyzed = 0
+        scoped_files = 0
+
+        for file_path, file_changes in changes.items():
+            path_obj = Path(file_path)
+            if read_source is None and not path_obj.exists():
+                continue
+            self._stream_progress(f"[scan] Analyzing {file_changes.changed_line_count} changed lines in {path_obj}")
+            try:
+                code = read_source(file_path) if read_source is not None else None
+                violations, scoped = self.analysis_helper.analyze_file_changes(
+                    path_obj, profile, file_changes, code=code
+                )
+            except Exception as exc:  # pragma: no cover - analyzer failures are rare
+                error = self.error_handler.create_error(
+                    "ANALYSIS_FAILED",
+                    f"Failed to analyze {path_obj}: {exc}",
+                    ERROR_SEVERITY["MEDIUM"],
+                    {"path": str(path_obj)},
+                )
+                self._handle_cli_error(error)
+                continue
+
+            violation_map[str(path_obj)] = violations
+            files_analyzed += 1
+            scoped_files += int(scoped)
+
+        analysis_time = time.time() - start
+        return violation_map, files_analyzed, scoped_files, analysis_time
+
     def _iter_source_files(self, paths: Iterable[str], exclude: Optional[str] = None) -> Iterable[Path]:
         seen = set()
         for raw_path in paths:
@@ -1038,9 +1158,7 @@ class ConnascenceCLI:
             print(f"Error: Cannot validate non-existent file: {target}", file=sys.stderr)
             return ExitCode.CONFIGURATION_ERROR
 
-        thresholds = self._get_threshold_config(args.profile)
-        analyzer = ConnascenceASTAnalyzer(thresholds=thresholds)
-        violations = analyzer.analyze_file(target)
+        violations = self.analysis_helper.analyze_file_cached(target, args.profile)
         payload = {
             "compliant": len(violations) == 0,
             "profile": args.profile,
@@ -1059,9 +1177,7 @@ class ConnascenceCLI:
             print(f"Error: Cannot generate suggestions for non-existent file: {target}", file=sys.stderr)
             return ExitCode.CONFIGURATION_ERROR
 
-        thresholds = self._get_threshold_config(args.profile)
-        analyzer = ConnascenceASTAnalyzer(thresholds=thresholds)
-        violations = analyzer.analyze_file(target)
+        violations = self.analysis_helper.analyze_file_cached(target, args.profile)
         suggestions = self._build_refactoring_suggestions(violations, args.line, args.limit)
         payload = {
             "path": str(target),
@@ -1350,8 +1466,28 @@ class ConnascenceCLI:
         return "note"
 
 
+def _should_forward_to_daemon(argv: List[str]) -> bool:
+    from analyzer.cli_daemon import DAEMON_SUPPORTED, daemon_requested
+
+    if not DAEMON_SUPPORTED or not daemon_requested(argv):
+        return False
+    # Commands that manage processes themselves always run in-process
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    return command not in {"daemon", "mcp"}
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """Main entry point for CLI with error handling."""
+    argv = list(sys.argv[1:] if args is None else args)
+    if _should_forward_to_daemon(argv):
+        from analyzer.cli_daemon import forward_to_daemon
+
+        exit_code = forward_to_daemon(argv)
+        if exit_code is not None:
+            return exit_code
+        # No daemon reachable: fall through to an in-process run
+        args = [arg for arg in argv if arg != "--daemon"]
+
     try:
         cli = ConnascenceCLI()
         return cli.run(args)
@@ -13,6 +13,7 @@ all advanced features through command-line options.
 """
 
 import argparse
+import importlib.util
 import json
 from pathlib import Path
 import sys
@@ -22,12 +23,11 @@ from typing import Any, Dict, List, Optional
 from .config_discovery import ConfigDiscovery
 from .policy_detection import PolicyDetection
 
-# Import the full analyzer for actual analysis
+# The full analyzer is imported on first analysis so --help and config
+# discovery do not pay for the detector stack
 try:
-    from analyzer.core import ConnascenceAnalyzer
-
-    ANALYZER_AVAILABLE = True
-except ImportError:
+    ANALYZER_AVAILABLE = importlib.util.find_spec("analyzer.core") is not None
+except (ImportError, ValueError):
     ANALYZER_AVAILABLE = False
 
 
@@ -38,6 +38,7 @@ class SimpleConnascenceCLI:
         self.config_discovery = ConfigDiscovery()
         self.policy_detection = PolicyDetection()
         self.exit_code = 0
+        self._analyzer = None
 
     def create_parser(self) -> argparse.ArgumentParser:
         """Create argument parser with simple flake8-like interface."""
@@ -119,6 +120,12 @@ Examples:
             help="Disable duplication analysis (enabled by default)",
         )
 
+        parser.add_argument(
+            "--daemon",
+            action="store_true",
+            help="Run through the warm background analysis daemon (also enabled by CONNASCENCE_DAEMON=1)",
+        )
+
         # Compatibility with old interface
         parser.add_argument("--legacy-cli", action="store_true", help="Use the full legacy CLI interface")
 
@@ -289,7 +296,7 @@ Examples:
             return 1
 
         try:
-            analyzer = ConnascenceAnalyzer()
+            analyzer = self._get_analyzer()
 
             # Use first path for analysis (simple CLI focuses on single path)
             path = args.paths[0] if args.paths else "."
@@ -371,6 +378,14 @@ Examples:
             print(f"Analysis failed: {e}", file=sys.stderr)
             return 1
 
+    def _get_analyzer(self):
+        # Reused across runs so a long-lived process (the CLI daemon) keeps its caches warm
+        if self._analyzer is None:
+            from analyzer.core import ConnascenceAnalyzer
+
+            self._analyzer = ConnascenceAnalyzer()
+        return self._analyzer
+
     def _combine_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Combine multiple analysis results into one."""
         if not results:
@@ -396,6 +411,15 @@ Examples:
 
 def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point for simple CLI."""
+    from analyzer.cli_daemon import DAEMON_SUPPORTED, daemon_requested, forward_to_daemon
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if DAEMON_SUPPORTED and daemon_requested(argv):
+        exit_code = forward_to_daemon(argv, cli="simple")
+        if exit_code is not None:
+            return exit_code
+        argv = [arg for arg in argv if arg != "--daemon"]
+
     cli = SimpleConnascenceCLI()
     return cli.run(argv)
 
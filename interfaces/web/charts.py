@@ -16,10 +16,65 @@ Chart generation for connascence dashboard.
 
 Provides chart data generation for various visualizations
 including trends, distributions, and comparative analysis.
+
+Chart payloads are bounded regardless of history or scan size: long trend
+series are downsampled with LTTB (Largest-Triangle-Three-Buckets), large
+scatter plots are binned, and per-file metrics are rolled up once per scan.
+Generated payloads are cached per data version with an ETag.
 """
 
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict
+import hashlib
+import heapq
+import json
+import math
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+# Points kept in a trend series after downsampling
+DEFAULT_TREND_POINTS = 200
+# Scatter plots with more files than this are binned
+DEFAULT_SCATTER_POINTS = 1000
+# Chart payloads kept in the ETag cache
+CHART_CACHE_SIZE = 64
+
+
+def lttb_indices(values: Sequence[float], threshold: int) -> List[int]:
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last point and, from each bucket in between, the point
+    forming the largest triangle with the previously kept point and the next
+    bucket's average, which preserves peaks and troughs of the series.
+    """
+    count = len(values)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    selected = [0]
+    bucket_size = (count - 2) / (threshold - 2)
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        if end >= next_end:
+            avg_x, avg_y = float(count - 1), values[count - 1]
+        else:
+            avg_x = (end + next_end - 1) / 2
+            avg_y = sum(values[end:next_end]) / (next_end - end)
+
+        anchor_y = values[anchor]
+        best, best_area = start, -1.0
+        for index in range(start, end):
+            area = abs((anchor - avg_x) * (values[index] - anchor_y) - (anchor - index) * (avg_y - anchor_y))
+            if area > best_area:
+                best, best_area = index, area
+        selected.append(best)
+        anchor = best
+
+    selected.append(count - 1)
+    return selected
 
 
 class ChartGenerator:
@@ -42,6 +97,39 @@ class ChartGenerator:
             "quality": ["#10b981", "#f59e0b", "#ef4444"],  # Good, Warning, Critical
             "gradient": ["#3b82f6", "#8b5cf6", "#ec4899", "#f59e0b"],
         }
+        self._chart_cache: "OrderedDict[Tuple, Tuple[Dict[str, Any], str]]" = OrderedDict()
+        self._file_rollups: Tuple[Optional[Hashable], List[Dict[str, Any]]] = (None, [])
+
+    def get_chart(
+        self,
+        chart_type: str,
+        data: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
+        version: Optional[Hashable] = None,
+        max_points: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Chart payload and its ETag.
+
+        With a ``version`` identifying the underlying data (scan id, rollup
+        version), payloads are cached so unchanged charts are not rebuilt;
+        ``data`` may then be a callable that is only invoked on a cache miss.
+        """
+        key = (chart_type, version, max_points)
+        if version is not None and key in self._chart_cache:
+            self._chart_cache.move_to_end(key)
+            return self._chart_cache[key]
+
+        if callable(data):
+            data = data()
+        if max_points:
+            data = {**data, "max_points": max_points}
+        payload = self.generate_chart(chart_type, data)
+        etag = hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+        if version is not None:
+            self._chart_cache[key] = (payload, etag)
+            if len(self._chart_cache) > CHART_CACHE_SIZE:
+                self._chart_cache.popitem(last=False)
+        return payload, etag
 
     def generate_chart(self, chart_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate chart data for specified chart type."""
@@ -149,8 +237,11 @@ class ChartGenerator:
         if not trends:
             return self._empty_chart("line", "No trend data available")
 
-        # Sort by timestamp
+        # Sort by timestamp and keep the shape of long series within the point budget
         sorted_trends = sorted(trends, key=lambda x: x.get("timestamp", ""))
+        max_points = data.get("max_points") or DEFAULT_TREND_POINTS
+        kept = lttb_indices([trend.get("connascence_index", 0) or 0 for trend in sorted_trends], max_points)
+        sorted_trends = [sorted_trends[index] for index in kept]
 
         labels = []
         index_values = []
@@ -225,8 +316,8 @@ class ChartGenerator:
         if not violations_by_file:
             return self._empty_chart("bar", "No file data available")
 
-        # Sort files by violation count and take top 15
-        sorted_files = sorted(violations_by_file.items(), key=lambda x: x[1], reverse=True)[:15]
+        # Take the top 15 files by violation count
+        sorted_files = heapq.nlargest(15, violations_by_file.items(), key=lambda x: x[1])
 
         file_names = [self._shorten_filename(f[0]) for f in sorted_files]
         violation_counts = [f[1] for f in sorted_files]
@@ -277,45 +368,26 @@ class ChartGenerator:
 
     def _generate_complexity_scatter(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate complexity vs violations scatter plot."""
-        violations = data.get("violations", [])
+        file_metrics = data.get("file_rollups")
+        if file_metrics is None:
+            file_metrics = self.file_rollups(data)
 
-        if not violations:
+        if not file_metrics:
             return self._empty_chart("scatter", "No violation data available")
 
-        # Group violations by file and calculate metrics
-        file_metrics = {}
-        for violation in violations:
-            file_path = violation.get("file_path", "")
-            if file_path not in file_metrics:
-                file_metrics[file_path] = {
-                    "violation_count": 0,
-                    "complexity_score": 0,
-                    "critical_count": 0,
-                    "file_name": self._shorten_filename(file_path),
-                }
-
-            file_metrics[file_path]["violation_count"] += 1
-
-            # Estimate complexity score based on violation type and severity
-            if violation.get("connascence_type") == "CoA":  # Algorithm connascence
-                file_metrics[file_path]["complexity_score"] += 2
-            else:
-                file_metrics[file_path]["complexity_score"] += 1
-
-            if violation.get("severity") == "critical":
-                file_metrics[file_path]["critical_count"] += 1
-
-        # Create scatter plot data
-        scatter_data = []
-        for file_path, metrics in file_metrics.items():
-            scatter_data.append(
-                {
-                    "x": metrics["violation_count"],
-                    "y": metrics["complexity_score"],
-                    "label": metrics["file_name"],
-                    "critical_count": metrics["critical_count"],
-                }
-            )
+        # Create scatter plot data, binned when there are too many files to plot individually
+        scatter_data = [
+            {
+                "x": metrics["violation_count"],
+                "y": metrics["complexity_score"],
+                "label": metrics["file_name"],
+                "critical_count": metrics["critical_count"],
+            }
+            for metrics in file_metrics
+        ]
+        max_points = data.get("max_points") or DEFAULT_SCATTER_POINTS
+        if len(scatter_data) > max_points:
+            scatter_data = self._bin_scatter(scatter_data, max_points)
 
         # Color points based on critical violations
         point_colors = []
@@ -363,6 +435,80 @@ class ChartGenerator:
             },
         }
 
+    def file_rollups(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Per-file violation metrics of a scan, computed once per scan.
+
+        Scans are identified by ``job_id`` (or timestamp); the last scan's
+        rollup is reused across chart requests.
+        """
+        violations = data.get("violations", [])
+        scan_key = (data.get("job_id") or data.get("timestamp"), len(violations))
+        if scan_key[0] is not None and self._file_rollups[0] == scan_key:
+            return self._file_rollups[1]
+
+        file_metrics: Dict[str, Dict[str, Any]] = {}
+        for violation in violations:
+            file_path = violation.get("file_path", "")
+            metrics = file_metrics.get(file_path)
+            if metrics is None:
+                metrics = file_metrics[file_path] = {
+                    "violation_count": 0,
+                    "complexity_score": 0,
+                    "critical_count": 0,
+                    "file_name": self._shorten_filename(file_path),
+                }
+
+            metrics["violation_count"] += 1
+            # Estimate complexity score based on violation type and severity
+            metrics["complexity_score"] += 2 if violation.get("connascence_type") == "CoA" else 1
+            if violation.get("severity") == "critical":
+                metrics["critical_count"] += 1
+
+        rollups = list(file_metrics.values())
+        if scan_key[0] is not None:
+            self._file_rollups = (scan_key, rollups)
+        return rollups
+
+    def _bin_scatter(self, points: List[Dict[str, Any]], max_points: int) -> List[Dict[str, Any]]:
+        """Merge scatter points into a grid of at most ``max_points`` cells."""
+        bins_per_axis = max(1, int(math.sqrt(max_points)))
+        max_x = max(point["x"] for point in points) or 1
+        max_y = max(point["y"] for point in points) or 1
+
+        cells: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        for point in points:
+            cell = (
+                min(int(point["x"] / max_x * bins_per_axis), bins_per_axis - 1),
+                min(int(point["y"] / max_y * bins_per_axis), bins_per_axis - 1),
+            )
+            merged = cells.get(cell)
+            if merged is None:
+                cells[cell] = {**point, "count": 1, "_x": point["x"], "_y": point["y"]}
+                continue
+            merged["count"] += 1
+            merged["_x"] += point["x"]
+            merged["_y"] += point["y"]
+            merged["critical_count"] += point["critical_count"]
+            # Label the cell with its worst file
+            if point["x"] > merged["x"]:
+                merged["label"], merged["x"] = point["label"], point["x"]
+
+        binned = []
+        for merged in cells.values():
+            count = merged["count"]
+            label = merged["label"] if count == 1 else f"{merged['label']} (+{count - 1} files)"
+            binned.append(
+                {
+                    "x": round(merged.pop("_x") / count, 2),
+                    "y": round(merged.pop("_y") / count, 2),
+                    "label": label,
+                    "critical_count": merged["critical_count"],
+                    "count": count,
+                }
+            )
+        return binned
+
     def _generate_timeline(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate timeline chart showing violation introduction."""
         # This would require git history analysis
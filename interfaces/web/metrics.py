@@ -16,6 +16,11 @@ Dashboard metrics collection and analysis.
 
 Provides historical tracking, trend analysis, and performance
 metrics for the connascence analysis dashboard.
+
+Scans are also rolled up into per-project, per-day and per-week buckets as
+they are recorded, so trend charts read one row per bucket instead of every
+scan. Rollups are backfilled from existing scans when the table is created
+and pruned together with the scans they summarize.
 """
 
 from datetime import datetime, timedelta
@@ -23,7 +28,23 @@ import json
 from pathlib import Path
 import sqlite3
 import statistics
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Rollup granularities and the bucket each timestamp falls into
+ROLLUP_PERIODS = ("day", "week")
+
+# Scan columns a rollup is built from
+ROLLUP_SOURCE_SQL = (
+    "SELECT timestamp, project_path, connascence_index, total_violations, critical_count FROM scan_results"
+)
+
+
+def rollup_bucket(timestamp: str, period: str) -> str:
+    """Start date of the ``period`` bucket containing ``timestamp``."""
+    day = datetime.fromisoformat(timestamp).date()
+    if period == "week":
+        day -= timedelta(days=day.weekday())
+    return day.isoformat()
 
 
 class DashboardMetrics:
@@ -85,6 +106,31 @@ class DashboardMetrics:
             """
             )
 
+            rollup_columns = {row[1] for row in conn.execute("PRAGMA table_info(scan_rollups)")}
+            if "project_path" not in rollup_columns:
+                # New database, or rollups from before they were kept per project: rebuild from the scans
+                conn.execute("DROP TABLE IF EXISTS scan_rollups")
+                conn.execute(
+                    """
+                    CREATE TABLE scan_rollups (
+                        project_path TEXT NOT NULL,
+                        period TEXT NOT NULL,
+                        bucket TEXT NOT NULL,
+                        scans INTEGER NOT NULL,
+                        index_sum REAL NOT NULL,
+                        index_min REAL NOT NULL,
+                        index_max REAL NOT NULL,
+                        violations_sum INTEGER NOT NULL,
+                        violations_max INTEGER NOT NULL,
+                        critical_sum INTEGER NOT NULL,
+                        PRIMARY KEY (project_path, period, bucket)
+                    )
+                """
+                )
+                self._fold_scans(conn, conn.execute(f"{ROLLUP_SOURCE_SQL} ORDER BY id").fetchall())
+
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_scan_results_timestamp ON scan_results(timestamp)")
+
             conn.commit()
 
     def record_scan(self, scan_results: Dict[str, Any]) -> int:
@@ -92,6 +138,7 @@ class DashboardMetrics:
         with sqlite3.connect(str(self.db_path)) as conn:
             summary = scan_results.get("summary", {})
 
+            timestamp = scan_results.get("timestamp") or datetime.now().isoformat()
             cursor = conn.execute(
                 """
                 INSERT INTO scan_results (
@@ -102,7 +149,7 @@ class DashboardMetrics:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
                 (
-                    scan_results.get("timestamp", datetime.now().isoformat()),
+                    timestamp,
                     scan_results.get("project_path", ""),
                     scan_results.get("policy_preset", ""),
                     summary.get("total_violations", 0),
@@ -120,12 +167,136 @@ class DashboardMetrics:
 
             scan_id = cursor.lastrowid
 
+            self._update_rollups(
+                conn,
+                timestamp,
+                scan_results.get("project_path", ""),
+                summary.get("connascence_index", 0.0),
+                summary.get("total_violations", 0),
+                summary.get("critical_count", 0),
+            )
+
             # Record daily violation trends
-            self._update_violation_trends(scan_results.get("violations", []))
+            self._update_violation_trends(scan_results.get("violations", []), conn)
 
             conn.commit()
             return scan_id
 
+    def _update_rollups(
+        self,
+        conn: sqlite3.Connection,
+        timestamp: str,
+        project_path: str,
+        index: float,
+        violations: int,
+        critical: int,
+        periods: Tuple[str, ...] = ROLLUP_PERIODS,
+    ) -> None:
+        """Fold one scan into its project's day and week rollup buckets."""
+        for period in periods:
+            conn.execute(
+                """
+                INSERT INTO scan_rollups (
+                    project_path, period, bucket, scans, index_sum, index_min, index_max,
+                    violations_sum, violations_max, critical_sum
+                ) VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(project_path, period, bucket) DO UPDATE SET
+                    scans = scans + 1,
+                    index_sum = index_sum + excluded.index_sum,
+                    index_min = MIN(index_min, excluded.index_min),
+                    index_max = MAX(index_max, excluded.index_max),
+                    violations_sum = violations_sum + excluded.violations_sum,
+                    violations_max = MAX(violations_max, excluded.violations_max),
+                    critical_sum = critical_sum + excluded.critical_sum
+            """,
+                (
+                    project_path,
+                    period,
+                    rollup_bucket(timestamp, period),
+                    index,
+                    index,
+                    index,
+                    violations,
+                    violations,
+                    critical,
+                ),
+            )
+
+    def _fold_scans(
+        self,
+        conn: sqlite3.Connection,
+        rows: List[Tuple[str, str, float, int, int]],
+        periods: Tuple[str, ...] = ROLLUP_PERIODS,
+        bucket: Optional[str] = None,
+    ) -> None:
+        """Fold stored scan rows (``ROLLUP_SOURCE_SQL`` columns) into their rollups, optionally one bucket only."""
+        for timestamp, project_path, index, violations, critical in rows:
+            try:
+                if bucket is not None and any(rollup_bucket(timestamp, period) != bucket for period in periods):
+                    continue
+                self._update_rollups(
+                    conn, timestamp, project_path, index or 0.0, violations or 0, critical or 0, periods
+                )
+            except ValueError:
+                continue  # Timestamp that is not ISO formatted
+
+    def get_rollups(
+        self, period: str = "day", days: Optional[int] = None, project_path: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Trend points aggregated per day or week, oldest first.
+
+        Each point carries the bucket's average connascence index and violation
+        count, so it can be charted like a single scan. Without ``project_path``
+        the buckets of every project are combined.
+        """
+        if period not in ROLLUP_PERIODS:
+            raise ValueError(f"Unknown rollup period: {period}")
+
+        params: List[Any] = [period]
+        where = "WHERE period = ?"
+        if project_path is not None:
+            where += " AND project_path = ?"
+            params.append(project_path)
+        if days is not None:
+            where += " AND bucket >= ?"
+            params.append(rollup_bucket((datetime.now() - timedelta(days=days)).isoformat(), period))
+
+        with sqlite3.connect(str(self.db_path)) as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT bucket, SUM(scans), SUM(index_sum), MIN(index_min), MAX(index_max),
+                       SUM(violations_sum), MAX(violations_max), SUM(critical_sum)
+                FROM scan_rollups
+                {where}
+                GROUP BY bucket
+                ORDER BY bucket
+            """,
+                params,
+            )
+
+            return [
+                {
+                    "timestamp": bucket,
+                    "scans": scans,
+                    "connascence_index": round(index_sum / scans, 2),
+                    "connascence_index_min": index_min,
+                    "connascence_index_max": index_max,
+                    "total_violations": round(violations_sum / scans),
+                    "max_violations": violations_max,
+                    "critical_count": round(critical_sum / scans),
+                }
+                for (bucket, scans, index_sum, index_min, index_max, violations_sum, violations_max, critical_sum) in (
+                    cursor
+                )
+            ]
+
+    def data_version(self) -> Tuple[int, int]:
+        """Changes whenever scans are recorded or cleaned up; used to cache chart payloads."""
+        with sqlite3.connect(str(self.db_path)) as conn:
+            count, last_id = conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM scan_results").fetchone()
+            return count, last_id
+
     def record_performance(
         self,
         operation_type: str,
@@ -352,7 +523,7 @@ class DashboardMetrics:
 
             return type_counts
 
-    def _update_violation_trends(self, violations: List[Dict]):
+    def _update_violation_trends(self, violations: List[Dict], conn: Optional[sqlite3.Connection] = None):
         """Update daily violation trends."""
         if not violations:
             return
@@ -367,18 +538,19 @@ class DashboardMetrics:
             key = (conn_type, severity)
             type_severity_counts[key] = type_severity_counts.get(key, 0) + 1
 
-        # Store in database
-        with sqlite3.connect(str(self.db_path)) as conn:
-            for (conn_type, severity), count in type_severity_counts.items():
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO violation_trends
-                    (date, connascence_type, severity, count)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (date_str, conn_type, severity, count),
-                )
-            conn.commit()
+        # Store in database, inside the caller's transaction when given one
+        rows = [(date_str, conn_type, severity, count) for (conn_type, severity), count in type_severity_counts.items()]
+        sql = """
+            INSERT OR REPLACE INTO violation_trends
+            (date, connascence_type, severity, count)
+            VALUES (?, ?, ?, ?)
+        """
+        if conn is not None:
+            conn.executemany(sql, rows)
+            return
+        with sqlite3.connect(str(self.db_path)) as own_conn:
+            own_conn.executemany(sql, rows)
+            own_conn.commit()
 
     def _percentile(self, data: List[float], percentile: float) -> float:
         """Calculate percentile value."""
@@ -413,14 +585,33 @@ class DashboardMetrics:
             cursor = conn.execute("DELETE FROM violation_trends WHERE date < ?", (trend_cutoff,))
             trend_rows_deleted = cursor.rowcount
 
+            rollup_rows_deleted = self._prune_rollups(conn, cutoff_date)
+
             conn.commit()
 
             return {
                 "scan_results_deleted": scan_rows_deleted,
                 "performance_metrics_deleted": perf_rows_deleted,
                 "violation_trends_deleted": trend_rows_deleted,
+                "scan_rollups_deleted": rollup_rows_deleted,
             }
 
+    def _prune_rollups(self, conn: sqlite3.Connection, cutoff: str) -> int:
+        """
+        Drop rollups of pruned scans.
+
+        Buckets entirely before the cutoff are deleted; the bucket holding the
+        cutoff is rebuilt from the scans that remain in it.
+        """
+        deleted = 0
+        for period in ROLLUP_PERIODS:
+            boundary = rollup_bucket(cutoff, period)
+            cursor = conn.execute("DELETE FROM scan_rollups WHERE period = ? AND bucket <= ?", (period, boundary))
+            deleted += cursor.rowcount
+            remaining = conn.execute(f"{ROLLUP_SOURCE_SQL} WHERE timestamp >= ? ORDER BY id", (boundary,)).fetchall()
+            self._fold_scans(conn, remaining, (period,), bucket=boundary)
+        return deleted
+
     def export_metrics(self, format: str = "json", days: int = 30) -> str:
         """Export metrics data in specified format."""
         data = {
@@ -0,0 +1,409 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+"""
+Background scan jobs for the local dashboard.
+
+A project has at most one active scan. Jobs analyze the project file by file
+so the dashboard sees results while the scan runs:
+
+- ``scan_progress`` reports files done (throttled), then blocks clustered
+  during the duplication phase
+- ``scan_violations`` carries each batch of newly found violations
+- ``scan_complete`` carries the summary and page counts only; the full
+  violation and duplication lists are fetched page by page
+
+The streamed per-file pass is the job's result; nothing is analyzed twice.
+The policy preset is validated before the first file, summary counters are
+updated as each file finishes, and each file's code blocks are collected
+for duplication clustering as it is analyzed. Once every file is done the
+blocks are clustered and recommendations are built from the collected
+results; cancellation is honored throughout.
+"""
+
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import uuid
+
+from analyzer.optimization.digest_service import iter_tree_files
+
+logger = logging.getLogger(__name__)
+
+SEVERITY_WEIGHTS = {"critical": 10, "high": 5, "medium": 2, "low": 1}
+
+# Result lists a client can page through
+RESULT_KINDS = ("violations", "nasa_violations", "duplication_clusters")
+
+
+class ScanStatus(Enum):
+    """Lifecycle of a dashboard scan job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+
+@dataclass
+class ScanSummary:
+    """Summary counters kept up to date while a scan runs."""
+
+    total_violations: int = 0
+    critical_count: int = 0
+    high_count: int = 0
+    medium_count: int = 0
+    low_count: int = 0
+    violations_by_type: Counter = field(default_factory=Counter)
+    violations_by_file: Counter = field(default_factory=Counter)
+    connascence_index: float = 0.0
+    file_count: int = 0
+    nasa_score_total: float = 0.0
+    # MECE score, known once duplication clustering has run
+    duplication_score: float = 1.0
+
+    def add_file(self, violations: List[Dict[str, Any]], nasa_compliance_score: float) -> None:
+        self.file_count += 1
+        self.nasa_score_total += nasa_compliance_score
+        for violation in violations:
+            severity = violation.get("severity", "medium")
+            self.total_violations += 1
+            if severity in SEVERITY_WEIGHTS:
+                setattr(self, f"{severity}_count", getattr(self, f"{severity}_count") + 1)
+            self.violations_by_type[violation.get("type", "unknown")] += 1
+            self.violations_by_file[Path(violation.get("file_path", "")).name] += 1
+            self.connascence_index += SEVERITY_WEIGHTS.get(severity, 1) * violation.get("weight", 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        nasa_compliance_score = self.nasa_score_total / self.file_count if self.file_count else 1.0
+        overall_quality_score = (nasa_compliance_score + self.duplication_score) / 2.0
+        return {
+            "total_violations": self.total_violations,
+            "critical_count": self.critical_count,
+            "high_count": self.high_count,
+            "medium_count": self.medium_count,
+            "low_count": self.low_count,
+            "violations_by_type": dict(self.violations_by_type),
+            "violations_by_file": dict(self.violations_by_file),
+            "connascence_index": round(self.connascence_index, 2),
+            "nasa_compliance_score": nasa_compliance_score,
+            "duplication_score": self.duplication_score,
+            "overall_quality_score": overall_quality_score,
+            "file_count": self.file_count,
+        }
+
+
+@dataclass
+class ScanJob:
+    """One scan of one project."""
+
+    job_id: str
+    project_path: Path
+    policy_preset: str
+    status: ScanStatus = ScanStatus.QUEUED
+    files_total: int = 0
+    files_done: int = 0
+    summary: ScanSummary = field(default_factory=ScanSummary)
+    violations: List[Dict[str, Any]] = field(default_factory=list)
+    nasa_violations: List[Dict[str, Any]] = field(default_factory=list)
+    duplication_clusters: List[Dict[str, Any]] = field(default_factory=list)
+    recommendations: Dict[str, List[str]] = field(
+        default_factory=lambda: {"priority_fixes": [], "improvement_actions": []}
+    )
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    thread: Optional[threading.Thread] = field(default=None, repr=False)
+    # MECE code blocks gathered per file for the duplication phase
+    code_blocks: List[Any] = field(default_factory=list, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (ScanStatus.COMPLETED, ScanStatus.CANCELLED, ScanStatus.FAILED)
+
+    def status_payload(self, page_size: int) -> Dict[str, Any]:
+        """Job state and summary, without the result lists."""
+        return {
+            "job_id": self.job_id,
+            "project_path": str(self.project_path),
+            "policy_preset": self.policy_preset,
+            "status": self.status.value,
+            "files_total": self.files_total,
+            "files_done": self.files_done,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "errors": self.errors,
+            "summary": self.summary.to_dict(),
+            "recommendations": self.recommendations,
+            "page_size": page_size,
+            "pages": {kind: -(-len(getattr(self, kind)) // page_size) for kind in RESULT_KINDS},
+        }
+
+    def page(self, kind: str, page: int, page_size: int) -> Dict[str, Any]:
+        """One page of a result list (pages start at 0)."""
+        if kind not in RESULT_KINDS:
+            raise ValueError(f"Unknown result kind: {kind}")
+        items = getattr(self, kind)
+        start = max(page, 0) * page_size
+        return {
+            "job_id": self.job_id,
+            "kind": kind,
+            "page": page,
+            "page_size": page_size,
+            "total": len(items),
+            "items": items[start : start + page_size],
+        }
+
+    def to_scan_results(self) -> Dict[str, Any]:
+        """Full results in the dashboard's ``scan_results`` layout."""
+        return {
+            "job_id": self.job_id,
+            "project_path": str(self.project_path),
+            "policy_preset": self.policy_preset,
+            "timestamp": self.finished_at,
+            "violations": self.violations,
+            "duplication_clusters": self.duplication_clusters,
+            "nasa_violations": self.nasa_violations,
+            "summary": self.summary.to_dict(),
+            "recommendations": self.recommendations,
+            "errors": self.errors,
+        }
+
+
+class ScanJobManager:
+    """Runs dashboard scans in the background, one active job per project."""
+
+    def __init__(
+        self,
+        analyzer,
+        emit: Callable[[str, Dict[str, Any]], None],
+        on_complete: Optional[Callable[[ScanJob], None]] = None,
+        batch_size: int = 200,
+        page_size: int = 500,
+        progress_interval: float = 0.1,
+        max_finished_jobs: int = 20,
+    ):
+        self.analyzer = analyzer
+        self.emit = emit
+        self.on_complete = on_complete
+        self.batch_size = batch_size
+        self.page_size = page_size
+        self.progress_interval = progress_interval
+        self.max_finished_jobs = max_finished_jobs
+
+        self._jobs: "OrderedDict[str, ScanJob]" = OrderedDict()
+        self._active: Dict[Path, ScanJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, project_path: Path, policy_preset: str) -> Tuple[ScanJob, bool]:
+        """
+        Start a scan unless an identical one is already running.
+
+        A request for the same project with another preset cancels the running
+        job; the new one starts once it has stopped.
+
+        Returns:
+            The job serving the request and whether it was newly created
+        """
+        key = Path(project_path).resolve()
+        with self._lock:
+            previous = self._active.get(key)
+            if previous and not previous.finished:
+                if previous.policy_preset == policy_preset:
+                    return previous, False
+                previous.cancel_event.set()
+
+            job = ScanJob(job_id=uuid.uuid4().hex, project_path=Path(project_path), policy_preset=policy_preset)
+            self._jobs[job.job_id] = job
+            self._active[key] = job
+            self._trim_finished()
+
+        job.thread = threading.Thread(target=self._run, args=(job, key, previous), daemon=True)
+        job.thread.start()
+        return job, True
+
+    def cancel(self, job_id: str) -> bool:
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        job.cancel_event.set()
+        return True
+
+    def get(self, job_id: str) -> Optional[ScanJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _trim_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def _run(self, job: ScanJob, key: Path, previous: Optional[ScanJob]) -> None:
+        if previous is not None and previous.thread is not None:
+            previous.thread.join()
+
+        job.status = ScanStatus.RUNNING
+        job.started_at = datetime.now().isoformat()
+        self.emit(
+            "scan_started",
+            {"job_id": job.job_id, "project_path": str(job.project_path), "policy_preset": job.policy_preset},
+        )
+
+        try:
+            job.errors = self._validate_preset(job)
+            self._scan_files(job)
+            if not job.cancel_event.is_set():
+                self._find_duplications(job)
+            if not job.cancel_event.is_set():
+                job.recommendations = self._recommendations(job)
+
+            job.finished_at = datetime.now().isoformat()
+            if job.cancel_event.is_set():
+                job.status = ScanStatus.CANCELLED
+                self.emit("scan_cancelled", job.status_payload(self.page_size))
+                return
+
+            job.status = ScanStatus.COMPLETED
+            if self.on_complete:
+                self.on_complete(job)
+            self.emit("scan_complete", job.status_payload(self.page_size))
+        except Exception as e:
+            logger.error(f"Dashboard scan of {job.project_path} failed: {e}")
+            job.status = ScanStatus.FAILED
+            job.error = str(e)
+            job.finished_at = datetime.now().isoformat()
+            self.emit("scan_error", {"job_id": job.job_id, "error": str(e)})
+        finally:
+            with self._lock:
+                if self._active.get(key) is job:
+                    del self._active[key]
+
+    def _validate_preset(self, job: ScanJob) -> List[Dict[str, Any]]:
+        """Check the project path and policy preset the way a project analysis would."""
+        initialize = getattr(self.analyzer, "_initialize_analysis_context", None)
+        if initialize is None:
+            return []
+        errors, _warnings = initialize(job.project_path, job.policy_preset)
+        return [error.to_dict() for error in errors]
+
+    def _scan_files(self, job: ScanJob) -> None:
+        files = self._discover_files(job.project_path)
+        job.files_total = len(files)
+        mece_analyzer = getattr(self.analyzer, "mece_analyzer", None)
+
+        batch: List[Dict[str, Any]] = []
+        last_progress = 0.0
+        for file_path in files:
+            if job.cancel_event.is_set():
+                break
+
+            result = self.analyzer.analyze_file(file_path)
+            violations = result.get("connascence_violations", [])
+            job.violations.extend(violations)
+            job.nasa_violations.extend(result.get("nasa_violations", []))
+            job.summary.add_file(violations, result.get("nasa_compliance_score", 1.0))
+            if mece_analyzer:
+                job.code_blocks.extend(mece_analyzer.extract_file_blocks(file_path))
+            job.files_done += 1
+
+            batch.extend(violations)
+            if len(batch) >= self.batch_size:
+                self._emit_violations(job, batch)
+                batch = []
+
+            now = time.monotonic()
+            if now - last_progress >= self.progress_interval or job.files_done == job.files_total:
+                last_progress = now
+                self.emit(
+                    "scan_progress",
+                    {
+                        "job_id": job.job_id,
+                        "phase": "files",
+                        "files_done": job.files_done,
+                        "files_total": job.files_total,
+                        "current_file": str(file_path),
+                        "summary": job.summary.to_dict(),
+                    },
+                )
+
+        if batch:
+            self._emit_violations(job, batch)
+
+    def _emit_violations(self, job: ScanJob, batch: List[Dict[str, Any]]) -> None:
+        self.emit("scan_violations", {"job_id": job.job_id, "violations": batch, "total": len(job.violations)})
+
+    def _discover_files(self, project_path: Path) -> List[Path]:
+        if project_path.is_file():
+            return [project_path]
+        should_analyze = getattr(self.analyzer, "_should_analyze_file", None)
+        files = sorted(iter_tree_files(project_path))
+        return [path for path in files if should_analyze(path)] if should_analyze else files
+
+    def _find_duplications(self, job: ScanJob) -> None:
+        """Cluster the collected code blocks, reporting progress and stopping on cancel."""
+        mece_analyzer = getattr(self.analyzer, "mece_analyzer", None)
+        if not mece_analyzer:
+            return
+        last_progress = 0.0
+
+        def on_progress(done: int, total: int) -> None:
+            nonlocal last_progress
+            now = time.monotonic()
+            if now - last_progress >= self.progress_interval or done == total:
+                last_progress = now
+                self.emit(
+                    "scan_progress",
+                    {"job_id": job.job_id, "phase": "duplication", "blocks_done": done, "blocks_total": total},
+                )
+
+        try:
+            duplications, score = mece_analyzer.find_duplications(
+                job.code_blocks, should_stop=job.cancel_event.is_set, on_progress=on_progress
+            )
+        except Exception as e:
+            logger.warning(f"Duplication analysis failed: {e}")
+            return
+        finally:
+            job.code_blocks = []
+        job.duplication_clusters = duplications
+        job.summary.duplication_score = score
+
+    def _recommendations(self, job: ScanJob) -> Dict[str, List[str]]:
+        """Recommendations built from the streamed results."""
+        generator = getattr(self.analyzer, "recommendation_generator", None)
+        if not generator:
+            return job.recommendations
+        try:
+            recommendations = generator.generate_recommendations(
+                {"connascence": job.violations, "duplication": job.duplication_clusters, "nasa": job.nasa_violations}
+            )
+        except Exception as e:
+            logger.warning(f"Recommendation generation failed: {e}")
+            return job.recommendations
+        return {
+            "priority_fixes": list(recommendations.get("priority_fixes", [])),
+            "improvement_actions": list(recommendations.get("improvement_actions", [])),
+        }
+
+
+__all__ = ["ScanJob", "ScanJobManager", "ScanStatus", "ScanSummary"]
@@ -33,12 +33,13 @@ from fixes.phase0.production_safe_assertions import ProductionAssert
 
 # Updated imports for unified analyzer
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from analyzer.unified_analyzer import UnifiedAnalysisResult, UnifiedConnascenceAnalyzer
+from analyzer.unified_analyzer import UnifiedConnascenceAnalyzer
 from autofix.patch_api import SafeAutofixer
 from policy.manager import PolicyManager
 
 from .charts import ChartGenerator
 from .metrics import DashboardMetrics
+from .scan_jobs import RESULT_KINDS, ScanJob, ScanJobManager
 
 
 class LocalDashboard:
@@ -60,8 +61,9 @@ class LocalDashboard:
         # Dashboard state
         self.current_project: Optional[Path] = None
         self.scan_results: Dict[str, Any] = {}
-        self.unified_results: Optional[UnifiedAnalysisResult] = None
         self.historical_data: List[Dict] = []
+        self.scan_jobs = ScanJobManager(self.analyzer, emit=self.socketio.emit, on_complete=self._record_scan)
+        self.latest_job: Optional[ScanJob] = None
 
         self._setup_routes()
         self._setup_websocket_handlers()
@@ -86,12 +88,45 @@ class LocalDashboard:
             policy_preset = data.get("policy_preset", "service-defaults")
 
             try:
-                # Start background scan
-                self._start_background_scan(project_path, policy_preset)
-                return jsonify({"status": "started", "message": "Scan initiated"})
+                # Start background scan (or join the identical one already running)
+                job, created = self._start_background_scan(project_path, policy_preset)
+                return jsonify(
+                    {
+                        "status": "started" if created else "already_running",
+                        "message": "Scan initiated" if created else "Scan already in progress",
+                        "job_id": job.job_id,
+                    }
+                )
             except Exception as e:
                 return jsonify({"status": "error", "message": str(e)}), 500
 
+        @self.app.route("/api/scan/<job_id>")
+        def scan_status(job_id):
+            """Get progress and summary of a scan job."""
+            job = self.scan_jobs.get(job_id)
+            if job is None:
+                return jsonify({"error": "Unknown scan job"}), 404
+            return jsonify(job.status_payload(self.scan_jobs.page_size))
+
+        @self.app.route("/api/scan/<job_id>/cancel", methods=["POST"])
+        def cancel_scan(job_id):
+            """Cancel a running scan job."""
+            if not self.scan_jobs.cancel(job_id):
+                return jsonify({"status": "error", "message": "No running scan with that id"}), 404
+            return jsonify({"status": "cancelling", "job_id": job_id})
+
+        @self.app.route("/api/scan/<job_id>/results/<kind>")
+        def scan_results_page(job_id, kind):
+            """Get one page of a scan job's violations, NASA violations or duplication clusters."""
+            job = self.scan_jobs.get(job_id)
+            if job is None:
+                return jsonify({"error": "Unknown scan job"}), 404
+            if kind not in RESULT_KINDS:
+                return jsonify({"error": "Unsupported result kind"}), 400
+            page = request.args.get("page", 0, type=int)
+            page_size = min(request.args.get("page_size", self.scan_jobs.page_size, type=int), 5000)
+            return jsonify(job.page(kind, page, max(page_size, 1)))
+
         @self.app.route("/api/autofix/preview", methods=["POST"])
         def preview_autofix():
             """Preview autofix suggestions."""
@@ -120,15 +155,34 @@ class LocalDashboard:
 
             ProductionAssert.not_none(chart_type, "chart_type")
 
-            if not self.scan_results:
+            max_points = request.args.get("max_points", type=int)
+            if chart_type == "trend_line":
+                # Trends come from the per-day/per-week rollups rather than individual scans
+                period = request.args.get("period", "day")
+                days = request.args.get("days", type=int)
+                project = request.args.get("project") or (str(self.current_project) if self.current_project else None)
+                version = ("trend_line", period, days, project, self.metrics.data_version())
+
+                def data():
+                    return {"trends": self.metrics.get_rollups(period, days, project)}
+
+            elif not self.scan_results:
                 return jsonify({"error": "No scan results available"}), 404
+            else:
+                version = self.scan_results.get("job_id") or self.scan_results.get("timestamp")
+                data = self.scan_results
 
             try:
-                chart_data = self.chart_generator.generate_chart(chart_type, self.scan_results)
-                return jsonify(chart_data)
+                chart_data, etag = self.chart_generator.get_chart(chart_type, data, version, max_points)
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
 
+            # Unchanged charts are answered with 304 Not Modified
+            response = jsonify(chart_data)
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = "no-cache"
+            return response.make_conditional(request)
+
         @self.app.route("/api/policy/presets")
         def get_policy_presets():
             """Get available policy presets."""
@@ -173,8 +227,25 @@ class LocalDashboard:
         @self.socketio.on("request_live_update")
         def handle_live_update():
             """Handle request for live updates."""
-            if self.scan_results:
-                emit("scan_update", self.scan_results)
+            if self.latest_job:
+                emit("scan_update", self.latest_job.status_payload(self.scan_jobs.page_size))
+
+        @self.socketio.on("cancel_scan")
+        def handle_cancel_scan(data):
+            """Handle scan cancellation request."""
+            job_id = (data or {}).get("job_id") or (self.latest_job.job_id if self.latest_job else None)
+            accepted = bool(job_id and self.scan_jobs.cancel(job_id))
+            emit("scan_cancel_requested", {"job_id": job_id, "accepted": accepted})
+
+        @self.socketio.on("request_results_page")
+        def handle_results_page(data):
+            """Send one page of scan results."""
+            job = self.scan_jobs.get(data.get("job_id", ""))
+            kind = data.get("kind", "violations")
+            if job is None or kind not in RESULT_KINDS:
+                emit("scan_error", {"error": "Unknown scan job or result kind", "job_id": data.get("job_id")})
+                return
+            emit("scan_results_page", job.page(kind, int(data.get("page", 0)), self.scan_jobs.page_size))
 
         @self.socketio.on("scan_file")
         def handle_file_scan(data):
@@ -192,65 +263,17 @@ class LocalDashboard:
                 emit("scan_error", {"error": str(e), "file_path": str(file_path)})
 
     def _start_background_scan(self, project_path: Path, policy_preset: str):
-        """Start background project scan."""
-
-        def scan_worker():
-            try:
-                self.current_project = project_path
-
-                # Emit scan started
-                self.socketio.emit("scan_started", {"project_path": str(project_path), "policy_preset": policy_preset})
-
-                # Perform unified analysis
-                self.unified_results = self.analyzer.analyze_project(project_path, policy_preset=policy_preset)
-
-                # Generate dashboard summary
-                self.analyzer.get_dashboard_summary(self.unified_results)
-
-                # Process results for dashboard compatibility
-                self.scan_results = {
-                    "project_path": str(project_path),
-                    "policy_preset": policy_preset,
-                    "timestamp": self.unified_results.timestamp,
-                    "violations": self.unified_results.connascence_violations,
-                    "duplication_clusters": self.unified_results.duplication_clusters,
-                    "nasa_violations": self.unified_results.nasa_violations,
-                    "summary": {
-                        "total_violations": self.unified_results.total_violations,
-                        "critical_count": self.unified_results.critical_count,
-                        "high_count": self.unified_results.high_count,
-                        "medium_count": self.unified_results.medium_count,
-                        "low_count": self.unified_results.low_count,
-                        "violations_by_type": self._group_by_type_from_dict(
-                            self.unified_results.connascence_violations
-                        ),
-                        "violations_by_file": self._group_by_file_from_dict(
-                            self.unified_results.connascence_violations
-                        ),
-                        "connascence_index": self.unified_results.connascence_index,
-                        "nasa_compliance_score": self.unified_results.nasa_compliance_score,
-                        "duplication_score": self.unified_results.duplication_score,
-                        "overall_quality_score": self.unified_results.overall_quality_score,
-                    },
-                    "recommendations": {
-                        "priority_fixes": self.unified_results.priority_fixes,
-                        "improvement_actions": self.unified_results.improvement_actions,
-                    },
-                }
-
-                # Store historical data
-                self.metrics.record_scan(self.scan_results)
-
-                # Emit scan complete
-                self.socketio.emit("scan_complete", self.scan_results)
-
-            except Exception as e:
-                self.socketio.emit("scan_error", {"error": str(e)})
-
-        # Start background thread
-        thread = threading.Thread(target=scan_worker)
-        thread.daemon = True
-        thread.start()
+        """Start background project scan, one per project."""
+        self.current_project = project_path
+        job, created = self.scan_jobs.submit(project_path, policy_preset)
+        self.latest_job = job
+        return job, created
+
+    def _record_scan(self, job: ScanJob):
+        """Keep the results of a completed scan for charts, exports and trends."""
+        self.scan_results = job.to_scan_results()
+        self.metrics.record_scan(self.scan_results)
+        self.chart_generator.file_rollups(self.scan_results)
 
     def _violation_to_dict(self, violation) -> Dict:
         """Convert violation object to dictionary."""
@@ -280,22 +303,6 @@ class LocalDashboard:
             weight=data["weight"],
         )
 
-    def _group_by_type_from_dict(self, violations) -> Dict[str, int]:
-        """Group violations by connascence type from dict format."""
-        groups = {}
-        for violation in violations:
-            conn_type = violation.get("type", "unknown")
-            groups[conn_type] = groups.get(conn_type, 0) + 1
-        return groups
-
-    def _group_by_file_from_dict(self, violations) -> Dict[str, int]:
-        """Group violations by file from dict format."""
-        groups = {}
-        for violation in violations:
-            file_path = Path(violation.get("file_path", "")).name
-            groups[file_path] = groups.get(file_path, 0) + 1
-        return groups
-
     def _group_by_type(self, violations) -> Dict[str, int]:
         """Group violations by connascence type (legacy compatibility)."""
         groups = {}
@@ -67,10 +67,27 @@ class ConnascenceDashboard {
             this.handleScanStarted(data);
         });
         
+        this.socket.on('scan_progress', (data) => {
+            this.handleScanProgress(data);
+        });
+        
+        this.socket.on('scan_violations', (data) => {
+            this.handleScanViolations(data);
+        });
+        
         this.socket.on('scan_complete', (data) => {
             this.handleScanComplete(data);
         });
         
+        this.socket.on('scan_cancelled', (data) => {
+            this.handleScanCancelled(data);
+        });
+        
+        this.socket.on('scan_update', (data) => {
+            this.updateMetrics(data.summary);
+            this.updateCharts(data);
+        });
+        
         this.socket.on('scan_error', (data) => {
             this.handleScanError(data);
         });
@@ -303,7 +320,9 @@ class ConnascenceDashboard {
         })
         .then(response => response.json())
         .then(data => {
-            if (data.status !== 'started') {
+            if (data.status === 'started' || data.status === 'already_running') {
+                this.activeJobId = data.job_id;
+            } else {
                 this.handleScanError({error: data.message});
             }
         })
@@ -313,15 +332,64 @@ class ConnascenceDashboard {
     }
     
     handleScanStarted(data) {
+        this.activeJobId = data.job_id;
+        this.scanResults = {job_id: data.job_id, violations: [], summary: {}};
         document.getElementById('scanStatus').textContent = `Scanning ${data.project_path}...`;
-        document.getElementById('scanProgress').style.width = '20%';
+        document.getElementById('scanProgress').style.width = '0%';
         
         // Update project path display
         document.getElementById('projectPath').textContent = data.project_path;
     }
     
-    handleScanComplete(data) {
-        this.scanResults = data;
+    handleScanProgress(data) {
+        if (data.job_id !== this.activeJobId) return;
+        
+        const percent = data.files_total ? (data.files_done / data.files_total) * 100 : 0;
+        document.getElementById('scanProgress').style.width = `${Math.min(percent, 99)}%`;
+        document.getElementById('scanStatus').textContent =
+            `Scanning ${data.files_done}/${data.files_total} files...`;
+        
+        this.updateMetrics(data.summary);
+        this.updateCharts(data);
+    }
+    
+    handleScanViolations(data) {
+        if (!this.scanResults || data.job_id !== this.scanResults.job_id) return;
+        
+        this.scanResults.violations.push(...data.violations);
+        
+        // Re-render at most a few times per second while batches stream in
+        if (!this.renderPending) {
+            this.renderPending = true;
+            setTimeout(() => {
+                this.renderPending = false;
+                this.updateViolationsList(this.scanResults.violations);
+            }, 250);
+        }
+    }
+    
+    async loadResultPages(jobId, kind, pages) {
+        // Fetch result lists page by page when live batches were missed
+        const items = [];
+        for (let page = 0; page < pages; page++) {
+            const response = await fetch(`/api/scan/${jobId}/results/${kind}?page=${page}`);
+            const data = await response.json();
+            items.push(...data.items);
+        }
+        return items;
+    }
+    
+    async handleScanComplete(data) {
+        if (data.job_id !== this.activeJobId) return;
+        
+        const violations = this.scanResults && this.scanResults.job_id === data.job_id
+            ? this.scanResults.violations : [];
+        this.scanResults = {
+            ...data,
+            timestamp: data.finished_at,
+            violations: violations.length === data.summary.total_violations
+                ? violations : await this.loadResultPages(data.job_id, 'violations', data.pages.violations)
+        };
         
         // Reset scan button
         const scanButton = document.getElementById('scanButton');
@@ -343,7 +411,7 @@ class ConnascenceDashboard {
         this.updateCharts(data);
         
         // Update violations list
-        this.updateViolationsList(data.violations);
+        this.updateViolationsList(this.scanResults.violations);
         
         // Reset progress after delay
         setTimeout(() => {
@@ -352,6 +420,22 @@ class ConnascenceDashboard {
         }, 2000);
     }
     
+    handleScanCancelled(data) {
+        if (data.job_id !== this.activeJobId) return;
+        
+        const scanButton = document.getElementById('scanButton');
+        scanButton.disabled = false;
+        scanButton.innerHTML = '<i class="fas fa-search me-2"></i>Scan';
+        document.getElementById('scanProgress').style.width = '0%';
+        document.getElementById('scanStatus').textContent = 'Scan cancelled';
+    }
+    
+    cancelScan() {
+        if (this.activeJobId) {
+            this.socket.emit('cancel_scan', {job_id: this.activeJobId});
+        }
+    }
+    
     handleScanError(data) {
         // Reset scan button
         const scanButton = document.getElementById('scanButton');
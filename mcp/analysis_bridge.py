@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
 
 from analyzer.cli_entry import SharedCLIAnalyzer, get_shared_cli_analyzer
 from fixes.phase0.production_safe_assertions import ProductionAssert
@@ -40,6 +40,18 @@ class AnalyzerBridge:
             selected_files=list(file_paths),
         )
 
+    def analyze_workspace_file(self, file_path: Path, analysis_type: str) -> Dict[str, object]:
+        """Analyze one file of a workspace job; failures are reported in the payload."""
+        ProductionAssert.not_none(file_path, "file_path")
+        profile = self._resolve_profile(analysis_type)
+        try:
+            payload = self._cli_helper.analyze_workspace_file(Path(file_path), profile)
+        except Exception as exc:
+            return {"target": str(file_path), "success": False, "error": str(exc), "findings": [], "summary": {}}
+        payload.setdefault("target", str(file_path))
+        payload["success"] = True
+        return payload
+
     def health_snapshot(self) -> Dict[str, object]:
         return {
             "analyzer_available": True,
@@ -57,4 +69,19 @@ class AnalyzerBridge:
         return mapping.get(analysis_type, "service-defaults")
 
 
-__all__ = ["AnalyzerBridge"]
+_worker_bridge: Optional[AnalyzerBridge] = None
+
+
+def analyze_files_in_worker(file_paths: List[str], analysis_type: str) -> List[Dict[str, object]]:
+    """Analyze a chunk of workspace files inside a pool worker.
+
+    Each worker process keeps one bridge, so the analyzer and its result cache
+    are built once per process rather than once per chunk.
+    """
+    global _worker_bridge
+    if _worker_bridge is None:
+        _worker_bridge = AnalyzerBridge()
+    return [_worker_bridge.analyze_workspace_file(Path(file_path), analysis_type) for file_path in file_paths]
+
+
+__all__ = ["AnalyzerBridge", "analyze_files_in_worker"]
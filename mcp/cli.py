@@ -90,6 +90,7 @@ async def analyze_workspace_command(args: argparse.Namespace) -> int:
             analysis_type=args.analysis_type,
             file_patterns=args.file_patterns or ["*.py"],
             include_integrations=args.include_integrations,
+            wait=True,
         )
 
         if args.output:
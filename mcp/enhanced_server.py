@@ -28,6 +28,7 @@ from typing import Any, Dict, List, Optional
 
 from fixes.phase0.production_safe_assertions import ProductionAssert
 from mcp.analysis_bridge import AnalyzerBridge
+from mcp.workspace_jobs import JobStatus, WorkspaceJobManager
 
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -45,6 +46,8 @@ except ImportError:
         TOOL_ANALYZE_WORKSPACE = "analyze_workspace"
         TOOL_GET_VIOLATIONS = "get_violations"
         TOOL_HEALTH_CHECK = "health_check"
+        TOOL_GET_WORKSPACE_RESULTS = "get_workspace_results"
+        TOOL_CANCEL_WORKSPACE_JOB = "cancel_workspace_job"
         DEFAULT_MAX_FILE_SIZE = 1024  # KB
         DEFAULT_RATE_LIMIT = 60
         DEFAULT_AUDIT_ENABLED = True
@@ -123,11 +126,22 @@ class EnhancedConnascenceMCPServer:
         self.analysis_bridge = AnalyzerBridge()
         self.integrations = self._load_integrations()
 
+        # Workspace analyses run as jobs on a bounded worker pool
+        self.workspace_jobs = WorkspaceJobManager(
+            max_workers=self.config.get("workspace_max_workers"),
+            use_processes=self.config.get("workspace_use_processes", True),
+            page_size=PerformanceLimits.MAX_FILES_PER_BATCH,
+        )
+
         # Register tools
         self._tools = self._register_tools()
 
         logger.info(f"Enhanced MCP Server initialized: {self.name} v{self.version}")
 
+    def cleanup(self) -> None:
+        """Stop workspace jobs and release their worker pool; call when the server shuts down."""
+        self.workspace_jobs.shutdown()
+
     def _create_rate_limiter(self):
         """Create rate limiter with central config."""
         try:
@@ -275,8 +289,38 @@ class EnhancedConnascenceMCPServer:
                         "description": "Include external tool integrations",
                         "default": True,
                     },
+                    "wait": {
+                        "type": "boolean",
+                        "description": "Wait for the job and return every file result instead of a job id",
+                        "default": False,
+                    },
                 },
             },
+            MCPConstants.TOOL_GET_WORKSPACE_RESULTS: {
+                "description": "Page through the per-file results of a workspace analysis job",
+                "parameters": {
+                    "job_id": {"type": "string", "description": "Job id returned by analyze_workspace"},
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page; omit for the first page",
+                        "optional": True,
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of file results to return",
+                        "default": PerformanceLimits.MAX_FILES_PER_BATCH,
+                    },
+                    "wait": {
+                        "type": "number",
+                        "description": "Seconds to wait for new results while the job is running",
+                        "default": 0,
+                    },
+                },
+            },
+            MCPConstants.TOOL_CANCEL_WORKSPACE_JOB: {
+                "description": "Cancel a running workspace analysis job",
+                "parameters": {"job_id": {"type": "string", "description": "Job id to cancel"}},
+            },
             MCPConstants.TOOL_GET_VIOLATIONS: {
                 "description": "Get violations by type or severity",
                 "parameters": {
@@ -393,29 +437,40 @@ class EnhancedConnascenceMCPServer:
                 }
 
             file_patterns = kwargs.get("file_patterns", ["*.py"])
-            files_to_analyze = []
-
-            # Find files matching patterns
-            for pattern in file_patterns:
-                files_to_analyze.extend(workspace_path.rglob(pattern))
-
-            # Limit number of files for performance
-            max_files = PerformanceLimits.MAX_FILES_PER_BATCH
-            if len(files_to_analyze) > max_files:
-                files_to_analyze = files_to_analyze[:max_files]
-                logger.warning(f"Limited analysis to {max_files} files")
-
+            files_to_analyze = self._collect_workspace_files(workspace_path, file_patterns)
             analysis_type = kwargs.get("analysis_type", "full")
-            bridge_result = await asyncio.to_thread(
-                self.analysis_bridge.analyze_workspace,
-                workspace_path,
-                files_to_analyze,
-                analysis_type,
+
+            # Every matching file is analyzed; results are paged rather than truncated
+            job = self.workspace_jobs.submit(workspace_path, files_to_analyze, analysis_type)
+            self.audit_logger.log(
+                "analyze_workspace_job",
+                {"job_id": job.job_id, "workspace_path": str(workspace_path), "files_total": job.files_total},
             )
 
+            if not kwargs.get("wait", False):
+                return {
+                    "success": True,
+                    **job.progress(),
+                    "workspace_path": str(workspace_path),
+                    "analysis_type": analysis_type,
+                    "next_cursor": "0",
+                    "metrics": {
+                        "files_considered": len(files_to_analyze),
+                        "file_patterns": file_patterns,
+                        "execution_time": time.time() - start_time,
+                    },
+                }
+
+            job = await self.workspace_jobs.wait_for_completion(job.job_id)
+            progress = job.progress()
             return {
-                "success": True,
-                **bridge_result,
+                "success": job.status == JobStatus.COMPLETED,
+                "job_id": job.job_id,
+                "status": progress["status"],
+                "files": {result["target"]: result for result in job.results},
+                "files_analyzed": progress["files_done"] - progress["files_failed"],
+                "files_failed": progress["files_failed"],
+                "overall_score": progress["overall_score"],
                 "analysis_type": analysis_type,
                 "files_considered": len(files_to_analyze),
                 "metrics": {
@@ -436,6 +491,37 @@ class EnhancedConnascenceMCPServer:
                 "execution_time": time.time() - start_time,
             }
 
+    async def get_workspace_results(
+        self,
+        job_id: str,
+        *,
+        client_id: str = "mcp-cli",
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        wait: float = 0.0,
+    ) -> Dict[str, Any]:
+        """Get one page of a workspace job's file results."""
+        try:
+            self._guard_request(MCPConstants.TOOL_GET_WORKSPACE_RESULTS, client_id, {"job_id": job_id})
+            return await self.workspace_jobs.page(job_id, cursor=cursor, limit=limit, wait=float(wait or 0))
+        except Exception as e:
+            error_msg = f"Failed to get workspace results: {e!s}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg}
+
+    async def cancel_workspace_job(self, job_id: str, *, client_id: str = "mcp-cli") -> Dict[str, Any]:
+        """Cancel a running workspace job; results gathered so far stay available."""
+        try:
+            self._guard_request(MCPConstants.TOOL_CANCEL_WORKSPACE_JOB, client_id, {"job_id": job_id})
+            job = self.workspace_jobs.get(job_id)
+            if job is None:
+                return {"success": False, "error": f"Unknown workspace job: {job_id}"}
+            return {"success": True, "cancelled": self.workspace_jobs.cancel(job_id), **job.progress()}
+        except Exception as e:
+            error_msg = f"Failed to cancel workspace job: {e!s}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg}
+
     async def get_violations(
         self,
         file_path: str,
@@ -551,6 +637,13 @@ class EnhancedConnascenceMCPServer:
 
         return {"valid": True}
 
+    def _collect_workspace_files(self, workspace_path: Path, file_patterns: List[str]) -> List[Path]:
+        """All files matching any pattern, once each, in a stable order."""
+        files = set()
+        for pattern in file_patterns:
+            files.update(path for path in workspace_path.rglob(pattern) if path.is_file())
+        return sorted(files)
+
     async def _perform_analysis(self, request: AnalysisRequest) -> AnalysisResponse:
         """Perform the actual analysis."""
         try:
@@ -663,6 +756,10 @@ class EnhancedConnascenceMCPServer:
                 return await self.analyze_file(client_id=client_id, **arguments)
             elif name == MCPConstants.TOOL_ANALYZE_WORKSPACE:
                 return await self.analyze_workspace(client_id=client_id, **arguments)
+            elif name == MCPConstants.TOOL_GET_WORKSPACE_RESULTS:
+                return await self.get_workspace_results(client_id=client_id, **arguments)
+            elif name == MCPConstants.TOOL_CANCEL_WORKSPACE_JOB:
+                return await self.cancel_workspace_job(client_id=client_id, **arguments)
             elif name == MCPConstants.TOOL_GET_VIOLATIONS:
                 return await self.get_violations(client_id=client_id, **arguments)
             elif name == MCPConstants.TOOL_HEALTH_CHECK:
@@ -695,6 +792,8 @@ def get_server_info() -> Dict[str, Any]:
         "tools": [
             MCPConstants.TOOL_ANALYZE_FILE,
             MCPConstants.TOOL_ANALYZE_WORKSPACE,
+            MCPConstants.TOOL_GET_WORKSPACE_RESULTS,
+            MCPConstants.TOOL_CANCEL_WORKSPACE_JOB,
             MCPConstants.TOOL_GET_VIOLATIONS,
             MCPConstants.TOOL_HEALTH_CHECK,
         ],
@@ -702,6 +801,7 @@ def get_server_info() -> Dict[str, Any]:
             "Connascence analysis",
             "NASA compliance checking",
             "MECE duplication detection",
+            "Paginated workspace analysis jobs",
             "External tool integrations",
             "Rate limiting",
             "Audit logging",
@@ -15,6 +15,7 @@
 Mock MCP Server implementation for test compatibility.
 """
 
+import ast
 import asyncio
 from pathlib import Path
 
@@ -89,7 +90,7 @@ except ImportError:
 
 
 try:
-    from analyzer.unified_analyzer import ErrorHandler, StandardError
+    from analyzer.standard_errors import ErrorHandler, StandardError
 except ImportError:
     # Fallback for test environments
     class StandardError:
@@ -199,22 +200,30 @@ class ConnascenceMCPServer:
                 from analyzer.nasa_engine.nasa_analyzer import NASAAnalyzer
                 from analyzer.dup_detection.mece_analyzer import MECEAnalyzer
                 from analyzer.enterprise.sixsigma.analyzer import SixSigmaAnalyzer
+                from analyzer.enterprise.sixsigma.telemetry import DEFAULT_HISTORY_DIR
                 from analyzer.theater_detection.core import TheaterDetector
 
                 self.connascence = ConnascenceAnalyzer()
                 self.nasa = NASAAnalyzer()
                 self.mece = MECEAnalyzer()
-                self.sixsigma = SixSigmaAnalyzer()
+                self.sixsigma = SixSigmaAnalyzer(history_dir=Path.cwd() / DEFAULT_HISTORY_DIR)
                 self.theater = TheaterDetector()
 
             def analyze(self, source_code: str, file_path: str = "<unknown>") -> dict:
                 """Run all analyzers and return combined results."""
+                from analyzer.enterprise.sixsigma.metrics_kernel import count_ast_opportunities
+
                 connascence_violations = self.connascence.analyze_file(Path(file_path))
                 nasa_violations = self.nasa.analyze_file(file_path, source_code=source_code)
                 theater_violations = self.theater.detect_all(source_code)
+                try:
+                    opportunities = count_ast_opportunities(ast.parse(source_code))
+                except SyntaxError:
+                    opportunities = None
                 sixsigma_result = self.sixsigma.analyze_violations(
                     [v.to_dict() if hasattr(v, "to_dict") else v for v in connascence_violations],
                     file_path=Path(file_path),
+                    opportunities=opportunities,
                 )
                 return {
                     "connascence": connascence_violations,
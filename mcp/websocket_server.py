@@ -20,6 +20,7 @@ except ImportError as exc:  # pragma: no cover - surfaced during CLI invocation
     ) from exc
 
 from mcp.enhanced_server import create_enhanced_mcp_server, get_server_info
+from mcp.workspace_jobs import MAX_WAIT_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class MCPWebSocketServer:
         self.config = config or {}
         self._ws_server: Optional[Serve] = None
         self._clients: Set[WebSocketServerProtocol] = set()
+        self._streams: Dict[WebSocketServerProtocol, Set[asyncio.Task]] = {}
         self._backend = create_enhanced_mcp_server(self.config)
         self._server_info = get_server_info()
 
@@ -53,6 +55,7 @@ class MCPWebSocketServer:
             self._ws_server = None
 
         await asyncio.gather(*(self._close_client(client) for client in list(self._clients)), return_exceptions=True)
+        self._backend.cleanup()
 
     async def _close_client(self, websocket: WebSocketServerProtocol) -> None:
         try:
@@ -81,6 +84,8 @@ class MCPWebSocketServer:
             logger.warning("MCP client disconnected with error: %s", error)
         finally:
             self._clients.discard(websocket)
+            for task in self._streams.pop(websocket, set()):
+                task.cancel()
             logger.debug("MCP client disconnected (%s active)", len(self._clients))
 
     async def _dispatch_message(self, websocket: WebSocketServerProtocol, raw_message: str) -> None:
@@ -151,6 +156,74 @@ class MCPWebSocketServer:
             )
             return
 
+        if message_type == "analyze_workspace":
+            workspace_path = message.get("workspacePath")
+            if not workspace_path:
+                await websocket.send(
+                    json.dumps(
+                        {
+                            "type": "workspace_job",
+                            "requestId": request_id,
+                            "error": "Missing workspacePath for analysis",
+                        }
+                    )
+                )
+                return
+
+            options = dict(message.get("options") or {})
+            options.pop("wait", None)
+            result = await self._backend.analyze_workspace(workspace_path=workspace_path, **options)
+            await websocket.send(
+                json.dumps(
+                    {
+                        "type": "workspace_job",
+                        "requestId": request_id,
+                        "data": result,
+                        "error": None if result.get("success") else result.get("error"),
+                    }
+                )
+            )
+            if result.get("success") and message.get("stream", True):
+                # Stream results in the background so the client can keep sending requests
+                task = asyncio.create_task(self._stream_workspace_job(websocket, request_id, result["job_id"]))
+                streams = self._streams.setdefault(websocket, set())
+                streams.add(task)
+                task.add_done_callback(streams.discard)
+            return
+
+        if message_type == "workspace_results":
+            result = await self._backend.get_workspace_results(
+                message.get("jobId", ""),
+                cursor=message.get("cursor"),
+                limit=message.get("limit"),
+                wait=message.get("wait", 0),
+            )
+            await websocket.send(
+                json.dumps(
+                    {
+                        "type": "workspace_results",
+                        "requestId": request_id,
+                        "data": result,
+                        "error": None if result.get("success") else result.get("error"),
+                    }
+                )
+            )
+            return
+
+        if message_type == "cancel_workspace":
+            result = await self._backend.cancel_workspace_job(message.get("jobId", ""))
+            await websocket.send(
+                json.dumps(
+                    {
+                        "type": "workspace_cancelled",
+                        "requestId": request_id,
+                        "data": result,
+                        "error": None if result.get("success") else result.get("error"),
+                    }
+                )
+            )
+            return
+
         if message_type == "ping":
             await websocket.send(json.dumps({"type": "pong", "requestId": request_id}))
             return
@@ -165,6 +238,27 @@ class MCPWebSocketServer:
             )
         )
 
+    async def _stream_workspace_job(self, websocket: WebSocketServerProtocol, request_id: Any, job_id: str) -> None:
+        """Send each new page of a workspace job as a progress notification until it finishes."""
+        cursor: Optional[str] = "0"
+        try:
+            while cursor is not None:
+                # Read the job directly: a stream is one request, not one per page
+                page = await self._backend.workspace_jobs.page(job_id, cursor=cursor, wait=MAX_WAIT_SECONDS)
+                if not page.get("success"):
+                    await websocket.send(
+                        json.dumps({"type": "workspace_complete", "requestId": request_id, "error": page.get("error")})
+                    )
+                    return
+                if page["items"]:
+                    await websocket.send(json.dumps({"type": "workspace_progress", "requestId": request_id, **page}))
+                cursor = page["next_cursor"]
+
+            final = {key: value for key, value in page.items() if key != "items"}
+            await websocket.send(json.dumps({"type": "workspace_complete", "requestId": request_id, **final}))
+        except websockets.ConnectionClosed:
+            logger.debug("Client went away while streaming workspace job %s", job_id)
+
 
 __all__ = ["MCPWebSocketServer"]
 
@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+
+"""
+Workspace analysis jobs for the MCP server.
+
+A workspace analysis runs as a job over the full file set instead of a single
+truncated batch. Files are analyzed in chunks on a bounded worker pool; the
+per-file results are appended to the job as chunks complete. Clients either
+page through them with an opaque cursor or wait for progress updates, so each
+request stays small no matter how large the workspace is.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+import uuid
+
+from analyzer.optimization.memory_budget import MemoryBudget, get_global_memory_budget
+from mcp.analysis_bridge import analyze_files_in_worker
+
+logger = logging.getLogger(__name__)
+
+# Files sent to a worker per task; amortizes pickling and scheduling overhead
+CHUNK_SIZE = 16
+# Chunks queued per worker, so the pool never holds the whole workspace
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+# Longest a page request may wait for new results
+MAX_WAIT_SECONDS = 30.0
+# Finished jobs kept for late page requests
+MAX_RETAINED_JOBS = 32
+
+
+class JobStatus(Enum):
+    """Lifecycle of a workspace analysis job."""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class WorkspaceJob:
+    """State of one workspace analysis; ``results`` is append-only."""
+
+    job_id: str
+    workspace_path: str
+    analysis_type: str
+    files_total: int
+    status: JobStatus = JobStatus.RUNNING
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    files_failed: int = 0
+    score_total: float = 0.0
+    error: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    cancel_requested: bool = False
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status != JobStatus.RUNNING
+
+    def progress(self) -> Dict[str, Any]:
+        """Counters describing how far the job got."""
+        analyzed = len(self.results) - self.files_failed
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "files_total": self.files_total,
+            "files_done": len(self.results),
+            "files_failed": self.files_failed,
+            "overall_score": round(self.score_total / analyzed, 2) if analyzed else 100.0,
+            "elapsed": round(end - self.started_at, 3),
+            "error": self.error,
+        }
+
+    def _notify(self) -> None:
+        # Wake current waiters; later waiters get a fresh event
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+class WorkspaceJobManager:
+    """Runs workspace jobs on a bounded pool and serves their results page by page."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        worker: Callable[[List[str], str], List[Dict[str, Any]]] = analyze_files_in_worker,
+        memory_budget: Optional[MemoryBudget] = None,
+    ):
+        self.max_workers = max_workers or min(os.cpu_count() or 1, 8)
+        # Live RSS of the server and its pool narrows the chunk window when memory runs short
+        self.memory_budget = memory_budget or get_global_memory_budget()
+        self.use_processes = use_processes
+        self.page_size = min(page_size, MAX_PAGE_SIZE)
+        self._worker = worker
+        self._executor: Optional[Executor] = None
+        # Chunks handed to the pool and not yet finished, cancelled on shutdown
+        self._submitted: Set[Future] = set()
+        self._jobs: "OrderedDict[str, WorkspaceJob]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def submit(self, workspace_path: Path, files: Iterable[Path], analysis_type: str) -> WorkspaceJob:
+        """Start analyzing ``files`` and return the job right away."""
+        file_list = [str(file_path) for file_path in files]
+        job = WorkspaceJob(
+            job_id=uuid.uuid4().hex,
+            workspace_path=str(workspace_path),
+            analysis_type=analysis_type,
+            files_total=len(file_list),
+        )
+        self._jobs[job.job_id] = job
+        self._evict_finished_jobs()
+        self._tasks[job.job_id] = asyncio.get_running_loop().create_task(self._run(job, file_list))
+        return job
+
+    def get(self, job_id: str) -> Optional[WorkspaceJob]:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Stop scheduling new chunks; results gathered so far stay readable."""
+        job = self._jobs.get(job_id)
+        if job is None or job.done:
+            return False
+        job.cancel_requested = True
+        return True
+
+    async def wait(self, job: WorkspaceJob, seen: int, timeout: Optional[float] = None) -> None:
+        """Wait until the job has more than ``seen`` results or has finished."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(job.results) <= seen and not job.done:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(job._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
+
+    async def page(
+        self, job_id: str, cursor: Optional[str] = None, limit: Optional[int] = None, wait: float = 0.0
+    ) -> Dict[str, Any]:
+        """Return the results after ``cursor``; ``next_cursor`` is None once everything was read."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return {"success": False, "error": f"Unknown workspace job: {job_id}"}
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError:
+            return {"success": False, "error": f"Invalid cursor: {cursor}"}
+        if offset < 0 or offset > len(job.results):
+            return {"success": False, "error": f"Invalid cursor: {cursor}"}
+
+        if wait > 0:
+            await self.wait(job, offset, min(wait, MAX_WAIT_SECONDS))
+
+        limit = max(1, min(limit or self.page_size, MAX_PAGE_SIZE))
+        items = job.results[offset : offset + limit]
+        end = offset + len(items)
+        exhausted = job.done and end >= len(job.results)
+        return {
+            "success": True,
+            **job.progress(),
+            "items": items,
+            "cursor": str(offset),
+            "next_cursor": None if exhausted else str(end),
+        }
+
+    async def wait_for_completion(self, job_id: str) -> Optional[WorkspaceJob]:
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.shield(task)
+        return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        """Cancel running jobs and queued chunks, then release the worker pool without waiting."""
+        for job in self._jobs.values():
+            if not job.done:
+                job.cancel_requested = True
+        # Executor.shutdown(cancel_futures=True) needs Python 3.9
+        for future in list(self._submitted):
+            future.cancel()
+        self._submitted.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _max_in_flight(self) -> int:
+        return self.memory_budget.parallelism(self.max_workers) * CHUNKS_IN_FLIGHT_PER_WORKER
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+
+    async def _run(self, job: WorkspaceJob, file_list: List[str]) -> None:
+        loop = asyncio.get_running_loop()
+        pending: Dict[asyncio.Future, List[str]] = {}
+        try:
+            for start in range(0, len(file_list), CHUNK_SIZE):
+                while len(pending) >= self._max_in_flight() and not job.cancel_requested:
+                    await self._collect(job, pending)
+                # Checked after waiting too, so a cancel or shutdown never schedules another chunk
+                if job.cancel_requested:
+                    break
+                chunk = file_list[start : start + CHUNK_SIZE]
+                submitted = self._get_executor().submit(self._worker, chunk, job.analysis_type)
+                self._submitted.add(submitted)
+                submitted.add_done_callback(self._submitted.discard)
+                pending[asyncio.wrap_future(submitted, loop=loop)] = chunk
+            while pending:
+                await self._collect(job, pending)
+            job.status = JobStatus.CANCELLED if job.cancel_requested else JobStatus.COMPLETED
+        except Exception as exc:
+            logger.error(f"Workspace job {job.job_id} failed: {exc}")
+            for future in pending:
+                future.cancel()
+            job.status = JobStatus.FAILED
+            job.error = str(exc)
+        finally:
+            job.finished_at = time.time()
+            self._tasks.pop(job.job_id, None)
+            job._notify()
+
+    async def _collect(self, job: WorkspaceJob, pending: Dict[asyncio.Future, List[str]]) -> None:
+        """Wait for at least one chunk and append its results to the job."""
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            chunk = pending.pop(future)
+            if future.cancelled():
+                # Dropped by shutdown before a worker picked it up
+                continue
+            try:
+                payloads = future.result()
+            except BrokenExecutor as exc:
+                # A worker died; later chunks go to a fresh pool
+                self._executor = None
+                payloads = [{"target": path, "success": False, "error": str(exc)} for path in chunk]
+            except Exception as exc:
+                # A crashed worker fails its chunk, not the whole job
+                payloads = [{"target": path, "success": False, "error": str(exc)} for path in chunk]
+            for payload in payloads:
+                if payload.get("success", True):
+                    job.score_total += payload.get("quality_score", 0.0)
+                else:
+                    job.files_failed += 1
+                job.results.append(payload)
+        job._notify()
+
+    def _evict_finished_jobs(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(0, len(self._jobs) - MAX_RETAINED_JOBS)]:
+            del self._jobs[job_id]
+
+
+__all__ = ["JobStatus", "WorkspaceJob", "WorkspaceJobManager"]
@@ -89,7 +89,7 @@ except ImportError:
 
 
 try:
-    from analyzer.unified_analyzer import ErrorHandler, StandardError
+    from analyzer.standard_errors import ErrorHandler, StandardError
 except ImportError:
     # Fallback for test environments
     class StandardError:
@@ -24,6 +24,11 @@ Provides enterprise-grade drift tracking for connascence violations including:
 - Performance benchmarking and comparative analysis
 - Integration with baseline and waiver systems
 
+Measurements are appended to a binary time-series store (numeric series with
+incrementally maintained window statistics) and a JSON-lines detail log, so
+recording a measurement and answering trend/anomaly queries do not cost
+O(history). An existing ``drift.json`` is imported on first use.
+
 Author: Connascence Safety Analyzer Team
 """
 
@@ -36,6 +41,23 @@ from pathlib import Path
 import statistics
 from typing import Any, Dict, List, Optional
 
+from analyzer.optimization.timeseries_store import DAY_SECONDS, TimeSeriesStore
+
+# Numeric series kept in the time-series store
+DRIFT_FIELDS = (
+    "total_violations",
+    "files_analyzed",
+    "analysis_duration_ms",
+    "critical",
+    "high",
+    "medium",
+    "low",
+)
+# Trailing windows (days) whose statistics are maintained on append
+DRIFT_WINDOW_DAYS = (7, 30)
+# Detail records kept for branch comparison and benchmarks
+MAX_DETAIL_HISTORY = 1000
+
 
 @dataclass
 class DriftMetric:
@@ -93,75 +115,105 @@ class EnhancedDriftTracker:
 
     def __init__(self, project_root: Optional[Path] = None):
         self.project_root = project_root or Path.cwd()
-        self.drift_file = self.project_root / ".connascence" / "drift.json"
+        self.drift_dir = self.project_root / ".connascence"
+        self.drift_file = self.drift_dir / "drift.json"  # Legacy whole-history file, imported once
+        self.details_file = self.drift_dir / "drift.jsonl"
         self.logger = logging.getLogger(__name__)
 
         # Ensure directories exist
-        self.drift_file.parent.mkdir(parents=True, exist_ok=True)
+        self.drift_dir.mkdir(parents=True, exist_ok=True)
+
+        self.store = TimeSeriesStore(
+            self.drift_dir, "drift", DRIFT_FIELDS, windows=[days * DAY_SECONDS for days in DRIFT_WINDOW_DAYS]
+        )
+        self._drift_history: Optional[List[DriftMetric]] = None
+        if not len(self.store) and self.drift_file.exists():
+            self._import_legacy_history()
+
+    @property
+    def drift_history(self) -> List[DriftMetric]:
+        """Most recent detailed measurements, loaded on first use."""
+        if self._drift_history is None:
+            self._drift_history = self._load_drift_history()
+        return self._drift_history
 
-        # Load existing drift data
-        self.drift_history: List[DriftMetric] = self._load_drift_history()
+    @drift_history.setter
+    def drift_history(self, history: List[DriftMetric]) -> None:
+        self._drift_history = history
 
     def _load_drift_history(self) -> List[DriftMetric]:
-        """Load drift history from JSON file."""
-        if not self.drift_file.exists():
-            self._create_default_drift_file()
+        """Load the most recent detail records from the JSON-lines log."""
+        if not self.details_file.exists():
             return []
 
+        history = []
         try:
-            with open(self.drift_file, encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data or "drift_history" not in data:
-                return []
-
-            history = []
-            for metric_data in data["drift_history"]:
-                history.append(DriftMetric(**metric_data))
-
-            return history
-
+            with open(self.details_file, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        history.append(DriftMetric(**json.loads(line)))
         except Exception as e:
             self.logger.error(f"Failed to load drift history: {e}")
             return []
 
-    def _save_drift_history(self) -> bool:
-        """Save drift history to JSON file."""
-        try:
-            # Convert to serializable format
-            drift_data = [asdict(metric) for metric in self.drift_history]
-
-            config = {
-                "version": "1.0",
-                "updated_at": datetime.now().isoformat(),
-                "total_measurements": len(self.drift_history),
-                "drift_history": drift_data,
-            }
-
-            with open(self.drift_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
+        # Compact the log once it holds well over the retained history
+        if len(history) > 2 * MAX_DETAIL_HISTORY:
+            history = history[-MAX_DETAIL_HISTORY:]
+            self._save_drift_history(history)
+        return history[-MAX_DETAIL_HISTORY:]
 
+    def _save_drift_history(self, history: List[DriftMetric]) -> bool:
+        """Rewrite the detail log (compaction and cleanup only)."""
+        tmp_file = self.details_file.with_name(f"{self.details_file.name}.tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                for metric in history:
+                    f.write(json.dumps(asdict(metric)) + "\n")
+            tmp_file.replace(self.details_file)
             return True
 
         except Exception as e:
             self.logger.error(f"Failed to save drift history: {e}")
             return False
 
-    def _create_default_drift_file(self):
-        """Create default drift.json configuration."""
-        default_config = {
-            "version": "1.0",
-            "description": "Connascence Safety Analyzer - Drift Tracking Configuration",
-            "created_at": datetime.now().isoformat(),
-            "total_measurements": 0,
-            "drift_history": [],
-        }
+    def _append_detail(self, metric: DriftMetric) -> None:
+        try:
+            with open(self.details_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(metric)) + "\n")
+        except Exception as e:
+            self.logger.error(f"Failed to append drift measurement: {e}")
+
+    def _append_series(self, metric: DriftMetric) -> None:
+        severity = metric.violations_by_severity
+        self.store.append(
+            {
+                "total_violations": metric.total_violations,
+                "files_analyzed": metric.files_analyzed,
+                "analysis_duration_ms": metric.analysis_duration_ms,
+                "critical": severity.get("critical", 0),
+                "high": severity.get("high", 0),
+                "medium": severity.get("medium", 0),
+                "low": severity.get("low", 0),
+            },
+            timestamp=datetime.fromisoformat(metric.timestamp).timestamp(),
+        )
 
+    def _import_legacy_history(self) -> None:
+        """Copy measurements from a pre-store ``drift.json`` into the store and detail log."""
         try:
-            with open(self.drift_file, "w", encoding="utf-8") as f:
-                json.dump(default_config, f, indent=2)
+            with open(self.drift_file, encoding="utf-8") as f:
+                data = json.load(f)
+            history = [DriftMetric(**metric_data) for metric_data in (data or {}).get("drift_history", [])]
         except Exception as e:
-            self.logger.error(f"Failed to create default drift config: {e}")
+            self.logger.error(f"Failed to import legacy drift history: {e}")
+            return
+
+        history.sort(key=lambda metric: metric.timestamp)
+        for metric in history:
+            self._append_series(metric)
+        self._save_drift_history(history[-MAX_DETAIL_HISTORY:])
+        self._drift_history = None
+        self.logger.info(f"Imported {len(history)} drift measurements from {self.drift_file}")
 
     def record_measurement(
         self,
@@ -203,15 +255,13 @@ class EnhancedDriftTracker:
             metadata=metadata or {},
         )
 
-        # Add to history
-        self.drift_history.append(metric)
-
-        # Keep only last 1000 measurements to prevent unbounded growth
-        if len(self.drift_history) > 1000:
-            self.drift_history = self.drift_history[-1000:]
-
-        # Save to file
-        self._save_drift_history()
+        # Append to the series and detail log; nothing already recorded is rewritten
+        self._append_series(metric)
+        self._append_detail(metric)
+        if self._drift_history is not None:
+            self._drift_history.append(metric)
+            if len(self._drift_history) > MAX_DETAIL_HISTORY:
+                self._drift_history = self._drift_history[-MAX_DETAIL_HISTORY:]
 
         return metric
 
@@ -219,10 +269,10 @@ class EnhancedDriftTracker:
         """Analyze trend over specified number of days."""
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        # Filter recent measurements
-        recent_metrics = [m for m in self.drift_history if datetime.fromisoformat(m.timestamp) >= cutoff_date]
+        # Read only the measurements inside the window
+        timestamps, violation_counts = self.store.series("total_violations", since=cutoff_date.timestamp())
 
-        if len(recent_metrics) < 2:
+        if len(violation_counts) < 2:
             return TrendAnalysis(
                 trend_direction="stable",
                 trend_strength=0.0,
@@ -233,13 +283,9 @@ class EnhancedDriftTracker:
                 analysis_period_days=days,
             )
 
-        # Extract violation counts and timestamps
-        violation_counts = [m.total_violations for m in recent_metrics]
-        timestamps = [datetime.fromisoformat(m.timestamp) for m in recent_metrics]
-
         # Calculate linear regression slope
         n = len(violation_counts)
-        x_values = [(ts - timestamps[0]).days for ts in timestamps]
+        x_values = [int((ts - timestamps[0]) // DAY_SECONDS) for ts in timestamps]
         y_values = violation_counts
 
         # Simple linear regression
@@ -290,12 +336,10 @@ class EnhancedDriftTracker:
 
     def detect_anomalies(self, current_violations: int, lookback_days: int = 30) -> AnomalyDetection:
         """Detect anomalies in current violation count."""
-        cutoff_date = datetime.now() - timedelta(days=lookback_days)
-
-        # Get baseline measurements
-        baseline_metrics = [m for m in self.drift_history if datetime.fromisoformat(m.timestamp) >= cutoff_date]
+        # Baseline statistics; maintained incrementally for the standard windows
+        baseline = self.store.window_stats("total_violations", lookback_days * DAY_SECONDS, datetime.now().timestamp())
 
-        if len(baseline_metrics) < 5:
+        if baseline.count < 5:
             return AnomalyDetection(
                 is_anomaly=False,
                 anomaly_score=0.0,
@@ -305,10 +349,8 @@ class EnhancedDriftTracker:
                 threshold_exceeded=False,
             )
 
-        # Calculate baseline statistics
-        baseline_counts = [m.total_violations for m in baseline_metrics]
-        baseline_mean = statistics.mean(baseline_counts)
-        baseline_stddev = statistics.stdev(baseline_counts) if len(baseline_counts) > 1 else 0.0
+        baseline_mean = baseline.mean
+        baseline_stddev = baseline.stddev
 
         # Calculate z-score for current measurement
         current_z_score = 0.0 if baseline_stddev == 0 else (current_violations - baseline_mean) / baseline_stddev
@@ -424,7 +466,8 @@ class EnhancedDriftTracker:
     def export_drift_report(self, days: int = 30) -> Dict[str, Any]:
         """Export comprehensive drift analysis report."""
         trend = self.analyze_trend(days)
-        anomaly = self.detect_anomalies(self.drift_history[-1].total_violations if self.drift_history else 0, days)
+        latest = self.store.series("total_violations", since=self.store.last_timestamp)[1] if len(self.store) else []
+        anomaly = self.detect_anomalies(latest[-1] if latest else 0, days)
         severity = self.get_drift_severity(trend)
         benchmarks = self.get_performance_benchmarks()
 
@@ -435,25 +478,19 @@ class EnhancedDriftTracker:
             "anomaly_detection": asdict(anomaly),
             "drift_severity": severity.value,
             "performance_benchmarks": benchmarks,
-            "total_measurements": len(self.drift_history),
-            "recent_measurements": len(
-                [
-                    m
-                    for m in self.drift_history
-                    if datetime.fromisoformat(m.timestamp) >= datetime.now() - timedelta(days=days)
-                ]
-            ),
+            "total_measurements": len(self.store),
+            "recent_measurements": self.store.count_since((datetime.now() - timedelta(days=days)).timestamp()),
         }
 
     def cleanup_old_measurements(self, keep_days: int = 90) -> int:
         """Remove measurements older than specified days."""
         cutoff_date = datetime.now() - timedelta(days=keep_days)
 
-        initial_count = len(self.drift_history)
-        self.drift_history = [m for m in self.drift_history if datetime.fromisoformat(m.timestamp) >= cutoff_date]
-
-        cleaned_count = initial_count - len(self.drift_history)
+        cleaned_count = self.store.truncate_before(cutoff_date.timestamp())
         if cleaned_count > 0:
-            self._save_drift_history()
+            self.drift_history = [
+                m for m in self.drift_history if datetime.fromisoformat(m.timestamp) >= cutoff_date
+            ]
+            self._save_drift_history(self.drift_history)
 
         return cleaned_count
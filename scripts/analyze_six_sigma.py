@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import ast
 from pathlib import Path
 import sys
 
@@ -12,6 +13,8 @@ sys.path.insert(0, str(REPO_ROOT))
 
 from analyzer.check_connascence import ConnascenceAnalyzer  # noqa: E402
 from analyzer.enterprise.sixsigma.analyzer import SixSigmaAnalyzer  # noqa: E402
+from analyzer.enterprise.sixsigma.metrics_kernel import count_ast_opportunities  # noqa: E402
+from analyzer.enterprise.sixsigma.telemetry import DEFAULT_HISTORY_DIR  # noqa: E402
 
 
 def _collect_connascence_dicts(path: Path) -> list[dict]:
@@ -23,6 +26,17 @@ def _collect_connascence_dicts(path: Path) -> list[dict]:
     return [v.to_dict() for v in violations]
 
 
+def _count_opportunities(path: Path) -> int | None:
+    files = [path] if path.is_file() else sorted(path.rglob("*.py"))
+    total = 0
+    for file_path in files:
+        try:
+            total += count_ast_opportunities(ast.parse(file_path.read_text(encoding="utf-8")))
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            continue
+    return total or None
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Six Sigma analyzer wrapper")
     parser.add_argument("path", help="Path to analyze")
@@ -35,8 +49,9 @@ def main() -> int:
         return 2
 
     violations = _collect_connascence_dicts(target)
-    sixsigma = SixSigmaAnalyzer(target_level=args.target)
-    result = sixsigma.analyze_violations(violations, file_path=target)
+    project_root = target if target.is_dir() else target.parent
+    sixsigma = SixSigmaAnalyzer(target_level=args.target, history_dir=project_root / DEFAULT_HISTORY_DIR)
+    result = sixsigma.analyze_violations(violations, file_path=target, opportunities=_count_opportunities(target))
 
     print("Six Sigma Quality Metrics")
     print("=" * 40)
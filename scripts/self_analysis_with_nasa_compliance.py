@@ -98,7 +98,10 @@ class ComprehensiveSelfAnalysis:
 
         # Phase 4: Tool Integration Analysis
         print("\n🔧 Phase 4: Multi-Tool Integration Analysis")
-        await self._analyze_tool_integration()
+        try:
+            await self._analyze_tool_integration()
+        finally:
+            self.tool_coordinator.close()
 
         # Phase 5: Generate Recommendations
         print("\n💡 Phase 5: Generate Improvement Recommendations")
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+"""
+Audit Log Writer
+
+Moves audit persistence off the request path:
+- Events are queued in a bounded in-memory queue
+- A background thread writes them in batched transactions on one
+  WAL-mode SQLite connection
+- Every row carries a hash chain (HMAC over the previous row's chain value
+  and the event's own integrity hash), so deleting, reordering or editing
+  rows is detectable even though events are committed in groups. Each batch
+  reads the newest chain value inside its own write transaction, so several
+  writers on one database extend a single chain
+- Durability is configurable: ``per_event`` waits for the commit before
+  returning, ``group_commit`` returns immediately and commits within
+  ``flush_interval``
+- A failed batch is reported to the callers waiting on it (``per_event``
+  appends and the next ``flush``) as ``AuditLogError``
+"""
+
+import atexit
+from concurrent import futures
+from enum import Enum
+import hashlib
+import hmac
+import logging
+from pathlib import Path
+import queue
+import sqlite3
+import threading
+import time
+from typing import Callable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# timestamp, event_type, user_id, session_token, ip_address, resource, action, result, details, integrity_hash
+AuditRow = Tuple[str, str, str, str, str, str, str, str, str, str]
+
+AUDIT_COLUMNS = (
+    "timestamp, event_type, user_id, session_token, ip_address, resource, action, result, details, integrity_hash"
+)
+
+
+class AuditDurability(Enum):
+    """When an audit event counts as written."""
+
+    PER_EVENT = "per_event"  # Caller waits for the transaction holding its event
+    GROUP_COMMIT = "group_commit"  # Caller returns at once; commit follows within flush_interval
+
+
+class AuditLogError(RuntimeError):
+    """Queued audit events could not be committed."""
+
+
+class AuditLogWriter:
+    """Group-committing audit log backed by SQLite; one background writer thread per instance."""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        key_provider: Callable[[], bytes],
+        durability: AuditDurability = AuditDurability.GROUP_COMMIT,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+    ):
+        self.db_path = Path(db_path)
+        self.key_provider = key_provider
+        self.durability = AuditDurability(durability)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._read_lock = threading.Lock()
+        self._closed = False
+        # Failure of a batch with rows nobody waited on, reported by the next flush
+        self._unreported_error: Optional[AuditLogError] = None
+
+        self._conn = self._connect()
+        self._init_schema(self._conn)
+        self._reader = self._connect()
+
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, row: AuditRow) -> None:
+        """
+        Queue an audit row.
+
+        Blocks while the queue is full rather than dropping events. In
+        ``per_event`` mode also waits until the row has been committed.
+
+        Raises:
+            AuditLogError: ``per_event`` only, when the row's batch failed
+        """
+        if self._closed:
+            raise RuntimeError("Audit log writer is closed")
+
+        done: Optional[futures.Future] = futures.Future() if self.durability is AuditDurability.PER_EVENT else None
+        self._queue.put((row, done))
+        if done is not None:
+            done.result()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued row is committed.
+
+        Returns:
+            False if the timeout expired first
+
+        Raises:
+            AuditLogError: A batch failed since the previous flush
+        """
+        if self._closed:
+            return True
+        done: futures.Future = futures.Future()
+        self._queue.put((None, done))
+        try:
+            done.result(timeout)
+        except futures.TimeoutError:
+            return False
+        return True
+
+    def close(self) -> None:
+        """Commit pending rows and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._conn.close()
+        with self._read_lock:
+            self._reader.close()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            # Events queued while the previous batch was committing join this one; group
+            # commit also waits up to flush_interval for more
+            wait = self.flush_interval if self.durability is AuditDurability.GROUP_COMMIT else 0.0
+            deadline = time.monotonic() + wait
+            while len(batch) < self.batch_size and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            stopping = batch[-1] is None
+            entries = [entry for entry in batch if entry is not None]
+            rows = [row for row, _ in entries if row is not None]
+            error = None
+            try:
+                self._write_batch(rows)
+            except Exception as e:
+                # The thread stays up so later events and flushes are still served
+                logger.error(f"Failed to write {len(rows)} audit events: {e}")
+                error = AuditLogError(f"Failed to write {len(rows)} audit events: {e}")
+                if any(done is None for row, done in entries if row is not None):
+                    self._unreported_error = error
+
+            for row, done in entries:
+                if done is None:
+                    continue
+                if row is None:
+                    # A flush reports every failure since the previous flush
+                    failure, self._unreported_error = self._unreported_error, None
+                else:
+                    failure = error
+                if failure is None:
+                    done.set_result(None)
+                else:
+                    done.set_exception(failure)
+
+    def _write_batch(self, rows: List[AuditRow]) -> None:
+        if not rows:
+            return
+
+        key = self.key_provider()
+        conn = self._conn
+        try:
+            # Takes the write lock before reading the chain head, so another writer
+            # on this database cannot append between the read and the insert
+            conn.execute("BEGIN IMMEDIATE")
+            latest = conn.execute("SELECT chain_hash FROM audit_events ORDER BY id DESC LIMIT 1").fetchone()
+            chain = (latest[0] or "") if latest else ""
+            values = []
+            for row in rows:
+                chain = chain_hash(key, chain, row[9])
+                values.append((*row, chain))
+            conn.executemany(
+                f"INSERT INTO audit_events ({AUDIT_COLUMNS}, chain_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                values,
+            )
+            conn.commit()
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        user_id: Optional[str] = None,
+        limit: int = 1000,
+    ) -> List[sqlite3.Row]:
+        """
+        Newest-first audit rows matching the filters.
+
+        Pending rows are committed first. Each row also carries
+        ``previous_chain_hash`` so callers can verify its chain link.
+        """
+        self.flush()
+
+        clauses = []
+        params: List[object] = []
+        if user_id:
+            clauses.append("e.user_id = ?")
+            params.append(user_id)
+        if start_time:
+            clauses.append("e.timestamp >= ?")
+            params.append(start_time)
+        if end_time:
+            clauses.append("e.timestamp <= ?")
+            params.append(end_time)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+
+        # Served by idx_audit_timestamp, or idx_audit_user_timestamp with a user filter
+        sql = f"""
+            SELECT e.*,
+                   (SELECT p.chain_hash FROM audit_events p WHERE p.id < e.id ORDER BY p.id DESC LIMIT 1)
+                       AS previous_chain_hash
+            FROM audit_events e
+            {where}
+            ORDER BY e.timestamp DESC
+            LIMIT ?
+        """
+        with self._read_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    def verify_row(self, row: sqlite3.Row) -> bool:
+        """Check a queried row's link in the hash chain."""
+        if row["chain_hash"] is None:
+            return False
+        expected = chain_hash(self.key_provider(), row["previous_chain_hash"] or "", row["integrity_hash"])
+        return hmac.compare_digest(row["chain_hash"], expected)
+
+    def verify_chain(self) -> List[int]:
+        """Ids of rows whose chain link does not verify, scanning the whole log."""
+        self.flush()
+        key = self.key_provider()
+        broken = []
+        previous = ""
+        with self._read_lock:
+            rows = self._reader.execute("SELECT id, integrity_hash, chain_hash FROM audit_events ORDER BY id")
+            for row_id, integrity_hash, stored in rows:
+                if stored is None or not hmac.compare_digest(stored, chain_hash(key, previous, integrity_hash)):
+                    broken.append(row_id)
+                previous = stored or ""
+        return broken
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL with NORMAL loses at most the last transactions on power failure; FULL syncs every commit
+        synchronous = "FULL" if self.durability is AuditDurability.PER_EVENT else "NORMAL"
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+        return conn
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS audit_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    session_token TEXT NOT NULL,
+                    ip_address TEXT NOT NULL,
+                    resource TEXT NOT NULL,
+                    action TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    details TEXT NOT NULL,
+                    integrity_hash TEXT NOT NULL,
+                    chain_hash TEXT
+                )
+            """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(audit_events)")}
+            if "chain_hash" not in columns:
+                # Databases from before the hash chain; their rows report as unchained
+                conn.execute("ALTER TABLE audit_events ADD COLUMN chain_hash TEXT")
+
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_events(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_user ON audit_events(user_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_user_timestamp ON audit_events(user_id, timestamp)")
+
+
+def chain_hash(key: bytes, previous: str, integrity_hash: str) -> str:
+    """Chain value of a row: HMAC over the previous row's chain value and this row's hash."""
+    return hmac.new(key, f"{previous}|{integrity_hash}".encode(), hashlib.sha256).hexdigest()
+
+
+__all__ = ["AuditDurability", "AuditLogError", "AuditLogWriter", "AuditRow", "chain_hash"]
@@ -25,7 +25,6 @@ Implements comprehensive security controls for enterprise deployment:
 - RBAC (Role-Based Access Control)
 """
 
-from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -37,14 +36,14 @@ import os
 from pathlib import Path
 import re
 import secrets
-import sqlite3
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 
 import bcrypt
 
 from fixes.phase0.production_safe_assertions import ProductionAssert
+from security.audit_log import AuditDurability, AuditLogWriter
 
 # Enterprise cryptography imports
 try:
@@ -326,20 +325,26 @@ class SecurityManager:
 
     _audit_key = None
 
-    def __init__(self, config_path: Optional[Path] = None, air_gapped: bool = False):
+    def __init__(
+        self,
+        config_path: Optional[Path] = None,
+        air_gapped: bool = False,
+        audit_durability: Optional[Union[str, AuditDurability]] = None,
+    ):
         """Initialize security manager."""
         self.config_path = config_path or Path(".connascence_security")
         self.air_gapped = air_gapped
         self.sessions: Dict[str, SecurityContext] = {}
         self.rate_limiters: Dict[str, RateLimiter] = {}
         self.encryption = EncryptionManager()
-
-        # Initialize audit database
-        self._init_audit_database()
+        self.config_path.mkdir(parents=True, exist_ok=True)
 
         # Load security configuration
         self._load_security_config()
 
+        # Initialize audit database
+        self._init_audit_database(audit_durability or self.config.get("audit_durability", "group_commit"))
+
         # Set up rate limiting defaults
         self._setup_rate_limiting()
 
@@ -570,45 +575,33 @@ class SecurityManager:
         if not (context.has_role(UserRole.AUDITOR) or context.has_role(UserRole.ADMIN)):
             raise PermissionError("Insufficient permissions to access audit logs")
 
-        query = "SELECT * FROM audit_events WHERE 1=1"
-        params = []
-
-        if start_time:
-            query += " AND timestamp >= ?"
-            params.append(start_time.isoformat())
-
-        if end_time:
-            query += " AND timestamp <= ?"
-            params.append(end_time.isoformat())
-
-        if user_id:
-            query += " AND user_id = ?"
-            params.append(user_id)
-
-        query += " ORDER BY timestamp DESC LIMIT 1000"
-
-        with self._get_audit_db() as cursor:
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+        rows = self.audit_log.query(
+            start_time.isoformat() if start_time else None,
+            end_time.isoformat() if end_time else None,
+            user_id,
+            limit=1000,
+        )
 
         events = []
         for row in rows:
             event = AuditEvent(
-                timestamp=datetime.fromisoformat(row[1]),
-                event_type=AuditEventType(row[2]),
-                user_id=row[3],
-                session_token=row[4],
-                ip_address=row[5],
-                resource=row[6],
-                action=row[7],
-                result=row[8],
-                details=json.loads(row[9]),
-                integrity_hash=row[10],
+                timestamp=datetime.fromisoformat(row["timestamp"]),
+                event_type=AuditEventType(row["event_type"]),
+                user_id=row["user_id"],
+                session_token=row["session_token"],
+                ip_address=row["ip_address"],
+                resource=row["resource"],
+                action=row["action"],
+                result=row["result"],
+                details=json.loads(row["details"]),
+                integrity_hash=row["integrity_hash"],
             )
 
             # Verify integrity
             if not event.verify_integrity():
                 logger.warning(f"Audit event integrity violation detected: {event.timestamp}")
+            if not self.audit_log.verify_row(row):
+                logger.warning(f"Audit chain broken before event {row['id']}: records missing or altered")
 
             events.append(event)
 
@@ -626,55 +619,20 @@ class SecurityManager:
 
         return events
 
-    def _init_audit_database(self) -> None:
-        """Initialize SQLite database for audit logging."""
+    def _init_audit_database(self, durability: Union[str, AuditDurability] = AuditDurability.GROUP_COMMIT) -> None:
+        """Open the audit database and start its background writer."""
         self.config_path.mkdir(parents=True, exist_ok=True)
-        db_path = self.config_path / "audit.db"
-
-        with sqlite3.connect(str(db_path)) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS audit_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    session_token TEXT NOT NULL,
-                    ip_address TEXT NOT NULL,
-                    resource TEXT NOT NULL,
-                    action TEXT NOT NULL,
-                    result TEXT NOT NULL,
-                    details TEXT NOT NULL,
-                    integrity_hash TEXT NOT NULL
-                )
-            """
-            )
-
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_audit_timestamp
-                ON audit_events(timestamp)
-            """
-            )
+        self.audit_log = AuditLogWriter(
+            self.config_path / "audit.db", key_provider=self._get_audit_key, durability=AuditDurability(durability)
+        )
 
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_audit_user
-                ON audit_events(user_id)
-            """
-            )
+    def flush_audit_log(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued audit events are committed."""
+        return self.audit_log.flush(timeout)
 
-    @contextmanager
-    def _get_audit_db(self):
-        """Get database cursor for audit operations."""
-        db_path = self.config_path / "audit.db"
-        conn = sqlite3.connect(str(db_path))
-        try:
-            cursor = conn.cursor()
-            yield cursor
-            conn.commit()
-        finally:
-            conn.close()
+    def close(self) -> None:
+        """Commit pending audit events and stop the audit writer."""
+        self.audit_log.close()
 
     def _log_audit_event(
         self,
@@ -687,7 +645,7 @@ class SecurityManager:
         result: str,
         details: Dict[str, Any],
     ) -> None:
-        """Log audit event to database."""
+        """Queue audit event for the background writer."""
 
         event = AuditEvent(
             timestamp=datetime.now(datetime.UTC),
@@ -702,27 +660,20 @@ class SecurityManager:
         )
 
         try:
-            with self._get_audit_db() as cursor:
-                cursor.execute(
-                    """
-                    INSERT INTO audit_events
-                    (timestamp, event_type, user_id, session_token, ip_address,
-                     resource, action, result, details, integrity_hash)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        event.timestamp.isoformat(),
-                        event.event_type.value,
-                        event.user_id,
-                        event.session_token,
-                        event.ip_address,
-                        event.resource,
-                        event.action,
-                        event.result,
-                        json.dumps(event.details),
-                        event.integrity_hash,
-                    ),
+            self.audit_log.append(
+                (
+                    event.timestamp.isoformat(),
+                    event.event_type.value,
+                    event.user_id,
+                    event.session_token,
+                    event.ip_address,
+                    event.resource,
+                    event.action,
+                    event.result,
+                    json.dumps(event.details),
+                    event.integrity_hash,
                 )
+            )
         except Exception as e:
             logger.error(f"Failed to log audit event: {e}")
 
@@ -818,6 +769,7 @@ class SecurityManager:
                 "max_concurrent_sessions": 5,
                 "rate_limits": {"analysis": {"default": 10, "admin": 100}, "export": {"default": 2, "admin": 20}},
                 "audit_retention_days": 365,
+                "audit_durability": "group_commit",
                 "encryption_enabled": True,
             }
 
@@ -45,10 +45,33 @@ class ConnascenceAnalyzer:
         try:
             # Read source code
             source_code = file_path.read_text(encoding="utf-8")
+        except Exception as e:
+            # Log error but don't fail the entire analysis
+            print(f"Warning: Error analyzing {file_path}: {e}")
+            return []
+
+        return self.analyze_source(source_code, file_path)
+
+    def analyze_source(
+        self, source_code: str, file_path: Path, tree: Optional[ast.AST] = None
+    ) -> List[ConnascenceViolation]:
+        """
+        Analyze source code that the caller has already read (and optionally parsed).
+
+        Args:
+            source_code: Contents of the file
+            file_path: Path the source was read from, used in violations
+            tree: AST parsed from ``source_code``; parsed here when omitted
+
+        Returns:
+            List of ConnascenceViolation objects found in the source
+        """
+        try:
             source_lines = source_code.splitlines()
 
             # Parse AST
-            tree = ast.parse(source_code, filename=str(file_path))
+            if tree is None:
+                tree = ast.parse(source_code, filename=str(file_path))
 
             # Use DetectorFactory for analysis
             detector_factory = DetectorFactory(str(file_path), source_lines)
@@ -0,0 +1,169 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+
+import pytest
+
+from mcp import workspace_jobs
+from mcp.enhanced_server import EnhancedConnascenceMCPServer
+from mcp.workspace_jobs import JobStatus, WorkspaceJobManager
+
+
+def make_workspace(root, count):
+    for index in range(count):
+        package = root / f"pkg{index % 3}"
+        package.mkdir(exist_ok=True)
+        (package / f"module_{index}.py").write_text(
+            f"def handler_{index}(alpha, beta, gamma, delta, epsilon):\n    return alpha + {index}\n",
+            encoding="utf-8",
+        )
+    return root
+
+
+async def read_all_pages(server, job_id, limit):
+    cursor, pages, items = None, 0, []
+    while True:
+        page = await server.call_tool(
+            "get_workspace_results", {"job_id": job_id, "cursor": cursor, "limit": limit, "wait": 5}
+        )
+        assert page["success"] is True
+        assert len(page["items"]) <= limit
+        items.extend(page["items"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items, pages, page
+
+
+def test_workspace_job_pages_every_file_from_a_process_pool(tmp_path):
+    workspace = make_workspace(tmp_path, 130)
+    server = EnhancedConnascenceMCPServer({"workspace_max_workers": 2})
+
+    async def scenario():
+        arguments = {"workspace_path": str(workspace), "include_integrations": False}
+        job = await server.call_tool("analyze_workspace", arguments)
+        assert job["success"] is True
+        assert job["status"] == "running"
+        assert job["files_total"] == 130
+        return await read_all_pages(server, job["job_id"], 25)
+
+    try:
+        items, pages, last = asyncio.run(scenario())
+    finally:
+        server.cleanup()
+
+    assert len(items) == 130
+    assert len({item["target"] for item in items}) == 130
+    assert all(item["success"] for item in items)
+    assert pages >= 6
+    assert last["status"] == "completed"
+    assert last["files_done"] == 130
+
+
+def test_waiting_workspace_analysis_returns_all_files(tmp_path):
+    workspace = make_workspace(tmp_path, 20)
+    server = EnhancedConnascenceMCPServer({"workspace_use_processes": False})
+
+    try:
+        result = asyncio.run(server.analyze_workspace(str(workspace), file_patterns=["*.py", "module_*"], wait=True))
+    finally:
+        server.cleanup()
+
+    assert result["success"] is True
+    assert result["files_considered"] == 20
+    assert result["files_analyzed"] == 20
+    assert len(result["files"]) == 20
+
+
+def test_failed_chunks_are_reported_and_cancel_stops_scheduling():
+    def worker(paths, analysis_type):
+        if any(path.endswith("bad") for path in paths):
+            raise RuntimeError("worker crashed")
+        return [{"target": path, "success": True, "quality_score": 80.0} for path in paths]
+
+    async def scenario():
+        manager = WorkspaceJobManager(max_workers=1, use_processes=False, worker=worker)
+        files = [f"file_{index}" for index in range(48)] + ["bad"]
+        job = manager.submit("workspace", files, "full")
+        finished = await manager.wait_for_completion(job.job_id)
+
+        slow = manager.submit("workspace", [f"slow_{index}" for index in range(2000)], "full")
+        await manager.wait(slow, 0, timeout=5)
+        assert manager.cancel(slow.job_id)
+        await manager.wait_for_completion(slow.job_id)
+        manager.shutdown()
+        return finished, slow
+
+    finished, slow = asyncio.run(scenario())
+
+    assert finished.status == JobStatus.COMPLETED
+    assert finished.files_failed == 1
+    assert finished.results[-1] == {"target": "bad", "success": False, "error": "worker crashed"}
+    assert finished.progress()["overall_score"] == 80.0
+    assert slow.status == JobStatus.CANCELLED
+    assert len(slow.results) < 2000
+
+
+def test_shutdown_cancels_queued_chunks_without_cancel_futures(monkeypatch):
+    class Python38Executor(ThreadPoolExecutor):
+        def shutdown(self, wait=True):
+            super().shutdown(wait=wait)
+
+    monkeypatch.setattr(workspace_jobs, "ThreadPoolExecutor", Python38Executor)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def worker(paths, analysis_type):
+        calls.append(paths[0])
+        started.set()
+        release.wait(5)
+        return [{"target": path, "success": True, "quality_score": 80.0} for path in paths]
+
+    async def scenario():
+        manager = WorkspaceJobManager(max_workers=1, use_processes=False, worker=worker)
+        job = manager.submit("workspace", [f"file_{index}" for index in range(64)], "full")
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        manager.shutdown()
+        release.set()
+        return await manager.wait_for_completion(job.job_id)
+
+    job = asyncio.run(scenario())
+
+    assert job.status == JobStatus.CANCELLED
+    assert calls == ["file_0"]
+    assert len(job.results) == workspace_jobs.CHUNK_SIZE
+
+
+def test_websocket_streams_progress_until_completion(tmp_path):
+    try:
+        from mcp.websocket_server import MCPWebSocketServer
+    except RuntimeError as exc:
+        pytest.skip(str(exc))
+    workspace = make_workspace(tmp_path, 45)
+
+    class RecordingSocket:
+        def __init__(self):
+            self.messages = []
+
+        async def send(self, message):
+            self.messages.append(json.loads(message))
+
+    async def scenario():
+        server = MCPWebSocketServer(config={"workspace_use_processes": False})
+        socket = RecordingSocket()
+        request = {"type": "analyze_workspace", "requestId": 7, "workspacePath": str(workspace)}
+        await server._dispatch_message(socket, json.dumps(request))
+        await asyncio.gather(*server._streams[socket])
+        await server.stop()
+        return socket.messages
+
+    messages = asyncio.run(scenario())
+
+    assert messages[0]["type"] == "workspace_job"
+    assert messages[-1]["type"] == "workspace_complete"
+    assert messages[-1]["status"] == "completed"
+    progress = [message for message in messages if message["type"] == "workspace_progress"]
+    assert sum(len(message["items"]) for message in progress) == 45
+    assert all(message["requestId"] == 7 for message in messages)
@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+"""
+Time budget for architectural checks on a large import graph.
+
+Layer and coupling checks walk the cached graph once; on a 50k-module
+project they must finish well inside a second.
+"""
+
+import random
+import time
+
+from analyzer.architectural_analysis import ArchitecturalAnalyzer, DependencyInfo, ModuleInfo
+
+MODULE_COUNT = 50000
+IMPORTS_PER_MODULE = 8
+LAYER_NAMES = ("ui", "api", "services", "data", "util")
+
+CHECK_BUDGET_SECONDS = 1.0
+
+
+def _build_analyzer() -> ArchitecturalAnalyzer:
+    rng = random.Random(7)
+    analyzer = ArchitecturalAnalyzer()
+    names = [f"app.{LAYER_NAMES[i % len(LAYER_NAMES)]}.mod{i}" for i in range(MODULE_COUNT)]
+    for name in names:
+        targets = [names[rng.randrange(MODULE_COUNT)] for _ in range(IMPORTS_PER_MODULE)]
+        targets.append("os")
+        dependencies = [DependencyInfo(name, target, "from", line) for line, target in enumerate(targets, start=1)]
+        analyzer.graph.set_module(ModuleInfo(name, f"{name}.py", imports=set(targets)), dependencies)
+    return analyzer
+
+
+def test_layer_and_coupling_checks_within_budget():
+    analyzer = _build_analyzer()
+
+    start = time.perf_counter()
+    analyzer._detect_layer_violations()
+    analyzer._detect_coupling_issues()
+    elapsed = time.perf_counter() - start
+
+    assert analyzer.violations
+    assert elapsed < CHECK_BUDGET_SECONDS, f"layer/coupling checks took {elapsed:.2f}s"
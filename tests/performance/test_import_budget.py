@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2024 Connascence Safety Analyzer Contributors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+"""
+Import-time budget for the CLI and MCP entry points.
+
+Each entry point is imported in a fresh interpreter so module caching in the
+test process cannot hide a regression. Heavy detector and orchestration
+modules must stay unloaded until an analysis actually runs.
+"""
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Modules that only an actual analysis should load
+HEAVY_MODULES = (
+    "analyzer.core",
+    "analyzer.unified_analyzer",
+    "analyzer.smart_integration_engine",
+    "analyzer.check_connascence",
+    "analyzer.optimization.performance_benchmark",
+)
+
+# Generous wall-clock budget; catches an eager import of the whole detector stack
+IMPORT_BUDGET_SECONDS = 2.0
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _probe_import(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "module",
+    ["interfaces.cli", "interfaces.cli.simple_cli", "interfaces.cli.connascence", "mcp.server"],
+)
+def test_entry_point_skips_heavy_modules(module):
+    probe = _probe_import(module)
+    assert probe["loaded"] == []
+    assert probe["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.performance
+def test_unified_analyzer_defers_components():
+    probe = _probe_import("analyzer.unified_analyzer")
+    assert probe["loaded"] == ["analyzer.unified_analyzer"]
+    assert probe["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_unified_analyzer_legacy_names_resolve():
+    from analyzer import unified_analyzer
+
+    assert isinstance(unified_analyzer.STREAMING_AVAILABLE, bool)
+    assert unified_analyzer.ErrorHandler is not None
+    with pytest.raises(AttributeError):
+        unified_analyzer.NotAComponent  # noqa: B018
+
+
+def test_monitoring_hooks_are_set_up_by_the_coordinator():
+    from analyzer.unified_analyzer import UnifiedConnascenceAnalyzer
+
+    analyzer = UnifiedConnascenceAnalyzer()
+    if analyzer.memory_monitor is None:
+        pytest.skip("advanced monitoring not available")
+
+    # Built during __init__ because monitoring is enabled, not on first use
+    assert "monitoring_coordinator" in analyzer.__dict__
+    assert analyzer.monitoring_coordinator.is_monitoring_active()
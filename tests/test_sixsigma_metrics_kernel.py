@@ -0,0 +1,134 @@
+"""
+Test the columnar Six Sigma metrics kernel against the per-violation
+telemetry implementation.
+"""
+
+import ast
+from pathlib import Path
+import random
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyzer.enterprise.sixsigma import CTQCalculator, SixSigmaAnalyzer
+from analyzer.enterprise.sixsigma.metrics_kernel import ViolationTable, count_ast_opportunities
+
+TYPES = ["identity", "meaning", "algorithm", "position", "execution", "timing", "values", "type", "convention", "Custom"]
+SEVERITIES = ["critical", "high", "medium", "low", "HIGH", "info"]
+
+
+def _random_violations(rng, count):
+    violations = []
+    for _ in range(count):
+        violation = {"type": rng.choice(TYPES), "severity": rng.choice(SEVERITIES)}
+        if rng.random() < 0.05:
+            del violation["severity"]
+        violations.append(violation)
+    return violations
+
+
+@pytest.fixture
+def violations_by_file():
+    rng = random.Random(1234)
+    files = {Path(f"pkg/module_{i}.py"): _random_violations(rng, rng.randint(0, 40)) for i in range(25)}
+    files[Path("pkg/clean.py")] = []
+    files[Path("pkg/only_low.py")] = [{"type": "convention", "severity": "low"}] * 3
+    return files
+
+
+def test_codebase_metrics_match_per_file_analysis(violations_by_file):
+    rng = random.Random(99)
+    opportunities = {path: rng.randint(10, 500) for path in violations_by_file}
+
+    reference = SixSigmaAnalyzer()
+    original_counter = reference._count_violation_opportunities
+    reference._count_violation_opportunities = lambda path: opportunities.get(path, original_counter(path))
+    expected = [reference.analyze_violations(v, path) for path, v in violations_by_file.items()]
+
+    kernel_analyzer = SixSigmaAnalyzer()
+    report = kernel_analyzer.analyze_codebase(violations_by_file, file_opportunities=opportunities)
+    actual = kernel_analyzer.analysis_results
+
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        assert got.file_path == want.file_path
+        assert got.dpmo == want.dpmo
+        assert got.sigma_level == want.sigma_level
+        assert got.rty == want.rty
+        assert got.quality_level == want.quality_level
+        assert got.violations_by_type == want.violations_by_type
+        assert got.violations_by_severity == want.violations_by_severity
+        assert got.ctq_metrics == want.ctq_metrics
+        assert got.process_capability == want.process_capability
+        assert got.improvement_suggestions == want.improvement_suggestions
+
+    assert report["summary"]["files_analyzed"] == len(violations_by_file)
+    assert report["violations"]["total"] == sum(len(v) for v in violations_by_file.values())
+    assert report["trend_analysis"]["sample_count"] == len(violations_by_file)
+
+
+def test_ctq_calculator_values():
+    calculator = CTQCalculator()
+    violations = [
+        {"type": "algorithm", "severity": "critical"},
+        {"type": "algorithm", "severity": "high"},
+        {"type": "identity", "severity": "medium"},
+        {"type": "meaning", "severity": "low"},
+        {"type": "position", "severity": "info"},
+    ]
+
+    metrics = calculator.calculate_from_violations(violations)
+    clean = calculator.calculate_from_violations([])
+
+    assert {name: metric.value for name, metric in metrics.items()} == {
+        "maintainability_index": 81.5,
+        "cyclomatic_complexity": 6.0,
+        "coupling_factor": 0.2,
+        "cohesion_score": 0.8,
+        "duplication_ratio": 0.08,
+        "test_coverage": 75.0,
+    }
+    assert {name: metric.value for name, metric in clean.items()} == {
+        "maintainability_index": 100.0,
+        "cyclomatic_complexity": 5.0,
+        "coupling_factor": 0.0,
+        "cohesion_score": 1.0,
+        "duplication_ratio": 0.0,
+        "test_coverage": 75.0,
+    }
+
+
+def test_ast_opportunities_match_file_reparse(tmp_path):
+    source = "class A:\n    def f(self):\n        if x:\n            y = 1\n        try:\n            pass\n        except E:\n            pass\n"
+    path = tmp_path / "sample.py"
+    path.write_text(source)
+
+    assert count_ast_opportunities(ast.parse(source)) == SixSigmaAnalyzer()._count_violation_opportunities(path)
+
+
+def test_precomputed_opportunities_skip_the_reparse(tmp_path):
+    source = "def f(x):\n    if x:\n        return 1\n    return 2\n"
+    path = tmp_path / "sample.py"
+    path.write_text(source)
+    violations = [{"type": "meaning", "severity": "medium"}]
+
+    reparsed = SixSigmaAnalyzer().analyze_violations(violations, file_path=path)
+    path.unlink()
+    precomputed = SixSigmaAnalyzer().analyze_violations(
+        violations, file_path=path, opportunities=count_ast_opportunities(ast.parse(source))
+    )
+
+    assert precomputed.dpmo == reparsed.dpmo
+
+
+def test_table_histogram_counts_every_violation():
+    table = ViolationTable()
+    for i in range(1000):
+        table.append(i % 7, TYPES[i % len(TYPES)], SEVERITIES[i % 3])
+
+    histogram = table.histogram()
+    assert sum(histogram.values()) == 1000
+    assert len(table.files) == 7
@@ -5,6 +5,8 @@ Provides common test fixtures and utilities for all unit test modules.
 """
 
 import ast
+import threading
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -40,3 +42,34 @@ def sample_ast():
         ast.Module instance with basic structure
     """
     return ast.parse("x = 42\nprint(x)")
+
+
+@pytest.fixture
+def tracking_parallel_analyzer():
+    """
+    Create a factory for ParallelConnascenceAnalyzer stubs that record chunk concurrency.
+
+    Returns:
+        Callable taking a ParallelAnalysisConfig; each built analyzer's chunks
+        sleep briefly instead of analyzing, and ``concurrency`` lists how many
+        chunks were running as each one started
+    """
+    from analyzer.performance.parallel_analyzer import ParallelConnascenceAnalyzer
+
+    class TrackingParallelAnalyzer(ParallelConnascenceAnalyzer):
+        def __init__(self, config):
+            super().__init__(config)
+            self.running = 0
+            self.concurrency = []
+            self.lock = threading.Lock()
+
+        def _analyze_chunk(self, file_chunk, policy_preset, options):
+            with self.lock:
+                self.running += 1
+                self.concurrency.append(self.running)
+            time.sleep(0.03)
+            with self.lock:
+                self.running -= 1
+            return {"files_processed": len(file_chunk), "violations": [], "nasa_violations": []}
+
+    return TrackingParallelAnalyzer
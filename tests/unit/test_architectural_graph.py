@@ -0,0 +1,182 @@
+"""
+Unit tests for the cached import graph behind ArchitecturalAnalyzer.
+
+Tests cover:
+- Every strongly connected component is reported, not just the first cycle per root
+- Deep import chains do not hit the recursion limit
+- Repeated analysis replaces edges instead of accumulating them
+- Only modules whose content changed are re-parsed
+- The graph persists between analyzer instances, keyed by content digest
+- Deleted files drop out of the graph
+- The default graph cache is scoped to the project root and the analysis root
+- Trees parsed by the unified analyzer feed the graph without a second parse
+"""
+
+import ast
+from pathlib import Path
+import sys
+
+from analyzer.architectural_analysis import (
+    ArchitecturalAnalyzer,
+    DependencyInfo,
+    ImportGraph,
+    ModuleInfo,
+    analyze_architecture,
+    default_graph_cache,
+)
+
+
+def write(root, relative, source):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+def make_graph(edges):
+    graph = ImportGraph()
+    names = sorted({name for edge in edges for name in edge})
+    for name in names:
+        dependencies = [DependencyInfo(name, target, "absolute", 1) for source, target in edges if source == name]
+        graph.set_module(ModuleInfo(name, f"{name}.py", imports={d.target for d in dependencies}), dependencies)
+    return graph
+
+
+def test_every_component_is_reported():
+    graph = make_graph([("a", "b"), ("b", "a"), ("b", "c"), ("c", "d"), ("d", "e"), ("e", "c"), ("f", "f"), ("g", "a")])
+
+    components = sorted(sorted(c) for c in graph.strongly_connected_components())
+
+    assert components == [["a", "b"], ["c", "d", "e"], ["f"]]
+    assert graph.cycle_through(["c", "d", "e"]) == ["c", "d", "e", "c"]
+
+
+def test_deep_chain_does_not_recurse():
+    depth = sys.getrecursionlimit() * 3
+    edges = [(f"m{i}", f"m{i + 1}") for i in range(depth)] + [(f"m{depth}", "m0")]
+
+    components = make_graph(edges).strongly_connected_components()
+
+    assert len(components) == 1 and len(components[0]) == depth + 1
+
+
+def test_analysis_reports_cycles_and_layers(tmp_path):
+    write(tmp_path, "pkg/a.py", "import pkg.b\n")
+    write(tmp_path, "pkg/b.py", "from pkg import c\nimport pkg.a\n")
+    write(tmp_path, "pkg/data/store.py", "from pkg.ui import view\n")
+    write(tmp_path, "pkg/ui/view.py", "import os\n")
+
+    violations = ArchitecturalAnalyzer(str(tmp_path)).analyze_directory()
+
+    cycles = [v for v in violations if v.type == "CircularDependency"]
+    assert len(cycles) == 1 and set(cycles[0].details["modules"]) == {"pkg.a", "pkg.b"}
+    assert [v.line_number for v in violations if v.type == "LayerViolation"] == [1]
+
+
+def test_reanalysis_replaces_edges_and_parses_only_changes(tmp_path):
+    write(tmp_path, "pkg/a.py", "import pkg.b\n")
+    b = write(tmp_path, "pkg/b.py", "import os\n")
+    analyzer = ArchitecturalAnalyzer(str(tmp_path))
+
+    analyzer.analyze_directory()
+    analyzer.analyze_directory()
+    assert len(analyzer.dependencies) == 2
+    assert analyzer.graph.parsed == 2
+
+    b.write_text("import pkg.a\n", encoding="utf-8")
+    violations = analyzer.analyze_directory()
+
+    assert analyzer.graph.parsed == 3
+    assert analyzer.get_dependency_graph() == {"pkg.a": ["pkg.b"], "pkg.b": ["pkg.a"]}
+    assert [v.type for v in violations] == ["CircularDependency"]
+
+
+def test_graph_persists_between_instances(tmp_path):
+    project = tmp_path / "project"
+    cache = tmp_path / "graph.json"
+    write(project, "pkg/a.py", "import pkg.b\n")
+    stale = write(project, "pkg/b.py", "import pkg.a\n")
+
+    first = ArchitecturalAnalyzer(str(project), graph_cache=str(cache)).analyze_directory()
+    stale.unlink()
+    second_analyzer = ArchitecturalAnalyzer(str(project), graph_cache=str(cache))
+    second = second_analyzer.analyze_directory()
+
+    assert [v.type for v in first] == ["CircularDependency"]
+    assert second == []
+    assert second_analyzer.graph.parsed == 0
+    assert set(second_analyzer.modules) == {"pkg.a"}
+    assert ImportGraph.load(cache).modules.keys() == {"pkg.a"}
+
+
+def test_deleted_files_drop_out_for_unresolved_directories(tmp_path, monkeypatch):
+    write(tmp_path, "pkg/a.py", "import pkg.b\n")
+    stale = write(tmp_path, "pkg/b.py", "import pkg.a\n")
+    monkeypatch.chdir(tmp_path)
+    graph = ImportGraph()
+
+    graph.refresh("./pkg", Path("."))
+    stale.unlink()
+    graph.refresh("./pkg", Path("."))
+
+    assert set(graph.modules) == {"pkg.a"}
+
+
+def test_analyze_file_reports_wildcard_imports(tmp_path):
+    path = write(tmp_path, "mod.py", "from os.path import *\n")
+
+    violations = ArchitecturalAnalyzer(str(tmp_path)).analyze_file(str(path))
+
+    assert [(v.type, v.line_number) for v in violations] == [("WildcardImport", 1)]
+
+
+def test_default_graph_cache_is_project_scoped(tmp_path):
+    project = tmp_path / "project"
+    write(project, "pyproject.toml", "")
+    write(project, "src/pkg/a.py", "")
+
+    src_cache = default_graph_cache(project / "src")
+    pkg_cache = default_graph_cache(project / "src" / "pkg")
+
+    assert src_cache.parent == pkg_cache.parent == project.resolve() / ".connascence_cache"
+    assert src_cache != pkg_cache
+
+
+def test_analyze_architecture_uses_caller_parsed_trees(tmp_path, monkeypatch):
+    write(tmp_path, "pyproject.toml", "")
+    paths = [write(tmp_path, "pkg/a.py", "import pkg.b\n"), write(tmp_path, "pkg/b.py", "import pkg.a\n")]
+    sources = [(str(path), path.read_text(encoding="utf-8")) for path in paths]
+    parsed = [(file_path, source, ast.parse(source)) for file_path, source in sources]
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("module parsed twice")
+
+    monkeypatch.setattr(ast, "parse", no_parse)
+    violations = analyze_architecture(str(tmp_path), parsed=parsed)
+
+    assert [v.type for v in violations] == ["CircularDependency"]
+    assert set(ImportGraph.load(default_graph_cache(tmp_path)).modules) == {"pkg.a", "pkg.b"}
+
+
+def test_unified_analysis_shares_parsed_trees_with_the_graph(tmp_path, monkeypatch):
+    from analyzer.unified_analyzer import UnifiedConnascenceAnalyzer
+
+    write(tmp_path, "pyproject.toml", "")
+    write(tmp_path, "pkg/a.py", "import pkg.b\n")
+    write(tmp_path, "pkg/b.py", "import pkg.a\n")
+    updates = []
+    original = ImportGraph.update_from_source
+
+    def recording_update(self, module_name, file_path, source, tree=None):
+        reparsed = original(self, module_name, file_path, source, tree)
+        updates.append((module_name, tree is not None, reparsed))
+        return reparsed
+
+    monkeypatch.setattr(ImportGraph, "update_from_source", recording_update)
+    violations = UnifiedConnascenceAnalyzer()._run_analysis_phases(tmp_path, "service-defaults")
+
+    assert "CircularDependency" in [v["type"] for v in violations["connascence"]]
+    # Every module parsed by the graph came with the detector pass's tree
+    assert all(shared for _name, shared, reparsed in updates if reparsed)
+    assert {name for name, shared, _reparsed in updates if shared} == {"pkg.a", "pkg.b"}
+    assert default_graph_cache(tmp_path).exists()
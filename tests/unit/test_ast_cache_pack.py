@@ -0,0 +1,202 @@
+"""
+Unit tests for the pack-file persistence behind ASTCache.
+
+Tests cover:
+- Opening a cache reads no entries and decodes them only on first access
+- Entries survive across cache instances through the pack file
+- Stale entries are invalidated without being decoded
+- Index growth keeps every entry reachable
+- Compaction drops replaced and removed records from the pack
+- Size-based eviction removes least recently used entries
+- Stores in several processes append to one pack without losing entries
+"""
+
+import ast
+import multiprocessing
+import os
+import pickle
+
+from analyzer.caching import pack_store
+from analyzer.caching.ast_cache import ASTCache
+from analyzer.caching.pack_store import PackStore
+
+
+def make_files(root, count, body="value = {index}\n"):
+    root.mkdir(exist_ok=True)
+    files = []
+    for index in range(count):
+        path = root / f"mod{index}.py"
+        path.write_text(body.format(index=index), encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def fill(cache, files):
+    for path in files:
+        cache.put_ast(path, ast.parse(path.read_text(encoding="utf-8")))
+
+
+def test_open_is_lazy_and_round_trips(tmp_path, monkeypatch):
+    files = make_files(tmp_path / "src", 20)
+    cache = ASTCache(cache_dir=str(tmp_path / "cache"))
+    fill(cache, files)
+    cache.close()
+
+    loads = []
+    real_loads = pickle.loads
+    monkeypatch.setattr(pickle, "loads", lambda data: loads.append(data) or real_loads(data))
+    reopened = ASTCache(cache_dir=str(tmp_path / "cache"))
+
+    assert reopened.get_cache_statistics()["entries_count"] == 20
+    assert loads == [] and reopened.memory_cache == {}
+
+    tree = reopened.get_ast(files[3])
+    assert ast.dump(tree) == ast.dump(ast.parse("value = 3\n"))
+    assert len(loads) == 1
+    assert reopened.get_ast(files[3]) is tree
+    assert len(loads) == 1
+    assert reopened.cache_stats["hits"] == 2
+
+
+def test_analysis_results_persist(tmp_path):
+    (path,) = make_files(tmp_path / "src", 1)
+    cache = ASTCache(cache_dir=str(tmp_path / "cache"))
+    cache.put_analysis_result(path, {"violations": 2}, analysis_type="cohesion")
+    cache.close()
+
+    reopened = ASTCache(cache_dir=str(tmp_path / "cache"))
+
+    assert reopened.get_analysis_result(path, analysis_type="cohesion") == {"violations": 2}
+    assert reopened.get_analysis_result(path) is None
+
+
+def test_stale_entry_is_dropped_without_decoding(tmp_path, monkeypatch):
+    files = make_files(tmp_path / "src", 2)
+    cache = ASTCache(cache_dir=str(tmp_path / "cache"))
+    fill(cache, files)
+    cache.close()
+    files[0].write_text("value = 'changed'\n", encoding="utf-8")
+
+    monkeypatch.setattr(pickle, "loads", lambda data: (_ for _ in ()).throw(AssertionError("decoded")))
+    reopened = ASTCache(cache_dir=str(tmp_path / "cache"))
+
+    assert reopened.get_ast(files[0]) is None
+    assert reopened.cache_stats["invalidations"] == 1
+    assert reopened.store.live_count == 1
+
+
+def test_invalidate_file_reaches_unloaded_entries(tmp_path):
+    (path,) = make_files(tmp_path / "src", 1)
+    cache = ASTCache(cache_dir=str(tmp_path / "cache"))
+    cache.put_ast(path, ast.parse("value = 0\n"))
+    cache.put_analysis_result(path, {"ok": True})
+    cache.close()
+
+    reopened = ASTCache(cache_dir=str(tmp_path / "cache"))
+    reopened.invalidate_file(path)
+
+    assert reopened.store.live_count == 0
+    assert reopened.cache_stats["invalidations"] == 2
+
+
+def test_index_growth_keeps_entries(tmp_path):
+    store = PackStore(tmp_path)
+    keys = [index.to_bytes(16, "little") for index in range(pack_store.INITIAL_CAPACITY * 2)]
+    for index, key in enumerate(keys):
+        store.put(key, str(index).encode(), f"f{index}.py", 0.0, index)
+    store.delete(keys[0])
+    store.close()
+
+    reopened = PackStore(tmp_path)
+
+    assert reopened.live_count == len(keys) - 1
+    assert reopened.lookup(keys[0]) is None
+    record = reopened.lookup(keys[-1])
+    assert reopened.read(record) == str(len(keys) - 1).encode()
+    assert reopened.read_path(record) == f"f{len(keys) - 1}.py"
+
+
+def test_compaction_shrinks_pack(tmp_path):
+    files = make_files(tmp_path / "src", 10, body="value = {index}\n" + "x = 1\n" * 50)
+    cache = ASTCache(cache_dir=str(tmp_path / "cache"))
+    for _ in range(3):
+        fill(cache, files)
+    cache.invalidate_file(files[0])
+    before = cache.store.pack_bytes
+
+    cache.optimize_cache()
+
+    assert cache.store.pack_bytes == cache.store.live_bytes < before / 2
+    assert cache.get_ast(files[5]) is not None
+    assert cache.get_ast(files[0]) is None
+
+
+def test_size_eviction_drops_least_recent(tmp_path):
+    files = make_files(tmp_path / "src", 40, body="value = {index}\n" + "y = 2\n" * 400)
+    cache = ASTCache(cache_dir=str(tmp_path / "cache"))
+    fill(cache, files[:1])
+    entry_bytes = cache.store.live_bytes
+    cache.max_size_bytes = entry_bytes * 10
+
+    fill(cache, files[1:])
+
+    assert cache.store.live_bytes <= cache.max_size_bytes
+    assert cache.cache_stats["evictions"] > 0
+    assert cache.get_ast(files[-1]) is not None
+    assert cache.get_ast(files[0]) is None
+
+
+def test_clear_removes_pack_files(tmp_path):
+    files = make_files(tmp_path / "src", 3)
+    cache_dir = tmp_path / "cache"
+    cache = ASTCache(cache_dir=str(cache_dir))
+    fill(cache, files)
+    (cache_dir / "legacy.cache").write_bytes(b"")
+
+    cache.clear_cache()
+
+    assert os.listdir(cache_dir) == []
+    assert cache.get_ast(files[0]) is None
+
+
+def put_many(directory, start, count):
+    store = PackStore(directory)
+    for index in range(start, start + count):
+        store.put(index.to_bytes(16, "little"), str(index).encode(), f"f{index}.py", 0.0, index)
+    store.close()
+
+
+def test_stores_sharing_a_directory_keep_each_others_entries(tmp_path):
+    first = PackStore(tmp_path)
+    second = PackStore(tmp_path)
+
+    first.put(b"a" * 16, b"first", "a.py", 0.0, 1)
+    second.put(b"b" * 16, b"second", "b.py", 0.0, 1)
+    # Grows and rewrites the index under the first store
+    put_many(tmp_path, 0, pack_store.INITIAL_CAPACITY)
+    first.put(b"c" * 16, b"third", "c.py", 0.0, 1)
+    second.compact()
+    first.put(b"d" * 16, b"fourth", "d.py", 0.0, 1)
+    first.close()
+    second.close()
+
+    reopened = PackStore(tmp_path)
+    assert reopened.live_count == pack_store.INITIAL_CAPACITY + 4
+    for key, payload in [(b"a", b"first"), (b"b", b"second"), (b"c", b"third"), (b"d", b"fourth")]:
+        assert reopened.read(reopened.lookup(key * 16)) == payload
+
+
+def test_processes_appending_concurrently_lose_nothing(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=put_many, args=(tmp_path, start, 300)) for start in (0, 300, 600)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+        assert worker.exitcode == 0
+
+    store = PackStore(tmp_path)
+    assert store.live_count == 900
+    assert all(
+        store.read(store.lookup(index.to_bytes(16, "little"))) == str(index).encode() for index in range(900)
+    )
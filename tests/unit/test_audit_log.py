@@ -0,0 +1,186 @@
+"""
+Unit tests for the group-committing audit log writer.
+
+Tests cover:
+- Queued events are committed in batches and survive a reopen
+- per_event durability returns only after the row is committed
+- The hash chain continues across writers and detects deleted or edited rows
+- Writers sharing one database extend a single chain
+- Failed batches are reported to waiting callers and the writer keeps running
+- Databases created before the hash chain are migrated in place
+- Audit trail queries are served by the timestamp indexes
+"""
+
+import sqlite3
+
+import pytest
+
+from security.audit_log import AuditDurability, AuditLogError, AuditLogWriter
+
+KEY = b"k" * 32
+
+
+def row(index, user="analyst-001"):
+    return (
+        f"2024-01-01T00:00:{index:02d}",
+        "analysis_start",
+        user,
+        "token",
+        "127.0.0.1",
+        "analysis",
+        "execute",
+        "success",
+        "{}",
+        f"hash-{index}",
+    )
+
+
+@pytest.fixture
+def writer(tmp_path):
+    log = AuditLogWriter(tmp_path / "audit.db", key_provider=lambda: KEY)
+    yield log
+    log.close()
+
+
+def raw_rows(path):
+    with sqlite3.connect(str(path)) as conn:
+        return conn.execute("SELECT id, integrity_hash FROM audit_events ORDER BY id").fetchall()
+
+
+def test_group_commit_batches_and_persists(tmp_path, monkeypatch):
+    batches = []
+    real_write = AuditLogWriter._write_batch
+
+    def record_batch(self, rows):
+        batches.append(len(rows))
+        real_write(self, rows)
+
+    monkeypatch.setattr(AuditLogWriter, "_write_batch", record_batch)
+    log = AuditLogWriter(tmp_path / "audit.db", key_provider=lambda: KEY, flush_interval=0.2)
+
+    for index in range(50):
+        log.append(row(index))
+    log.close()
+
+    assert sum(batches) == 50 and len([size for size in batches if size]) < 50
+    assert [integrity for _, integrity in raw_rows(tmp_path / "audit.db")] == [f"hash-{i}" for i in range(50)]
+
+
+def test_per_event_durability_commits_before_returning(tmp_path):
+    log = AuditLogWriter(tmp_path / "audit.db", key_provider=lambda: KEY, durability=AuditDurability.PER_EVENT)
+    try:
+        log.append(row(1))
+        assert raw_rows(tmp_path / "audit.db") == [(1, "hash-1")]
+    finally:
+        log.close()
+
+
+def test_chain_continues_across_writers(tmp_path):
+    first = AuditLogWriter(tmp_path / "audit.db", key_provider=lambda: KEY)
+    first.append(row(1))
+    first.close()
+    second = AuditLogWriter(tmp_path / "audit.db", key_provider=lambda: KEY)
+    second.append(row(2))
+
+    try:
+        assert second.verify_chain() == []
+        assert all(second.verify_row(entry) for entry in second.query())
+    finally:
+        second.close()
+
+
+def test_concurrent_writers_share_one_chain(tmp_path):
+    first = AuditLogWriter(tmp_path / "audit.db", key_provider=lambda: KEY)
+    second = AuditLogWriter(tmp_path / "audit.db", key_provider=lambda: KEY)
+    try:
+        for index in range(6):
+            (first if index % 2 else second).append(row(index))
+            first.flush()
+            second.flush()
+
+        assert first.verify_chain() == [] and second.verify_chain() == []
+    finally:
+        first.close()
+        second.close()
+
+
+def test_failed_batches_reach_waiting_callers(tmp_path):
+    log = AuditLogWriter(tmp_path / "audit.db", key_provider=lambda: KEY, durability=AuditDurability.PER_EVENT)
+    try:
+        # NOT NULL violation: sqlite3.Error inside the transaction
+        with pytest.raises(AuditLogError):
+            log.append((None,) + row(1)[1:])
+        log.key_provider = lambda: 1 / 0
+        with pytest.raises(AuditLogError):
+            log.append(row(2))
+
+        log.key_provider = lambda: KEY
+        log.append(row(3))
+        assert [integrity for _, integrity in raw_rows(tmp_path / "audit.db")] == ["hash-3"]
+        assert log.verify_chain() == []
+    finally:
+        log.close()
+
+
+def test_flush_reports_group_commit_failures_once(writer):
+    writer.append((None,) + row(1)[1:])
+    with pytest.raises(AuditLogError):
+        writer.flush()
+
+    writer.append(row(2))
+    assert writer.flush() is True
+
+
+def test_chain_detects_deleted_and_edited_rows(writer, tmp_path):
+    for index in range(5):
+        writer.append(row(index))
+    writer.flush()
+
+    with sqlite3.connect(str(tmp_path / "audit.db")) as conn:
+        conn.execute("DELETE FROM audit_events WHERE id = 2")
+        conn.execute("UPDATE audit_events SET integrity_hash = 'forged' WHERE id = 4")
+
+    assert writer.verify_chain() == [3, 4]
+    assert {entry["id"] for entry in writer.query() if not writer.verify_row(entry)} == {3, 4}
+
+
+def test_legacy_database_is_migrated(tmp_path):
+    path = tmp_path / "audit.db"
+    with sqlite3.connect(str(path)) as conn:
+        conn.execute(
+            "CREATE TABLE audit_events (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+            "event_type TEXT NOT NULL, user_id TEXT NOT NULL, session_token TEXT NOT NULL, ip_address TEXT NOT NULL, "
+            "resource TEXT NOT NULL, action TEXT NOT NULL, result TEXT NOT NULL, details TEXT NOT NULL, "
+            "integrity_hash TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO audit_events VALUES (1, '2023-12-31T00:00:00', 'e', 'u', 's', 'i', 'r', 'a', 'x', '{}', 'old')"
+        )
+
+    log = AuditLogWriter(path, key_provider=lambda: KEY)
+    log.append(row(2))
+
+    try:
+        assert log.verify_chain() == [1]
+        assert [entry["integrity_hash"] for entry in log.query()] == ["hash-2", "old"]
+    finally:
+        log.close()
+
+
+def test_queries_use_indexes(writer, tmp_path):
+    for index in range(20):
+        writer.append(row(index, user=f"user-{index % 3}"))
+
+    rows = writer.query(start_time="2024-01-01T00:00:05", user_id="user-1", limit=3)
+
+    assert [entry["timestamp"] for entry in rows] == [f"2024-01-01T00:00:{i:02d}" for i in (19, 16, 13)]
+    with sqlite3.connect(str(tmp_path / "audit.db")) as conn:
+        plan = " ".join(
+            str(step[-1])
+            for step in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM audit_events WHERE user_id = ? AND timestamp >= ? "
+                "ORDER BY timestamp DESC",
+                ("user-1", "x"),
+            )
+        )
+    assert "idx_audit_user_timestamp" in plan
@@ -0,0 +1,166 @@
+"""
+Unit tests for batched external tool execution.
+
+Tests cover:
+- argv-length bounded chunking
+- Splitting combined tool output back into per-file results
+- Content-hash keyed on-disk result cache (warm runs skip unchanged files)
+- Tool failures are reported but never cached
+"""
+
+import re
+import sys
+from typing import Any, Dict, List
+
+import pytest
+
+from integrations.batch_executor import BatchToolExecutor, ToolResultCache, chunk_files_for_argv
+from integrations.unified_base import IntegrationType, UnifiedBaseIntegration
+
+# Fake linter: flags every line containing "BAD" in each file argument,
+# exits 1 when anything was flagged, and exits 3 when given a "CRASH" file.
+FAKE_TOOL = (
+    "import sys\n"
+    "found = False\n"
+    "for path in sys.argv[1:]:\n"
+    "    if path.endswith('crash.py'):\n"
+    "        sys.stderr.write('internal error')\n"
+    "        sys.exit(3)\n"
+    "    for n, line in enumerate(open(path), 1):\n"
+    "        if 'BAD' in line:\n"
+    "            print(f'{path}:{n}: error: bad line')\n"
+    "            found = True\n"
+    "sys.exit(1 if found else 0)\n"
+)
+
+
+class FakeLinterIntegration(UnifiedBaseIntegration):
+    """Integration driving the fake linter through the current interpreter."""
+
+    @property
+    def tool_name(self) -> str:
+        return "fakelint"
+
+    @property
+    def tool_command(self) -> str:
+        return sys.executable
+
+    @property
+    def version_command(self) -> List[str]:
+        return [sys.executable, "--version"]
+
+    @property
+    def integration_type(self) -> IntegrationType:
+        return IntegrationType.LINTER
+
+    @property
+    def description(self) -> str:
+        return "Fake linter for tests"
+
+    def _parse_output(self, stdout: str, stderr: str) -> List[Dict[str, Any]]:
+        issues = []
+        for line in stdout.splitlines():
+            match = re.match(r"^(.+?):(\d+): error: (.+)$", line)
+            if match:
+                issues.append({"file": match.group(1), "line": int(match.group(2)), "message": match.group(3)})
+        return issues
+
+
+@pytest.fixture
+def project(tmp_path):
+    files = []
+    for i in range(6):
+        path = tmp_path / f"mod_{i}.py"
+        path.write_text("x = 1\nBAD = 2\n" if i % 2 else "x = 1\n")
+        files.append(str(path))
+    return tmp_path, files
+
+
+@pytest.fixture
+def integration(tmp_path):
+    return FakeLinterIntegration({"tool_cache_dir": str(tmp_path / "cache")})
+
+
+def test_chunking_respects_argv_budget():
+    paths = [f"/src/module_{i:03d}.py" for i in range(100)]
+    chunks = chunk_files_for_argv(paths, base_argv_chars=50, max_argv_chars=400, max_files=1000)
+
+    assert [p for chunk in chunks for p in chunk] == paths
+    for chunk in chunks:
+        assert 50 + sum(len(p) + 1 for p in chunk) <= 400
+
+
+def test_chunking_respects_file_limit():
+    chunks = chunk_files_for_argv([f"f{i}.py" for i in range(10)], base_argv_chars=0, max_files=4)
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+
+def test_batch_analyze_splits_output_per_file(integration, project):
+    _, files = project
+    results = integration.batch_analyze(files, max_parallel=2, additional_args=["-c", FAKE_TOOL])
+
+    assert set(results) == set(files)
+    for i, path in enumerate(files):
+        result = results[path]
+        if i % 2:
+            assert not result.success
+            assert [issue["line"] for issue in result.issues] == [2]
+        else:
+            assert result.success
+            assert result.issues == []
+
+
+def test_warm_run_only_executes_changed_files(integration, project):
+    _, files = project
+    executor = BatchToolExecutor(
+        integration, cache=ToolResultCache(integration.config["tool_cache_dir"]), max_files_per_invocation=1
+    )
+
+    executor.run(files, ["-c", FAKE_TOOL])
+    assert executor.invocations == len(files)
+
+    executor.invocations = 0
+    warm = executor.run(files, ["-c", FAKE_TOOL])
+    assert executor.invocations == 0
+    assert all(result.metadata["cached"] for result in warm.values())
+
+    with open(files[0], "a") as handle:
+        handle.write("BAD = 3\n")
+    changed = executor.run(files, ["-c", FAKE_TOOL])
+    assert executor.invocations == 1
+    assert not changed[files[0]].success
+
+
+def test_config_change_invalidates_cache(integration, project):
+    _, files = project
+    cache = ToolResultCache(integration.config["tool_cache_dir"])
+    BatchToolExecutor(integration, cache=cache).run(files, ["-c", FAKE_TOOL])
+
+    executor = BatchToolExecutor(integration, cache=cache)
+    executor.run(files, ["-c", FAKE_TOOL + "\n# changed\n"])
+    assert executor.invocations == 1
+
+
+def test_tool_failure_is_not_cached(integration, tmp_path):
+    crash = tmp_path / "crash.py"
+    crash.write_text("x = 1\n")
+    executor = BatchToolExecutor(integration, cache=ToolResultCache(tmp_path / "cache"))
+
+    first = executor.run([str(crash)], ["-c", FAKE_TOOL])
+    assert not first[str(crash)].success
+    assert first[str(crash)].exit_code == 3
+
+    executor.run([str(crash)], ["-c", FAKE_TOOL])
+    assert executor.invocations == 2
+
+
+def test_output_lines_are_split_by_exact_path(integration):
+    executor = BatchToolExecutor(integration, cache=ToolResultCache(enabled=False), cpu_budget=1)
+    lookup = executor._path_lookup(["a.py", "data.py", "pkg/a.py.bak"])
+    output = "data.py:3: error: bad line\na.py:1: error: bad line\npkg/a.py.bak:2:5: error: bad line\nsummary a.py"
+
+    lines = executor._split_lines(lookup, output)
+
+    assert lines["a.py"] == ["a.py:1: error: bad line"]
+    assert lines["data.py"] == ["data.py:3: error: bad line"]
+    assert lines["pkg/a.py.bak"] == ["pkg/a.py.bak:2:5: error: bad line"]
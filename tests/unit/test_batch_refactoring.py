@@ -0,0 +1,113 @@
+"""
+Unit tests for single-reparse batch refactoring.
+
+Tests cover:
+- Non-conflicting candidates, including edits on one line, merge into one result
+- The whole batch is validated with a single pair of parses
+- Candidates overlapping an earlier candidate's edits are skipped
+- A failing batch is bisected and only the breaking candidate is dropped
+"""
+
+from types import SimpleNamespace
+
+from grammar.ast_safe_refactoring import ASTSafeRefactoring, RefactoringCandidate, RefactoringTechnique
+from grammar.backends.tree_sitter_backend import LanguageSupport
+from grammar.overlay_manager import OverlayManager
+
+SOURCE = "def scale(value):\n    return value * 42 + 7 * 42\n"
+
+
+class CountingBackend:
+    """Parses anything without a SYNTAX_ERROR marker and counts the parses."""
+
+    def __init__(self):
+        self.parses = 0
+
+    def parse(self, code, language):
+        self.parses += 1
+        success = "SYNTAX_ERROR" not in code
+        return SimpleNamespace(success=success, errors=[] if success else [{"message": "bad"}], ast=None)
+
+    def extract_functions(self, ast, language):
+        return []
+
+
+def candidate(technique, description, safety_impact="low", start_line=1):
+    return RefactoringCandidate(
+        technique=technique,
+        file_path="current_file",
+        start_line=start_line,
+        end_line=2,
+        description=description,
+        rationale="test",
+        estimated_effort="low",
+        safety_impact=safety_impact,
+        connascence_improvement="CoM -> CoN",
+    )
+
+
+def engine(tmp_path, **handlers):
+    refactoring = ASTSafeRefactoring(CountingBackend(), OverlayManager(tmp_path))
+    for name, handler in handlers.items():
+        refactoring._technique_handlers[RefactoringTechnique[name]] = handler
+    return refactoring
+
+
+def test_batch_merges_edits_and_validates_once(tmp_path):
+    refactoring = engine(tmp_path)
+    candidates = [
+        candidate(RefactoringTechnique.INTRODUCE_ASSERTION, "Add runtime assertions to scale", "high"),
+        candidate(RefactoringTechnique.REPLACE_MAGIC_NUMBER_WITH_SYMBOLIC_CONSTANT, "Replace magic number 42"),
+        candidate(RefactoringTechnique.REPLACE_MAGIC_NUMBER_WITH_SYMBOLIC_CONSTANT, "Replace magic number 7"),
+    ]
+
+    result = refactoring.batch_apply_refactorings(candidates, SOURCE, LanguageSupport.PYTHON)
+
+    assert result.success
+    assert result.refactored_code == (
+        "CONSTANT_42 = 42\n\n"
+        "CONSTANT_7 = 7\n\n"
+        "def scale(value):\n"
+        "    assert param is not None, 'Parameter must not be None'\n"
+        "    return value * CONSTANT_42 + CONSTANT_7 * CONSTANT_42\n"
+    )
+    assert refactoring.backend.parses == 2
+
+
+def test_overlapping_candidates_are_skipped(tmp_path):
+    refactoring = engine(
+        tmp_path,
+        RENAME_METHOD=lambda code, c, language: code.replace("value", "XXXXX"),
+        INLINE_METHOD=lambda code, c, language: code.replace("value", "YYYY"),
+    )
+    candidates = [
+        candidate(RefactoringTechnique.RENAME_METHOD, "Rename value"),
+        candidate(RefactoringTechnique.INLINE_METHOD, "Shorten value"),
+    ]
+
+    result = refactoring.batch_apply_refactorings(candidates, SOURCE, LanguageSupport.PYTHON)
+
+    assert result.success
+    assert result.refactored_code == SOURCE.replace("value", "XXXXX")
+    assert result.warnings == ["Skipped conflicting refactoring: Shorten value"]
+
+
+def test_failed_validation_bisects_to_the_breaking_candidate(tmp_path):
+    refactoring = engine(
+        tmp_path,
+        RENAME_METHOD=lambda code, c, language: code.replace("scale", "resize"),
+        INLINE_METHOD=lambda code, c, language: code.replace("return", "return  SYNTAX_ERROR"),
+        MOVE_METHOD=lambda code, c, language: code + "# moved\n",
+    )
+    candidates = [
+        candidate(RefactoringTechnique.RENAME_METHOD, "Rename scale"),
+        candidate(RefactoringTechnique.INLINE_METHOD, "Break the return"),
+        candidate(RefactoringTechnique.MOVE_METHOD, "Move scale"),
+    ]
+
+    result = refactoring.batch_apply_refactorings(candidates, SOURCE, LanguageSupport.PYTHON)
+
+    assert not result.success
+    assert result.technique == RefactoringTechnique.INLINE_METHOD
+    assert result.validation_errors == ["Syntax error: bad"]
+    assert result.refactored_code == SOURCE.replace("scale", "resize") + "# moved\n"
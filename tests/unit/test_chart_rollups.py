@@ -0,0 +1,152 @@
+"""
+Unit tests for dashboard chart rollups and downsampling.
+
+Tests cover:
+- LTTB keeps the endpoints and extreme points within the point budget
+- Trend charts over long histories are downsampled
+- Scans are folded into per-day and per-week rollups when recorded
+- Rollups are kept per project, backfilled on migration and pruned with their scans
+- Large scatter plots are binned, small ones are left alone
+- Chart payloads are cached per data version with a stable ETag
+"""
+
+from datetime import datetime, timedelta
+import sqlite3
+
+from interfaces.web.charts import ChartGenerator, lttb_indices
+from interfaces.web.metrics import DashboardMetrics
+
+
+def scan(timestamp, index, violations, critical=0, project="/project"):
+    return {
+        "timestamp": timestamp,
+        "project_path": project,
+        "policy_preset": "strict",
+        "summary": {"connascence_index": index, "total_violations": violations, "critical_count": critical},
+    }
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    values = [0.0] * 1000
+    values[137] = 50.0
+    values[612] = -40.0
+
+    kept = lttb_indices(values, 20)
+
+    assert len(kept) == 20
+    assert kept[0] == 0 and kept[-1] == 999
+    assert kept == sorted(kept)
+    assert 137 in kept and 612 in kept
+    assert lttb_indices(values[:10], 20) == list(range(10))
+
+
+def test_trend_line_is_downsampled():
+    trends = [
+        {"timestamp": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}", "connascence_index": i % 7, "total_violations": i}
+        for i in range(2000)
+    ]
+
+    chart = ChartGenerator().generate_chart("trend_line", {"trends": trends, "max_points": 100})
+
+    assert len(chart["data"]["labels"]) == 100
+    assert all(len(dataset["data"]) == 100 for dataset in chart["data"]["datasets"])
+
+
+def test_scans_are_rolled_up_per_day_and_week(tmp_path):
+    metrics = DashboardMetrics(tmp_path / "dashboard.db")
+    metrics.record_scan(scan("2024-01-01T09:00:00", 10.0, 4, critical=2))
+    metrics.record_scan(scan("2024-01-01T17:00:00", 20.0, 8))
+    metrics.record_scan(scan("2024-01-03T12:00:00", 30.0, 6))
+
+    daily = metrics.get_rollups("day")
+    weekly = metrics.get_rollups("week")
+
+    assert [(point["timestamp"], point["scans"]) for point in daily] == [("2024-01-01", 2), ("2024-01-03", 1)]
+    assert daily[0]["connascence_index"] == 15.0
+    assert daily[0]["connascence_index_min"] == 10.0 and daily[0]["connascence_index_max"] == 20.0
+    assert daily[0]["total_violations"] == 6 and daily[0]["max_violations"] == 8
+    assert [(point["timestamp"], point["scans"]) for point in weekly] == [("2024-01-01", 3)]
+    assert metrics.data_version() == (3, 3)
+
+
+def test_rollups_are_kept_per_project(tmp_path):
+    metrics = DashboardMetrics(tmp_path / "dashboard.db")
+    metrics.record_scan(scan("2024-01-01T09:00:00", 10.0, 4, project="/a"))
+    metrics.record_scan(scan("2024-01-01T10:00:00", 30.0, 8, project="/b"))
+
+    assert [point["connascence_index"] for point in metrics.get_rollups("day", project_path="/a")] == [10.0]
+    assert [point["connascence_index"] for point in metrics.get_rollups("day", project_path="/b")] == [30.0]
+    (combined,) = metrics.get_rollups("day")
+    assert combined["scans"] == 2 and combined["connascence_index"] == 20.0
+
+
+def test_existing_scans_are_backfilled_once(tmp_path):
+    path = tmp_path / "dashboard.db"
+    metrics = DashboardMetrics(path)
+    metrics.record_scan(scan("2024-01-01T09:00:00", 10.0, 4, project="/a"))
+    metrics.record_scan(scan("2024-01-02T09:00:00", 20.0, 6, project="/a"))
+    # Rollup table from before rollups were kept per project
+    with sqlite3.connect(str(path)) as conn:
+        conn.execute("DROP TABLE scan_rollups")
+        conn.execute(
+            "CREATE TABLE scan_rollups (period TEXT, bucket TEXT, scans INTEGER, PRIMARY KEY (period, bucket))"
+        )
+
+    DashboardMetrics(path)
+    reopened = DashboardMetrics(path)
+
+    assert [(p["timestamp"], p["scans"]) for p in reopened.get_rollups("day", project_path="/a")] == [
+        ("2024-01-01", 1),
+        ("2024-01-02", 1),
+    ]
+    assert [p["scans"] for p in reopened.get_rollups("week")] == [2]
+
+
+def test_cleanup_prunes_rollups_with_their_scans(tmp_path):
+    metrics = DashboardMetrics(tmp_path / "dashboard.db")
+    now = datetime.now()
+    metrics.record_scan(scan((now - timedelta(days=200)).isoformat(), 50.0, 9))
+    metrics.record_scan(scan((now - timedelta(days=1)).isoformat(), 10.0, 2))
+
+    deleted = metrics.cleanup_old_data(days_to_keep=90)
+
+    assert deleted["scan_results_deleted"] == 1 and deleted["scan_rollups_deleted"] >= 2
+    assert [p["connascence_index"] for p in metrics.get_rollups("day")] == [10.0]
+    assert [p["connascence_index"] for p in metrics.get_rollups("week")] == [10.0]
+
+
+def test_large_scatter_is_binned():
+    violations = [
+        {"file_path": f"src/module_{file_index}.py", "severity": "critical" if file_index == 0 else "low"}
+        for file_index in range(3000)
+        for _ in range(file_index % 25 + 1)
+    ]
+    generator = ChartGenerator()
+
+    points = generator.generate_chart(
+        "complexity_scatter", {"job_id": "job-1", "violations": violations, "max_points": 100}
+    )["data"]["datasets"][0]["data"]
+
+    assert len(points) <= 100
+    assert sum(point["count"] for point in points) == 3000
+    assert sum(point["critical_count"] for point in points) == 1
+
+    small = generator.generate_chart("complexity_scatter", {"violations": violations[:3]})
+    assert len(small["data"]["datasets"][0]["data"]) == 2
+
+
+def test_chart_payloads_are_cached_per_version():
+    generator = ChartGenerator()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return {"summary": {"violations_by_file": {"a.py": 3, "b.py": 1}}}
+
+    payload, etag = generator.get_chart("file_heatmap", load, version="job-1")
+    again, same_etag = generator.get_chart("file_heatmap", load, version="job-1")
+    _, fresh_etag = generator.get_chart("file_heatmap", {"summary": {"violations_by_file": {"a.py": 4}}}, "job-2")
+
+    assert again is payload and same_etag == etag
+    assert len(loads) == 1
+    assert fresh_etag != etag
@@ -0,0 +1,243 @@
+"""
+Unit tests for the opt-in CLI analysis daemon.
+
+Tests cover:
+- Forwarded invocations stream stdout/stderr and return the exit code
+- Requests run in the client's working directory
+- Unreachable daemons fall back to in-process execution
+- Idle shutdown removes the socket
+- The socket is private to its user and clients ignore sockets owned by others
+- SharedCLIAnalyzer per-file results are invalidated by content, not just mtime
+- Daemons running other code are restarted or bypassed
+- Forwarded environment and config digests reach the daemon's result cache key
+- Cached violation lists are returned as copies
+"""
+
+import io
+import os
+import stat
+from pathlib import Path
+import sys
+import tempfile
+import threading
+
+import pytest
+
+from analyzer import cli_daemon
+from analyzer.cli_daemon import CLIDaemonServer, forward_to_daemon, send_command
+from analyzer.cli_entry import SharedCLIAnalyzer
+
+pytestmark = pytest.mark.skipif(not cli_daemon.DAEMON_SUPPORTED, reason="requires Unix domain sockets")
+
+
+class EchoCLI:
+    """Minimal CLI front end recording what the daemon asked it to run."""
+
+    def __init__(self):
+        self.runs = []
+
+    def run(self, argv):
+        self.runs.append((list(argv), os.getcwd()))
+        print("out:" + " ".join(argv))
+        print("progress", file=sys.stderr)
+        if argv == ["--bad"]:
+            raise SystemExit(2)
+        return len(argv)
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are length-limited, so keep them short
+    with tempfile.TemporaryDirectory(prefix="cd") as directory:
+        yield Path(directory) / "d.sock"
+
+
+@pytest.fixture
+def daemon(socket_path):
+    cli = EchoCLI()
+    server = CLIDaemonServer(socket_path, idle_timeout=60, cli_factories={"connascence": lambda: cli})
+    thread = threading.Thread(target=server.serve_until_idle, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server, cli
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def test_forward_streams_output_and_exit_code(daemon, socket_path, tmp_path, monkeypatch):
+    server, cli = daemon
+    monkeypatch.chdir(tmp_path)
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    code = forward_to_daemon(["--daemon", "analyze", "x.py"], socket_path, autostart=False, stdout=stdout, stderr=stderr)
+
+    assert code == 2
+    assert stdout.getvalue() == "out:analyze x.py\n"
+    assert stderr.getvalue() == "progress\n"
+    assert cli.runs == [(["analyze", "x.py"], str(tmp_path))]
+    assert os.getcwd() == str(tmp_path)
+
+
+def test_argparse_exit_is_reported(daemon, socket_path):
+    code = forward_to_daemon(["--bad"], socket_path, autostart=False, stdout=io.StringIO(), stderr=io.StringIO())
+    assert code == 2
+    assert send_command("stats", socket_path)["requests_served"] == 1
+
+
+def test_unreachable_daemon_returns_none(socket_path):
+    assert forward_to_daemon(["analyze", "x.py"], socket_path, autostart=False) is None
+    assert send_command("ping", socket_path) is None
+
+
+def test_idle_shutdown_removes_socket(socket_path):
+    server = CLIDaemonServer(socket_path, idle_timeout=0.1, cli_factories={})
+    thread = threading.Thread(target=server.serve_until_idle, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+
+
+def test_socket_is_created_private(daemon, socket_path):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+def test_client_ignores_socket_owned_by_another_user(daemon, socket_path, monkeypatch):
+    monkeypatch.setattr(cli_daemon, "_current_uid", lambda: os.getuid() + 1)
+    assert send_command("ping", socket_path) is None
+    assert forward_to_daemon(["analyze"], socket_path, autostart=False) is None
+
+
+def test_default_socket_path_is_in_a_private_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv(cli_daemon.SOCKET_ENV_VAR, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert cli_daemon.default_socket_path() == tmp_path / "connascence-cli.sock"
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    path = cli_daemon.default_socket_path()
+    assert path.parent.parent == tmp_path
+
+    server = CLIDaemonServer(path, cli_factories={})
+    try:
+        assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+    finally:
+        server.server_close()
+
+
+def test_cached_analysis_decodes_like_open(tmp_path, monkeypatch):
+    helper = SharedCLIAnalyzer()
+    analyzer = helper._require_analyzer("standard")
+    seen = []
+    monkeypatch.setattr(analyzer, "analyze_string", lambda code, file_path: seen.append(code) or [])
+    crlf = tmp_path / "crlf.py"
+    crlf.write_bytes(b"def f(x):\r\n    return x * 42\r\n")
+
+    helper.analyze_file_cached(crlf, "standard")
+    assert seen == [crlf.read_text(encoding="utf-8")] == ["def f(x):\n    return x * 42\n"]
+
+    latin1 = tmp_path / "latin1.py"
+    latin1.write_bytes(b"x = '\xe9'\n")
+    with pytest.raises(UnicodeDecodeError):
+        helper.analyze_file_cached(latin1, "standard")
+
+
+def test_shared_analyzer_result_cache(tmp_path):
+    helper = SharedCLIAnalyzer()
+    target = tmp_path / "sample.py"
+    target.write_text("def f(x):\n    return x * 42\n", encoding="utf-8")
+
+    first = helper.analyze_file_cached(target, "standard")
+    assert first
+    first.clear()
+    again = helper.analyze_file_cached(target, "standard")
+    assert again and again is not first
+
+    # Touched but identical: the digest check reuses the result
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert helper.analyze_file_cached(target, "standard") == again
+
+    target.write_text("def f(x):\n    return x\n", encoding="utf-8")
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    changed = helper.analyze_file_cached(target, "standard")
+
+    assert changed != again
+    assert helper.get_cache_stats() == {"entries": 1, "hits": 1, "rehashed_hits": 1, "misses": 2}
+
+    # A different code version or configuration never reuses the entry
+    helper.cache_context = "other-config"
+    helper.analyze_file_cached(target, "standard")
+    assert helper.get_cache_stats()["misses"] == 3
+
+
+class HelperCLI(EchoCLI):
+    """EchoCLI exposing an analysis helper and the environment it ran under."""
+
+    def __init__(self):
+        super().__init__()
+        self.analysis_helper = SharedCLIAnalyzer()
+        self.contexts = []
+
+    def run(self, argv):
+        self.contexts.append((self.analysis_helper.cache_context, os.environ.get("CONNASCENCE_POLICY")))
+        return super().run(argv)
+
+
+def test_forwarded_environment_and_config_digest(socket_path, tmp_path, monkeypatch):
+    cli = HelperCLI()
+    server = CLIDaemonServer(socket_path, idle_timeout=60, cli_factories={"connascence": lambda: cli})
+    thread = threading.Thread(target=server.serve_until_idle, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("CONNASCENCE_POLICY", raising=False)
+    config = tmp_path / ".connascence.yml"
+    forward = lambda: forward_to_daemon(["x"], socket_path, autostart=False, stdout=io.StringIO(), stderr=io.StringIO())
+    try:
+        config.write_text("policy: strict\n", encoding="utf-8")
+        forward()
+        forward()
+        config.write_text("policy: lenient\n", encoding="utf-8")
+        forward()
+        monkeypatch.setenv("CONNASCENCE_POLICY", "nasa-compliance")
+        forward()
+    finally:
+        server.shutdown()
+        thread.join(timeout=5)
+
+    contexts = [context for context, _policy in cli.contexts]
+    assert all(context.startswith(server.version + ":") for context in contexts)
+    assert contexts[0] == contexts[1]
+    assert len(set(contexts)) == 3
+    assert [policy for _context, policy in cli.contexts] == [None, None, None, "nasa-compliance"]
+
+
+def test_forwarded_environment_replaces_the_daemons_own(socket_path, monkeypatch):
+    cli = HelperCLI()
+    server = CLIDaemonServer(socket_path, idle_timeout=60, cli_factories={"connascence": lambda: cli})
+    monkeypatch.setenv("CONNASCENCE_POLICY", "daemon-default")
+    try:
+        server.run_cli(["x"], None, lambda message: None, env={})
+        server.run_cli(["x"], None, lambda message: None, env={"CONNASCENCE_POLICY": "strict"})
+    finally:
+        server.server_close()
+
+    assert [policy for _context, policy in cli.contexts] == [None, "strict"]
+    assert os.environ["CONNASCENCE_POLICY"] == "daemon-default"
+
+
+def test_version_mismatch_falls_back_or_restarts(daemon, socket_path, monkeypatch):
+    server, cli = daemon
+    assert send_command("ping", socket_path)["version"] == server.version
+    monkeypatch.setattr(cli_daemon, "code_fingerprint", lambda root=None: "upgraded")
+
+    # Without autostart the stale daemon is bypassed and the CLI runs in-process
+    assert forward_to_daemon(["x"], socket_path, autostart=False, stdout=io.StringIO()) is None
+    assert cli.runs == []
+
+    # With autostart the stale daemon is asked to exit before a new one is spawned
+    spawned = []
+    monkeypatch.setattr(cli_daemon.subprocess, "Popen", lambda cmd, **kwargs: spawned.append(cmd))
+    assert cli_daemon.start_daemon(socket_path, wait=2) is False
+    assert send_command("ping", socket_path) is None
+    assert spawned and spawned[0][1:3] == ["-m", "analyzer.cli_daemon"]
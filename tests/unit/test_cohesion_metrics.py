@@ -0,0 +1,93 @@
+"""
+Unit tests for the bitset cohesion metrics in CohesionAnalyzer.
+
+Tests cover:
+- TCC counts pairs sharing an attribute, including through called helpers
+- LCC counts pairs connected through chains of shared attributes
+- LCOM4 counts connected components of the attribute/call graph
+- Popcount pair counting agrees with a pairwise set comparison
+- LCOM keeps the Henderson-Sellers definition
+"""
+
+import ast
+from itertools import combinations
+import random
+
+import pytest
+
+from analyzer.cohesion_analyzer import CohesionAnalyzer
+
+SOURCE = """
+class Account:
+    def __init__(self):
+        self.balance = 0
+        self.owner = None
+        self.log = []
+
+    def deposit(self, amount):
+        self.balance += amount
+        self._record(amount)
+
+    def withdraw(self, amount):
+        self.balance -= amount
+
+    def history(self):
+        return list(self.log)
+
+    def _record(self, entry):
+        self.log.append(entry)
+
+    def rename(self, owner):
+        self.owner = owner
+
+    async def ping(self):
+        return True
+"""
+
+
+def metrics_for(source):
+    analyzer = CohesionAnalyzer()
+    class_node = next(node for node in ast.walk(ast.parse(source)) if isinstance(node, ast.ClassDef))
+    return analyzer._calculate_metrics(analyzer._collect_references(class_node))
+
+
+def test_known_class_metrics():
+    metrics = metrics_for(SOURCE)
+
+    # deposit-withdraw share balance, deposit-history share log through _record
+    assert metrics.method_count == 5
+    assert metrics.tcc == pytest.approx(2 / 10)
+    # {deposit, withdraw, history} is one connected group: 3 of 10 pairs
+    assert metrics.lcc == pytest.approx(3 / 10)
+    # {deposit, withdraw, history, _record}, {rename}, {ping}
+    assert metrics.lcom4 == 3
+
+
+def test_lcom_keeps_henderson_sellers_definition():
+    metrics = metrics_for(SOURCE)
+
+    # balance, owner, log, _record referenced; public usage: 2 + 1 + 1 + 1 + 0
+    assert metrics.attribute_count == 4
+    assert metrics.lcom == pytest.approx(1 - 5 / (5 * 4))
+    assert metrics.shared_attributes == 4
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_popcount_pairs_match_pairwise_sets(seed):
+    rng = random.Random(seed)
+    methods = []
+    for index in range(40):
+        attributes = rng.sample(range(30), rng.randint(0, 3))
+        body = " + ".join(f"self.a{k}" for k in attributes) or "None"
+        methods.append((set(attributes), f"    def m{index}(self):\n        return {body}\n"))
+    metrics = metrics_for("class Generated:\n" + "".join(code for _, code in methods))
+
+    pairs = list(combinations([attrs for attrs, _ in methods], 2))
+    assert metrics.tcc == pytest.approx(sum(1 for a, b in pairs if a & b) / len(pairs))
+
+
+def test_analyze_source_reports_low_cohesion():
+    violations = CohesionAnalyzer().analyze_source(SOURCE, "account.py")
+
+    assert {v.type for v in violations} == {"LowCohesion", "LowTCC"}
+    assert all(v.metrics.lcom4 == 3 for v in violations)
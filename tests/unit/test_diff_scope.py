@@ -0,0 +1,206 @@
+"""
+Unit tests for hunk-scoped diff analysis.
+
+Tests cover:
+- Parsing ``git diff -U0`` hunks into new-side line ranges and deletions
+- Mapping changed lines onto enclosing function and class scopes
+- Module-level changes falling back to whole-file analysis
+- Scoped analysis reporting exactly the filtered whole-file findings
+- scan-diff analyzing only the changed lines of each file, at the head revision
+"""
+
+import argparse
+import ast
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from analyzer.ast_engine.core_analyzer import ConnascenceASTAnalyzer
+from analyzer.cli_entry import SharedCLIAnalyzer
+from analyzer.diff_scope import FileChanges, filter_to_changes, parse_unified_diff, select_changed_scopes
+
+DIFF = """\
+diff --git a/pkg/service.py b/pkg/service.py
+index 1111111..2222222 100644
+--- a/pkg/service.py
++++ b/pkg/service.py
+@@ -3 +3 @@ import os
+-    return 1
++    return 99
+@@ -10,0 +11,2 @@ class Service:
++        total = 500
++        return total
+@@ -20,2 +21,0 @@ class Service:
+-        pass
+-        pass
+diff --git a/README.md b/README.md
+--- a/README.md
++++ b/README.md
+@@ -1 +1 @@
+-old
++new
+diff --git a/gone.py b/gone.py
+deleted file mode 100644
+--- a/gone.py
++++ /dev/null
+@@ -1,3 +0,0 @@
+-x = 1
+"""
+
+SOURCE = '''\
+import os
+
+LIMIT = 250
+
+
+@register
+def configure(a, b, c, d, e, f, g, h):
+    value = 42
+    return value
+
+
+class Service:
+    def start(self, port):
+        if port > 1024:
+            return port
+        return 8080
+
+    def retry(self, attempts=30):
+        return attempts
+
+    def stop(self, timeout):
+        return timeout * 3600
+
+
+def helper(x):
+    def inner(y):
+        return y + 77
+    return inner(x)
+'''
+
+
+def lines_of(needle):
+    return next(number for number, line in enumerate(SOURCE.splitlines(), start=1) if needle in line)
+
+
+def comparable(violations):
+    return sorted((v.rule_id, v.line_number, v.description) for v in violations)
+
+
+def test_parse_unified_diff():
+    changes = parse_unified_diff(DIFF)
+
+    assert list(changes) == ["pkg/service.py"]
+    service = changes["pkg/service.py"]
+    assert service.ranges == [(3, 3), (11, 12)]
+    assert service.deletions == [21]
+    assert service.changed_line_count == 3
+    assert service.contains_line(12) and not service.contains_line(13)
+
+
+def test_change_inside_method_selects_enclosing_scopes():
+    tree = ast.parse(SOURCE)
+    line = lines_of("return 8080")
+
+    selection = select_changed_scopes(tree, FileChanges("s.py", [(line, line)]))
+
+    assert [getattr(s, "name", None) for s in selection.scopes] == ["Service", "start"]
+    assert not selection.module_level_changed
+    assert selection.header_lines == {lines_of("class Service"), lines_of("def start")}
+
+
+def test_nested_function_and_decorator_changes():
+    tree = ast.parse(SOURCE)
+    nested = lines_of("return y + 77")
+    decorator = lines_of("@register")
+
+    selection = select_changed_scopes(tree, FileChanges("s.py", [(decorator, decorator), (nested, nested)]))
+
+    assert [s.name for s in selection.scopes] == ["configure", "helper", "inner"]
+    # The decorator is part of configure's header and is re-scanned
+    assert any(isinstance(n, ast.Name) and n.id == "register" for n in selection.nodes)
+
+
+def test_module_level_changes_are_detected():
+    tree = ast.parse(SOURCE)
+    limit = lines_of("LIMIT = 250")
+    after_stop_header = lines_of("def stop")
+
+    assert select_changed_scopes(tree, FileChanges("s.py", [(limit, limit)])).module_level_changed
+    # Deletion between two top-level definitions
+    assert select_changed_scopes(tree, FileChanges("s.py", deletions=[lines_of("return value")])).module_level_changed
+    assert not select_changed_scopes(tree, FileChanges("s.py", deletions=[after_stop_header])).module_level_changed
+    # Lines removed after a definition's last line may have been module-level code
+    assert select_changed_scopes(tree, FileChanges("s.py", deletions=[lines_of("return timeout")])).module_level_changed
+
+
+@pytest.mark.parametrize(
+    "needles",
+    [
+        ["return 8080"],
+        ["return timeout"],
+        ["value = 42", "return y + 77"],
+        ["@register"],
+        ["def stop"],
+        # Body-only change: the default on the definition line is still reported
+        ["return attempts"],
+    ],
+)
+def test_scoped_analysis_matches_filtered_whole_file(needles):
+    tree = ast.parse(SOURCE)
+    changes = FileChanges("s.py", sorted((lines_of(n), lines_of(n)) for n in needles))
+    selection = select_changed_scopes(tree, changes)
+    analyzer = ConnascenceASTAnalyzer()
+
+    scoped = filter_to_changes(analyzer.analyze_scopes(tree, "s.py", selection), changes, selection)
+    whole = filter_to_changes(analyzer.analyze_string(SOURCE, "s.py"), changes, selection)
+
+    assert not selection.module_level_changed
+    assert comparable(scoped) == comparable(whole)
+
+
+def test_scoped_analysis_skips_untouched_scopes():
+    tree = ast.parse(SOURCE)
+    line = lines_of("return timeout")
+    changes = FileChanges("s.py", [(line, line)])
+
+    violations = ConnascenceASTAnalyzer().analyze_scopes(tree, "s.py", select_changed_scopes(tree, changes))
+
+    # configure's parameter bomb and magic literal live outside the change
+    assert {v.line_number for v in violations} == {lines_of("def stop"), line}
+
+
+def _fake_git(diff, head_source):
+    def run(cmd, **kwargs):
+        if cmd[1] == "show":
+            return SimpleNamespace(returncode=0, stdout=head_source, stderr="")
+        return SimpleNamespace(returncode=0, stdout=diff, stderr="")
+
+    return run
+
+
+def test_scan_diff_reports_only_changed_lines(tmp_path, monkeypatch):
+    from interfaces.cli.connascence import ConnascenceCLI
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pkg").mkdir()
+    # The working tree has moved on since head; findings must come from head
+    (tmp_path / "pkg" / "service.py").write_text("\n" * 5 + SOURCE, encoding="utf-8")
+    line = lines_of("return timeout")
+    diff = f"+++ b/pkg/service.py\n@@ -{line} +{line} @@\n"
+
+    cli = ConnascenceCLI()
+    cli.analysis_helper = SharedCLIAnalyzer()
+    args = argparse.Namespace(base="main", head="feature", policy="service-defaults", format="json",
+                              output=str(tmp_path / "out.json"), severity=None, full_files=False)
+    with mock.patch("interfaces.cli.connascence.subprocess.run", side_effect=_fake_git(diff, SOURCE)) as run:
+        cli.scan_diff_handler.handle(args)
+
+    assert "-U0" in run.call_args_list[0][0][0]
+    assert run.call_args_list[1][0][0] == ["git", "show", "feature:pkg/service.py"]
+    payload = json.loads((tmp_path / "out.json").read_text())
+    assert payload["metadata"]["scoped_files"] == 1
+    assert payload["metadata"]["changed_lines"] == 1
+    assert {f["line"] for f in payload["findings"]} == {lines_of("def stop"), line}
@@ -0,0 +1,126 @@
+"""
+Unit tests for the shared artifact digest service.
+
+Tests cover:
+- Digests match hashlib for small (single read) and large (mmap) files
+- Warm runs are served from the persistent cache
+- Changed files are re-hashed
+- The default cache lives at the project root whatever the working directory
+- SLSA materials cover every in-scope file
+- Incremental cache hashes decoded text whether or not content is passed in
+"""
+
+import hashlib
+import os
+
+from analyzer.enterprise.supply_chain.slsa_attestation import SLSAAttestationGenerator
+from analyzer.optimization.digest_service import (
+    DEFAULT_DIGEST_CACHE,
+    MMAP_THRESHOLD_BYTES,
+    ArtifactDigestService,
+    get_digest_service,
+    hash_file_sha256,
+)
+from analyzer.streaming.incremental_cache import IncrementalCache
+
+
+def _sha256(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_small_and_mmap_hashes_match_hashlib(tmp_path):
+    small = tmp_path / "small.py"
+    small.write_text("x = 1\n")
+    large = tmp_path / "large.bin"
+    large.write_bytes(os.urandom(MMAP_THRESHOLD_BYTES + 17))
+    empty = tmp_path / "empty.py"
+    empty.write_bytes(b"")
+
+    for path in (small, large, empty):
+        assert hash_file_sha256(path) == _sha256(path)
+
+
+def test_warm_run_is_served_from_persistent_cache(tmp_path):
+    project = tmp_path / "project"
+    (project / "pkg").mkdir(parents=True)
+    for i in range(20):
+        (project / "pkg" / f"mod_{i}.py").write_text(f"value = {i}\n")
+    cache_path = tmp_path / "digests.json"
+
+    with ArtifactDigestService(cache_path, max_workers=4) as cold:
+        first = cold.digest_tree(project)
+    assert cold.get_stats()["misses"] == 20
+
+    warm = ArtifactDigestService(cache_path, max_workers=4)
+    assert warm.digest_tree(project) == first
+    assert warm.get_stats()["hits"] == 20
+    assert warm.get_stats()["misses"] == 0
+
+
+def test_default_cache_is_resolved_against_the_project_root(tmp_path, monkeypatch):
+    (tmp_path / "pyproject.toml").write_text("[project]\n")
+    nested = tmp_path / "pkg" / "sub"
+    nested.mkdir(parents=True)
+
+    monkeypatch.chdir(nested)
+    from_nested = ArtifactDigestService()
+    monkeypatch.chdir(tmp_path)
+
+    assert from_nested.cache_path == tmp_path.resolve() / DEFAULT_DIGEST_CACHE
+    assert ArtifactDigestService().cache_path == from_nested.cache_path
+    assert get_digest_service(nested) is get_digest_service(tmp_path)
+
+
+def test_changed_file_is_rehashed(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("a = 1\n")
+    service = ArtifactDigestService(None)
+    before = service.digest_file(path)
+
+    path.write_text("a = 22\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    after = service.digest_file(path)
+    assert after != before
+    assert after == _sha256(path)
+
+
+def test_excluded_directories_are_skipped(tmp_path):
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "cached.py").write_text("")
+    (tmp_path / "keep.py").write_text("")
+
+    assert list(ArtifactDigestService(None).digest_tree(tmp_path)) == ["keep.py"]
+
+
+def test_slsa_materials_cover_every_source_file(tmp_path):
+    for i in range(60):
+        (tmp_path / f"mod_{i:02d}.py").write_text(f"n = {i}\n")
+    (tmp_path / "requirements.txt").write_text("requests==2.0\n")
+
+    generator = SLSAAttestationGenerator(str(tmp_path), digest_service=ArtifactDigestService(None))
+    materials = generator.collect_build_materials()
+
+    assert len(materials) == 61
+    assert materials[0].uri == "file://mod_00.py"
+    assert materials[0].digest["sha256"] == _sha256(tmp_path / "mod_00.py")
+
+
+def test_incremental_cache_hashes_text_on_every_path(tmp_path):
+    path = tmp_path / "crlf.py"
+    path.write_bytes("\ufeffx = 'é'\r\ny = 2\r\n".encode("utf-8"))
+    text = path.read_text(encoding="utf-8")
+    cache = IncrementalCache()
+
+    created = cache.track_file_change(path, new_content=text)
+    assert created.new_size == len(text)
+    # Same text read from disk (CRLF, BOM) is not a modification
+    assert cache.track_file_change(path) is None
+    assert cache.track_file_change(path) is None
+
+    path.write_bytes(b"x = 3\r\n")
+    modified = cache.track_file_change(path)
+    assert modified.change_type == "modified"
+    assert modified.new_size == len("x = 3\n")
+    assert cache.track_file_change(path, new_content="x = 3\n") is None
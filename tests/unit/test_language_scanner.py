@@ -0,0 +1,90 @@
+"""
+Unit tests for the single-pass JavaScript and C source scanners.
+
+Tests cover:
+- Literals inside comments are ignored, literals in headers are kept
+- Braces inside strings and comments do not break function boundaries
+- Parameter lists are reported for definitions but not control statements
+- The detect_* strategy methods share one scan per file
+- The formal grammar engine is built once per process
+"""
+
+from pathlib import Path
+
+from analyzer.language_scanner import C_SCANNER, JAVASCRIPT_SCANNER
+from analyzer.language_strategies import CStrategy, JavaScriptStrategy, get_formal_grammar_engine
+
+JS_SOURCE = """// timeout 123
+/* legacy
+   value 456 */
+function big(a, b = 10, c) {
+  const s = "not a } brace";
+  const t = `multi
+line`;
+  return 7;
+}
+const arrow = (x, y) => { return x * 2; };
+"""
+
+C_SOURCE = """#define LIMIT 42
+static int compute(int a, int b, int c, int d, int e, int f, int g)
+{
+    char *s = "hello {world";
+    if (a > 5) { return 3; }
+    return helper(2, 3);
+}
+int prototype(int a);
+"""
+
+
+def test_javascript_literals_skip_comments():
+    result = JAVASCRIPT_SCANNER.scan(JS_SOURCE)
+    assert [(token.line_number, token.text) for token in result.literals] == [
+        (4, "10"),
+        (5, '"not a } brace"'),
+        (8, "7"),
+        (10, "2"),
+    ]
+
+
+def test_javascript_function_boundaries_ignore_braces_in_strings():
+    result = JAVASCRIPT_SCANNER.scan(JS_SOURCE)
+    assert [(span.name, span.start_line, span.end_line) for span in result.functions] == [
+        ("big", 4, 9),
+        ("arrow", 10, 10),
+    ]
+    assert [header.parameters for header in result.parameter_lists] == ["a, b = 10, c", "x, y"]
+
+
+def test_c_scanner_headers_and_preprocessor():
+    result = C_SCANNER.scan(C_SOURCE)
+
+    assert [header.name for header in result.parameter_lists] == ["compute", "prototype"]
+    assert [(span.name, span.start_line, span.end_line) for span in result.functions] == [("compute", 2, 7)]
+    # "#define LIMIT 42" is the recommended fix, not a magic literal
+    assert "42" not in [token.text for token in result.literals]
+    assert ["5", "3", "2", "3"] == [token.text for token in result.literals if token.literal_type == "number"]
+
+
+def test_strategy_detectors_share_one_scan(monkeypatch):
+    strategy = CStrategy()
+    calls = []
+    original_scan = C_SCANNER.scan
+    monkeypatch.setattr(C_SCANNER, "scan", lambda source: calls.append(source) or original_scan(source))
+
+    lines = C_SOURCE.splitlines()
+    violations = strategy.analyze_source(Path("sample.c"), lines)
+
+    assert len(calls) == 1
+    assert any(v.type == "connascence_of_position" and v.context["parameter_count"] == 7 for v in violations)
+
+
+def test_god_function_detected_from_scan():
+    lines = ["function huge(a) {"] + ["  step();"] * 60 + ["}"]
+    violations = JavaScriptStrategy().detect_god_functions(Path("big.js"), lines)
+    assert len(violations) == 1
+    assert violations[0].context["function_length"] == 62
+
+
+def test_formal_grammar_engine_is_shared():
+    assert get_formal_grammar_engine() is get_formal_grammar_engine()
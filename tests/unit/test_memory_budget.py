@@ -0,0 +1,168 @@
+"""
+Unit tests for memory-budgeted admission control.
+
+Tests cover:
+- Work waits while live RSS plus in-flight reservations exceed the budget
+- Something is always admitted when nothing is in flight
+- Memory that in-flight work already allocated is not counted twice
+- A non-positive limit is rejected
+- Caches are shed cheapest first, and only until the work fits
+- Each instance's cache is registered on its own and dropped once it is collected
+- Parallelism narrows as pressure rises
+- FileContentCache sheds file entries and parsed trees separately
+- The parallel analyzer never runs more chunks than the budget admits
+"""
+
+import gc
+import threading
+
+import pytest
+
+from analyzer.cli_entry import SharedCLIAnalyzer
+from analyzer.optimization.file_cache import FileContentCache
+from analyzer.optimization.memory_budget import MemoryBudget, cache_name, estimate_file_cost_mb
+from analyzer.performance.parallel_analyzer import ParallelAnalysisConfig
+
+
+class FakeRss:
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+
+class FakeCache:
+    """Frees ``mb_per_entry`` of fake RSS per shed entry."""
+
+    def __init__(self, rss, entries, mb_per_entry):
+        self.rss = rss
+        self.entries = entries
+        self.mb_per_entry = mb_per_entry
+        self.calls = []
+
+    def shed(self, fraction):
+        self.calls.append(fraction)
+        count = round(self.entries * fraction)
+        self.entries -= count
+        self.rss.value -= count * self.mb_per_entry
+        return count
+
+
+def test_acquire_waits_for_release_and_never_stalls_when_idle():
+    budget = MemoryBudget(limit_mb=100, rss_sampler=FakeRss(50), sample_interval=0)
+
+    assert budget.try_acquire(30)
+    assert not budget.try_acquire(30)
+
+    admitted = threading.Event()
+    waiter = threading.Thread(target=lambda: budget.acquire(30) and admitted.set())
+    waiter.start()
+    assert not admitted.wait(0.2)
+    budget.release(30)
+    assert admitted.wait(2)
+    waiter.join()
+
+    budget.release(30)
+    # Larger than the whole budget, but nothing else is running
+    assert budget.acquire(500, timeout=0.1)
+    assert budget.in_flight == 1
+    assert budget.stats.waits == 1
+
+
+def test_in_flight_allocations_are_not_counted_twice():
+    rss = FakeRss(50)
+    budget = MemoryBudget(limit_mb=100, rss_sampler=rss, sample_interval=0)
+
+    assert budget.try_acquire(30)
+    # The admitted work has allocated its estimate; 50 + 30 + 30 would be over
+    rss.value = 80
+    assert budget.projected_usage_mb() == 80
+    assert not budget.try_acquire(30)
+    assert budget.try_acquire(20)
+
+    # Growth past the estimates is still charged in full
+    rss.value = 110
+    assert budget.projected_usage_mb() == 110
+    assert budget.pressure() == 1.1
+
+
+def test_non_positive_limit_is_rejected():
+    with pytest.raises(ValueError):
+        MemoryBudget(limit_mb=0, rss_sampler=FakeRss(10))
+
+
+def test_caches_are_shed_in_priority_order_until_work_fits():
+    rss = FakeRss(95)
+    budget = MemoryBudget(limit_mb=100, rss_sampler=rss, sample_interval=0)
+    results = FakeCache(rss, entries=10, mb_per_entry=1)
+    contents = FakeCache(rss, entries=20, mb_per_entry=1)
+    budget.register_cache("results", results.shed, priority=30)
+    budget.register_cache("contents", contents.shed, priority=10)
+
+    assert budget.try_acquire(1)
+    assert budget.try_acquire(10)
+
+    assert contents.calls == [0.5]
+    assert results.calls == []
+    assert rss.value == 85
+    assert budget.stats.shed_by_cache == {"contents": 10}
+
+
+def test_each_instance_registers_its_own_cache_and_is_not_kept_alive():
+    budget = MemoryBudget(limit_mb=100, rss_sampler=FakeRss(10), sample_interval=0)
+    first = SharedCLIAnalyzer(memory_budget=budget)
+    second = SharedCLIAnalyzer(memory_budget=budget)
+
+    assert budget.registered_caches() == [cache_name("cli_results", first), cache_name("cli_results", second)]
+
+    del first
+    gc.collect()
+    assert budget.registered_caches() == [cache_name("cli_results", second)]
+
+
+def test_parallelism_narrows_with_pressure():
+    rss = FakeRss(10)
+    budget = MemoryBudget(limit_mb=100, rss_sampler=rss, sample_interval=0)
+
+    assert budget.parallelism(8) == 8
+    rss.value = 80
+    assert budget.parallelism(8) == 4
+    rss.value = 95
+    assert budget.parallelism(8) == 1
+    assert estimate_file_cost_mb(1024 * 1024) > estimate_file_cost_mb(1024)
+    assert estimate_file_cost_mb(1024, node_count=10_000) > estimate_file_cost_mb(1024, node_count=10)
+
+
+def test_file_cache_sheds_entries_and_trees_separately(tmp_path):
+    cache = FileContentCache()
+    for index in range(4):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text(f"VALUE_{index} = {index}\n", encoding="utf-8")
+        assert cache.get_ast_tree(path) is not None
+
+    assert cache.shrink_ast_cache(0.5) == 2
+    assert cache.get_memory_usage()["ast_cache_count"] == 2
+    assert [entry.ast_tree is None for entry in cache._cache.values()] == [True, True, False, False]
+
+    assert cache.shrink(0.5) == 2
+    assert list(cache._cache) == [str(tmp_path / "module_2.py"), str(tmp_path / "module_3.py")]
+    assert cache.shrink(1.0) == 2
+    assert cache.get_memory_usage()["file_cache_bytes"] == 0
+
+
+def test_parallel_chunks_stay_within_the_budget(tracking_parallel_analyzer):
+    config = ParallelAnalysisConfig(max_workers=4, chunk_size=5, use_processes=False)
+    analyzer = tracking_parallel_analyzer(config)
+    chunks = [[f"missing_{chunk}_{index}.py" for index in range(5)] for chunk in range(10)]
+    # Two chunks of unreadable files (base cost only) fit at once
+    chunk_cost = 5 * estimate_file_cost_mb(0)
+    analyzer.memory_budget = MemoryBudget(limit_mb=2.5 * chunk_cost, rss_sampler=FakeRss(0), sample_interval=0)
+
+    results, times = analyzer._execute_parallel_chunks(chunks, "standard", {})
+
+    assert len(results) == len(times) == 10
+    assert sum(result["files_processed"] for result in results) == 50
+    assert max(analyzer.concurrency) == 2
+    assert analyzer.memory_budget.in_flight == 0
+    assert analyzer.memory_budget.reserved_mb == 0
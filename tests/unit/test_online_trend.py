@@ -0,0 +1,110 @@
+"""
+Unit tests for the online trend model behind the ML forecasters.
+
+Tests cover:
+- Incremental updates match a batch least-squares fit
+- Bulk loading merges into existing state with the same result
+- Ridge on standardized time is reproduced
+- Degenerate histories (one timestamp) forecast the mean
+- Forecasters replaying a history one by one or in bulk agree
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from analyzer.ml_modules.compliance_forecaster import ComplianceForecaster, ComplianceSnapshot
+from analyzer.ml_modules.online_trend import OnlineTrend
+from analyzer.ml_modules.quality_predictor import QualityPredictor, QualitySnapshot
+
+START = datetime(2024, 1, 1).timestamp()
+
+
+def observations(count):
+    xs = [START + index * 3600.0 + (index * 37 % 11) for index in range(count)]
+    rows = [[0.5 + index * 0.001 + (index * 13 % 7) * 0.01, 40.0 - index * 0.2] for index in range(count)]
+    return xs, rows
+
+
+def batch_fit(xs, ys, alpha=0.0):
+    """Reference fit: closed-form least squares (ridge on standardized x when alpha > 0)."""
+    count = len(xs)
+    mean_x = sum(xs) / count
+    mean_y = sum(ys) / count
+    m2 = sum((x - mean_x) ** 2 for x in xs)
+    comoment = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = comoment / (m2 * (1 + alpha / count))
+    return lambda x: mean_y + slope * (x - mean_x)
+
+
+def test_incremental_updates_match_batch_fit():
+    xs, rows = observations(500)
+    trend = OnlineTrend(["nasa", "violations"])
+    for x, ys in zip(xs, rows):
+        trend.update(x, ys)
+
+    future = xs[-1] + 30 * 86400
+    expected = [batch_fit(xs, [row[index] for row in rows])(future) for index in range(2)]
+    assert trend.predict(future) == pytest.approx(expected, rel=1e-9)
+
+
+def test_bulk_load_merges_with_running_state():
+    xs, rows = observations(300)
+    incremental = OnlineTrend(["nasa", "violations"], ridge_alpha=1.0)
+    for x, ys in zip(xs, rows):
+        incremental.update(x, ys)
+
+    merged = OnlineTrend(["nasa", "violations"], ridge_alpha=1.0)
+    for x, ys in zip(xs[:10], rows[:10]):
+        merged.update(x, ys)
+    merged.extend(xs[10:], rows[10:])
+
+    future = xs[-1] + 7 * 86400
+    expected = batch_fit(xs, [row[1] for row in rows], alpha=1.0)(future)
+    assert len(merged) == 300
+    assert merged.predict(future) == pytest.approx(incremental.predict(future), rel=1e-9)
+    assert merged.predict(future)[1] == pytest.approx(expected, rel=1e-9)
+
+
+def test_single_timestamp_forecasts_the_mean():
+    trend = OnlineTrend(["value"])
+    trend.extend([START, START, START], [[1.0], [2.0], [6.0]])
+
+    assert trend.predict(START + 86400) == pytest.approx([3.0])
+
+
+def test_forecasters_agree_between_replay_and_bulk_load():
+    base = datetime(2024, 1, 1)
+    compliance = [
+        ComplianceSnapshot(
+            (base + timedelta(days=day)).isoformat(), 0.7 + day * 0.004, 0.8, 0.75 + day * 0.002, 0.9, 0.6, 0, 0
+        )
+        for day in range(40)
+    ]
+    quality = [
+        QualitySnapshot((base + timedelta(days=day)).isoformat(), 0.7 + day * 0.004, 3.0, 60 - day, 1, 0.8, 4.0)
+        for day in range(40)
+    ]
+
+    replayed = ComplianceForecaster()
+    for snapshot in compliance:
+        replayed.add_snapshot(snapshot)
+    bulk = ComplianceForecaster()
+    bulk.add_snapshots(compliance)
+    target = (base + timedelta(days=50)).isoformat()
+
+    assert replayed.is_fitted and bulk.is_fitted
+    assert replayed.forecast(target).forecasted_overall_compliance == pytest.approx(0.7 + 50 * 0.004)
+    assert bulk.forecast(target).forecasted_category_compliance == pytest.approx(
+        replayed.forecast(target).forecasted_category_compliance
+    )
+
+    predictor = QualityPredictor()
+    predictor.add_snapshots(quality[:4])
+    assert not predictor.is_fitted
+    predictor.add_snapshots(quality[4:])
+    prediction = predictor.predict_future(7)
+    reference = batch_fit(
+        [datetime.fromisoformat(s.timestamp).timestamp() for s in quality], [s.total_violations for s in quality], 1.0
+    )
+    assert prediction.predicted_violations == int(reference((base + timedelta(days=46)).timestamp()))
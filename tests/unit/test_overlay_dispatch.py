@@ -0,0 +1,160 @@
+"""
+Unit tests for compiled grammar overlays.
+
+Tests cover:
+- Validation walks the whole tree once and dispatches on node type
+- Inherited rules, bans, limits and pattern rules are compiled together
+- Compiled overlays are reused until an overlay file changes
+- The overlay directory is checked at most once per interval, or on reload()
+- Unknown overlays still report an error
+"""
+
+import json
+import os
+
+from grammar.backends.tree_sitter_backend import LanguageSupport
+from grammar.overlay_manager import GrammarOverlay, OverlayManager, OverlayRule
+
+
+class FakeNode:
+    def __init__(self, node_type, line=0, text=b"", children=()):
+        self.type = node_type
+        self.start_point = (line, 4)
+        self.text = text
+        self.children = list(children)
+
+
+def overlay_file(directory, overlay_id, target, severity="high"):
+    data = {
+        "id": overlay_id,
+        "name": overlay_id,
+        "description": "test overlay",
+        "language": "c",
+        "inherits": ["nasa_c_safety"],
+        "rules": [
+            {
+                "id": f"{overlay_id}_ban",
+                "name": "ban",
+                "description": "ban",
+                "severity": severity,
+                "rule_type": "ban",
+                "target": target,
+            }
+        ],
+    }
+    path = directory / f"{overlay_id}.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def test_validation_walks_descendants_once(tmp_path):
+    manager = OverlayManager(tmp_path)
+    tree = FakeNode(
+        "translation_unit",
+        children=[
+            FakeNode(
+                "function_definition", 1, children=[FakeNode("goto_statement", 3), FakeNode("call_expression", 4)]
+            ),
+            FakeNode("goto_statement", 9),
+            FakeNode("function_pointer", 12),
+        ],
+    )
+
+    violations = manager.validate_code_against_overlay([tree], "nasa_c_safety")
+
+    assert [(v["rule_id"], v["line"]) for v in violations] == [
+        ("nasa_rule_1_goto", 4),
+        ("nasa_rule_1_goto", 10),
+        ("nasa_rule_9_function_pointers", 13),
+    ]
+    assert violations[0]["message"] == "Banned construct: goto_statement"
+    assert violations[0]["column"] == 4
+    assert violations[0]["type"] == "overlay_violation"
+
+
+def test_compiled_overlay_resolves_inheritance_and_patterns(tmp_path):
+    manager = OverlayManager(tmp_path)
+    manager.create_overlay(
+        GrammarOverlay(
+            id="strict_c",
+            name="Strict C",
+            description="strict",
+            language=LanguageSupport.C,
+            inherits=["nasa_c_safety", "missing_parent"],
+            rules=[
+                OverlayRule(
+                    id="no_alloca",
+                    name="No alloca",
+                    description="no alloca",
+                    severity="critical",
+                    rule_type="pattern",
+                    target="alloca",
+                    parameters={"regex": r"\balloca\s*\(", "node_types": ["call_expression"]},
+                ),
+                OverlayRule("stack_limit", "Stack", "stack", "high", "limit", "stack_depth", {"max_value": 4}),
+            ],
+        )
+    )
+
+    compiled = manager.compile_overlay("strict_c")
+    assert manager.compile_overlay("strict_c") is compiled
+    assert manager.get_rules_for_overlay("strict_c") is compiled.rules
+    assert len(compiled.rules) == 7
+    assert manager.get_banned_constructs("strict_c") == manager.get_banned_constructs("nasa_c_safety")
+    assert manager.get_complexity_limits("strict_c") == {
+        "function_lines": 60,
+        "pointer_indirection": 1,
+        "stack_depth": 4,
+    }
+
+    calls = [FakeNode("call_expression", 2, b"alloca(64)"), FakeNode("call_expression", 3, b"malloc(64)")]
+    violations = manager.validate_code_against_overlay(calls, "strict_c")
+    assert [(v["rule_id"], v["line"], v["message"]) for v in violations] == [
+        ("no_alloca", 3, "Pattern violation: alloca")
+    ]
+
+
+def test_overlay_file_changes_invalidate_compiled_overlays(tmp_path):
+    path = overlay_file(tmp_path, "project_c", "switch_statement")
+    manager = OverlayManager(tmp_path, reload_check_interval=0)
+    tree = FakeNode("translation_unit", children=[FakeNode("switch_statement"), FakeNode("while_statement")])
+
+    first = manager.compile_overlay("project_c")
+    assert [v["rule_id"] for v in manager.validate_code_against_overlay([tree], "project_c")] == ["project_c_ban"]
+
+    overlay_file(tmp_path, "project_c", "while_statement", severity="critical")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    violations = manager.validate_code_against_overlay([tree], "project_c")
+    assert manager.compile_overlay("project_c") is not first
+    assert [(v["rule_id"], v["severity"]) for v in violations] == [("project_c_ban", "critical")]
+
+    path.unlink()
+    assert manager.validate_code_against_overlay([tree], "project_c") == [{"error": "Overlay project_c not found"}]
+    assert manager.get_overlay("project_c") is None
+    assert manager.get_rules_for_overlay("nasa_c_safety")
+
+
+def test_overlay_directory_checks_are_throttled(tmp_path):
+    path = overlay_file(tmp_path, "project_c", "switch_statement")
+    manager = OverlayManager(tmp_path, reload_check_interval=3600)
+    tree = FakeNode("translation_unit", children=[FakeNode("switch_statement"), FakeNode("while_statement")])
+    checks = []
+    signature = manager._overlay_files_signature
+    manager._overlay_files_signature = lambda: checks.append(1) or signature()
+
+    for _ in range(100):
+        manager.compile_overlay("project_c")
+    assert checks == []
+
+    overlay_file(tmp_path, "project_c", "while_statement")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert manager.get_banned_constructs("project_c") >= {"switch_statement"}
+
+    assert manager.reload() is True
+    assert manager.reload() is False
+    assert "while_statement" in manager.get_banned_constructs("project_c")
+    assert "switch_statement" not in manager.get_banned_constructs("project_c")
+    assert len(checks) == 2
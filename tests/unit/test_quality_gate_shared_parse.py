@@ -0,0 +1,129 @@
+"""
+Unit tests for shared-parse execution in UnifiedQualityGate.
+
+Tests cover:
+- Each file is read and parsed once for all analyzer families
+- Excluded directories are pruned during the single discovery pass
+- Process-pool and in-process runs merge to identical, ordered results
+- Clarity violations are mapped onto the unified Violation model
+- Clarity detectors share one cached walk of each tree
+- NASAAnalyzer reuses a caller-supplied tree for every rule check
+"""
+
+import ast
+
+import pytest
+
+from analyzer.clarity_linter.base import iter_nodes
+from analyzer.nasa_engine.nasa_analyzer import NASAAnalyzer
+from analyzer.quality_gates import unified_quality_gate
+from analyzer.quality_gates.unified_quality_gate import UnifiedQualityGate, discover_python_files
+
+SOURCES = {
+    "pkg/a.py": "def a(x):\n    return helper(x)\n\n\ndef loop(items):\n    for i in items:\n        print(i)\n",
+    "pkg/b.py": "class Box:\n    def get(self, key):\n        return self.fetch(key)\n\n    def fetch(self, key):\n        return key * 42\n",
+    "c.py": "# TODO\nvalue = compute().strip().lower().split()\nrun()\n",
+    "d.py": "def connect(host, port, user, password, timeout):\n    return host\n",
+    "broken.py": "def broken(:\n",
+}
+
+
+@pytest.fixture
+def project(tmp_path):
+    for relative, source in SOURCES.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+    # Pruned during discovery, never read
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "vendored.py").write_text("x = 1\n", encoding="utf-8")
+    return tmp_path
+
+
+def _analyze(project, **execution):
+    gate = UnifiedQualityGate()
+    gate.config["execution"] = execution
+    return gate.analyze_project(str(project))
+
+
+def test_discovery_is_sorted_and_pruned(project):
+    files = discover_python_files(project)
+
+    assert files == sorted(files)
+    assert {f.relative_to(project).as_posix() for f in files} == set(SOURCES)
+
+
+def test_each_file_is_parsed_once(project, monkeypatch):
+    project_sources = set(SOURCES.values())
+    parsed = []
+    real_parse = ast.parse
+
+    def counting_parse(source, *args, **kwargs):
+        if source in project_sources:
+            parsed.append(source)
+        return real_parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    result = _analyze(project, workers=1)
+
+    assert sorted(parsed) == sorted(project_sources)
+    assert result.metadata["files_analyzed"] == len(SOURCES) - 1
+    assert {v.source_analyzer for v in result.violations} == {
+        "clarity_linter",
+        "connascence_analyzer",
+        "nasa_standards",
+    }
+
+
+def test_pool_and_serial_merge_identically(project):
+    serial = _analyze(project, workers=1)
+    pooled = _analyze(project, workers=2, parallel_threshold=1)
+
+    assert [v.to_dict() for v in pooled.violations] == [v.to_dict() for v in serial.violations]
+
+    families = [v.source_analyzer for v in serial.violations]
+    assert families == sorted(families, key=unified_quality_gate.ANALYZER_FAMILIES.index)
+    clarity = [(v.file, v.line) for v in serial.violations if v.source_analyzer == "clarity_linter"]
+    assert clarity == sorted(clarity)
+
+
+def test_clarity_violations_are_mapped(project):
+    result = _analyze(project, workers=1)
+    naming = [v for v in result.violations if v.rule_id == "CLARITY_POOR_NAMING" and v.line == 1]
+
+    assert naming and naming[0].message == "Single-letter function name 'a'"
+    assert naming[0].category == "clarity"
+    assert naming[0].fix_suggestion
+
+
+def test_disabled_family_is_not_run(project):
+    gate = UnifiedQualityGate()
+    gate.config["analyzers"]["connascence_analyzer"]["enabled"] = False
+    gate.config["analyzers"]["nasa_standards"]["enabled"] = False
+
+    result = gate.analyze_project(str(project))
+
+    assert {v.source_analyzer for v in result.violations} == {"clarity_linter"}
+
+
+def test_iter_nodes_walks_tree_once(monkeypatch):
+    tree = ast.parse(SOURCES["pkg/b.py"])
+    walks = []
+    real_walk = ast.walk
+    monkeypatch.setattr(ast, "walk", lambda node: walks.append(node) or real_walk(node))
+
+    functions = iter_nodes(tree, (ast.FunctionDef, ast.AsyncFunctionDef))
+    classes = iter_nodes(tree, ast.ClassDef)
+
+    assert [f.name for f in functions] == ["get", "fetch"]
+    assert [c.name for c in classes] == ["Box"]
+    assert iter_nodes(tree, ast.ClassDef) is classes
+    assert walks == [tree]
+
+
+def test_nasa_analyzer_reuses_supplied_tree():
+    source = "def run():\n    compute()\n"
+    # The path does not exist: every rule, including Rule 7, must work from the tree
+    violations = NASAAnalyzer().analyze_file("missing/module.py", source, tree=ast.parse(source))
+
+    assert any(v.type == "nasa_rule_7_violation" for v in violations)
@@ -0,0 +1,249 @@
+"""
+Unit tests for the dashboard scan job manager.
+
+Tests cover:
+- Progress and violation batches are emitted while the scan runs
+- Summary counters are maintained per file
+- Completion events carry page counts instead of result lists
+- Identical requests join the running job; another preset replaces it
+- Running jobs can be cancelled between files
+- The streamed pass is the final result: the preset is validated up front,
+  duplication blocks are collected per file and clustered with progress,
+  and recommendations come from the streamed violations
+- Cancellation is honored during duplication clustering
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from interfaces.web.scan_jobs import ScanJobManager, ScanStatus
+
+
+class FakeAnalyzer:
+    def __init__(self, gate=None):
+        self.gate = gate
+        self.analyzed = []
+
+    def analyze_file(self, file_path):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.analyzed.append(file_path.name)
+        index = int(file_path.stem.replace("mod", ""))
+        violations = [
+            {
+                "type": "CoM" if i % 2 else "CoP",
+                "severity": ("critical", "high", "medium", "low")[i % 4],
+                "file_path": str(file_path),
+                "line_number": i + 1,
+                "weight": 1,
+            }
+            for i in range(index)
+        ]
+        return {"connascence_violations": violations, "nasa_violations": [], "nasa_compliance_score": 0.5}
+
+
+class FakeMECE:
+    def __init__(self, pause_at=None):
+        self.pause_at = pause_at
+        self.paused = threading.Event()
+        self.resume = threading.Event()
+        self.clustered = None
+
+    def extract_file_blocks(self, file_path):
+        return [f"{file_path.name}:block"]
+
+    def find_duplications(self, blocks, should_stop=None, on_progress=None):
+        self.clustered = 0
+        for index in range(len(blocks)):
+            if index == self.pause_at:
+                self.paused.set()
+                self.resume.wait(5)
+            if should_stop():
+                break
+            self.clustered += 1
+            on_progress(index + 1, len(blocks))
+        return [{"id": "cluster-1", "block_count": len(blocks)}], 0.7
+
+
+class StreamingAnalyzer(FakeAnalyzer):
+    def __init__(self, mece):
+        super().__init__()
+        self.mece_analyzer = mece
+        self.presets = []
+        self.recommended_from = None
+        self.recommendation_generator = SimpleNamespace(generate_recommendations=self._recommend)
+
+    def _initialize_analysis_context(self, project_path, policy_preset):
+        self.presets.append(policy_preset)
+        error = SimpleNamespace(to_dict=lambda: {"message": f"Invalid policy preset: {policy_preset}"})
+        return ([error] if policy_preset == "bogus" else []), []
+
+    def _recommend(self, violations):
+        self.recommended_from = {kind: len(items) for kind, items in violations.items()}
+        return {"priority_fixes": ["Split mod5"], "improvement_actions": ["Add tests"], "strategic_suggestions": []}
+
+    def analyze_project(self, *args, **kwargs):
+        raise AssertionError("the streamed pass must not be repeated")
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+        self.done = threading.Event()
+
+    def __call__(self, name, payload):
+        self.events.append((name, payload))
+        if name in ("scan_complete", "scan_cancelled", "scan_error"):
+            self.done.set()
+
+    def named(self, name):
+        return [payload for event, payload in self.events if event == name]
+
+
+@pytest.fixture
+def project(tmp_path):
+    for index in range(6):
+        (tmp_path / f"mod{index}.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "mod9.py").write_text("x = 1\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_scan_streams_progress_and_batches(project):
+    recorder = Recorder()
+    completed = []
+    manager = ScanJobManager(
+        FakeAnalyzer(), recorder, on_complete=completed.append, batch_size=4, page_size=4, progress_interval=0
+    )
+
+    job, created = manager.submit(project, "strict")
+    assert recorder.done.wait(5)
+
+    assert created and job.status is ScanStatus.COMPLETED
+    assert [event for event, _ in recorder.events][0] == "scan_started"
+    progress = recorder.named("scan_progress")
+    assert [p["files_done"] for p in progress] == [1, 2, 3, 4, 5, 6]
+    batches = recorder.named("scan_violations")
+    assert sum(len(b["violations"]) for b in batches) == 15
+    assert all(len(b["violations"]) >= 4 for b in batches[:-1])
+
+    (complete,) = recorder.named("scan_complete")
+    assert "violations" not in complete
+    assert complete["summary"]["total_violations"] == 15
+    assert complete["summary"]["violations_by_type"] == {"CoP": 9, "CoM": 6}
+    assert complete["summary"]["critical_count"] == 6
+    assert complete["pages"]["violations"] == 4
+    assert completed == [job]
+
+    pages = [job.page("violations", page, 4)["items"] for page in range(4)]
+    assert [v for page in pages for v in page] == job.violations
+
+
+def test_identical_request_joins_running_job(project):
+    gate = threading.Event()
+    recorder = Recorder()
+    analyzer = FakeAnalyzer(gate)
+    manager = ScanJobManager(analyzer, recorder)
+
+    first, created = manager.submit(project, "strict")
+    second, joined = manager.submit(project, "strict")
+    gate.set()
+    assert recorder.done.wait(5)
+
+    assert created and not joined and second is first
+    assert len(recorder.named("scan_started")) == 1
+    assert len(analyzer.analyzed) == 6
+
+
+def test_new_preset_cancels_running_job(project):
+    gate = threading.Event()
+    recorder = Recorder()
+    manager = ScanJobManager(FakeAnalyzer(gate), recorder)
+
+    first, _ = manager.submit(project, "strict")
+    second, created = manager.submit(project, "lenient")
+    gate.set()
+    second.thread.join(5)
+
+    assert created and second is not first
+    assert first.status is ScanStatus.CANCELLED
+    assert second.status is ScanStatus.COMPLETED
+    assert [p["job_id"] for p in recorder.named("scan_complete")] == [second.job_id]
+
+
+def test_cancel_stops_between_files(project):
+    gate = threading.Event()
+    recorder = Recorder()
+    analyzer = FakeAnalyzer(gate)
+    manager = ScanJobManager(analyzer, recorder)
+
+    job, _ = manager.submit(project, "strict")
+    assert manager.cancel(job.job_id)
+    gate.set()
+    assert recorder.done.wait(5)
+
+    assert job.status is ScanStatus.CANCELLED
+    assert len(analyzer.analyzed) <= 1
+    assert recorder.named("scan_complete") == []
+    assert not manager.cancel(job.job_id)
+
+
+def test_streamed_pass_is_the_final_result(project):
+    recorder = Recorder()
+    completed = []
+    analyzer = StreamingAnalyzer(FakeMECE())
+    manager = ScanJobManager(analyzer, recorder, on_complete=completed.append, progress_interval=0)
+
+    job, _ = manager.submit(project, "strict-core")
+    assert recorder.done.wait(5)
+
+    assert job.status is ScanStatus.COMPLETED
+    assert analyzer.presets == ["strict-core"]
+    assert len(analyzer.analyzed) == 6
+    assert analyzer.recommended_from == {"connascence": 15, "duplication": 1, "nasa": 0}
+
+    dup_progress = [p for p in recorder.named("scan_progress") if p["phase"] == "duplication"]
+    assert [p["blocks_done"] for p in dup_progress] == [1, 2, 3, 4, 5, 6]
+    (complete,) = recorder.named("scan_complete")
+    summary = complete["summary"]
+    assert summary["total_violations"] == 15
+    assert (summary["nasa_compliance_score"], summary["duplication_score"]) == (0.5, 0.7)
+    assert summary["overall_quality_score"] == pytest.approx(0.6)
+    assert complete["recommendations"] == {"priority_fixes": ["Split mod5"], "improvement_actions": ["Add tests"]}
+
+    stored = job.to_scan_results()
+    assert stored["policy_preset"] == "strict-core"
+    assert stored["duplication_clusters"] == [{"id": "cluster-1", "block_count": 6}]
+    assert stored["errors"] == []
+    assert job.code_blocks == []
+
+
+def test_invalid_preset_is_reported_with_the_streamed_result(project):
+    recorder = Recorder()
+    manager = ScanJobManager(StreamingAnalyzer(FakeMECE()), recorder)
+
+    job, _ = manager.submit(project, "bogus")
+    assert recorder.done.wait(5)
+
+    assert job.status is ScanStatus.COMPLETED
+    assert job.errors == [{"message": "Invalid policy preset: bogus"}]
+
+
+def test_cancel_during_duplication_phase(project):
+    recorder = Recorder()
+    mece = FakeMECE(pause_at=2)
+    analyzer = StreamingAnalyzer(mece)
+    manager = ScanJobManager(analyzer, recorder, progress_interval=0)
+
+    job, _ = manager.submit(project, "strict")
+    assert mece.paused.wait(5)
+    assert manager.cancel(job.job_id)
+    mece.resume.set()
+    assert recorder.done.wait(5)
+
+    assert job.status is ScanStatus.CANCELLED
+    assert mece.clustered == 2
+    assert analyzer.recommended_from is None
+    assert recorder.named("scan_complete") == []
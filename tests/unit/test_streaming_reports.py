@@ -0,0 +1,232 @@
+"""
+Unit tests for the streaming JSON, SARIF and NDJSON report writers.
+
+Tests cover:
+- JSONStreamWriter output is byte-identical to json.dumps
+- JSONReporter/SARIFReporter streaming output matches the in-memory layout
+- Report streams accept violations as they arrive
+- SARIF rule indexes are precomputed and tolerate unknown types
+- NDJSON records and coordinator streaming to files
+- Peak memory does not grow with the number of violations
+"""
+
+from datetime import datetime
+import gc
+import io
+import json
+from types import SimpleNamespace
+import tracemalloc
+from unittest import mock
+import uuid
+
+import pytest
+
+from analyzer.reporting.coordinator import UnifiedReportingCoordinator
+from analyzer.reporting.json import JSONReporter
+from analyzer.reporting.sarif import SARIF_SCHEMA_URI, SARIFReporter
+from analyzer.reporting.streaming import JSONStreamWriter
+from analyzer.thresholds import ConnascenceType
+
+RULE_TYPES = [
+    ConnascenceType.NAME,
+    ConnascenceType.MEANING,
+    ConnascenceType.POSITION,
+    ConnascenceType.TIMING,
+    ConnascenceType.IDENTITY,
+]
+
+
+def make_violation(i, connascence_type=None):
+    return SimpleNamespace(
+        id=f"v{i}",
+        type=connascence_type or RULE_TYPES[i % len(RULE_TYPES)],
+        severity=SimpleNamespace(value=["low", "medium", "high", "critical"][i % 4]),
+        weight=1.5 + i % 3,
+        locality="cross_module" if i % 5 == 0 else "local",
+        file_path=f"pkg/mod{i % 7}.py",
+        line_number=i + 1,
+        column=i % 4,
+        end_line=None if i % 2 else i + 2,
+        end_column=None if i % 3 else 9,
+        description=f"issue ü {i}",
+        recommendation="extract constant",
+        function_name="f" if i % 2 else None,
+        class_name=None,
+        code_snippet="x = 1" if i % 4 == 0 else None,
+        context={"similar_function": "g"} if i % 10 == 0 else {},
+    )
+
+
+def make_result(count=30, violations=None):
+    return SimpleNamespace(
+        violations=violations if violations is not None else [make_violation(i) for i in range(count)],
+        timestamp="2024-01-01T00:00:00",
+        project_root="/project",
+        total_files_analyzed=7,
+        analysis_duration_ms=12,
+        policy_preset="strict",
+        file_stats={"pkg/mod1.py": {"lines": 3}},
+        budget_status=None,
+        baseline_comparison=None,
+        summary_metrics={"total_violations": count},
+    )
+
+
+@pytest.fixture
+def frozen_ids():
+    """Make uuid4/datetime deterministic so two SARIF renders can be compared."""
+
+    def patch():
+        ids = iter(uuid.UUID(int=i) for i in range(1000))
+        uuids = mock.patch("uuid.uuid4", lambda: next(ids))
+        clock = mock.patch("analyzer.reporting.sarif.datetime", **{"now.return_value": datetime(2024, 1, 1)})
+        return uuids, clock
+
+    return patch
+
+
+@pytest.mark.parametrize("indent", [2, None])
+@pytest.mark.parametrize("sort_keys", [True, False])
+def test_stream_writer_matches_json_dumps(indent, sort_keys):
+    document = {"b": [{"y": [1, 2], "x": "é\nq"}, []], "a": {}, "c": [], "d": {"e": [[{}]]}}
+    buffer = io.StringIO()
+    writer = JSONStreamWriter(buffer, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+
+    writer.begin_object()
+    for key in sorted(document) if sort_keys else document:
+        if key == "b":
+            writer.begin_array("b")
+            writer.items(document["b"])
+            writer.end_array()
+        else:
+            writer.field(key, document[key])
+    writer.close()
+
+    assert buffer.getvalue() == json.dumps(document, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+
+
+def test_json_report_matches_in_memory_layout():
+    reporter = JSONReporter()
+    result = make_result()
+    expected = {
+        "schema_version": reporter.schema_version,
+        "metadata": reporter._create_metadata(result),
+        "summary": reporter._create_summary(result),
+        "violations": [reporter._serialize_violation(v) for v in result.violations],
+        "file_stats": result.file_stats,
+        "policy_compliance": reporter._create_policy_compliance(result),
+    }
+
+    assert reporter.generate(result) == json.dumps(expected, indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def test_json_report_stream_accepts_arriving_violations():
+    reporter = JSONReporter()
+    result = make_result()
+    buffer = io.StringIO()
+
+    with reporter.open_stream(buffer, make_result(violations=[])) as stream:
+        for violation in result.violations:
+            stream.add(violation)
+
+    assert json.loads(buffer.getvalue()) == json.loads(reporter.generate(result))
+
+
+def test_sarif_report_matches_in_memory_layout(frozen_ids):
+    reporter = SARIFReporter()
+    result = make_result()
+
+    ids, clock = frozen_ids()
+    with ids, clock:
+        streamed = reporter.generate(result)
+    ids, clock = frozen_ids()
+    with ids, clock:
+        expected = {"$schema": SARIF_SCHEMA_URI, "version": "2.1.0", "runs": [reporter._create_run(result)]}
+
+    assert streamed == json.dumps(expected, indent=2, ensure_ascii=False)
+
+
+def test_sarif_rule_indexes_are_precomputed():
+    reporter = SARIFReporter()
+    rules = reporter.rules
+    assert reporter.rules is rules
+
+    payload = json.loads(reporter.generate(make_result()))
+    run = payload["runs"][0]
+    for result in run["results"]:
+        assert run["tool"]["driver"]["rules"][result["ruleIndex"]]["id"] == result["ruleId"]
+
+    unknown = reporter._create_result(make_violation(1, ConnascenceType.STATE))
+    assert "ruleIndex" not in unknown
+
+
+def test_ndjson_records():
+    buffer = io.StringIO()
+    written = JSONReporter().write_ndjson(make_result(count=5), buffer)
+
+    records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert written == 5
+    assert [r["record_type"] for r in records] == ["metadata"] + ["violation"] * 5 + ["summary"]
+    assert records[-1]["total_violations"] == 5
+
+
+def test_coordinator_streams_to_files(tmp_path):
+    unified = SimpleNamespace(
+        connascence_violations=[
+            {"id": f"v{i}", "type": "CoM", "severity": "high", "description": "magic", "file_path": "a.py"}
+            for i in range(3)
+        ],
+        project_path="/project",
+        timestamp="2024-01-01T00:00:00",
+        files_analyzed=1,
+        analysis_duration_ms=3,
+        policy_preset="standard",
+        total_violations=3,
+        critical_count=0,
+        high_count=3,
+        medium_count=0,
+        low_count=0,
+    )
+    coordinator = UnifiedReportingCoordinator()
+
+    generated = coordinator.generate_multi_format_report(unified, ["json", "sarif", "ndjson"], tmp_path)
+
+    assert json.loads((tmp_path / "connascence_report.json").read_text())["summary"]["total_violations"] == 3
+    assert len(json.loads((tmp_path / "connascence_report.sarif").read_text())["runs"][0]["results"]) == 3
+    assert len((tmp_path / "connascence_report.ndjson").read_text().splitlines()) == 5
+    assert set(generated) == {"json", "sarif", "ndjson"}
+
+
+class _NullWriter(io.TextIOBase):
+    """Discards output so only the writer's own allocations are measured."""
+
+    def write(self, data):
+        return len(data)
+
+
+def _peak_bytes(write, result):
+    # Park objects left by earlier tests in the permanent generation; a large
+    # long-lived heap otherwise defers the full collections that reclaim the
+    # encoder's per-call reference cycles, and the peak depends on test order
+    gc.collect()
+    gc.freeze()
+    try:
+        tracemalloc.start()
+        write(result, _NullWriter())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        gc.unfreeze()
+    return peak
+
+
+@pytest.mark.parametrize("write", [JSONReporter().write, SARIFReporter().write, JSONReporter().write_ndjson])
+def test_peak_memory_independent_of_violation_count(write):
+    small = make_result(count=100)
+    large = make_result(count=2000)
+
+    small_peak = _peak_bytes(write, small)
+    large_peak = _peak_bytes(write, large)
+
+    # 20x the violations must not mean 20x the memory
+    assert large_peak < small_peak * 2
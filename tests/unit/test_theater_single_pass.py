@@ -0,0 +1,124 @@
+"""
+Unit tests for single-pass theater detection in analyzer.theater_detection.core.
+
+Tests cover:
+- Offsets map to line numbers through the newline index
+- Each file is parsed once and never re-walked per function
+- Text patterns keep separate, possibly overlapping, matches per pattern
+- Findings keep the per-category order of the individual detectors
+- Process-pool and in-process directory runs return identical results
+"""
+
+import ast
+
+import pytest
+
+from analyzer.theater_detection import core
+from analyzer.theater_detection.core import LineIndex, TheaterDetector, TheaterType
+
+SOURCE = '''\
+import os
+
+
+def test_empty():
+    pass
+
+
+def test_gamed():
+    assert True
+    helper()
+
+
+def load(path) -> str:
+    """Loads the file.
+
+    Returns:
+        The contents. Raises OSError when missing.
+    """
+    try:
+        os.stat(path)
+    except:
+        pass
+
+
+successcore = 1.0 or True
+coverage = 100
+'''
+
+
+def summary(patterns):
+    return [(p.pattern_type, p.line_number, p.description) for p in patterns]
+
+
+def test_line_index():
+    content = "a\nbb\n\nccc"
+    index = LineIndex(content)
+
+    assert [index.line_of(content.index(ch)) for ch in "abc"] == [1, 2, 4]
+    assert index.line_of(content.index("\n")) == 1
+
+
+def test_file_is_parsed_once_and_walked_once(tmp_path, monkeypatch):
+    path = tmp_path / "test_sample.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    parses = []
+    real_parse = ast.parse
+    monkeypatch.setattr(ast, "parse", lambda source, *a, **k: parses.append(source) or real_parse(source, *a, **k))
+    monkeypatch.setattr(ast, "walk", lambda node: pytest.fail("per-function ast.walk"))
+
+    patterns = TheaterDetector().detect_all_patterns(str(path))
+
+    assert len(parses) == 1
+    assert patterns
+
+
+def test_findings_by_category():
+    patterns = TheaterDetector().detect_all(SOURCE, "sample.py")
+
+    assert [t for t, *_ in summary(patterns)] == sorted(
+        (p.pattern_type for p in patterns),
+        key=[
+            TheaterType.TEST_GAMING,
+            TheaterType.ERROR_MASKING,
+            TheaterType.METRICS_INFLATION,
+            TheaterType.DOCUMENTATION_THEATER,
+            TheaterType.QUALITY_FACADE,
+        ].index,
+    )
+    lines = {(t, line) for t, line, _ in summary(patterns)}
+    assert {
+        (TheaterType.TEST_GAMING, 4),
+        (TheaterType.TEST_GAMING, 9),
+        (TheaterType.ERROR_MASKING, 21),
+        (TheaterType.DOCUMENTATION_THEATER, 13),
+        (TheaterType.QUALITY_FACADE, 4),
+        (TheaterType.QUALITY_FACADE, 13),
+        (TheaterType.QUALITY_FACADE, 21),
+    } <= lines
+    # "successcore" holds both keywords; each pattern reports its own match
+    inflation = [p.evidence["match"] for p in patterns if p.pattern_type == TheaterType.METRICS_INFLATION]
+    assert inflation == ["coverage = 100", "score = 1.0", "successcore = 1.0 or True"]
+
+
+def test_documentation_checks_use_subtree_facts():
+    patterns = TheaterDetector().detect_all(SOURCE)
+    documentation = [p.description for p in patterns if p.pattern_type == TheaterType.DOCUMENTATION_THEATER]
+
+    assert documentation == [
+        "Function 'load' docstring claims exceptions but none raised",
+        "Function 'load' docstring claims return value but returns None",
+    ]
+
+
+def test_directory_pool_matches_serial(tmp_path, monkeypatch):
+    for index in range(6):
+        (tmp_path / f"test_mod{index}.py").write_text(SOURCE, encoding="utf-8")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "vendored.py").write_text(SOURCE, encoding="utf-8")
+
+    serial = TheaterDetector().analyze_directory(str(tmp_path), max_workers=1)
+    monkeypatch.setattr(core, "THEATER_PARALLEL_THRESHOLD", 1)
+    pooled = TheaterDetector().analyze_directory(str(tmp_path), max_workers=2)
+
+    assert summary(pooled) == summary(serial)
+    assert {p.file_path for p in serial} == {str(tmp_path / f"test_mod{i}.py") for i in range(6)}
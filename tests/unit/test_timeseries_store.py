@@ -0,0 +1,161 @@
+"""
+Unit tests for the append-only time-series store and its drift consumer.
+
+Tests cover:
+- Range queries return only the records inside the window
+- Maintained window statistics match a full recomputation, across reopen
+- Unmaintained windows and EWMA are answered correctly
+- Truncation drops old records and rebuilds the aggregates
+- Files with another field layout are rejected
+- The drift tracker appends measurements and imports a legacy drift.json
+- The trend analyzer imports a legacy trends.json
+- Six Sigma callers keep their history in the store; saved files stay bounded
+"""
+
+from datetime import datetime, timedelta
+import json
+import statistics
+
+import pytest
+
+from analyzer.enterprise.sixsigma import telemetry as sixsigma_telemetry
+from analyzer.enterprise.sixsigma.integration import ConnascenceSixSigmaIntegration
+from analyzer.enterprise.sixsigma.telemetry import SixSigmaTelemetry
+from analyzer.optimization.timeseries_store import DAY_SECONDS, TimeSeriesStore
+from dashboard.metrics import MetricsTrendAnalyzer
+from policy.drift import EnhancedDriftTracker
+
+HOUR = 3600.0
+
+
+@pytest.fixture
+def values():
+    return [(index * 7919) % 101 for index in range(600)]
+
+
+def fill(store, values):
+    for index, value in enumerate(values):
+        store.append({"count": value, "index": index}, timestamp=index * HOUR)
+
+
+def test_range_queries_read_only_the_window(tmp_path, values):
+    store = TimeSeriesStore(tmp_path, "series", ("count", "index"))
+    fill(store, values)
+
+    timestamps, indexes = store.series("index", since=100 * HOUR, until=104 * HOUR)
+
+    assert indexes == [100.0, 101.0, 102.0, 103.0, 104.0]
+    assert timestamps == [index * HOUR for index in range(100, 105)]
+    assert store.count_since(590 * HOUR) == 10
+    assert list(store.records(since=599 * HOUR)) == [(599 * HOUR, {"count": values[599], "index": 599.0})]
+
+
+def test_window_stats_match_recomputation_across_reopen(tmp_path, values):
+    store = TimeSeriesStore(tmp_path, "series", ("count", "index"))
+    fill(store, values)
+    store.close()
+
+    reopened = TimeSeriesStore(tmp_path, "series", ("count", "index"))
+    now = 620 * HOUR
+    stats = reopened.window_stats("count", 7 * DAY_SECONDS, now)
+    expected = [value for index, value in enumerate(values) if index * HOUR >= now - 7 * DAY_SECONDS]
+
+    assert stats.count == len(expected)
+    assert stats.mean == pytest.approx(statistics.mean(expected))
+    assert stats.stddev == pytest.approx(statistics.stdev(expected))
+
+    custom = reopened.window_stats("count", 2 * DAY_SECONDS, 599 * HOUR)
+    assert custom.count == 49
+    assert custom.mean == pytest.approx(statistics.mean(values[-49:]))
+
+
+def test_ewma_and_truncation(tmp_path, values):
+    store = TimeSeriesStore(tmp_path, "series", ("count", "index"), ewma_alpha=0.5)
+    fill(store, values[:3])
+    assert store.ewma("count") == pytest.approx(0.25 * values[0] + 0.25 * values[1] + 0.5 * values[2])
+
+    # Earlier timestamps than the last record are stored under the last one
+    fill(store, values)
+    assert store.series("index", until=2 * HOUR)[1] == [0.0, 1.0, 2.0, 0.0, 1.0, 2.0]
+
+    assert store.truncate_before(500 * HOUR) == 503
+    assert len(store) == 100
+    assert store.window_stats("index", 7 * DAY_SECONDS, 599 * HOUR).count == 100
+    assert store.series("index", until=0.0) == ([], [])
+
+
+def test_field_layout_is_checked(tmp_path):
+    TimeSeriesStore(tmp_path, "series", ("count",)).close()
+
+    with pytest.raises(ValueError):
+        TimeSeriesStore(tmp_path, "series", ("count", "index"))
+
+
+def test_drift_tracker_appends_and_imports_legacy_history(tmp_path):
+    now = datetime.now()
+    legacy = [
+        {
+            "timestamp": (now - timedelta(days=10 - day)).isoformat(),
+            "total_violations": 100 + day,
+            "violations_by_type": {},
+            "violations_by_severity": {"critical": 1, "high": 0, "medium": 0, "low": 0},
+            "files_analyzed": 10,
+            "analysis_duration_ms": 5.0,
+        }
+        for day in range(8)
+    ]
+    (tmp_path / ".connascence").mkdir()
+    (tmp_path / ".connascence" / "drift.json").write_text(json.dumps({"drift_history": legacy}), encoding="utf-8")
+
+    tracker = EnhancedDriftTracker(tmp_path)
+    tracker.record_measurement([], files_analyzed=10, analysis_duration_ms=4.0)
+
+    assert len(tracker.store) == 9
+    assert len(tracker.drift_history) == 9
+    assert tracker.analyze_trend(30).trend_direction == "improving"
+    anomaly = tracker.detect_anomalies(500, lookback_days=30)
+    assert anomaly.is_anomaly
+    assert anomaly.baseline_mean == pytest.approx(statistics.mean([100 + day for day in range(8)] + [0]))
+
+    reopened = EnhancedDriftTracker(tmp_path)
+    assert len(reopened.store) == 9
+    assert reopened.export_drift_report(30)["recent_measurements"] == 9
+
+
+def test_trend_analyzer_imports_legacy_trends_json(tmp_path):
+    now = datetime.now()
+    entries = [
+        {"timestamp": (now - timedelta(days=day)).isoformat(), "total_violations": 10 * day, "nasa_score": 0.9}
+        for day in (3, 1, 2)
+    ]
+    entries.append({"timestamp": "not a date", "total_violations": 1})
+    (tmp_path / "trends.json").write_text(json.dumps({"entries": entries, "metadata": {}}), encoding="utf-8")
+
+    analyzer = MetricsTrendAnalyzer(str(tmp_path))
+
+    assert [values["total_violations"] for _, values in analyzer.store.records()] == [30.0, 20.0, 10.0]
+    assert len(MetricsTrendAnalyzer(str(tmp_path)).store) == 3
+
+
+def test_sixsigma_history_persists_through_the_integration(tmp_path, monkeypatch):
+    monkeypatch.setattr(sixsigma_telemetry, "MAX_SAVED_SNAPSHOTS", 2)
+    results = {"violations": [{"type": "algorithm", "severity": "high"}]}
+    integration = ConnascenceSixSigmaIntegration(history_dir=tmp_path)
+    for _ in range(3):
+        integration.process_analysis_results(results)
+
+    assert integration.telemetry is integration.analyzer.telemetry
+    assert len(integration.telemetry.history_store) == 3
+    saved = tmp_path / "metrics.json"
+    integration.telemetry.save_metrics(saved)
+    assert len(json.loads(saved.read_text(encoding="utf-8"))["metrics_history"]) == 2
+
+    # A file saved without a store is imported once into a new store
+    legacy = SixSigmaTelemetry()
+    for _ in range(3):
+        legacy.generate_metrics_snapshot()
+    legacy.save_metrics(tmp_path / "legacy.json")
+    fresh = SixSigmaTelemetry(history_dir=tmp_path / "fresh")
+    fresh.load_metrics(tmp_path / "legacy.json")
+    fresh.load_metrics(tmp_path / "legacy.json")
+    assert len(fresh.history_store) == 3
@@ -0,0 +1,180 @@
+"""
+Unit tests for the CPU-budgeted tool scheduler.
+
+Tests cover:
+- Global CPU budget is never exceeded by concurrently running jobs
+- Longest-expected-runtime jobs start first
+- Results stream out in completion order
+- Runtime history is persisted and reused for ordering and parallelism
+- CPU time is measured per job, and saturated jobs probe one more core
+- Granted cores reach tools and the connascence analysis per call
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from integrations.tool_scheduler import ScheduledJob, ToolRuntimeHistory, ToolScheduler, run_subprocess
+
+
+def _collect(scheduler, jobs):
+    async def run():
+        return [outcome async for outcome in scheduler.run(jobs)]
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def history(tmp_path):
+    return ToolRuntimeHistory(tmp_path / "runtimes.json")
+
+
+def test_cpu_budget_is_respected(history):
+    lock = threading.Lock()
+    state = {"cores": 0, "peak": 0}
+
+    def work(grant):
+        with lock:
+            state["cores"] += grant
+            state["peak"] = max(state["peak"], state["cores"])
+        time.sleep(0.02)
+        with lock:
+            state["cores"] -= grant
+        return grant
+
+    jobs = [ScheduledJob(name=f"tool{i}", func=work, parallelism=2) for i in range(5)]
+    outcomes = _collect(ToolScheduler(cpu_budget=4, history=history), jobs)
+
+    assert len(outcomes) == 5
+    assert state["peak"] <= 4
+    assert all(outcome.granted_cores == 2 for outcome in outcomes)
+
+
+def test_parallelism_is_capped_at_budget(history):
+    outcomes = _collect(
+        ToolScheduler(cpu_budget=2, history=history), [ScheduledJob(name="wide", func=lambda g: g, parallelism=16)]
+    )
+    assert outcomes[0].result == 2
+
+
+def test_longest_jobs_start_first(history):
+    started = []
+    jobs = [
+        ScheduledJob(name=name, func=lambda g, n=name: started.append(n), estimated_runtime=runtime)
+        for name, runtime in [("short", 0.1), ("long", 10.0), ("medium", 1.0)]
+    ]
+    _collect(ToolScheduler(cpu_budget=1, history=history), jobs)
+    assert started == ["long", "medium", "short"]
+
+
+def test_results_stream_in_completion_order(history):
+    jobs = [
+        ScheduledJob(name="slow", func=lambda g: time.sleep(0.2), estimated_runtime=5.0),
+        ScheduledJob(name="fast", func=lambda g: None, estimated_runtime=1.0),
+    ]
+    outcomes = _collect(ToolScheduler(cpu_budget=2, history=history), jobs)
+    assert [outcome.name for outcome in outcomes] == ["fast", "slow"]
+
+
+def test_failures_are_reported_not_raised(history):
+    def boom(grant):
+        raise RuntimeError("tool crashed")
+
+    outcomes = _collect(ToolScheduler(cpu_budget=1, history=history), [ScheduledJob(name="bad", func=boom)])
+    assert outcomes[0].error == "tool crashed"
+
+
+def test_cpu_time_counts_the_jobs_own_meter(history):
+    meters = {"measured": 0.0}
+
+    def spawn(grant):
+        # CPU burnt by "child processes" of this job only
+        meters["measured"] += 3.0
+
+    jobs = [
+        ScheduledJob(name="measured", func=spawn, cpu_meter=lambda: meters["measured"]),
+        ScheduledJob(name="bystander", func=lambda g: time.sleep(0.05)),
+    ]
+    outcomes = {outcome.name: outcome for outcome in _collect(ToolScheduler(cpu_budget=2, history=history), jobs)}
+
+    assert outcomes["measured"].cpu_time >= 3.0
+    assert outcomes["bystander"].cpu_time < 1.0
+
+
+def test_saturated_jobs_probe_one_more_core(history):
+    history.record("scales", wall_time=1.0, cpu_time=0.95, granted_cores=1)
+    history.record("serial", wall_time=1.0, cpu_time=1.0, granted_cores=4)
+
+    assert history.suggested_parallelism("scales") == 2
+    assert history.suggested_parallelism("serial") == 1
+    assert history.suggested_parallelism("unknown") is None
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="child CPU time needs wait4")
+def test_run_subprocess_measures_only_its_child():
+    completed, cpu_time = run_subprocess(
+        [sys.executable, "-c", "import time\nend = time.process_time() + 0.2\nwhile time.process_time() < end: pass"]
+    )
+
+    assert completed.returncode == 0
+    assert 0.15 <= cpu_time < 5.0
+
+
+def test_history_is_persisted_and_drives_ordering(tmp_path):
+    path = tmp_path / "runtimes.json"
+    jobs = [
+        ScheduledJob(name="a", func=lambda g: time.sleep(0.05)),
+        ScheduledJob(name="b", func=lambda g: None),
+    ]
+    _collect(ToolScheduler(cpu_budget=2, history=ToolRuntimeHistory(path)), jobs)
+    assert path.exists()
+
+    reloaded = ToolRuntimeHistory(path)
+    assert reloaded.expected_runtime("a") > reloaded.expected_runtime("b")
+    ordered = ToolScheduler(cpu_budget=1, history=reloaded).order_jobs(list(reversed(jobs)))
+    assert [job.name for job in ordered] == ["a", "b"]
+
+
+def test_granted_cores_are_passed_per_call(tmp_path):
+    from integrations.tool_coordinator import ToolCoordinator
+
+    class RecordingTool:
+        def __init__(self):
+            self.config = {}
+            self.calls = []
+
+        def analyze(self, project_path, max_parallel=None):
+            self.calls.append(max_parallel)
+            return {"issues": []}
+
+    coordinator = ToolCoordinator()
+    tool = coordinator.tools["ruff"] = RecordingTool()
+
+    assert coordinator._run_tool_sync("ruff", tmp_path, 3).success
+    assert coordinator._run_tool_sync("ruff", tmp_path, 1).success
+    assert tool.calls == [3, 1]
+    assert "max_parallel" not in tool.config
+
+    coordinator.close()
+    with pytest.raises(RuntimeError):
+        coordinator.scheduler._executor.submit(int)
+
+
+def test_connascence_analysis_uses_granted_cores(tmp_path):
+    from analyzer.ast_engine.core_analyzer import ConnascenceASTAnalyzer
+
+    for index in range(4):
+        (tmp_path / f"module_{index}.py").write_text(f"def f(a, b, c, d, e, f, g):\n    return a * {index + 42}\n")
+
+    serial = ConnascenceASTAnalyzer().analyze_directory(tmp_path)
+    pooled = ConnascenceASTAnalyzer().analyze_directory(tmp_path, max_workers=2)
+
+    assert pooled.total_files == serial.total_files == 4
+    assert pooled.worker_cpu_time > 0 and serial.worker_cpu_time == 0
+    assert [(v.file_path, v.line_number, v.type) for v in pooled.violations] == [
+        (v.file_path, v.line_number, v.type) for v in serial.violations
+    ]
@@ -0,0 +1,81 @@
+"""
+Unit tests for Tree-Sitter backend parse caching.
+
+Tests cover:
+- Repeated parses of the same content are served from the tree cache
+- validate() reuses a caller-supplied parse result instead of reparsing
+- The NASA pass discovers JS/TS/C files under the given project path
+"""
+
+from pathlib import Path
+
+import pytest
+
+from analyzer.unified_analyzer import _discover_tree_sitter_files
+from grammar.backends import tree_sitter_backend
+from grammar.backends.tree_sitter_backend import LanguageSupport, TreeSitterBackend
+
+
+class FakeTree:
+    def __init__(self, source):
+        self.source = source
+        self.root_node = type("Root", (), {"has_error": False, "children": [], "type": "program"})()
+
+
+class FakeParser:
+    def __init__(self):
+        self.calls = []
+
+    def parse(self, source):
+        self.calls.append(source)
+        return FakeTree(source)
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    monkeypatch.setattr(tree_sitter_backend, "TREE_SITTER_AVAILABLE", True)
+    backend = TreeSitterBackend({"tree_cache_size": 4})
+    backend._parsers = {LanguageSupport.C: FakeParser()}
+    return backend
+
+
+def test_repeated_parse_is_cached(fake_backend):
+    parser = fake_backend._parsers[LanguageSupport.C]
+    first = fake_backend.parse("int main() { return 0; }", LanguageSupport.C)
+    second = fake_backend.parse("int main() { return 0; }", LanguageSupport.C)
+
+    assert first is second
+    assert len(parser.calls) == 1
+    assert fake_backend.get_cache_stats()["hits"] == 1
+
+
+def test_tree_cache_is_bounded(fake_backend):
+    for i in range(10):
+        fake_backend.parse(f"int x{i};", LanguageSupport.C)
+    assert fake_backend.get_cache_stats()["entries"] == 4
+
+
+def test_validate_reuses_parse_result(fake_backend):
+    parser = fake_backend._parsers[LanguageSupport.C]
+    code = "void f(void) {}"
+    parse_result = fake_backend._parse_uncached(code, LanguageSupport.C)
+    calls_before = len(parser.calls)
+
+    result = fake_backend.validate(code, LanguageSupport.C, overlay="nasa_c_safety", parse_result=parse_result)
+
+    assert result.valid
+    assert len(parser.calls) == calls_before
+
+
+def test_nasa_discovery_uses_project_path(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "node_modules").mkdir()
+    for name in ["src/a.c", "src/a.h", "src/b.js", "src/c.ts", "src/d.txt", "node_modules/e.js"]:
+        (tmp_path / name).write_text("")
+
+    found = {
+        Path(path).relative_to(tmp_path).as_posix(): language
+        for path, language in _discover_tree_sitter_files(tmp_path, {"c", "javascript"})
+    }
+
+    assert found == {"src/a.c": "c", "src/a.h": "c", "src/b.js": "javascript", "src/c.ts": "javascript"}
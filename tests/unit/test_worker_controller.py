@@ -0,0 +1,129 @@
+"""
+Unit tests for the adaptive worker-count controller.
+
+Tests cover:
+- Workers are added while throughput improves and the last step is undone when it stops helping
+- Load average and memory headroom halve the worker count
+- The best setting is remembered per project and reused by the next run
+- A non-positive decision window is rejected
+- The parallel analyzer follows the controller's worker count during a run
+"""
+
+import json
+
+import pytest
+
+from analyzer.optimization.memory_budget import MemoryBudget
+from analyzer.performance.parallel_analyzer import ParallelAnalysisConfig
+from analyzer.performance.worker_controller import DEFAULT_SETTINGS_FILE, WorkerController, WorkerSettingsStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def controller(clock, initial=2, load=0.2, headroom=0.8, **kwargs):
+    signals = {"load": load, "headroom": headroom}
+    instance = WorkerController(
+        initial,
+        max_workers=8,
+        clock=clock,
+        cpu_sampler=lambda: 40.0,
+        load_sampler=lambda: signals["load"],
+        headroom_sampler=lambda: signals["headroom"],
+        **kwargs,
+    )
+    return instance, signals
+
+
+def run_window(instance, clock, files):
+    clock.now += 1.0
+    return instance.record(files)
+
+
+def test_hill_climbs_until_throughput_stops_improving():
+    clock = FakeClock()
+    instance, _ = controller(clock)
+
+    assert run_window(instance, clock, 20) == 3
+    assert run_window(instance, clock, 30) == 4
+    assert run_window(instance, clock, 31) == 3
+    # Holds at the knee before probing again
+    assert [run_window(instance, clock, 30) for _ in range(4)] == [3, 3, 3, 4]
+    assert instance.best_workers == 4
+    assert [entry["decision"] for entry in instance.history[:3]] == ["probe", "probe", "no_gain"]
+
+
+def test_congestion_halves_workers_once_per_hold_period():
+    clock = FakeClock()
+    instance, signals = controller(clock, initial=8)
+
+    signals["load"] = 3.0
+    assert run_window(instance, clock, 40) == 4
+    # Load average lags behind the decrease; it is not acted on again right away
+    assert run_window(instance, clock, 40) == 4
+
+    signals["headroom"] = 0.05
+    assert run_window(instance, clock, 40) == 2
+    assert run_window(instance, clock, 40) == 1
+    assert run_window(instance, clock, 40) == 1
+
+
+def test_best_setting_is_remembered_per_project(tmp_path):
+    clock = FakeClock()
+    first = WorkerController.for_project(
+        tmp_path,
+        use_processes=True,
+        default_workers=2,
+        max_workers=8,
+        clock=clock,
+        cpu_sampler=lambda: 10.0,
+        load_sampler=lambda: 0.1,
+        headroom_sampler=lambda: 0.9,
+    )
+    for files in (10, 20, 30, 30):
+        run_window(first, clock, files)
+    first.save()
+
+    stored = json.loads((tmp_path / DEFAULT_SETTINGS_FILE).read_text(encoding="utf-8"))
+    entry = stored["entries"][WorkerSettingsStore.key(True)]
+    assert entry["workers"] == 4
+    assert entry["files_per_second"] == 30.0
+
+    second = WorkerController.for_project(tmp_path, use_processes=True, default_workers=2, max_workers=8)
+    assert second.workers == 4
+    threads = WorkerController.for_project(tmp_path, use_processes=False, default_workers=2, max_workers=8)
+    assert threads.workers == 2
+
+    (tmp_path / DEFAULT_SETTINGS_FILE).write_text("{not json", encoding="utf-8")
+    assert WorkerController.for_project(tmp_path, True, default_workers=3, max_workers=8).workers == 3
+
+
+class StepController(WorkerController):
+    """Raises the worker count to three after the first completed chunk."""
+
+    def record(self, files):
+        self._workers = 3
+        return self._workers
+
+
+def test_non_positive_window_is_rejected():
+    with pytest.raises(ValueError):
+        controller(FakeClock(), window_seconds=0)
+
+
+def test_parallel_analyzer_follows_the_controller(tracking_parallel_analyzer):
+    analyzer = tracking_parallel_analyzer(ParallelAnalysisConfig(max_workers=1, chunk_size=2, use_processes=False))
+    analyzer.memory_budget = MemoryBudget(limit_mb=10_000, rss_sampler=lambda: 0.0, sample_interval=0)
+    chunks = [[f"file_{chunk}_{index}.py" for index in range(2)] for chunk in range(8)]
+
+    results, _ = analyzer._execute_parallel_chunks(chunks, "standard", {}, StepController(1, max_workers=4))
+
+    assert len(results) == 8
+    assert analyzer.concurrency[0] == 1
+    assert max(analyzer.concurrency) == 3
+    assert analyzer.worker_controller.workers == 3